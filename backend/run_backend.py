@@ -12,5 +12,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        ws_per_message_deflate=True  # permessage-deflate for the market feed
     )
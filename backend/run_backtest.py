@@ -70,6 +70,7 @@ async def main():
     parser.add_argument("--max-pos", type=int, default=10, help="Max open positions in Shark Tank mode (Default: 10)")
     parser.add_argument("--max-order", type=float, default=50000.0, help="Max notional value per order (Default: 50000)")
     parser.add_argument("--mm-rate", type=float, default=0.004, help="Maintenance Margin Rate (Default: 0.004)")
+    parser.add_argument("--vectorized", action="store_true", help="Precompute signals from NumPy columns (faster, same results)")
     
     args = parser.parse_args()
     
@@ -130,7 +131,9 @@ async def main():
         loader=loader,
         simulator=simulator,
         trend_filter=trend_filter,
-        circuit_breaker=circuit_breaker
+        circuit_breaker=circuit_breaker,
+        indicator_engine=container.get_incremental_indicator_engine(),
+        mode=BacktestEngine.MODE_VECTORIZED if args.vectorized else BacktestEngine.MODE_STEP
     )
     
     # 3. Time Range
@@ -0,0 +1,183 @@
+"""
+Hinto Stock Parameter Sweep Runner
+
+Runs many portfolio backtests in parallel (one process per core) and reports
+the best parameters. Results stream to a Parquet dataset, so re-running the
+same command after a crash only executes the missing runs.
+
+Usage:
+  python run_sweep.py --symbols "BTCUSDT,ETHUSDT" --days 90 \
+      --space '{"risk_per_trade": [0.005, 0.01, 0.02], "signal.SNIPER_PROXIMITY": [0.01, 0.015, 0.02]}'
+  python run_sweep.py --symbols BTCUSDT --days 180 --sampler bayesian --trials 60 \
+      --space '{"risk_per_trade": [0.005, 0.03], "trailing_stop_atr": [2.0, 6.0]}' \
+      --train-days 60 --test-days 20 --objective sharpe
+"""
+
+import asyncio
+import argparse
+import json
+import logging
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+# Add src to path (Robust approach)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from src.infrastructure.di_container import DIContainer
+from src.infrastructure.data.historical_data_loader import HistoricalDataLoader
+from src.application.backtest.parameter_sweep import (
+    OBJECTIVES,
+    ParameterSweepRunner,
+    SweepConfig,
+    WalkForwardConfig,
+)
+
+# Setup logging
+logging.basicConfig(
+    level=logging.WARNING, # Reduce noise
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger("SweepRunner")
+logger.setLevel(logging.INFO)
+logging.getLogger("src.application.backtest.parameter_sweep").setLevel(logging.INFO)
+
+
+def build_signal_generator():
+    """Signal generator factory for worker processes (must be module-level to pickle)."""
+    return DIContainer().get_signal_generator()
+
+
+def parse_space(raw: str) -> dict:
+    """
+    Parse a parameter space from JSON text or a JSON file path.
+
+    Two-element numeric lists are treated as (low, high) ranges by the
+    random / bayesian samplers; the grid sampler always enumerates lists.
+    """
+    if os.path.isfile(raw):
+        with open(raw, "r", encoding="utf-8") as f:
+            raw = f.read()
+    return json.loads(raw)
+
+
+def to_ranges(space: dict) -> dict:
+    ranges = {}
+    for name, values in space.items():
+        numeric = all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)
+        ranges[name] = tuple(values) if len(values) == 2 and numeric else values
+    return ranges
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Hinto Stock Parameter Sweep")
+    parser.add_argument("--symbols", type=str, default="BTCUSDT", help="Comma-separated list of pairs")
+    parser.add_argument("--interval", type=str, default="15m", help="Timeframe")
+    parser.add_argument("--days", type=int, default=30, help="Days of history (if start/end not provided)")
+    parser.add_argument("--start", type=str, help="Start date YYYY-MM-DD")
+    parser.add_argument("--end", type=str, help="End date YYYY-MM-DD")
+    parser.add_argument("--space", type=str, required=True, help="Parameter space (JSON text or file)")
+    parser.add_argument("--sampler", choices=["grid", "random", "bayesian"], default="grid")
+    parser.add_argument("--trials", type=int, default=50, help="Trials per optimization (random/bayesian)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--objective", choices=OBJECTIVES, default="net_return_pct")
+    parser.add_argument("--min-trades", type=int, default=5, help="Runs with fewer trades score -inf")
+    parser.add_argument("--train-days", type=int, help="Walk-forward train window (enables walk-forward)")
+    parser.add_argument("--test-days", type=int, help="Walk-forward test window")
+    parser.add_argument("--step-days", type=int, help="Walk-forward step (default: test days)")
+    parser.add_argument("--anchored", action="store_true", help="Anchored (expanding) train windows")
+    parser.add_argument("--balance", type=float, default=10000.0, help="Initial Shared Balance")
+    parser.add_argument("--max-pos", type=int, default=10, help="Max open positions (Default: 10)")
+    parser.add_argument("--workers", type=int, help="Worker processes (Default: all cores)")
+    parser.add_argument("--step-mode", action="store_true", help="Use the step-by-step engine instead of vectorized")
+    parser.add_argument("--results", type=str, default="data/sweeps/sweep.parquet", help="Results dataset (resumable)")
+
+    args = parser.parse_args()
+
+    symbols = list(dict.fromkeys(s.strip().upper() for s in args.symbols.split(",")))
+    space = parse_space(args.space)
+    if args.sampler != "grid":
+        space = to_ranges(space)
+
+    if args.start:
+        try:
+            start_time = datetime.strptime(args.start, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+            if args.end:
+                end_time = datetime.strptime(args.end, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+            else:
+                end_time = datetime.now(timezone.utc)
+        except ValueError as e:
+            logger.error(f"Invalid date format. Use YYYY-MM-DD: {e}")
+            return
+    else:
+        end_time = datetime.now(timezone.utc)
+        start_time = end_time - timedelta(days=args.days)
+
+    walk_forward = None
+    if args.train_days:
+        if not args.test_days:
+            logger.error("--test-days is required with --train-days")
+            return
+        walk_forward = WalkForwardConfig(
+            train_days=args.train_days,
+            test_days=args.test_days,
+            step_days=args.step_days,
+            anchored=args.anchored
+        )
+
+    config = SweepConfig(
+        symbols=symbols,
+        interval=args.interval,
+        start_time=start_time,
+        end_time=end_time,
+        space=space,
+        sampler=args.sampler,
+        n_trials=args.trials,
+        seed=args.seed,
+        objective=args.objective,
+        min_trades=args.min_trades,
+        simulator_defaults={
+            'initial_balance': args.balance,
+            'mode': "SHARK_TANK",
+            'max_positions': args.max_pos,
+        },
+        engine_mode="STEP" if args.step_mode else "VECTORIZED",
+        walk_forward=walk_forward,
+        max_workers=args.workers
+    )
+
+    print(f"🚀 Parameter sweep: {len(symbols)} pairs | {args.sampler} | objective={args.objective}")
+    print(f"💾 Results: {args.results}")
+
+    runner = ParameterSweepRunner(config, HistoricalDataLoader(), build_signal_generator, args.results)
+    try:
+        report = await runner.run()
+    except Exception as e:
+        logger.error(f"Sweep failed: {e}", exc_info=True)
+        return
+
+    print("\n" + "="*60)
+    print("📊 SWEEP REPORT")
+    print("="*60)
+    print(f"🔢 Runs: {len(report.rows)} ({report.evaluated} executed, {len(report.rows) - report.evaluated} resumed)")
+
+    if walk_forward is None:
+        if report.best:
+            print(f"🏆 Best {args.objective}: {report.best['score']:.4f}")
+            print(f"   Params: {report.best['params_json']}")
+            print(f"   Return: {report.best['net_return_pct']:.2f}% | Trades: {report.best['total_trades']} "
+                  f"| Max DD: {report.best['max_drawdown_pct']:.2f}%")
+    else:
+        print("\n--- Out-of-sample (walk-forward) ---")
+        for row in report.out_of_sample:
+            print(f"[{row['window']}] {row['start'][:10]} → {row['end'][:10]} | "
+                  f"{args.objective}={row['score']:.4f} | Return {row['net_return_pct']:.2f}% | {row['params_json']}")
+        if report.out_of_sample:
+            total = sum(r['net_return_pct'] for r in report.out_of_sample)
+            print(f"\n📈 Sum of out-of-sample returns: {total:.2f}%")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+"""
+Micro-benchmark: Binance kline frame decoding, messages/second on one core.
+
+Compares the dict-based validated path (json.loads + parse_kline_message +
+extract_metadata) with the single-pass stream path (parse_stream), with
+the stdlib and orjson decoders, validated and trusted, and measures the
+whole BinanceWebSocketClient._process_message with a no-op candle handler.
+
+Usage:
+  python scripts/benchmark_message_parser.py
+  python scripts/benchmark_message_parser.py --messages 200000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from src.infrastructure.websocket import message_parser
+from src.infrastructure.websocket.binance_websocket_client import BinanceWebSocketClient
+from src.infrastructure.websocket.message_parser import BinanceMessageParser
+
+
+def make_frames(count: int) -> list:
+    """Combined-stream kline frames: 1m ticks of a few bars for 3 symbols."""
+    frames = []
+    for i in range(count):
+        symbol = ("btcusdt", "ethusdt", "solusdt")[i % 3]
+        open_time = 1767571200000 + (i // 600) * 60_000
+        price = 90_000.0 + (i % 997) * 0.37
+        frames.append(json.dumps({
+            "stream": f"{symbol}@kline_1m",
+            "data": {
+                "e": "kline", "E": open_time + i % 60_000, "s": symbol.upper(),
+                "k": {"t": open_time, "T": open_time + 59_999, "s": symbol.upper(), "i": "1m",
+                      "f": 100 + i, "L": 200 + i, "o": f"{price:.2f}", "c": f"{price + 1.3:.2f}",
+                      "h": f"{price + 5.1:.2f}", "l": f"{price - 4.2:.2f}", "v": "12.345",
+                      "n": 100, "x": False, "q": "1111.1", "V": "5.5", "Q": "500.1", "B": "0"},
+            },
+        }, separators=(',', ':')))
+    return frames
+
+
+def rate(fn, frames: list) -> float:
+    started = time.perf_counter()
+    for frame in frames:
+        fn(frame)
+    return len(frames) / (time.perf_counter() - started)
+
+
+def legacy_path(parser: BinanceMessageParser):
+    def parse(frame):
+        data = json.loads(frame)["data"]
+        parser.parse_kline_message(data)
+        parser.extract_metadata(data)
+    return parse
+
+
+def client_rate(frames: list) -> float:
+    client = BinanceWebSocketClient()
+    client.subscribe_candle(lambda candle, metadata: None)
+
+    async def run():
+        started = time.perf_counter()
+        for frame in frames:
+            await client._process_message(frame)
+        return len(frames) / (time.perf_counter() - started)
+
+    return asyncio.run(run())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Kline frame decoding throughput (one core)")
+    parser.add_argument("--messages", type=int, default=100_000)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    frames = make_frames(args.messages)
+    results = [("dict path, json, validated", rate(legacy_path(BinanceMessageParser()), frames))]
+
+    orjson_loads = message_parser._loads
+    message_parser._loads = json.loads
+    results.append(("stream path, json, validated", rate(BinanceMessageParser().parse_stream, frames)))
+    results.append(("stream path, json, trusted", rate(BinanceMessageParser(trusted=True).parse_stream, frames)))
+    message_parser._loads = orjson_loads
+    if message_parser.JSON_DECODER == 'orjson':
+        results.append(("stream path, orjson, validated", rate(BinanceMessageParser().parse_stream, frames)))
+        results.append(("stream path, orjson, trusted", rate(BinanceMessageParser(trusted=True).parse_stream, frames)))
+    results.append((f"client._process_message ({message_parser.JSON_DECODER})", client_rate(frames)))
+
+    baseline = results[0][1]
+    print(f"{args.messages} frames, one core")
+    for name, per_second in results:
+        print(f"  {name:<40} {per_second:>12,.0f} msg/s  {per_second / baseline:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
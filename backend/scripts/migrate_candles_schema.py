@@ -0,0 +1,54 @@
+"""
+Migrate candle storage to the single `candles` table.
+
+Copies every legacy `{symbol}_{timeframe}` table (ISO TEXT timestamps)
+into `candles` (INTEGER epoch-ms, clustered on symbol/timeframe/ts) in
+small transactions, so it can run while the API is writing. Safe to re-run.
+
+Usage:
+  python scripts/migrate_candles_schema.py
+  python scripts/migrate_candles_schema.py --db data/market_data.db --keep-legacy --vacuum
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from src.infrastructure.persistence.sqlite_market_data_repository import SQLiteMarketDataRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Migrate legacy candle tables into `candles`")
+    parser.add_argument("--db", default="data/market_data.db", help="SQLite database path")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per transaction")
+    parser.add_argument("--keep-legacy", action="store_true", help="Do not drop legacy tables")
+    parser.add_argument("--vacuum", action="store_true", help="VACUUM afterwards to shrink the file (blocks writers)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    repo = SQLiteMarketDataRepository(args.db, write_behind=False)
+    size_before = repo.get_database_size()
+
+    migrated = repo.migrate_legacy_tables(batch_size=args.batch_size, drop_legacy=not args.keep_legacy)
+    if not migrated:
+        print("No legacy candle tables found.")
+
+    if args.vacuum:
+        repo.vacuum()
+
+    print(f"Migrated {len(migrated)} tables, {sum(m['copied'] for m in migrated.values())} rows")
+    for table, result in migrated.items():
+        if result['skipped']:
+            print(f"  {table}: {result['skipped']} rows with unparseable timestamps, table kept")
+    print(f"Database size: {size_before:.2f} MB -> {repo.get_database_size():.2f} MB")
+    repo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Load-test the real-time pipeline from a recorded Binance capture.
+
+Replays a capture (see SharedBinanceClient.start_recording /
+STREAM_RECORD_PATH) through SharedBinanceClient -> RealtimeService ->
+aggregator -> signals -> EventBus -> WebSocketManager, without a Binance
+connection, and prints throughput plus latency percentiles per stage.
+
+Usage:
+  python scripts/replay_stream.py captures/btc_eth.jsonl.gz
+  python scripts/replay_stream.py captures/btc_eth.jsonl.gz --speed max --db /tmp/replay.db
+  python scripts/replay_stream.py captures/btc_eth.jsonl.gz --speed 20 --warmup
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from src.api.event_bus import get_event_bus
+from src.api.websocket_manager import get_websocket_manager
+from src.infrastructure.di_container import DIContainer
+from src.infrastructure.websocket.shared_binance_client import get_shared_binance_client
+from src.infrastructure.websocket.stream_capture import read_capture
+from src.utils.latency_probe import install_latency_probe, uninstall_latency_probe
+
+
+def capture_symbols(path: str) -> list:
+    """Symbols of the combined streams in a capture (stream name prefix)."""
+    symbols = []
+    for _, message in read_capture(path):
+        stream = json.loads(message).get('stream', '')
+        symbol = stream.split('@')[0]
+        if symbol and symbol not in symbols:
+            symbols.append(symbol)
+    return symbols
+
+
+async def run(args) -> dict:
+    symbols = [s.lower() for s in args.symbols] if args.symbols else capture_symbols(args.capture)
+    container = DIContainer({'DATABASE_PATH': args.db})
+    event_bus = get_event_bus()
+    shared_client = get_shared_binance_client()
+
+    await event_bus.start_worker(get_websocket_manager())
+    services = []
+    for symbol in symbols:
+        service = container.get_realtime_service(symbol)
+        service.set_event_bus(event_bus)
+        services.append(service)
+    if args.warmup:
+        # Loads history over REST (needs network), like the API startup
+        await asyncio.gather(*(service.start(shared_client_mode=True) for service in services))
+    for symbol, service in zip(symbols, services):
+        shared_client.register_handler(symbol, service.on_candle_update)
+
+    probe = install_latency_probe()
+    try:
+        report = await shared_client.replay(args.capture, args.speed, limit=args.limit)
+
+        # Let queued broadcasts and Paper Engine work finish before reading the probe
+        deadline = time.monotonic() + args.drain_timeout
+        while event_bus.pending_count() and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*(service.drain_paper_pipeline() for service in services))
+        report['stages'] = probe.get_statistics()
+    finally:
+        uninstall_latency_probe()
+        await event_bus.stop_worker()
+
+    report['symbols'] = symbols
+    report['event_bus'] = {k: v for k, v in event_bus.get_statistics().items() if k != 'current_thread'}
+    await asyncio.to_thread(container.cleanup)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a combined-stream capture through the live pipeline")
+    parser.add_argument("capture", help="Capture file (gzip, written by the stream recorder)")
+    parser.add_argument("--speed", default="1",
+                        help="1 = recorded pace, N = N times faster, 'max' = as fast as possible")
+    parser.add_argument("--symbols", nargs="*", help="Symbols to route (default: every symbol in the capture)")
+    parser.add_argument("--db", default=":memory:", help="SQLite database for candles/orders")
+    parser.add_argument("--limit", type=int, default=None, help="Replay at most this many messages")
+    parser.add_argument("--warmup", action="store_true", help="Load history over REST before replaying")
+    parser.add_argument("--drain-timeout", type=float, default=10.0, help="Seconds to wait for queued broadcasts")
+    args = parser.parse_args()
+    args.speed = None if args.speed.lower() == "max" else float(args.speed)
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    print(json.dumps(asyncio.run(run(args)), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -18,16 +18,20 @@ def get_container() -> DIContainer:
 def get_order_repository() -> SQLiteOrderRepository:
     """
     Get singleton instance of SQLiteOrderRepository.
+    
+    Shares the container's pooled connections to trading_system.db.
     """
-    return SQLiteOrderRepository(db_path="data/trading_system.db")
+    return get_container().get_order_repository()
 
 
 @lru_cache()
 def get_signal_repository() -> SQLiteSignalRepository:
     """
     Get singleton instance of SQLiteSignalRepository.
+    
+    Shares the container's pooled connections to trading_system.db.
     """
-    return SQLiteSignalRepository(db_path="data/trading_system.db")
+    return get_container().get_signal_repository()
 
 
 @lru_cache()
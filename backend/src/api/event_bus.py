@@ -15,18 +15,30 @@ Lợi ích:
 
 CRITICAL: Thread-Safety
 - Binance WebSocket client chạy trong OS Thread riêng
-- asyncio.Queue.put_nowait() KHÔNG thread-safe khi gọi từ thread khác
+- Lane buffers chỉ được sửa trên event loop thread
 - Phải dùng loop.call_soon_threadsafe() để bridge giữa Thread và Async Loop
+
+Lanes (bounded, drained by one worker):
+- priority: signals, state changes, errors - always served first
+- candle slots: latest-value-wins per (symbol, event type); ticks of the
+  same bar overwrite each other, the final state of a finished bar is
+  kept in the normal lane
+- normal: everything else, FIFO
+Full lanes drop their oldest event; drops and coalesces are counted.
 """
 
 import asyncio
 import logging
 import threading
-from typing import Dict, Any, Optional, TYPE_CHECKING
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
 
+from ..utils.latency_probe import current_ingress, get_latency_probe
+
 if TYPE_CHECKING:
     from .websocket_manager import WebSocketManager
 
@@ -51,10 +63,17 @@ class BroadcastEvent:
     data: Dict[str, Any]
     symbol: str = "btcusdt"
     timestamp: datetime = None
+    # Latency tracing (perf_counter; set only while a LatencyProbe is installed)
+    ingress: Optional[float] = None
+    enqueued_at: Optional[float] = None
     
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.now()
+        if get_latency_probe() is not None:
+            self.enqueued_at = time.perf_counter()
+            if self.ingress is None:
+                self.ingress = current_ingress()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for JSON serialization."""
@@ -70,9 +89,16 @@ class EventBus:
     """
     Central event bus for async communication.
     
-    Singleton pattern - one queue for the entire application.
+    Singleton pattern - one bus for the entire application.
     """
     
+    PRIORITY_TYPES = frozenset({EventType.SIGNAL, EventType.STATE_CHANGE, EventType.ERROR})
+    COALESCE_TYPES = frozenset({EventType.CANDLE_UPDATE, EventType.CANDLE_15M, EventType.CANDLE_1H})
+    
+    # Lane bounds (oldest event is dropped when full)
+    PRIORITY_MAXSIZE = 1000
+    NORMAL_MAXSIZE = 1000
+    
     _instance: Optional['EventBus'] = None
     
     def __new__(cls):
@@ -85,9 +111,12 @@ class EventBus:
         if self._initialized:
             return
         
-        # Main event queue - unlimited size for now
-        # In production, consider maxsize to prevent memory issues
-        self._queue: asyncio.Queue = asyncio.Queue()
+        # Lanes hold (sequence, event); sequence keeps FIFO order across lanes
+        self._priority: Deque[Tuple[int, BroadcastEvent]] = deque()
+        self._normal: Deque[Tuple[int, BroadcastEvent]] = deque()
+        self._candle_slots: 'OrderedDict[Tuple[str, EventType], Tuple[int, BroadcastEvent]]' = OrderedDict()
+        self._sequence = 0
+        self._wakeup = asyncio.Event()
         
         # Reference to the main event loop (set when worker starts)
         # CRITICAL: Needed for thread-safe publishing from Binance WS thread
@@ -97,6 +126,8 @@ class EventBus:
         self._events_published = 0
         self._events_consumed = 0
         self._events_dropped = 0
+        self._events_coalesced = 0
+        self._dropped_by_lane = {'priority': 0, 'normal': 0}
         
         # Worker state
         self._worker_task: Optional[asyncio.Task] = None
@@ -126,8 +157,8 @@ class EventBus:
             try:
                 running_loop = asyncio.get_running_loop()
                 if self._loop and running_loop == self._loop:
-                    # Same loop - safe to use put_nowait directly
-                    self._queue.put_nowait(event)
+                    # Same loop - safe to touch the lanes directly
+                    self._put(event)
                     self._events_published += 1
                     logger.debug(f"Event published (async): {event.event_type.value}")
                     return True
@@ -148,10 +179,6 @@ class EventBus:
                 logger.warning(f"Event dropped (loop not ready): {event.event_type.value}")
                 return False
                 
-        except asyncio.QueueFull:
-            self._events_dropped += 1
-            logger.warning(f"Queue full, event dropped: {event.event_type.value}")
-            return False
         except Exception as e:
             self._events_dropped += 1
             logger.error(f"Failed to publish event: {e}")
@@ -159,14 +186,64 @@ class EventBus:
     
     def _safe_put(self, event: BroadcastEvent) -> None:
         """
-        Internal method to safely put event into queue.
+        Internal method to safely put event into its lane.
         Called via call_soon_threadsafe from external threads.
         """
         try:
-            self._queue.put_nowait(event)
-        except asyncio.QueueFull:
+            self._put(event)
+        except Exception as e:
             self._events_dropped += 1
-            logger.warning(f"Queue full in _safe_put: {event.event_type.value}")
+            logger.error(f"Failed to enqueue event: {e}")
+    
+    def _put(self, event: BroadcastEvent) -> None:
+        """Route an event to its lane. Event loop thread only."""
+        self._sequence += 1
+        event_type = event.event_type
+        
+        if event_type in self.COALESCE_TYPES:
+            key = (event.symbol, event_type)
+            pending = self._candle_slots.get(key)
+            if pending is not None:
+                if pending[1].data.get('time') == event.data.get('time'):
+                    # Same bar - latest tick wins, keeps its place in line
+                    self._candle_slots[key] = (pending[0], event)
+                    self._events_coalesced += 1
+                    return
+                # New bar - the previous bar's final state must still go out
+                del self._candle_slots[key]
+                self._append(self._normal, pending, 'normal', self.NORMAL_MAXSIZE)
+            self._candle_slots[key] = (self._sequence, event)
+        elif event_type in self.PRIORITY_TYPES:
+            self._append(self._priority, (self._sequence, event), 'priority', self.PRIORITY_MAXSIZE)
+        else:
+            self._append(self._normal, (self._sequence, event), 'normal', self.NORMAL_MAXSIZE)
+        
+        self._wakeup.set()
+    
+    def _append(self, lane: Deque, item: Tuple[int, BroadcastEvent], name: str, maxsize: int) -> None:
+        """Append to a bounded lane, dropping its oldest event when full."""
+        if len(lane) >= maxsize:
+            _, dropped = lane.popleft()
+            self._events_dropped += 1
+            self._dropped_by_lane[name] += 1
+            logger.warning(f"{name} lane full, dropped oldest event: {dropped.event_type.value}")
+        lane.append(item)
+    
+    def _pop(self) -> Optional[BroadcastEvent]:
+        """Next event: priority lane first, then the older of normal lane / candle slots."""
+        if self._priority:
+            return self._priority.popleft()[1]
+        if self._candle_slots:
+            first_key = next(iter(self._candle_slots))
+            if not self._normal or self._candle_slots[first_key][0] < self._normal[0][0]:
+                return self._candle_slots.pop(first_key)[1]
+        if self._normal:
+            return self._normal.popleft()[1]
+        return None
+    
+    def pending_count(self) -> int:
+        """Events waiting in all lanes."""
+        return len(self._priority) + len(self._normal) + len(self._candle_slots)
     
     def publish_candle_update(self, candle_data: Dict[str, Any], symbol: str = "btcusdt") -> bool:
         """Convenience method to publish 1m candle update."""
@@ -288,23 +365,32 @@ class EventBus:
         """
         while self._is_running:
             try:
-                # Wait for event from queue (async blocking)
-                # Timeout to allow periodic health checks
-                try:
-                    event: BroadcastEvent = await asyncio.wait_for(
-                        self._queue.get(),
-                        timeout=5.0  # Check every 5 seconds
-                    )
-                except asyncio.TimeoutError:
-                    # No events, continue loop
+                event = self._pop()
+                if event is None:
+                    # Wait for the next publish
+                    # Timeout to allow periodic health checks
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=5.0)
+                    except asyncio.TimeoutError:
+                        # No events, continue loop
+                        pass
                     continue
                 
+                probe = get_latency_probe()
+                if probe and event.enqueued_at is not None:
+                    picked = time.perf_counter()
+                    probe.record('bus_queue', picked - event.enqueued_at)
+                
                 # Broadcast to all connected clients
                 message = event.to_dict()
                 sent_count = await manager.broadcast(message, symbol=event.symbol)
                 
                 self._events_consumed += 1
-                self._queue.task_done()
+                if probe and event.enqueued_at is not None:
+                    probe.since('broadcast', picked)
+                    if event.ingress is not None:
+                        probe.since('end_to_end', event.ingress)
                 
                 if sent_count > 0:
                     logger.debug(f"Broadcast {event.event_type.value} to {sent_count} clients")
@@ -319,10 +405,17 @@ class EventBus:
     def get_statistics(self) -> Dict[str, Any]:
         """Get queue statistics."""
         return {
-            'queue_size': self._queue.qsize(),
+            'queue_size': self.pending_count(),
+            'lanes': {
+                'priority': len(self._priority),
+                'normal': len(self._normal),
+                'candle_slots': len(self._candle_slots)
+            },
             'events_published': self._events_published,
             'events_consumed': self._events_consumed,
             'events_dropped': self._events_dropped,
+            'events_coalesced': self._events_coalesced,
+            'dropped_by_lane': dict(self._dropped_by_lane),
             'worker_running': self._is_running,
             'loop_captured': self._loop is not None,
             'current_thread': threading.current_thread().name
@@ -0,0 +1,122 @@
+"""
+Event Loop Lag Monitor
+
+Measures how late the asyncio event loop runs its callbacks. Every
+`interval` seconds a sampler sleeps and records how much longer than
+requested the sleep took; that overshoot is the time some callback held
+the loop (synchronous SQLite, blocking HTTP, heavy CPU on the loop).
+
+The loop serves FastAPI, the WebSocket writers and the Binance tick
+handlers at once, so any stall shows up as lag here. Samples above
+`stall_threshold` are counted and logged with the slowest one.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(ordered: list, q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))
+    return ordered[index]
+
+
+class EventLoopLagMonitor:
+    """
+    Periodic sleep-drift sampler for the running event loop.
+
+    Usage:
+        monitor = get_loop_monitor()
+        await monitor.start()
+        ...
+        monitor.get_statistics()  # {'p50_ms': ..., 'p99_ms': ..., 'max_ms': ...}
+        await monitor.stop()
+    """
+
+    def __init__(self, interval: float = 0.1, window: int = 600, stall_threshold: float = 0.1):
+        """
+        Args:
+            interval: Seconds between samples
+            window: Samples kept for percentiles (600 x 0.1s = last minute)
+            stall_threshold: Lag in seconds counted (and logged) as a stall
+        """
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {
+            'samples': 0,
+            'stalls': 0,
+            'max_ms': 0.0,
+        }
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start sampling on the running loop (no-op if already running)."""
+        if self.is_running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info(f"⏱️ Event loop lag monitor started (every {self.interval * 1000:.0f}ms)")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, time.perf_counter() - expected))
+
+    def record(self, lag: float) -> None:
+        """Add one lag sample (seconds)."""
+        lag_ms = lag * 1000
+        self._samples.append(lag_ms)
+        self._stats['samples'] += 1
+        if lag_ms > self._stats['max_ms']:
+            self._stats['max_ms'] = round(lag_ms, 3)
+        if lag >= self.stall_threshold:
+            self._stats['stalls'] += 1
+            logger.warning(f"🐢 Event loop stalled for {lag_ms:.1f}ms")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Lag percentiles over the recent window plus lifetime totals (ms)."""
+        ordered = sorted(self._samples)
+        return {
+            **self._stats,
+            'running': self.is_running,
+            'interval_ms': self.interval * 1000,
+            'window_samples': len(ordered),
+            'last_ms': round(self._samples[-1], 3) if self._samples else 0.0,
+            'p50_ms': round(_percentile(ordered, 0.50), 3),
+            'p99_ms': round(_percentile(ordered, 0.99), 3),
+            'window_max_ms': round(ordered[-1], 3) if ordered else 0.0,
+        }
+
+
+# Global instance
+_loop_monitor: Optional[EventLoopLagMonitor] = None
+
+
+def get_loop_monitor() -> EventLoopLagMonitor:
+    """Get or create the global EventLoopLagMonitor instance."""
+    global _loop_monitor
+    if _loop_monitor is None:
+        _loop_monitor = EventLoopLagMonitor()
+    return _loop_monitor
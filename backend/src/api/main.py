@@ -8,8 +8,9 @@ from src.api.routers import system, market, settings, trades, signals, backtest,
 from src.api.routers.market import market_router
 from src.api.dependencies import get_realtime_service, get_container
 from src.api.event_bus import get_event_bus
+from src.api.loop_monitor import get_loop_monitor
 from src.api.websocket_manager import get_websocket_manager
-from src.config import MultiTokenConfig
+from src.config import MultiTokenConfig, StreamCaptureConfig
 from src.infrastructure.websocket.shared_binance_client import get_shared_binance_client
 
 # Configure logging
@@ -18,6 +19,7 @@ logger = logging.getLogger(__name__)
 
 # Multi-token configuration (loaded from env or defaults)
 multi_token_config = MultiTokenConfig()
+stream_capture_config = StreamCaptureConfig()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -29,6 +31,8 @@ async def lifespan(app: FastAPI):
     2. Create RealtimeService per symbol and register with SharedBinanceClient
     3. Start single SharedBinanceClient (1 WebSocket for ALL symbols)
     4. Start DataRetentionService
+    5. Migrate legacy candle tables in the background (if any)
+    6. Start the event loop lag monitor
     
     Benefits:
     - 1 WebSocket connection instead of 7 (no timeout issues)
@@ -55,13 +59,15 @@ async def lifespan(app: FastAPI):
     for symbol in multi_token_config.symbols:
         service = container.get_realtime_service(symbol.lower())
         service.set_event_bus(event_bus)
-        
-        # Start service in shared_client_mode (loads historical data, skips WebSocket)
-        await service.start(shared_client_mode=True)
-        
-        # Register service's candle handler with shared client
-        shared_client.register_handler(symbol.lower(), service.on_candle_update)
         services.append(service)
+    
+    # Start services in shared_client_mode (loads historical data, skips WebSocket).
+    # All symbols x timeframes are fetched concurrently over the pooled REST client.
+    await asyncio.gather(*(service.start(shared_client_mode=True) for service in services))
+    
+    # Register each service's candle handler with shared client
+    for symbol, service in zip(multi_token_config.symbols, services):
+        shared_client.register_handler(symbol.lower(), service.on_candle_update)
         logger.info(f"📝 Registered handler for {symbol}")
     
     # Store services in app state for shutdown
@@ -70,25 +76,67 @@ async def lifespan(app: FastAPI):
     
     # 4. SOTA: Start single combined WebSocket connection for ALL symbols
     # This is the key improvement - 1 connection instead of 7!
-    try:
-        await shared_client.connect()
-        logger.info(f"✅ SOTA: Combined Streams connected ({len(multi_token_config.symbols)} symbols × 3 timeframes = {len(multi_token_config.symbols) * 3} streams)")
-    except Exception as e:
-        logger.error(f"❌ Failed to connect shared client: {e}")
+    # (or replay a recorded capture through the same pipeline)
+    if stream_capture_config.replay_path:
+        async def replay_capture():
+            report = await shared_client.replay(stream_capture_config.replay_path, stream_capture_config.replay_speed)
+            logger.info(f"✅ Replay finished: {report}")
+        app.state.stream_replay = asyncio.create_task(replay_capture())
+        logger.info(f"▶️ Replaying {stream_capture_config.replay_path} (speed: {stream_capture_config.replay_speed or 'max'})")
+    else:
+        if stream_capture_config.record_path:
+            shared_client.start_recording(stream_capture_config.record_path)
+        try:
+            await shared_client.connect()
+            logger.info(f"✅ SOTA: Combined Streams connected ({len(multi_token_config.symbols)} symbols × 3 timeframes = {len(multi_token_config.symbols) * 3} streams)")
+        except Exception as e:
+            logger.error(f"❌ Failed to connect shared client: {e}")
     
     # 5. Start DataRetentionService (SOTA auto-cleanup)
     await retention_service.start()
     logger.info("✅ DataRetentionService started (auto-cleanup enabled)")
     
+    # 6. Copy legacy per-symbol candle tables into `candles` (online, chunked)
+    market_repo = container.get_market_data_repository()
+    if await asyncio.to_thread(market_repo.get_legacy_tables):
+        app.state.candle_migration = asyncio.create_task(asyncio.to_thread(market_repo.migrate_legacy_tables))
+        logger.info("📦 Migrating legacy candle tables in the background")
+    
+    # 7. Event loop lag (p50/p99/max, exposed on /ws/status)
+    loop_monitor = get_loop_monitor()
+    await loop_monitor.start()
+    
     logger.info("🎯 All services started successfully!")
     
     yield
     
     # Shutdown
     logger.info("Shutting down...")
+    await loop_monitor.stop()
     await retention_service.stop()
+    replay_task = getattr(app.state, 'stream_replay', None)
+    if replay_task:
+        replay_task.cancel()
     await shared_client.disconnect()
     await event_bus.stop_worker()
+    # Finish pending closed-candle signal batches, then stop the worker threads
+    indicator_pool = container.get_indicator_worker_pool()
+    await indicator_pool.drain()
+    indicator_pool.shutdown()
+    # Finish queued Paper Engine ticks/signals, then stop the order I/O thread
+    await asyncio.gather(*(service.drain_paper_pipeline() for service in services))
+    await asyncio.to_thread(container.get_order_repository().close)
+    # Stop the legacy table migration between chunks before the pool closes
+    candle_migration = getattr(app.state, 'candle_migration', None)
+    if candle_migration:
+        market_repo.stop_migration()
+        try:
+            await candle_migration
+        except Exception as e:
+            logger.error(f"Legacy candle migration failed: {e}")
+    # Drain the candle write-behind queue (blocking join, keep it off the loop)
+    await asyncio.to_thread(market_repo.close)
+    await container.get_rest_client().aclose()
     logger.info("✅ Shutdown complete")
 
 app = FastAPI(
@@ -61,7 +61,9 @@ async def run_backtest(request: BacktestRequest):
             loader=loader,
             simulator=simulator,
             trend_filter=trend_filter,
-            circuit_breaker=circuit_breaker
+            circuit_breaker=circuit_breaker,
+            indicator_engine=container.get_incremental_indicator_engine(),
+            mode=BacktestEngine.MODE_VECTORIZED if request.vectorized else BacktestEngine.MODE_STEP
         )
         
         # 4. Run Engine
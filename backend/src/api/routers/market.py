@@ -23,7 +23,9 @@ import logging
 
 from src.api.dependencies import get_realtime_service, get_realtime_service_for_symbol, get_market_data_repository
 from src.api.websocket_manager import get_websocket_manager, WebSocketManager
+from src.api.ws_protocol import negotiate_protocol
 from src.api.event_bus import get_event_bus
+from src.api.loop_monitor import get_loop_monitor
 from src.application.services.realtime_service import RealtimeService
 from src.infrastructure.persistence.sqlite_market_data_repository import SQLiteMarketDataRepository
 
@@ -60,6 +62,8 @@ async def websocket_stream(
     - Real-time candle data with indicators (VWAP, BB, StochRSI)
     - Signal notifications (via EventBus broadcast)
     - Graceful disconnect handling
+    - Optional compact binary/delta candle frames, negotiated with the
+      `hinto.compact.v1` subprotocol or `?protocol=compact` (JSON default)
     
     Architecture:
     - Client connects here and receives initial snapshot
@@ -75,7 +79,8 @@ async def websocket_stream(
     
     # Connect client to WebSocketManager
     # EventBus broadcast worker will automatically send updates to all connected clients
-    connection = await manager.connect(websocket, symbol.lower())
+    protocol, subprotocol = negotiate_protocol(websocket)
+    connection = await manager.connect(websocket, symbol.lower(), protocol=protocol, subprotocol=subprotocol)
     
     try:
         # Send initial data snapshot
@@ -110,7 +115,8 @@ async def websocket_stream(
                 'timestamp': current_signal.timestamp.isoformat() if hasattr(current_signal, 'timestamp') else None
             }
         
-        await websocket.send_text(json.dumps(initial_data))
+        # Through the client's send queue, so it stays ordered with broadcasts
+        await manager.send_to_client(connection.client_id, initial_data)
         logger.info(f"Client {connection.client_id} connected, initial snapshot sent")
         
         # Keep connection alive and handle client messages
@@ -126,7 +132,7 @@ async def websocket_stream(
                     msg_type = msg.get('type')
                     
                     if msg_type == 'ping':
-                        await websocket.send_text(json.dumps({'type': 'pong'}))
+                        await manager.send_to_client(connection.client_id, {'type': 'pong'})
                     
                     elif msg_type == 'subscribe':
                         # Client wants to change subscription
@@ -134,7 +140,7 @@ async def websocket_stream(
                         if new_symbol != connection.symbol:
                             # Disconnect from old, connect to new
                             await manager.disconnect(connection)
-                            connection = await manager.connect(websocket, new_symbol)
+                            connection = await manager.connect(websocket, new_symbol, protocol=protocol)
                             logger.info(f"Client resubscribed to {new_symbol}")
                     
                 except json.JSONDecodeError:
@@ -223,14 +229,17 @@ async def get_websocket_status():
     Get WebSocket manager status and statistics.
     
     Returns:
-        Connection statistics and active subscriptions
+        Connection statistics and active subscriptions, including
+        per-client send queue depth, drops and lag (websocket.clients),
+        and event loop lag percentiles (event_loop)
     """
     manager = get_websocket_manager()
     event_bus = get_event_bus()
     
     return {
         'websocket': manager.get_statistics(),
-        'event_bus': event_bus.get_statistics()
+        'event_bus': event_bus.get_statistics(),
+        'event_loop': get_loop_monitor().get_statistics()
     }
 
 
@@ -405,7 +414,7 @@ async def get_top_volume_tokens(
         
         # Use Futures API for more accurate volume data
         url = "https://fapi.binance.com/fapi/v1/ticker/24hr"
-        response = requests.get(url, timeout=10)
+        response = await asyncio.to_thread(requests.get, url, timeout=10)
         response.raise_for_status()
         
         data = response.json()
@@ -267,7 +267,7 @@ async def execute_signal(
     
     try:
         # Execute the trade
-        order_id = paper_service.execute_trade(signal=signal, symbol="BTCUSDT")
+        order_id = await paper_service.repo.run_io(paper_service.execute_trade, signal, "BTCUSDT")
         
         if order_id:
             # Link signal to order
@@ -273,7 +273,12 @@ async def debug_signal_check():
         
         # ADX
         if realtime_service.adx_calculator:
-            adx_result = realtime_service.adx_calculator.calculate_adx(candles_1m)
+            # Streaming ADX when the engine is in step with the 1m buffer
+            snapshot = realtime_service.get_indicator_snapshot('1m')
+            if snapshot is not None and snapshot.adx is not None and snapshot.matches(candles_1m):
+                adx_result = snapshot.adx
+            else:
+                adx_result = realtime_service.adx_calculator.calculate_adx(candles_1m)
             if adx_result:
                 result["indicators"]["adx"] = {
                     "value": adx_result.adx_value,
@@ -234,7 +234,8 @@ async def close_position(
     if current_price <= 0:
         return {"success": False, "error": f"Cannot determine current price for {position.symbol}"}
     
-    success = paper_service.close_position_by_id(position_id, current_price, "MANUAL_CLOSE")
+    # Runs on the paper engine's I/O thread, serialized with SL/TP matching
+    success = await paper_service.close_position_by_id_async(position_id, current_price, "MANUAL_CLOSE")
     
     return {
         "success": success,
@@ -290,27 +291,12 @@ async def cancel_pending_order(
     Returns:
         Success status and cancelled order details
     """
-    # Find the pending order
-    pending_orders = paper_service.repo.get_pending_orders()
-    target_order = None
-    
-    for order in pending_orders:
-        if order.id == order_id:
-            target_order = order
-            break
+    # Mark as CANCELLED and refund margin (serialized with tick matching)
+    target_order = await paper_service.repo.run_io(paper_service.cancel_pending_order, order_id)
     
     if not target_order:
         raise HTTPException(status_code=404, detail=f"Pending order not found: {order_id}")
     
-    # Mark as CANCELLED (or delete from DB)
-    target_order.status = 'CANCELLED'
-    target_order.exit_reason = 'USER_CANCELLED'
-    paper_service.repo.update_order(target_order)
-    
-    # Refund margin to balance
-    current_balance = paper_service.repo.get_account_balance()
-    paper_service.repo.update_account_balance(current_balance + target_order.margin)
-    
     logger.info(f"🚫 CANCELLED pending order: {target_order.side} {target_order.symbol} @ {target_order.entry_price:.2f}")
     
     return {
@@ -335,25 +321,12 @@ async def cancel_all_pending_orders(
     Returns:
         Number of orders cancelled and total refunded margin
     """
-    pending_orders = paper_service.repo.get_pending_orders()
+    # Cancel and refund all margin at once (serialized with tick matching)
+    cancelled_count, total_refund = await paper_service.repo.run_io(paper_service.cancel_all_pending_orders)
     
-    if not pending_orders:
+    if not cancelled_count:
         return {"success": True, "message": "No pending orders to cancel", "count": 0}
     
-    total_refund = 0.0
-    cancelled_count = 0
-    
-    for order in pending_orders:
-        order.status = 'CANCELLED'
-        order.exit_reason = 'USER_CANCELLED_ALL'
-        paper_service.repo.update_order(order)
-        total_refund += order.margin
-        cancelled_count += 1
-    
-    # Refund all margin at once
-    current_balance = paper_service.repo.get_account_balance()
-    paper_service.repo.update_account_balance(current_balance + total_refund)
-    
     logger.info(f"🚫 CANCELLED ALL {cancelled_count} pending orders, refunded ${total_refund:.2f}")
     
     return {
@@ -391,7 +364,7 @@ async def reset_account(
     
     Clears all trades and resets balance to initial value.
     """
-    paper_service.reset_account()
+    await paper_service.repo.run_io(paper_service.reset_account)
     return {"success": True, "message": "Account reset to $10,000"}
 
 
@@ -416,8 +389,6 @@ async def execute_pending(
     Returns:
         Execution result with fill price
     """
-    from datetime import datetime
-    
     # Get current price
     latest_candle = service.get_latest_data('1m')
     if not latest_candle or latest_candle.close <= 0:
@@ -426,46 +397,27 @@ async def execute_pending(
     current_price = latest_candle.close
     
     # Find the pending order
-    pending_orders = paper_service.repo.get_pending_orders()
-    target_order = None
-    
-    for order in pending_orders:
-        if order.id == position_id:
-            target_order = order
-            break
+    pending = paper_service.repo.get_order(position_id)
+    if not pending or pending.status != 'PENDING':
+        return {
+            "success": False, 
+            "error": f"PENDING order not found: {position_id}"
+        }
+    original_entry = pending.entry_price
     
+    # Execute at CURRENT price (market order), serialized with tick matching
+    target_order = await paper_service.fill_pending_at_market_async(position_id, current_price)
     if not target_order:
         return {
             "success": False, 
             "error": f"PENDING order not found: {position_id}"
         }
     
-    # Execute at CURRENT price (market order)
-    original_entry = target_order.entry_price
-    target_order.entry_price = current_price  # Fill at market price
-    target_order.status = 'OPEN'
-    target_order.open_time = datetime.now()
-    
-    # Recalculate liquidation price
-    if target_order.side == 'LONG':
-        target_order.liquidation_price = current_price - (target_order.margin / target_order.quantity)
-    else:
-        target_order.liquidation_price = current_price + (target_order.margin / target_order.quantity)
-    
-    paper_service.repo.update_order(target_order)
-    
     logger.info(
         f"✅ MARKET FILLED {target_order.side} {target_order.symbol} @ {current_price:.2f} "
         f"(was PENDING @ {original_entry:.2f})"
     )
     
-    # Trigger state machine callback
-    if paper_service.on_order_filled:
-        try:
-            paper_service.on_order_filled(target_order.id)
-        except Exception as e:
-            logger.error(f"Error in on_order_filled callback: {e}")
-    
     return {
         "success": True,
         "message": f"Order filled at market price",
@@ -539,10 +491,7 @@ async def simulate_signal(
     
     # Execute the simulated trade
     try:
-        position_id = paper_service.execute_trade(
-            signal=trading_signal,
-            symbol="BTCUSDT"
-        )
+        position_id = await paper_service.repo.run_io(paper_service.execute_trade, trading_signal, "BTCUSDT")
         
         if position_id:
             return {
@@ -19,6 +19,7 @@ class BacktestRequest(BaseModel):
     max_consecutive_losses: int = Field(3, description="CB Max Losses")
     cb_cooldown_hours: int = Field(4, description="CB Cooldown Hours")
     cb_drawdown_limit: float = Field(0.15, description="CB Portfolio Drawdown Limit")
+    vectorized: bool = Field(False, description="Precompute signals from NumPy columns (faster, same results)")
 
 class BacktestTradeResponse(BaseModel):
     trade_id: str
@@ -8,20 +8,67 @@ Manages WebSocket connections with:
 - Connection tracking with graceful disconnect handling
 - Pub/Sub broadcast mechanism from Trading Engine to connected clients
 - Graceful handling of WebSocketDisconnect without crashing
+
+Broadcast pipeline (compute once, fan out many):
+- Each event is serialized once (orjson when installed, else json) and the
+  same payload is handed to every subscriber
+- Every client owns a bounded send queue drained by its own writer task,
+  so a slow browser only delays itself
+- Candle updates for the same bar are coalesced (latest value wins) and a
+  full queue drops its oldest entry instead of blocking the broadcaster
+- Per-client queue depth, drops and enqueue-to-send lag are reported
+- Clients may negotiate the compact binary/delta protocol (ws_protocol.py);
+  JSON stays the default
 """
 
 import asyncio
-import json
 import logging
-from typing import Dict, List, Set, Optional, Callable, Any
+import time
+from collections import deque
+from typing import Deque, Dict, List, Set, Optional, Callable, Any, Hashable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from fastapi import WebSocket, WebSocketDisconnect
 
+from .ws_protocol import (
+    JSON_ENCODER,
+    STREAM_CODES,
+    EncodedEvent,
+    WireProtocol,
+)
+
 
 logger = logging.getLogger(__name__)
 
+# Message types where only the latest update of a bar matters
+COALESCE_TYPES = frozenset(STREAM_CODES)
+
+
+def coalesce_key(message: Dict[str, Any], symbol: Optional[str]) -> Optional[Hashable]:
+    """
+    Slot key for latest-value-wins delivery, or None if the message must
+    be delivered as is.
+
+    Candle updates share a slot per (type, symbol, bar open time), so a
+    newer tick of the same bar replaces a queued one while the final state
+    of the previous bar is never overwritten by the next bar.
+    """
+    msg_type = message.get('type')
+    if msg_type not in COALESCE_TYPES:
+        return None
+    return (msg_type, message.get('symbol', symbol), message.get('time', message.get('timestamp')))
+
+
+class _OutgoingMessage:
+    """Queued payload for one client."""
+    __slots__ = ('payload', 'key', 'enqueued_at')
+
+    def __init__(self, payload: EncodedEvent, key: Optional[Hashable], enqueued_at: float):
+        self.payload = payload
+        self.key = key
+        self.enqueued_at = enqueued_at
+
 
 class ConnectionState(Enum):
     """WebSocket connection states."""
@@ -41,6 +88,52 @@ class ClientConnection:
     state: ConnectionState = ConnectionState.CONNECTING
     message_count: int = 0
     last_message_at: Optional[datetime] = None
+    protocol: WireProtocol = WireProtocol.JSON
+    bytes_sent: int = 0
+    
+    # Send queue metrics
+    dropped_count: int = 0
+    coalesced_count: int = 0
+    max_queue_depth: int = 0
+    last_lag_ms: float = 0.0
+    avg_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+    
+    # Send queue state (owned by WebSocketManager)
+    _queue: Deque[_OutgoingMessage] = field(default_factory=deque, repr=False)
+    _slots: Dict[Hashable, _OutgoingMessage] = field(default_factory=dict, repr=False)
+    _wakeup: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    _idle: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    _writer_task: Optional[asyncio.Task] = field(default=None, repr=False)
+    # Compact protocol: last seq sent per candle stream (delta base)
+    _stream_seq: Dict[Tuple[int, str], int] = field(default_factory=dict, repr=False)
+    
+    @property
+    def queue_depth(self) -> int:
+        """Messages waiting to be sent to this client."""
+        return len(self._queue)
+    
+    def record_lag(self, lag_ms: float) -> None:
+        """Track enqueue-to-send latency (EMA for the average)."""
+        self.last_lag_ms = lag_ms
+        self.avg_lag_ms = lag_ms if self.message_count <= 1 else self.avg_lag_ms * 0.9 + lag_ms * 0.1
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+    
+    def lag_stats(self) -> Dict[str, Any]:
+        """Send queue metrics for /ws/status."""
+        return {
+            'client_id': self.client_id,
+            'symbol': self.symbol,
+            'protocol': self.protocol.value,
+            'bytes_sent': self.bytes_sent,
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'dropped': self.dropped_count,
+            'coalesced': self.coalesced_count,
+            'lag_ms': round(self.last_lag_ms, 3),
+            'avg_lag_ms': round(self.avg_lag_ms, 3),
+            'max_lag_ms': round(self.max_lag_ms, 3),
+        }
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for status reporting."""
@@ -50,7 +143,8 @@ class ClientConnection:
             'connected_at': self.connected_at.isoformat(),
             'state': self.state.value,
             'message_count': self.message_count,
-            'last_message_at': self.last_message_at.isoformat() if self.last_message_at else None
+            'last_message_at': self.last_message_at.isoformat() if self.last_message_at else None,
+            **self.lag_stats()
         }
 
 
@@ -62,6 +156,7 @@ class WebSocketManager:
     - Connection tracking per symbol (topic)
     - Graceful disconnect handling
     - Broadcast to all clients or by symbol
+    - Per-client bounded send queue + writer task
     - Thread-safe operations
     - Connection statistics
     
@@ -71,7 +166,13 @@ class WebSocketManager:
     - Topics: Symbol names (e.g., 'btcusdt')
     """
     
-    def __init__(self):
+    def __init__(self, max_queue_size: int = 256):
+        """
+        Args:
+            max_queue_size: Pending messages per client before the oldest is dropped
+        """
+        self.max_queue_size = max_queue_size
+        
         # Connections by symbol (topic) - using Dict[client_id, ClientConnection]
         self._connections: Dict[str, Dict[str, ClientConnection]] = {}
         
@@ -85,6 +186,17 @@ class WebSocketManager:
         self._total_connections = 0
         self._total_disconnections = 0
         self._total_messages_sent = 0
+        self._total_broadcasts = 0
+        self._total_dropped = 0
+        self._total_coalesced = 0
+        self._total_bytes_sent = 0
+        
+        # Encode cost per form: {'json' | 'keyframe' | 'delta': [count, seconds]}
+        self._encode_stats: Dict[str, List[float]] = {}
+        
+        # Candle streams: (code, symbol) -> last broadcast EncodedEvent
+        self._streams: Dict[Tuple[int, str], EncodedEvent] = {}
+        self._compact_clients = 0
         
         # Callbacks for connection events
         self._on_connect_callbacks: List[Callable] = []
@@ -92,7 +204,14 @@ class WebSocketManager:
         
         logger.info("WebSocketManager initialized")
     
-    async def connect(self, websocket: WebSocket, symbol: str, client_id: Optional[str] = None) -> ClientConnection:
+    async def connect(
+        self,
+        websocket: WebSocket,
+        symbol: str,
+        client_id: Optional[str] = None,
+        protocol: WireProtocol = WireProtocol.JSON,
+        subprotocol: Optional[str] = None
+    ) -> ClientConnection:
         """
         Accept and register a new WebSocket connection.
         
@@ -100,6 +219,8 @@ class WebSocketManager:
             websocket: FastAPI WebSocket instance
             symbol: Symbol/topic to subscribe to
             client_id: Optional client identifier
+            protocol: Wire protocol for broadcasts (see ws_protocol.negotiate_protocol)
+            subprotocol: Subprotocol to accept in the handshake
             
         Returns:
             ClientConnection object
@@ -109,14 +230,18 @@ class WebSocketManager:
             client_id = f"{symbol}_{self._total_connections}_{datetime.now().timestamp()}"
         
         # Accept the WebSocket connection
-        await websocket.accept()
+        if subprotocol:
+            await websocket.accept(subprotocol=subprotocol)
+        else:
+            await websocket.accept()
         
         # Create connection object
         connection = ClientConnection(
             websocket=websocket,
             client_id=client_id,
             symbol=symbol,
-            state=ConnectionState.CONNECTED
+            state=ConnectionState.CONNECTED,
+            protocol=protocol
         )
         
         async with self._lock:
@@ -130,6 +255,11 @@ class WebSocketManager:
             
             # Update statistics
             self._total_connections += 1
+            if protocol is WireProtocol.COMPACT:
+                self._compact_clients += 1
+        
+        connection._idle.set()
+        connection._writer_task = asyncio.create_task(self._writer(connection))
         
         logger.info(f"Client connected: {client_id} for symbol {symbol}. "
                    f"Total connections: {len(self._all_connections)}")
@@ -168,6 +298,20 @@ class WebSocketManager:
             
             # Update statistics
             self._total_disconnections += 1
+            if connection.protocol is WireProtocol.COMPACT:
+                self._compact_clients -= 1
+        
+        # Stop the writer (unless it is the one disconnecting after a failed send)
+        writer = connection._writer_task
+        if writer is not None and writer is not asyncio.current_task() and not writer.done():
+            writer.cancel()
+            try:
+                await writer
+            except asyncio.CancelledError:
+                pass
+        connection._queue.clear()
+        connection._slots.clear()
+        connection._idle.set()
         
         connection.state = ConnectionState.DISCONNECTED
         
@@ -199,81 +343,187 @@ class WebSocketManager:
         """
         Broadcast message to connected clients.
         
+        The message is serialized once and queued for each recipient; the
+        per-client writer tasks do the actual sends, so this never waits
+        on a slow socket.
+        
         Args:
             message: Message dict to send
             symbol: Optional symbol to filter recipients (None = all)
             
         Returns:
-            Number of clients message was sent to
+            Number of clients the message was queued for
         """
-        json_message = json.dumps(message)
-        sent_count = 0
-        failed_connections: List[ClientConnection] = []
+        if symbol:
+            # Send to specific symbol subscribers
+            connections = self._connections.get(symbol)
+            if not connections:
+                return 0
+            connections = list(connections.values())
+        else:
+            # Send to all
+            connections = list(self._all_connections.values())
+        if not connections:
+            return 0
         
-        async with self._lock:
-            if symbol:
-                # Send to specific symbol subscribers
-                connections = list(self._connections.get(symbol, {}).values())
-            else:
-                # Send to all
-                connections = list(self._all_connections.values())
+        payload = self._prepare(message, symbol)
+        self._total_broadcasts += 1
         
+        key = coalesce_key(message, symbol)
+        now = time.monotonic()
+        queued_count = 0
         for connection in connections:
             if connection.state != ConnectionState.CONNECTED:
                 continue
-                
-            try:
-                await connection.websocket.send_text(json_message)
-                connection.message_count += 1
-                connection.last_message_at = datetime.now()
-                sent_count += 1
-                
-            except WebSocketDisconnect:
-                # Client disconnected - mark for cleanup
-                logger.debug(f"Client {connection.client_id} disconnected during broadcast")
-                failed_connections.append(connection)
-                
-            except Exception as e:
-                # Other errors - log and mark for cleanup
-                logger.warning(f"Error sending to {connection.client_id}: {e}")
-                failed_connections.append(connection)
-        
-        # Clean up failed connections
-        for conn in failed_connections:
-            await self.disconnect(conn)
-        
-        # Update statistics
-        self._total_messages_sent += sent_count
+            self._enqueue(connection, payload, key, now)
+            queued_count += 1
         
-        return sent_count
+        return queued_count
     
     async def send_to_client(self, client_id: str, message: Dict[str, Any]) -> bool:
         """
         Send message to a specific client.
         
+        Goes through the client's send queue so it stays ordered with
+        broadcasts; never coalesced.
+        
         Args:
             client_id: Target client ID
             message: Message to send
             
         Returns:
-            True if sent successfully
+            True if queued for a connected client
         """
         connection = self._all_connections.get(client_id)
         
         if not connection or connection.state != ConnectionState.CONNECTED:
             return False
         
+        self._enqueue(connection, EncodedEvent(message, stats=self._encode_stats), None, time.monotonic())
+        return True
+    
+    async def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Wait until every client's send queue has been drained.
+        
+        Returns:
+            False if the timeout expired first
+        """
+        waits = [conn._idle.wait() for conn in list(self._all_connections.values())]
+        if not waits:
+            return True
         try:
-            await connection.websocket.send_text(json.dumps(message))
-            connection.message_count += 1
-            connection.last_message_at = datetime.now()
+            await asyncio.wait_for(asyncio.gather(*waits), timeout)
             return True
-            
-        except Exception as e:
-            logger.warning(f"Error sending to {client_id}: {e}")
-            await self.disconnect(connection)
+        except asyncio.TimeoutError:
             return False
     
+    def _prepare(self, message: Dict[str, Any], symbol: Optional[str]) -> EncodedEvent:
+        """
+        Wrap a broadcast for lazy, encode-once delivery. Candle events get
+        the next seq of their stream and, when compact clients are
+        connected, the previous frame's values as delta base.
+        """
+        code = STREAM_CODES.get(message.get('type'))
+        if code is None:
+            return EncodedEvent(message, stats=self._encode_stats)
+        
+        stream = (code, message.get('symbol') or symbol or '')
+        last = self._streams.get(stream)
+        previous = last.values() if last is not None and self._compact_clients else None
+        event = EncodedEvent(
+            message,
+            symbol=stream[1],
+            code=code,
+            seq=last.seq + 1 if last is not None else 0,
+            previous=previous,
+            stats=self._encode_stats
+        )
+        self._streams[stream] = event
+        return event
+    
+    def _enqueue(
+        self,
+        connection: ClientConnection,
+        payload: EncodedEvent,
+        key: Optional[Hashable],
+        now: float
+    ) -> None:
+        """Queue a payload: coalesce into a pending slot, else append (dropping the oldest if full)."""
+        if key is not None:
+            pending = connection._slots.get(key)
+            if pending is not None:
+                pending.payload = payload
+                connection.coalesced_count += 1
+                self._total_coalesced += 1
+                return
+        
+        queue = connection._queue
+        if len(queue) >= self.max_queue_size:
+            oldest = queue.popleft()
+            if oldest.key is not None and connection._slots.get(oldest.key) is oldest:
+                del connection._slots[oldest.key]
+            connection.dropped_count += 1
+            self._total_dropped += 1
+        
+        entry = _OutgoingMessage(payload, key, now)
+        queue.append(entry)
+        if key is not None:
+            connection._slots[key] = entry
+        connection.max_queue_depth = max(connection.max_queue_depth, len(queue))
+        connection._idle.clear()
+        connection._wakeup.set()
+    
+    async def _writer(self, connection: ClientConnection) -> None:
+        """Per-client task: drain the send queue in order."""
+        queue = connection._queue
+        failed = False
+        try:
+            while connection.state == ConnectionState.CONNECTED:
+                if not queue:
+                    connection._idle.set()
+                    connection._wakeup.clear()
+                    await connection._wakeup.wait()
+                    continue
+                
+                entry = queue.popleft()
+                if entry.key is not None and connection._slots.get(entry.key) is entry:
+                    del connection._slots[entry.key]
+                
+                event = entry.payload
+                if connection.protocol is WireProtocol.COMPACT and event.code is not None:
+                    frame = event.compact(connection._stream_seq.get(event.stream))
+                    connection._stream_seq[event.stream] = event.seq
+                else:
+                    frame = event.text()
+                
+                try:
+                    if isinstance(frame, bytes):
+                        await connection.websocket.send_bytes(frame)
+                    else:
+                        await connection.websocket.send_text(frame)
+                except WebSocketDisconnect:
+                    # Client disconnected - clean up below
+                    logger.debug(f"Client {connection.client_id} disconnected during send")
+                    failed = True
+                    break
+                except Exception as e:
+                    logger.warning(f"Error sending to {connection.client_id}: {e}")
+                    failed = True
+                    break
+                
+                connection.message_count += 1
+                connection.last_message_at = datetime.now()
+                connection.record_lag((time.monotonic() - entry.enqueued_at) * 1000)
+                connection.bytes_sent += len(frame)
+                self._total_messages_sent += 1
+                self._total_bytes_sent += len(frame)
+        finally:
+            connection._idle.set()
+        
+        if failed:
+            await self.disconnect(connection)
+    
     def get_connection_count(self, symbol: Optional[str] = None) -> int:
         """
         Get number of active connections.
@@ -303,7 +553,21 @@ class WebSocketManager:
             'connections_by_symbol': {
                 symbol: len(conns) 
                 for symbol, conns in self._connections.items()
-            }
+            },
+            'broadcast': {
+                'encoder': JSON_ENCODER,
+                'events': self._total_broadcasts,
+                'bytes_sent': self._total_bytes_sent,
+                'compact_clients': self._compact_clients,
+                'encodes': {
+                    form: {'count': count, 'avg_us': round(seconds / count * 1e6, 2)}
+                    for form, (count, seconds) in self._encode_stats.items()
+                },
+                'max_queue_size': self.max_queue_size,
+                'dropped': self._total_dropped,
+                'coalesced': self._total_coalesced,
+            },
+            'clients': [conn.lag_stats() for conn in self._all_connections.values()]
         }
     
     def get_all_connections_info(self) -> List[Dict[str, Any]]:
@@ -0,0 +1,298 @@
+"""
+WebSocket Wire Protocols for the market feed
+
+JSON text frames stay the default. A client can opt into the compact
+protocol, either with the `hinto.compact.v1` subprotocol
+(Sec-WebSocket-Protocol) or with `?protocol=compact` on /ws/stream/{symbol}.
+
+Compact protocol:
+- Candle events (candle, candle_15m, candle_1h) are sent as packed binary
+  frames, with no key names, symbol, ISO timestamps or nested dicts
+- Consecutive ticks of a stream are delta-encoded: only the fields that
+  changed since the previous frame of that stream are sent
+- Everything else (snapshot, signals, state changes, pong) stays JSON text
+- Compression is permessage-deflate, negotiated by the ASGI server
+
+Frame layout (little-endian):
+    u8  kind        1 = keyframe, 2 = delta
+    u8  stream      0 = candle, 1 = candle_15m, 2 = candle_1h
+    u32 seq         per (stream, symbol), +1 per broadcast
+    u32 time        bar open time, unix seconds
+    u16 present     bit i set -> FIELDS[i] value follows as f64
+    u16 nulls       (delta only) bit i set -> FIELDS[i] became null
+    keyframe only:  u8 symbol length + ASCII symbol
+    f64 * popcount(present), in FIELDS order
+
+A delta applies to the frame with seq - 1. Each event is encoded at most
+once per form (JSON text, keyframe, delta). A client whose queue dropped or
+coalesced the previous frame gets the keyframe instead.
+"""
+
+import json
+import struct
+from time import perf_counter
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+JSON_ENCODER = 'orjson' if orjson is not None else 'json'
+
+COMPACT_SUBPROTOCOL = 'hinto.compact.v1'
+JSON_SUBPROTOCOL = 'hinto.json.v1'
+
+
+class WireProtocol(Enum):
+    """Per-connection wire format."""
+    JSON = "json"
+    COMPACT = "compact"
+
+
+# Candle message types -> compact stream code
+STREAM_CODES = {'candle': 0, 'candle_15m': 1, 'candle_1h': 2}
+STREAM_TYPES = {code: msg_type for msg_type, code in STREAM_CODES.items()}
+
+# Numeric candle fields, nested dicts flattened with '.'
+FIELDS = (
+    'open', 'high', 'low', 'close', 'volume', 'vwap', 'rsi',
+    'bollinger.upper_band', 'bollinger.middle_band', 'bollinger.lower_band',
+    'bollinger.bandwidth', 'bollinger.percent_b',
+)
+FIELD_INDEX = {name: i for i, name in enumerate(FIELDS)}
+
+# Envelope keys carried by the header (or implied by `time`)
+_ENVELOPE_KEYS = frozenset({'type', 'symbol', 'timestamp', 'time'})
+
+KIND_KEYFRAME = 1
+KIND_DELTA = 2
+_HEADER = struct.Struct('<BBIIHH')
+_U32 = 2 ** 32
+
+FlatValues = List[Optional[float]]
+
+
+def encode_message(message: Dict[str, Any]) -> str:
+    """
+    Serialize a message once for all recipients.
+
+    Uses orjson when available (NaN/Inf become null); anything orjson
+    cannot encode falls back to the standard json module.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        except TypeError:
+            pass
+    return json.dumps(message)
+
+
+def negotiate_protocol(websocket) -> Tuple[WireProtocol, Optional[str]]:
+    """
+    Pick the wire protocol for a connecting client.
+
+    Returns:
+        (protocol, subprotocol to echo in the handshake or None)
+    """
+    requested = websocket.scope.get('subprotocols') or []
+    if COMPACT_SUBPROTOCOL in requested:
+        return WireProtocol.COMPACT, COMPACT_SUBPROTOCOL
+    if JSON_SUBPROTOCOL in requested:
+        return WireProtocol.JSON, JSON_SUBPROTOCOL
+    if websocket.query_params.get('protocol') == WireProtocol.COMPACT.value:
+        return WireProtocol.COMPACT, None
+    return WireProtocol.JSON, None
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def flatten_candle(message: Dict[str, Any]) -> Optional[FlatValues]:
+    """
+    Candle message -> values in FIELDS order (None = null/absent).
+
+    Returns None if the message has anything the compact frame cannot
+    carry; such events go out as JSON.
+    """
+    values: FlatValues = [None] * len(FIELDS)
+    for key, value in message.items():
+        if key in _ENVELOPE_KEYS:
+            continue
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                index = FIELD_INDEX.get(f"{key}.{sub_key}")
+                if index is None or not (sub_value is None or _is_number(sub_value)):
+                    return None
+                values[index] = sub_value
+        elif value is None:
+            if key not in FIELD_INDEX and key != 'bollinger':
+                return None
+        else:
+            index = FIELD_INDEX.get(key)
+            if index is None or not _is_number(value):
+                return None
+            values[index] = value
+
+    bar_time = message.get('time')
+    if not _is_number(bar_time) or not 0 <= bar_time < _U32:
+        return None
+    return values
+
+
+def encode_keyframe(code: int, seq: int, bar_time: int, symbol: str, values: FlatValues) -> bytes:
+    """Full state of a stream."""
+    present = 0
+    payload = []
+    for i, value in enumerate(values):
+        if value is not None:
+            present |= 1 << i
+            payload.append(value)
+    name = symbol.encode('ascii')
+    return b''.join((
+        _HEADER.pack(KIND_KEYFRAME, code, seq % _U32, int(bar_time), present, 0),
+        bytes((len(name),)), name,
+        struct.pack(f'<{len(payload)}d', *payload),
+    ))
+
+
+def encode_delta(code: int, seq: int, bar_time: int, values: FlatValues, previous: FlatValues) -> bytes:
+    """Fields that changed since the previous frame of the stream."""
+    present = 0
+    nulls = 0
+    payload = []
+    for i, (value, before) in enumerate(zip(values, previous)):
+        if value == before:
+            continue
+        if value is None:
+            nulls |= 1 << i
+        else:
+            present |= 1 << i
+            payload.append(value)
+    return _HEADER.pack(KIND_DELTA, code, seq % _U32, int(bar_time), present, nulls) + \
+        struct.pack(f'<{len(payload)}d', *payload)
+
+
+class EncodedEvent:
+    """
+    One outgoing message, encoded lazily and at most once per form.
+
+    Shared by every recipient; candle events also carry their stream
+    position so compact clients can get a delta or a keyframe.
+    """
+    __slots__ = ('message', 'symbol', 'code', 'seq', 'previous', '_values', '_text', '_keyframe', '_delta', '_stats')
+
+    def __init__(
+        self,
+        message: Dict[str, Any],
+        symbol: Optional[str] = None,
+        code: Optional[int] = None,
+        seq: int = 0,
+        previous: Optional[FlatValues] = None,
+        stats: Optional[Dict[str, List[float]]] = None
+    ):
+        self.message = message
+        self.symbol = symbol
+        self.code = code
+        self.seq = seq
+        self.previous = previous
+        self._values: Any = False  # False = not flattened yet
+        self._text: Optional[str] = None
+        self._keyframe: Optional[bytes] = None
+        self._delta: Optional[bytes] = None
+        self._stats = stats
+
+    @property
+    def stream(self) -> Optional[Tuple[int, str]]:
+        return (self.code, self.symbol) if self.code is not None else None
+
+    def values(self) -> Optional[FlatValues]:
+        """Flattened candle fields (None if not compact-encodable)."""
+        if self._values is False:
+            self._values = flatten_candle(self.message) if self.code is not None else None
+        return self._values
+
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self._timed('json', encode_message, self.message)
+        return self._text
+
+    def compact(self, last_seq: Optional[int]) -> Union[str, bytes]:
+        """
+        Frame for a compact client whose last frame of this stream had
+        `last_seq`: delta if it directly precedes this event, else keyframe.
+        Non-candle or non-encodable events fall back to JSON text.
+        """
+        values = self.values()
+        if values is None:
+            return self.text()
+        bar_time = self.message['time']
+        if self.previous is not None and last_seq == (self.seq - 1) % _U32:
+            if self._delta is None:
+                self._delta = self._timed('delta', encode_delta, self.code, self.seq, bar_time, values, self.previous)
+            return self._delta
+        if self._keyframe is None:
+            self._keyframe = self._timed('keyframe', encode_keyframe, self.code, self.seq, bar_time, self.symbol, values)
+        return self._keyframe
+
+    def _timed(self, form: str, encode, *args):
+        if self._stats is None:
+            return encode(*args)
+        started = perf_counter()
+        result = encode(*args)
+        entry = self._stats.setdefault(form, [0, 0.0])
+        entry[0] += 1
+        entry[1] += perf_counter() - started
+        return result
+
+
+class CompactFrameDecoder:
+    """
+    Reference decoder for compact frames (one per connection).
+
+    Rebuilds the candle message a JSON client would have received,
+    minus the ISO `timestamp` (derive it from `time`).
+    """
+
+    def __init__(self):
+        self._streams: Dict[int, Tuple[int, str, FlatValues]] = {}
+
+    def decode(self, frame: bytes) -> Dict[str, Any]:
+        kind, code, seq, bar_time, present, nulls = _HEADER.unpack_from(frame)
+        offset = _HEADER.size
+        if kind == KIND_KEYFRAME:
+            length = frame[offset]
+            symbol = frame[offset + 1:offset + 1 + length].decode('ascii')
+            offset += 1 + length
+            values: FlatValues = [None] * len(FIELDS)
+        elif kind == KIND_DELTA:
+            state = self._streams.get(code)
+            if state is None or state[0] != (seq - 1) % _U32:
+                raise ValueError(f"Delta frame seq {seq} for stream {code} has no base")
+            _, symbol, base = state
+            values = list(base)
+        else:
+            raise ValueError(f"Unknown frame kind {kind}")
+
+        count = bin(present).count('1')
+        numbers = iter(struct.unpack_from(f'<{count}d', frame, offset))
+        for i in range(len(FIELDS)):
+            if present >> i & 1:
+                values[i] = next(numbers)
+            elif nulls >> i & 1:
+                values[i] = None
+        self._streams[code] = (seq, symbol, values)
+
+        message: Dict[str, Any] = {'type': STREAM_TYPES[code], 'symbol': symbol, 'time': bar_time}
+        for name, value in zip(FIELDS, values):
+            if value is None:
+                continue
+            if '.' in name:
+                parent, child = name.split('.', 1)
+                message.setdefault(parent, {})[child] = value
+            else:
+                message[name] = value
+        return message
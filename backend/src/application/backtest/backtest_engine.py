@@ -3,6 +3,11 @@ BacktestEngine - Application Layer
 
 The orchestrator for backtesting trading strategies.
 SOTA Feature: Multi-Timeframe Synchronization (15m + H4) with Pointer Optimization.
+
+Modes:
+- STEP: calls SignalGenerator.generate_signal on the growing history every step.
+- VECTORIZED: precomputes every symbol's signals from NumPy columns up front;
+  the time loop only drives ExecutionSimulator and the circuit breaker.
 """
 
 import logging
@@ -14,27 +19,60 @@ from ...domain.entities.candle import Candle
 from ...domain.entities.trading_signal import TradingSignal
 from ..signals.signal_generator import SignalGenerator
 from .execution_simulator import ExecutionSimulator
+from .vectorized_signals import VectorizedSignalPrecomputer
 from ...domain.interfaces.i_historical_data_loader import IHistoricalDataLoader
+from ...domain.interfaces.i_incremental_indicator_engine import IIncrementalIndicatorEngine
 from ..analysis.trend_filter import TrendFilter
 from ..risk_management.circuit_breaker import CircuitBreaker
 
 
 class BacktestEngine:
+    MODE_STEP = "STEP"
+    MODE_VECTORIZED = "VECTORIZED"
+
     def __init__(
         self,
         signal_generator: SignalGenerator,
         loader: IHistoricalDataLoader,
         simulator: Optional[ExecutionSimulator] = None,
         trend_filter: Optional[TrendFilter] = None,
-        circuit_breaker: Optional[CircuitBreaker] = None
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        indicator_engine: Optional[IIncrementalIndicatorEngine] = None,
+        mode: str = MODE_STEP
     ):
+        if mode not in (self.MODE_STEP, self.MODE_VECTORIZED):
+            raise ValueError(f"Unknown backtest mode: {mode}")
+
         self.signal_generator = signal_generator
         self.loader = loader 
         self.simulator = simulator or ExecutionSimulator()
         self.trend_filter = trend_filter or TrendFilter(ema_period=200)
         self.circuit_breaker = circuit_breaker
+        # Optional streaming indicators: O(1) per candle instead of recomputing over full history
+        self.indicator_engine = indicator_engine
+        self.mode = mode
         self.logger = logging.getLogger(__name__)
 
+    def _precompute_signals(
+        self,
+        symbols: List[str],
+        ltf_timeline: Dict[datetime, Dict[str, Candle]],
+        ltf_ts_list: List[datetime],
+        warmup_candles: int
+    ) -> Dict[str, Dict[int, TradingSignal]]:
+        """Build each symbol's history in timeline order and precompute its signals."""
+        histories: Dict[str, List[Candle]] = {s: [] for s in symbols}
+        for ts in ltf_ts_list:
+            for sym, candle in ltf_timeline[ts].items():
+                histories.setdefault(sym, []).append(candle)
+        
+        precomputer = VectorizedSignalPrecomputer(self.signal_generator, warmup_candles)
+        precomputed = {sym: precomputer.precompute(sym, hist) for sym, hist in histories.items()}
+        self.logger.info(
+            f"⚡ Vectorized precompute: {sum(len(v) for v in precomputed.values())} candidate signals"
+        )
+        return precomputed
+
     async def run_portfolio(
         self,
         symbols: List[str],
@@ -63,6 +101,13 @@ class BacktestEngine:
         
         htf_ptr = 0 # Pointer for efficient HTF sync
         
+        vectorized = self.mode == self.MODE_VECTORIZED
+        precomputed: Dict[str, Dict[int, TradingSignal]] = {}
+        if vectorized:
+            precomputed = self._precompute_signals(symbols, ltf_timeline, ltf_ts_list, warmup_candles)
+        elif self.indicator_engine:
+            self.indicator_engine.reset()
+        
         # 2. Main Time Loop
         for i, ts in enumerate(ltf_ts_list):
             # A. Update HTF histories up to current timestamp
@@ -76,15 +121,18 @@ class BacktestEngine:
             current_ltf_map = ltf_timeline[ts]
             for sym, candle in current_ltf_map.items():
                 symbol_histories_ltf[sym].append(candle)
+                if self.indicator_engine and not vectorized:
+                    self.indicator_engine.update(sym, interval, candle)
             
-            # C. Determine Bias
+            # C. Determine Bias (unused by the Sniper, so the vectorized mode skips it)
             htf_bias_map = {}
-            for sym in symbols:
-                h_history = symbol_histories_htf.get(sym, [])
-                if len(h_history) >= 200:
-                    htf_bias_map[sym] = self.trend_filter.calculate_bias(h_history)
-                else:
-                    htf_bias_map[sym] = 'NEUTRAL'
+            if not vectorized:
+                for sym in symbols:
+                    h_history = symbol_histories_htf.get(sym, [])
+                    if len(h_history) >= 200:
+                        htf_bias_map[sym] = self.trend_filter.calculate_bias(h_history)
+                    else:
+                        htf_bias_map[sym] = 'NEUTRAL'
 
             # D. Update Simulator & Circuit Breaker Record
             self.simulator.update(current_ltf_map, ts)
@@ -120,9 +168,14 @@ class BacktestEngine:
                     if is_long_blocked and is_short_blocked:
                         continue
 
-                signal = self.signal_generator.generate_signal(
-                    symbol_histories_ltf[sym], sym, htf_bias=htf_bias_map.get(sym, 'NEUTRAL')
-                )
+                if vectorized:
+                    signal = precomputed[sym].get(len(symbol_histories_ltf[sym]) - 1)
+                else:
+                    snapshot = self.indicator_engine.get_snapshot(sym, interval) if self.indicator_engine else None
+                    signal = self.signal_generator.generate_signal(
+                        symbol_histories_ltf[sym], sym, htf_bias=htf_bias_map.get(sym, 'NEUTRAL'),
+                        indicator_snapshot=snapshot
+                    )
                 
                 if signal and signal.signal_type.value != 'neutral':
                     # Filter signal by CB
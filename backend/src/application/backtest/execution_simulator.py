@@ -6,6 +6,10 @@ SOTA Updates 2026.01.02:
 1. "Hardcore Reality Mode": Liquidation Logic & Tier 1 Vol Cap.
 2. Entry-based Leverage Calculation.
 3. Semantic Exit Reasoning.
+
+Bars are only walked for symbols whose order/position trigger levels
+(fill, liquidation, SL, TP1, breakeven, watermark) the bar's range
+crossed; see TriggerIndex.
 """
 
 import logging
@@ -16,6 +20,12 @@ from typing import List, Optional, Dict, Any
 
 from ...domain.entities.candle import Candle
 from ...domain.entities.trading_signal import TradingSignal, SignalType
+from ...domain.services.trigger_index import ABOVE, BELOW, Trigger, TriggerIndex
+
+
+# Relative widening of derived levels (float rounding of abs()/arithmetic)
+_LEVEL_TOLERANCE = 1e-9
+_ALWAYS = float('-inf')  # ABOVE -inf: crossed by every bar
 
 
 @dataclass
@@ -80,6 +90,9 @@ class ExecutionSimulator:
         self.trades: List[BacktestTrade] = []
         self.equity_curve: List[Dict[str, Any]] = []
         
+        # Levels at which a bar can change a symbol's order/position (group = symbol)
+        self._triggers = TriggerIndex()
+        
         self.logger = logging.getLogger(__name__)
 
     def process_batch_signals(self, signals: List[TradingSignal]):
@@ -144,10 +157,18 @@ class ExecutionSimulator:
             'atr': signal.indicators.get('atr', 0),
             'timestamp': signal.generated_at
         }
+        self._index_symbol(symbol)
 
     def update(self, candle_map: Dict[str, Candle], timestamp: datetime):
         for symbol, candle in candle_map.items():
+            # Symbols without orders/positions, or whose levels the bar
+            # did not reach, would come out of _process_symbol unchanged
+            high = max(candle.high, candle.open, candle.close)
+            low = min(candle.low, candle.open, candle.close)
+            if not self._triggers.crossed(symbol, high, low):
+                continue
             self._process_symbol(symbol, candle, timestamp)
+            self._index_symbol(symbol)
             
         unrealized_pnl = 0.0
         for sym, pos in self.positions.items():
@@ -191,6 +212,43 @@ class ExecutionSimulator:
                 if pos['entry_time'] == time: continue 
                 self._update_position_logic(pos, price, time, candle)
 
+    def _index_symbol(self, symbol: str) -> None:
+        """Re-register the trigger levels of a symbol's pending order and position."""
+        self._triggers.remove_group(symbol)
+
+        def add(name: str, level: float, direction: str) -> None:
+            self._triggers.add(Trigger((symbol, name), symbol, level, direction, group=symbol))
+
+        order = self.pending_orders.get(symbol)
+        if order is not None:
+            if order['type'] == 'MARKET':
+                add('fill', _ALWAYS, ABOVE)
+            elif order['type'] == 'LIMIT':
+                add('fill', order['target_price'], BELOW if order['side'] == 'LONG' else ABOVE)
+
+        pos = self.positions.get(symbol)
+        if pos is None:
+            return
+        is_long = pos['side'] == 'LONG'
+        toward_profit, toward_loss = (ABOVE, BELOW) if is_long else (BELOW, ABOVE)
+
+        add('liquidation', pos['liq_price'], toward_loss)
+        add('stop_loss', pos['stop_loss'], toward_loss)
+        add('watermark', pos['max_price'], toward_profit)
+        if pos['tp_hit_count'] == 0 and pos['tp_levels'].get('tp1'):
+            add('tp1', pos['tp_levels']['tp1'], toward_profit)
+        if not pos['is_breakeven']:
+            # |price - entry| >= initial_risk * R, on either side of the entry
+            distance = pos['initial_risk'] * self.breakeven_trigger_r
+            add('breakeven_up', (pos['entry_price'] + distance) * (1 - _LEVEL_TOLERANCE), ABOVE)
+            add('breakeven_down', (pos['entry_price'] - distance) * (1 + _LEVEL_TOLERANCE), BELOW)
+        if pos['tp_hit_count'] >= 1 and pos['atr'] > 0:
+            trail = pos['atr'] * self.trailing_stop_atr
+            trail_pending = pos['max_price'] - trail > pos['stop_loss'] if is_long \
+                else pos['max_price'] + trail < pos['stop_loss']
+            if trail_pending:
+                add('trailing', _ALWAYS, ABOVE)
+
     def _update_position_logic(self, pos, price, time, candle):
         side = pos['side']
         symbol = pos['symbol']
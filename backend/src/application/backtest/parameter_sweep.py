@@ -0,0 +1,790 @@
+"""
+Parameter Sweep / Walk-Forward Optimizer - Application Layer
+
+Runs many BacktestEngine backtests in parallel to tune ExecutionSimulator
+knobs (risk_per_trade, breakeven_trigger_r, trailing_stop_atr, max_positions,
+...) and SignalGenerator Sniper parameters.
+
+- Samplers: exhaustive grid, random, or Bayesian (Gaussian process + expected
+  improvement, NumPy only).
+- Candles are loaded once in the parent, packed into one shared-memory block
+  and attached by every ProcessPoolExecutor worker (no per-task pickling).
+  Workers read it through NumPy views and build Candle objects only for the
+  rows a backtest window touches.
+- Walk-forward: optimize on each train window, score the winner out of sample
+  on the following test window.
+- Every finished run is streamed to a SweepResultsStore, so an interrupted
+  sweep resumes where it stopped.
+
+Parameter names are ExecutionSimulator keyword arguments, or
+``signal.<ATTRIBUTE>`` for SignalGenerator attributes
+(e.g. ``signal.SNIPER_PROXIMITY``).
+"""
+
+import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import math
+import os
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ...domain.entities.candle import Candle
+from ...domain.entities.candle_store import CandleArrays, timestamp_to_ms
+from ...domain.interfaces.i_historical_data_loader import IHistoricalDataLoader
+from ..signals.signal_generator import SignalGenerator
+from .backtest_engine import BacktestEngine
+from .execution_simulator import ExecutionSimulator
+from .sweep_results_store import SweepResultsStore
+
+
+logger = logging.getLogger(__name__)
+
+# A dimension is either a list of discrete values or a (low, high) range
+ParameterSpace = Dict[str, Union[Sequence[Any], Tuple[float, float]]]
+
+SIGNAL_PARAM_PREFIX = "signal."
+
+INTERVAL_MINUTES = {
+    '1m': 1, '3m': 3, '5m': 5, '15m': 15, '30m': 30,
+    '1h': 60, '2h': 120, '4h': 240, '6h': 360, '8h': 480, '12h': 720,
+    '1d': 1440, '3d': 4320, '1w': 10080
+}
+
+OBJECTIVES = ('net_return_pct', 'sharpe', 'calmar', 'win_rate')
+
+
+# ----------------------------------------------------------------------
+# Parameter space & samplers
+
+
+def _is_range(values: Any) -> bool:
+    return isinstance(values, tuple) and len(values) == 2 and \
+        all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)
+
+
+def _normalize_choices(values: Sequence[Any]) -> List[Any]:
+    """Give every choice of a numeric dimension the same type (int or float)."""
+    values = list(values)
+    if not values:
+        raise ValueError("Parameter dimension has no values")
+    numeric = all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)
+    if numeric and not all(isinstance(v, int) for v in values):
+        return [float(v) for v in values]
+    return values
+
+
+class ParameterSampler(ABC):
+    """Proposes parameter sets; ask() returns [] when the budget is spent."""
+
+    def __init__(self, space: ParameterSpace):
+        if not space:
+            raise ValueError("Parameter space is empty")
+        self.space = {
+            name: values if _is_range(values) else _normalize_choices(values)
+            for name, values in space.items()
+        }
+        self.names = list(self.space)
+
+    @abstractmethod
+    def ask(self, n: int) -> List[Dict[str, Any]]:
+        pass
+
+    def tell(self, params: Dict[str, Any], score: float) -> None:
+        """Report a result (ignored by non-adaptive samplers)."""
+        pass
+
+
+class GridSampler(ParameterSampler):
+    """Cartesian product of all discrete dimensions."""
+
+    def __init__(self, space: ParameterSpace):
+        super().__init__(space)
+        ranges = [name for name, values in self.space.items() if _is_range(values)]
+        if ranges:
+            raise ValueError(f"Grid sampling needs discrete values, got ranges for: {ranges}")
+        self._iterator = itertools.product(*(self.space[name] for name in self.names))
+
+    def __len__(self) -> int:
+        return math.prod(len(v) for v in self.space.values())
+
+    def ask(self, n: int) -> List[Dict[str, Any]]:
+        return [dict(zip(self.names, combo)) for combo in itertools.islice(self._iterator, n)]
+
+
+class RandomSampler(ParameterSampler):
+    """Independent uniform draws; integer ranges yield integers."""
+
+    def __init__(self, space: ParameterSpace, n_trials: int, seed: Optional[int] = None):
+        super().__init__(space)
+        self.n_trials = n_trials
+        self._rng = np.random.default_rng(seed)
+        self._issued = 0
+
+    def _draw(self) -> Dict[str, Any]:
+        params = {}
+        for name in self.names:
+            values = self.space[name]
+            if _is_range(values):
+                low, high = values
+                if isinstance(low, int) and isinstance(high, int):
+                    params[name] = int(self._rng.integers(low, high + 1))
+                else:
+                    params[name] = float(self._rng.uniform(low, high))
+            else:
+                params[name] = values[int(self._rng.integers(len(values)))]
+        return params
+
+    def ask(self, n: int) -> List[Dict[str, Any]]:
+        count = max(0, min(n, self.n_trials - self._issued))
+        self._issued += count
+        return [self._draw() for _ in range(count)]
+
+
+class BayesianSampler(RandomSampler):
+    """
+    Sequential model-based sampler.
+
+    The first `n_initial` trials are random; after that a Gaussian process
+    (RBF kernel on the unit cube) is fitted to the reported scores and the
+    candidate with the highest expected improvement is proposed. Batches use
+    the "kriging believer" trick: each pick is added with its predicted mean
+    before choosing the next.
+    """
+
+    def __init__(
+        self,
+        space: ParameterSpace,
+        n_trials: int,
+        seed: Optional[int] = None,
+        n_initial: int = 8,
+        n_candidates: int = 512,
+        length_scale: float = 0.25
+    ):
+        super().__init__(space, n_trials, seed)
+        self.n_initial = n_initial
+        self.n_candidates = n_candidates
+        self.length_scale = length_scale
+        self._x: List[np.ndarray] = []
+        self._y: List[float] = []
+
+    # Encoding between parameter dicts and the unit cube
+    def _encode(self, params: Dict[str, Any]) -> np.ndarray:
+        point = []
+        for name in self.names:
+            values, value = self.space[name], params[name]
+            if _is_range(values):
+                low, high = values
+                point.append((value - low) / (high - low) if high != low else 0.0)
+            else:
+                point.append(values.index(value) / (len(values) - 1) if len(values) > 1 else 0.0)
+        return np.array(point, dtype=np.float64)
+
+    def _decode(self, point: np.ndarray) -> Dict[str, Any]:
+        params = {}
+        for name, u in zip(self.names, point):
+            values = self.space[name]
+            if _is_range(values):
+                low, high = values
+                value = low + float(u) * (high - low)
+                if isinstance(low, int) and isinstance(high, int):
+                    value = int(round(value))
+                params[name] = value
+            else:
+                params[name] = values[int(round(float(u) * (len(values) - 1)))]
+        return params
+
+    def _kernel(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        sq_dist = ((a[:, None, :] - b[None, :, :]) ** 2).sum(axis=-1)
+        return np.exp(-0.5 * sq_dist / self.length_scale ** 2)
+
+    def _posterior(self, x_train, y_train, x_query):
+        k = self._kernel(x_train, x_train) + 1e-6 * np.eye(len(x_train))
+        chol = np.linalg.cholesky(k)
+        alpha = np.linalg.solve(chol.T, np.linalg.solve(chol, y_train))
+        k_star = self._kernel(x_query, x_train)
+        mean = k_star @ alpha
+        v = np.linalg.solve(chol, k_star.T)
+        var = np.clip(1.0 - (v ** 2).sum(axis=0), 1e-12, None)
+        return mean, np.sqrt(var)
+
+    def _standardized_scores(self) -> np.ndarray:
+        y = np.array(self._y, dtype=np.float64)
+        finite = np.isfinite(y)
+        if not finite.any():
+            return np.zeros_like(y)
+        worst = y[finite].min() - (y[finite].std() or 1.0)
+        y = np.where(finite, y, worst)
+        std = y.std() or 1.0
+        return (y - y.mean()) / std
+
+    def tell(self, params: Dict[str, Any], score: float) -> None:
+        self._x.append(self._encode(params))
+        self._y.append(float(score))
+
+    def ask(self, n: int) -> List[Dict[str, Any]]:
+        count = max(0, min(n, self.n_trials - self._issued))
+        if count == 0:
+            return []
+        if len(self._y) < self.n_initial:
+            return super().ask(count)
+
+        self._issued += count
+        x_train = np.array(self._x)
+        y_train = self._standardized_scores()
+        proposals = []
+        for _ in range(count):
+            candidates = self._rng.uniform(size=(self.n_candidates, len(self.names)))
+            mean, std = self._posterior(x_train, y_train, candidates)
+            improvement = mean - y_train.max() - 0.01
+            z = improvement / std
+            cdf = 0.5 * (1.0 + np.vectorize(math.erf)(z / math.sqrt(2.0)))
+            pdf = np.exp(-0.5 * z ** 2) / math.sqrt(2.0 * math.pi)
+            expected_improvement = improvement * cdf + std * pdf
+
+            best = candidates[int(np.argmax(expected_improvement))]
+            params = self._decode(best)
+            proposals.append(params)
+
+            believed, _ = self._posterior(x_train, y_train, best[None, :])
+            x_train = np.vstack([x_train, self._encode(params)])
+            y_train = np.append(y_train, believed[0])
+        return proposals
+
+
+def make_sampler(
+    kind: str,
+    space: ParameterSpace,
+    n_trials: int = 50,
+    seed: Optional[int] = None
+) -> ParameterSampler:
+    """Create a sampler by name: 'grid', 'random' or 'bayesian'."""
+    if kind == 'grid':
+        return GridSampler(space)
+    if kind == 'random':
+        return RandomSampler(space, n_trials, seed)
+    if kind == 'bayesian':
+        return BayesianSampler(space, n_trials, seed)
+    raise ValueError(f"Unknown sampler: {kind}")
+
+
+# ----------------------------------------------------------------------
+# Walk-forward windows
+
+
+@dataclass
+class WalkForwardWindow:
+    index: int
+    train_start: datetime
+    train_end: datetime
+    test_start: datetime
+    test_end: datetime
+
+
+@dataclass
+class WalkForwardConfig:
+    train_days: int
+    test_days: int
+    step_days: Optional[int] = None   # default: test_days (non-overlapping test windows)
+    anchored: bool = False            # True: train window always starts at the first candle
+
+
+def walk_forward_windows(
+    start: datetime,
+    end: datetime,
+    config: WalkForwardConfig
+) -> List[WalkForwardWindow]:
+    """
+    Split [start, end] into consecutive train/test windows.
+
+    Windows are half-open in practice: each test window starts right after
+    its train window ends, and the last window must fit entirely in range.
+    """
+    train = timedelta(days=config.train_days)
+    test = timedelta(days=config.test_days)
+    step = timedelta(days=config.step_days or config.test_days)
+
+    windows = []
+    offset = timedelta(0)
+    while True:
+        train_start = start if config.anchored else start + offset
+        train_end = start + offset + train
+        test_end = train_end + test
+        if test_end > end:
+            break
+        windows.append(WalkForwardWindow(
+            index=len(windows),
+            train_start=train_start,
+            train_end=train_end - timedelta(microseconds=1),
+            test_start=train_end,
+            test_end=test_end - timedelta(microseconds=1)
+        ))
+        offset += step
+    return windows
+
+
+# ----------------------------------------------------------------------
+# Shared-memory candle data
+
+
+@dataclass
+class SharedCandleSpec:
+    """Picklable description of a SharedCandleBlock for worker processes."""
+    shm_name: str
+    rows: int
+    symbols: List[str]
+    offsets: List[int]
+    tz_aware: bool
+
+
+class SharedCandleBlock:
+    """
+    All symbols' candles packed into one float64 shared-memory array.
+
+    Stored column-major, shape (6, rows): timestamp (epoch ms, as in
+    CandleArrays), open, high, low, close, volume. Rows of one symbol are
+    contiguous; offsets[i]:offsets[i+1] selects symbol i, so arrays() hands
+    out contiguous column views without copying.
+    """
+
+    COLUMNS = 6
+
+    def __init__(self, shm: shared_memory.SharedMemory, spec: SharedCandleSpec, owner: bool):
+        self._shm = shm
+        self.spec = spec
+        self._owner = owner
+
+    @classmethod
+    def create(cls, candles_by_symbol: Dict[str, List[Candle]]) -> 'SharedCandleBlock':
+        symbols = list(candles_by_symbol)
+        offsets = [0]
+        for sym in symbols:
+            offsets.append(offsets[-1] + len(candles_by_symbol[sym]))
+        rows = offsets[-1]
+
+        first = next((c for sym in symbols for c in candles_by_symbol[sym]), None)
+        tz_aware = bool(first and first.timestamp.tzinfo is not None)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(1, rows * cls.COLUMNS * 8))
+        data = np.ndarray((cls.COLUMNS, rows), dtype=np.float64, buffer=shm.buf)
+        for i, sym in enumerate(symbols):
+            block = [
+                (timestamp_to_ms(c.timestamp), c.open, c.high, c.low, c.close, c.volume)
+                for c in candles_by_symbol[sym]
+            ]
+            if block:
+                data[:, offsets[i]:offsets[i + 1]] = np.array(block, dtype=np.float64).T
+        del data
+
+        spec = SharedCandleSpec(shm.name, rows, symbols, offsets, tz_aware)
+        return cls(shm, spec, owner=True)
+
+    @classmethod
+    def attach(cls, spec: SharedCandleSpec) -> 'SharedCandleBlock':
+        return cls(shared_memory.SharedMemory(name=spec.shm_name), spec, owner=False)
+
+    def arrays(self) -> Dict[str, CandleArrays]:
+        """
+        Per-symbol column views into the shared block (no copy).
+
+        The views must be dropped before close(); workers keep the block
+        attached for their whole lifetime instead.
+        """
+        spec = self.spec
+        data = np.ndarray((self.COLUMNS, spec.rows), dtype=np.float64, buffer=self._shm.buf)
+        return {
+            sym: CandleArrays(*data[:, spec.offsets[i]:spec.offsets[i + 1]])
+            for i, sym in enumerate(spec.symbols)
+        }
+
+    def to_candles(self) -> Dict[str, List[Candle]]:
+        """Rebuild full Candle lists (copies; the block can be closed afterwards)."""
+        return {
+            sym: arrays.to_candles(tz=timezone.utc if self.spec.tz_aware else None)
+            for sym, arrays in self.arrays().items()
+        }
+
+    def close(self) -> None:
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> 'SharedCandleBlock':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class WindowedCandleLoader(IHistoricalDataLoader):
+    """
+    In-memory loader over preloaded candle columns.
+
+    Returns `warmup_bars` extra candles before start_time so a window's first
+    bar is already eligible for signals. Other intervals (e.g. the engine's
+    4h HTF request) return no data; the Sniper does not use HTF bias.
+
+    The window is found by binary search on the timestamp column and only
+    its rows become Candle objects; the last window per symbol is reused,
+    since the runs of one sweep phase share it.
+    """
+
+    def __init__(
+        self,
+        arrays_by_symbol: Dict[str, CandleArrays],
+        interval: str,
+        warmup_bars: int = 0,
+        tz_aware: bool = True
+    ):
+        self.arrays_by_symbol = arrays_by_symbol
+        self.interval = interval
+        self.warmup_bars = warmup_bars
+        self.tz_aware = tz_aware
+        self._windows: Dict[str, Tuple[int, int, List[Candle]]] = {}
+
+    def _window(self, sym: str, start_time: datetime, end_time: Optional[datetime]) -> List[Candle]:
+        arrays = self.arrays_by_symbol.get(sym)
+        if arrays is None:
+            return []
+        stamps = arrays.timestamp
+        lo = max(0, int(np.searchsorted(stamps, timestamp_to_ms(start_time), 'left')) - self.warmup_bars)
+        hi = int(np.searchsorted(stamps, timestamp_to_ms(end_time), 'right')) if end_time is not None else len(stamps)
+        cached = self._windows.get(sym)
+        if cached is None or cached[:2] != (lo, hi):
+            cached = (lo, hi, arrays.to_candles(lo, hi, timezone.utc if self.tz_aware else None))
+            self._windows[sym] = cached
+        return cached[2]
+
+    async def load_portfolio_data(
+        self,
+        symbols: List[str],
+        interval: str,
+        start_time: datetime,
+        end_time: Optional[datetime] = None
+    ) -> Dict[datetime, Dict[str, Candle]]:
+        if interval != self.interval:
+            return {}
+        timeline: Dict[datetime, Dict[str, Candle]] = {}
+        for sym in symbols:
+            for candle in self._window(sym, start_time, end_time):
+                timeline.setdefault(candle.timestamp, {})[sym] = candle
+        return {ts: timeline[ts] for ts in sorted(timeline)}
+
+
+# ----------------------------------------------------------------------
+# Worker side
+
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(spec: SharedCandleSpec, signal_generator_factory: Callable[[], SignalGenerator]) -> None:
+    # Stays attached for the worker's lifetime: the loaders read views into it
+    block = SharedCandleBlock.attach(spec)
+    _WORKER['block'] = block
+    _WORKER['arrays'] = block.arrays()
+    _WORKER['loaders'] = {}
+    _WORKER['factory'] = signal_generator_factory
+
+
+def _worker_loader(interval: str, warmup_bars: int) -> WindowedCandleLoader:
+    """Loader shared by the worker's tasks, so consecutive runs reuse their window's candles."""
+    key = (interval, warmup_bars)
+    loader = _WORKER['loaders'].get(key)
+    if loader is None:
+        loader = WindowedCandleLoader(_WORKER['arrays'], interval, warmup_bars, _WORKER['block'].spec.tz_aware)
+        _WORKER['loaders'][key] = loader
+    return loader
+
+
+def compute_run_metrics(
+    result: Dict[str, Any],
+    window_start: Optional[datetime],
+    bars_per_year: float
+) -> Dict[str, float]:
+    """Summary metrics of one backtest result (equity before window_start ignored)."""
+    stats = result.get('stats', {})
+    equity = [
+        point['balance'] for point in result.get('equity', [])
+        if window_start is None or point['time'] >= window_start
+    ]
+
+    max_drawdown_pct = 0.0
+    sharpe = 0.0
+    if len(equity) > 1:
+        curve = np.array(equity, dtype=np.float64)
+        peak = np.maximum.accumulate(curve)
+        max_drawdown_pct = float(((peak - curve) / peak).max() * 100)
+        returns = np.diff(curve) / curve[:-1]
+        if returns.std() > 0:
+            sharpe = float(returns.mean() / returns.std() * math.sqrt(bars_per_year))
+
+    net_return_pct = float(stats.get('net_return_pct', 0.0))
+    return {
+        'net_return_pct': net_return_pct,
+        'total_trades': int(stats.get('total_trades', 0)),
+        'win_rate': float(stats.get('win_rate', 0.0)),
+        'final_balance': float(stats.get('final_balance', 0.0)),
+        'max_drawdown_pct': max_drawdown_pct,
+        'sharpe': sharpe,
+        'calmar': net_return_pct / max_drawdown_pct if max_drawdown_pct > 0 else net_return_pct,
+    }
+
+
+def run_backtest_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one backtest inside a worker (module-level so it pickles)."""
+    started = time.perf_counter()
+    params = task['params']
+
+    generator = _WORKER['factory']()
+    sim_kwargs = dict(task['simulator_defaults'])
+    for name, value in params.items():
+        if name.startswith(SIGNAL_PARAM_PREFIX):
+            setattr(generator, name[len(SIGNAL_PARAM_PREFIX):], value)
+        else:
+            sim_kwargs[name] = value
+
+    engine = BacktestEngine(
+        signal_generator=generator,
+        loader=_worker_loader(task['interval'], task['warmup_candles'] - 1),
+        simulator=ExecutionSimulator(**sim_kwargs),
+        mode=task['engine_mode']
+    )
+    result = asyncio.run(engine.run_portfolio(
+        symbols=task['symbols'],
+        interval=task['interval'],
+        start_time=task['start'],
+        end_time=task['end'],
+        warmup_candles=task['warmup_candles']
+    ))
+    if 'error' in result:
+        result = {}
+
+    bars_per_year = 525600 / INTERVAL_MINUTES.get(task['interval'], 15)
+    metrics = compute_run_metrics(result, task['start'], bars_per_year)
+    score = metrics[task['objective']]
+    if metrics['total_trades'] < task['min_trades']:
+        score = float('-inf')
+
+    row = {
+        'run_key': task['run_key'],
+        'phase': task['phase'],
+        'window': task['window'],
+        'start': task['start'].isoformat(),
+        'end': task['end'].isoformat(),
+        'params_json': json.dumps(params, sort_keys=True),
+    }
+    row.update({f"param_{name}": value for name, value in params.items()})
+    row.update(metrics)
+    row['score'] = score
+    row['elapsed_sec'] = time.perf_counter() - started
+    return row
+
+
+# ----------------------------------------------------------------------
+# Runner
+
+
+@dataclass
+class SweepConfig:
+    symbols: List[str]
+    interval: str
+    start_time: datetime
+    end_time: datetime
+    space: ParameterSpace
+    sampler: str = 'grid'
+    n_trials: int = 50
+    seed: Optional[int] = 42
+    objective: str = 'net_return_pct'
+    min_trades: int = 0
+    simulator_defaults: Dict[str, Any] = field(default_factory=dict)
+    engine_mode: str = BacktestEngine.MODE_VECTORIZED
+    warmup_candles: int = 50
+    walk_forward: Optional[WalkForwardConfig] = None
+    max_workers: Optional[int] = None
+    batch_size: Optional[int] = None
+
+
+@dataclass
+class SweepReport:
+    rows: List[Dict[str, Any]]
+    best: Optional[Dict[str, Any]] = None                                   # best 'full' run
+    out_of_sample: List[Dict[str, Any]] = field(default_factory=list)      # one 'test' row per window
+    evaluated: int = 0                                                      # runs executed (not resumed)
+
+
+def run_key(phase: str, window: int, start: datetime, end: datetime, params: Dict[str, Any]) -> str:
+    payload = json.dumps(
+        {'phase': phase, 'window': window, 'start': start.isoformat(), 'end': end.isoformat(), 'params': params},
+        sort_keys=True
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def _best_row(rows: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    scored = [r for r in rows if r['score'] == r['score']]
+    return max(scored, key=lambda r: r['score']) if scored else None
+
+
+class ParameterSweepRunner:
+    """
+    Fan backtests out over a process pool.
+
+    Usage:
+        runner = ParameterSweepRunner(config, loader, build_signal_generator, "sweeps/run1.parquet")
+        report = await runner.run()
+
+    `signal_generator_factory` must be picklable (a module-level function),
+    since it is sent to the worker processes.
+    """
+
+    def __init__(
+        self,
+        config: SweepConfig,
+        loader: IHistoricalDataLoader,
+        signal_generator_factory: Callable[[], SignalGenerator],
+        results_path: Union[str, Path],
+        flush_every: int = 8
+    ):
+        if config.objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective: {config.objective} (choose from {OBJECTIVES})")
+        self.config = config
+        self.loader = loader
+        self.signal_generator_factory = signal_generator_factory
+        self.store = SweepResultsStore(results_path, flush_every=flush_every)
+        self.max_workers = config.max_workers or os.cpu_count() or 1
+        self.batch_size = config.batch_size or self.max_workers * 2
+        self._evaluated = 0
+        self.logger = logging.getLogger(__name__)
+
+    async def _load_candles(self) -> Dict[str, List[Candle]]:
+        cfg = self.config
+        timeline = await self.loader.load_portfolio_data(cfg.symbols, cfg.interval, cfg.start_time, cfg.end_time)
+        candles_by_symbol: Dict[str, List[Candle]] = {sym: [] for sym in cfg.symbols}
+        for ts in sorted(timeline):
+            for sym, candle in timeline[ts].items():
+                candles_by_symbol.setdefault(sym, []).append(candle)
+        return candles_by_symbol
+
+    def _make_task(self, phase: str, window: int, start: datetime, end: datetime, params: Dict[str, Any]) -> Dict[str, Any]:
+        cfg = self.config
+        return {
+            'run_key': run_key(phase, window, start, end, params),
+            'phase': phase,
+            'window': window,
+            'start': start,
+            'end': end,
+            'params': params,
+            'symbols': cfg.symbols,
+            'interval': cfg.interval,
+            'simulator_defaults': cfg.simulator_defaults,
+            'engine_mode': cfg.engine_mode,
+            'warmup_candles': cfg.warmup_candles,
+            'objective': cfg.objective,
+            'min_trades': cfg.min_trades,
+        }
+
+    async def _evaluate(
+        self,
+        pool: ProcessPoolExecutor,
+        phase: str,
+        window: int,
+        start: datetime,
+        end: datetime,
+        params_list: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+
+        async def evaluate_one(params: Dict[str, Any]) -> Dict[str, Any]:
+            task = self._make_task(phase, window, start, end, params)
+            cached = self.store.get(task['run_key'])
+            if cached is not None:
+                return cached
+            row = await loop.run_in_executor(pool, run_backtest_task, task)
+            self.store.append(row)
+            self._evaluated += 1
+            return row
+
+        return list(await asyncio.gather(*(evaluate_one(p) for p in params_list)))
+
+    async def _optimize(
+        self,
+        pool: ProcessPoolExecutor,
+        phase: str,
+        window: int,
+        start: datetime,
+        end: datetime
+    ) -> List[Dict[str, Any]]:
+        cfg = self.config
+        sampler = make_sampler(cfg.sampler, cfg.space, cfg.n_trials, cfg.seed)
+        rows: List[Dict[str, Any]] = []
+        while True:
+            batch = sampler.ask(self.batch_size)
+            if not batch:
+                break
+            batch_rows = await self._evaluate(pool, phase, window, start, end, batch)
+            for params, row in zip(batch, batch_rows):
+                sampler.tell(params, row['score'])
+            rows.extend(batch_rows)
+            best = _best_row(rows)
+            self.logger.info(
+                f"🔎 {phase}[{window}] {len(rows)} runs | best {cfg.objective}={best['score']:.4f}"
+                if best else f"🔎 {phase}[{window}] {len(rows)} runs"
+            )
+        return rows
+
+    def _bounds(self, candles_by_symbol: Dict[str, List[Candle]]) -> Tuple[datetime, datetime]:
+        """Data range, expressed in the same timezone-awareness as the candles."""
+        stamps = [c.timestamp for candles in candles_by_symbol.values() for c in candles]
+        if not stamps:
+            raise ValueError("No candles loaded for sweep")
+        return min(stamps), max(stamps)
+
+    async def run(self) -> SweepReport:
+        cfg = self.config
+        candles_by_symbol = await self._load_candles()
+        data_start, data_end = self._bounds(candles_by_symbol)
+        report = SweepReport(rows=[])
+
+        with SharedCandleBlock.create(candles_by_symbol) as block, ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(block.spec, self.signal_generator_factory)
+        ) as pool:
+            try:
+                if cfg.walk_forward is None:
+                    rows = await self._optimize(pool, 'full', 0, data_start, data_end)
+                    report.rows.extend(rows)
+                    report.best = _best_row(rows)
+                else:
+                    windows = walk_forward_windows(data_start, data_end, cfg.walk_forward)
+                    if not windows:
+                        raise ValueError("Data range too short for the walk-forward configuration")
+                    for w in windows:
+                        train_rows = await self._optimize(pool, 'train', w.index, w.train_start, w.train_end)
+                        report.rows.extend(train_rows)
+                        best = _best_row(train_rows)
+                        if best is None:
+                            continue
+                        params = json.loads(best['params_json'])
+                        test_rows = await self._evaluate(pool, 'test', w.index, w.test_start, w.test_end, [params])
+                        report.rows.extend(test_rows)
+                        report.out_of_sample.append(test_rows[0])
+                        self.logger.info(
+                            f"📈 Window {w.index}: in-sample {best['score']:.4f} → "
+                            f"out-of-sample {test_rows[0]['score']:.4f} ({params})"
+                        )
+            finally:
+                self.store.flush()
+
+        report.evaluated = self._evaluated
+        return report
@@ -0,0 +1,102 @@
+"""
+SweepResultsStore - Application Layer
+
+Append-only Parquet dataset for parameter-sweep results.
+
+Layout:
+  <path>/
+  ├── part-00000.parquet
+  ├── part-00001.parquet
+  └── ...
+
+Each flush writes a new part file (temp file + atomic rename), so a crash
+never leaves a half-written file behind and a restarted sweep can skip every
+run whose key is already on disk.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+class SweepResultsStore:
+    """
+    Streams sweep result rows to a Parquet dataset directory.
+
+    Usage:
+        store = SweepResultsStore("data/sweeps/run1.parquet")
+        if not store.has(run_key):
+            store.append(row)
+        store.flush()
+    """
+
+    KEY_COLUMN = "run_key"
+
+    def __init__(self, path: Union[str, Path], flush_every: int = 8):
+        """
+        Args:
+            path: Dataset directory (created if missing)
+            flush_every: Buffered rows before a part file is written
+        """
+        self.path = Path(path)
+        self.flush_every = max(1, flush_every)
+        self.logger = logging.getLogger(__name__)
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._buffer: List[Dict[str, Any]] = []
+        self._completed: Dict[str, Dict[str, Any]] = {}
+        self._next_part = 0
+        self._load_existing()
+
+    def _part_files(self) -> List[Path]:
+        return sorted(self.path.glob("part-*.parquet"))
+
+    def _load_existing(self) -> None:
+        """Index rows from previous (possibly interrupted) runs."""
+        for part in self._part_files():
+            try:
+                rows = pq.read_table(part).to_pylist()
+            except Exception as e:
+                self.logger.warning(f"Skipping unreadable results part {part.name}: {e}")
+                continue
+            for row in rows:
+                self._completed[row[self.KEY_COLUMN]] = row
+            self._next_part = max(self._next_part, int(part.stem.split("-")[1]) + 1)
+
+        if self._completed:
+            self.logger.info(f"♻️ Resuming sweep: {len(self._completed)} completed runs on disk")
+
+    def has(self, run_key: str) -> bool:
+        return run_key in self._completed
+
+    def get(self, run_key: str) -> Optional[Dict[str, Any]]:
+        return self._completed.get(run_key)
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """Buffer a finished run; writes a part file every `flush_every` rows."""
+        self._completed[row[self.KEY_COLUMN]] = row
+        self._buffer.append(row)
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows as a new part file."""
+        if not self._buffer:
+            return
+        final_path = self.path / f"part-{self._next_part:05d}.parquet"
+        tmp_path = final_path.with_suffix(".parquet.tmp")
+        pq.write_table(pa.Table.from_pylist(self._buffer), tmp_path)
+        os.replace(tmp_path, final_path)
+        self._next_part += 1
+        self._buffer = []
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """All completed rows (on disk and buffered)."""
+        return list(self._completed.values())
+
+    def __len__(self) -> int:
+        return len(self._completed)
@@ -0,0 +1,103 @@
+"""
+Vectorized Signal Precompute - Application Layer
+
+Computes Liquidity Sniper inputs (20-bar swing levels, day-anchored VWAP,
+Wilder ATR) for a symbol's whole history from CandleArrays in one pass,
+instead of calling SignalGenerator.generate_signal on a growing candle list
+at every backtest step.
+
+VWAP and ATR come from the same array paths the per-candle calculators use,
+so the precomputed signals equal the step-by-step ones.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from ...domain.entities.candle import Candle
+from ...domain.entities.candle_store import CandleArrays
+from ...domain.services.anchored_vwap import anchored_vwap
+from ...domain.entities.trading_signal import TradingSignal
+from ..signals.signal_generator import SignalGenerator
+
+
+def prior_window_extremes(low: np.ndarray, high: np.ndarray, lookback: int):
+    """
+    Min of lows / max of highs over the `lookback` bars BEFORE each bar.
+
+    Returns:
+        (swing_low, swing_high) arrays, NaN where fewer than `lookback` prior bars exist
+    """
+    n = len(low)
+    swing_low = np.full(n, np.nan)
+    swing_high = np.full(n, np.nan)
+    if n > lookback:
+        windows_low = np.lib.stride_tricks.sliding_window_view(low, lookback)
+        windows_high = np.lib.stride_tricks.sliding_window_view(high, lookback)
+        swing_low[lookback:] = windows_low[:n - lookback].min(axis=1)
+        swing_high[lookback:] = windows_high[:n - lookback].max(axis=1)
+    return swing_low, swing_high
+
+
+class VectorizedSignalPrecomputer:
+    """
+    Precompute Limit Sniper signals for every bar of a symbol's history.
+
+    Usage:
+        precomputer = VectorizedSignalPrecomputer(signal_generator)
+        signals = precomputer.precompute('BTCUSDT', candles)  # {bar_index: TradingSignal}
+    """
+
+    def __init__(self, signal_generator: SignalGenerator, warmup_candles: int = 50):
+        self.signal_generator = signal_generator
+        self.warmup_candles = warmup_candles
+
+    def precompute(self, symbol: str, candles: List[Candle]) -> Dict[int, TradingSignal]:
+        """
+        Compute signals for all bars in one pass.
+
+        Args:
+            symbol: Trading pair symbol
+            candles: Full chronological history of the symbol
+
+        Returns:
+            Dict mapping bar index -> TradingSignal (bars without a signal omitted)
+        """
+        generator = self.signal_generator
+        # generate_signal() never fires without an ATR calculator
+        if not candles or generator.atr_calculator is None:
+            return {}
+
+        arrays = CandleArrays.from_candles(candles)
+        lookback = generator.SNIPER_LOOKBACK
+        proximity = generator.SNIPER_PROXIMITY
+
+        swing_low, swing_high = prior_window_extremes(arrays.low, arrays.high, lookback)
+        vwap = anchored_vwap(arrays).vwap
+        atr = generator.atr_calculator.calculate_atr_series(arrays)
+
+        close = arrays.close
+        with np.errstate(invalid='ignore'):
+            dist_to_low = (close - swing_low) / swing_low
+            dist_to_high = (swing_high - close) / swing_high
+            candidates = ((dist_to_low > 0) & (dist_to_low < proximity)) | \
+                         ((dist_to_high > 0) & (dist_to_high < proximity))
+
+        first_bar = max(self.warmup_candles, generator.MIN_CANDLES, lookback + 1) - 1
+        candidates[:first_bar] = False
+
+        signals: Dict[int, TradingSignal] = {}
+        for i in np.flatnonzero(candidates).tolist():
+            vwap_value = float(vwap[i])
+            signal = generator.build_sniper_signal(
+                symbol=symbol,
+                generated_at=candles[i].timestamp,
+                current_price=candles[i].close,
+                swing_low=float(swing_low[i]),
+                swing_high=float(swing_high[i]),
+                vwap=vwap_value if vwap_value == vwap_value else None,
+                indicators={'atr': float(atr[i])}
+            )
+            if signal:
+                signals[i] = signal
+        return signals
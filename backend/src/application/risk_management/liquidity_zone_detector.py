@@ -34,6 +34,7 @@ from ...domain.interfaces import (
     LiquidityZone, 
     LiquidityZonesResult
 )
+from ...domain.services.swing_index import shared_swing_index
 
 
 logger = logging.getLogger(__name__)
@@ -126,8 +127,7 @@ class LiquidityZoneDetector(ILiquidityZoneDetector):
             zone_width = atr_value * self.zone_atr_multiplier
             
             # 1. Find swing highs and lows
-            swing_highs = self._find_swing_highs(candles, self.swing_lookback)
-            swing_lows = self._find_swing_lows(candles, self.swing_lookback)
+            swing_highs, swing_lows = self._find_swing_points(candles, self.swing_lookback)
             
             # 2. Detect stop loss clusters (below swing lows)
             sl_clusters = self._detect_stop_loss_clusters(
@@ -211,49 +211,17 @@ class LiquidityZoneDetector(ILiquidityZoneDetector):
         
         return np.mean(trs[-period:])
     
-    def _find_swing_highs(
+    def _find_swing_points(
         self,
         candles: List[Candle],
         lookback: int
-    ) -> List[Tuple[int, float]]:
-        """Find swing high points (local maxima)."""
-        swing_highs = []
-        
-        for i in range(lookback, len(candles) - lookback):
-            current_high = candles[i].high
-            is_swing = True
-            
-            for j in range(i - lookback, i + lookback + 1):
-                if j != i and candles[j].high >= current_high:
-                    is_swing = False
-                    break
-            
-            if is_swing:
-                swing_highs.append((i, current_high))
-        
-        return swing_highs
-    
-    def _find_swing_lows(
-        self,
-        candles: List[Candle],
-        lookback: int
-    ) -> List[Tuple[int, float]]:
-        """Find swing low points (local minima)."""
-        swing_lows = []
-        
-        for i in range(lookback, len(candles) - lookback):
-            current_low = candles[i].low
-            is_swing = True
-            
-            for j in range(i - lookback, i + lookback + 1):
-                if j != i and candles[j].low <= current_low:
-                    is_swing = False
-                    break
-            
-            if is_swing:
-                swing_lows.append((i, current_low))
-        
-        return swing_lows
+    ) -> Tuple[List[Tuple[int, float]], List[Tuple[int, float]]]:
+        """Find swing high and low points (local maxima/minima) from the shared swing index."""
+        highs, lows = shared_swing_index(lookback).pivots(candles)
+        return (
+            [(i, candles[i].high) for i in highs],
+            [(i, candles[i].low) for i in lows]
+        )
     
     def _detect_stop_loss_clusters(
         self,
@@ -15,7 +15,7 @@ Retention Policy:
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional
 
 from src.domain.repositories.market_data_repository import MarketDataRepository
@@ -114,37 +114,25 @@ class DataRetentionService:
                 # Wait a bit before retrying
                 await asyncio.sleep(300)  # 5 minutes
     
+    def _cutoffs(self) -> Dict[str, datetime]:
+        """Retention cutoff per timeframe (UTC, like stored candle times)."""
+        now = datetime.now(timezone.utc)
+        return {timeframe: now - timedelta(days=days) for timeframe, days in self._retention.items()}
+    
     async def _run_cleanup(self) -> None:
         """
         Execute cleanup for all timeframes and all symbols.
         
-        SOTA Multi-Symbol: Loops through all enabled symbols from config.
+        One indexed DELETE covers every stored symbol (including symbols
+        no longer enabled in config), run off the event loop.
         """
-        from src.config import MultiTokenConfig
-        
         self.logger.info("🧹 Starting retention cleanup...")
         
-        # SOTA: Get all enabled symbols from config
-        config = MultiTokenConfig()
-        symbols = [s.lower() for s in config.symbols]
-        
         total_deleted = 0
-        
-        for timeframe, days in self._retention.items():
-            for symbol in symbols:
-                try:
-                    cutoff = datetime.now() - timedelta(days=days)
-                    deleted = self._repository.delete_candles_before(timeframe, cutoff, symbol)
-                    
-                    if deleted > 0:
-                        self.logger.info(
-                            f"🧹 Cleaned {symbol}/{timeframe}: {deleted} candles "
-                            f"(older than {days} days)"
-                        )
-                        total_deleted += deleted
-                        
-                except Exception as e:
-                    self.logger.error(f"Failed to cleanup {symbol}/{timeframe}: {e}")
+        try:
+            total_deleted = await asyncio.to_thread(self._repository.delete_expired_candles, self._cutoffs())
+        except Exception as e:
+            self.logger.error(f"Failed to run retention cleanup: {e}")
         
         # Log database size after cleanup
         try:
@@ -160,25 +148,11 @@ class DataRetentionService:
         """
         Run cleanup synchronously (for testing or manual trigger).
         
-        SOTA Multi-Symbol: Cleans up all enabled symbols.
-        
         Returns:
             Total number of candles deleted
         """
-        from src.config import MultiTokenConfig
-        
-        config = MultiTokenConfig()
-        symbols = [s.lower() for s in config.symbols]
-        
-        total_deleted = 0
-        
-        for timeframe, days in self._retention.items():
-            for symbol in symbols:
-                try:
-                    cutoff = datetime.now() - timedelta(days=days)
-                    deleted = self._repository.delete_candles_before(timeframe, cutoff, symbol)
-                    total_deleted += deleted
-                except Exception as e:
-                    self.logger.error(f"Failed to cleanup {symbol}/{timeframe}: {e}")
-        
-        return total_deleted
+        try:
+            return self._repository.delete_expired_candles(self._cutoffs())
+        except Exception as e:
+            self.logger.error(f"Failed to run retention cleanup: {e}")
+            return 0
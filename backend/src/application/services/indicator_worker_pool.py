@@ -0,0 +1,219 @@
+"""
+IndicatorWorkerPool - Application Layer
+
+Shared worker pool for the per-symbol indicator/signal work that runs when
+a candle closes.
+
+Every RealtimeService used to run its signal pipeline inline in the
+SharedBinanceClient callback. With 20+ symbols closing at the same minute
+boundary that is 20+ back-to-back pipelines on the event loop. Instead:
+
+- Services submit a (compute, apply) job per closed candle, keyed by the
+  bar's close time (the boundary)
+- Jobs for one boundary are batched: the batch is dispatched once every
+  registered symbol has submitted, or `batch_window` seconds after the
+  first job, whichever comes first
+- compute() runs in a thread pool (NumPy/TA-Lib release the GIL), one
+  task per symbol running that symbol's jobs in order
+- apply() runs back on the event loop with the result, in submit order
+  per symbol
+- Batches run one at a time, so a symbol's jobs never overlap
+
+Per-boundary latency (batch wait, compute wall time, slowest job, submit to
+last apply) is kept for the status endpoints.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+
+@dataclass
+class _Job:
+    timeframe: str
+    compute: Callable[[], Any]
+    apply: Callable[[Any], None]
+
+
+@dataclass
+class _Batch:
+    boundary: datetime
+    first_submit: float
+    jobs: Dict[str, List[_Job]] = field(default_factory=dict)
+    handle: Optional[asyncio.TimerHandle] = None
+
+
+class IndicatorWorkerPool:
+    """
+    Boundary-batched thread pool for closed-candle indicator/signal work.
+
+    Usage:
+        pool = IndicatorWorkerPool()
+        pool.register_symbol('btcusdt')
+        pool.submit('btcusdt', '1m', close_time, compute=lambda: generate(...), apply=on_signal)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, batch_window: float = 0.25, history: int = 100):
+        """
+        Args:
+            max_workers: Worker threads (default: ThreadPoolExecutor's default)
+            batch_window: Max seconds to wait for the rest of a boundary's symbols
+            history: Number of per-boundary metric records kept
+        """
+        self.batch_window = batch_window
+        self.logger = logging.getLogger(__name__)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='indicator-worker')
+        self._symbols: set = set()
+        self._batches: Dict[datetime, _Batch] = {}
+        self._run_lock: Optional[asyncio.Lock] = None
+        self._tasks: set = set()
+
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._stats = {
+            'batches': 0,
+            'jobs': 0,
+            'errors': 0,
+            'inline_jobs': 0,
+        }
+
+    def register_symbol(self, symbol: str) -> None:
+        """Symbols expected at every boundary (a batch is complete once all have submitted)."""
+        self._symbols.add(symbol.lower())
+
+    def submit(
+        self,
+        symbol: str,
+        timeframe: str,
+        boundary: datetime,
+        compute: Callable[[], Any],
+        apply: Callable[[Any], None]
+    ) -> None:
+        """
+        Queue closed-candle work for `boundary`.
+
+        Must be called on the event loop thread. Without a running loop
+        (scripts, tests) the job runs inline.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._stats['inline_jobs'] += 1
+            self._run_inline(symbol, _Job(timeframe, compute, apply))
+            return
+
+        batch = self._batches.get(boundary)
+        if batch is None:
+            batch = _Batch(boundary=boundary, first_submit=time.perf_counter())
+            batch.handle = loop.call_later(self.batch_window, self._dispatch, boundary)
+            self._batches[boundary] = batch
+        batch.jobs.setdefault(symbol.lower(), []).append(_Job(timeframe, compute, apply))
+
+        if self._symbols and self._symbols.issubset(batch.jobs):
+            batch.handle.cancel()
+            self._dispatch(boundary)
+
+    async def drain(self) -> None:
+        """Dispatch pending batches now and wait for all running ones."""
+        for boundary in list(self._batches):
+            self._batches[boundary].handle.cancel()
+            self._dispatch(boundary)
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (pending compute calls finish first)."""
+        for batch in self._batches.values():
+            batch.handle.cancel()
+        self._batches.clear()
+        self._executor.shutdown(wait=True)
+
+    def _dispatch(self, boundary: datetime) -> None:
+        batch = self._batches.pop(boundary, None)
+        if batch is None:
+            return
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch, time.perf_counter()))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: _Batch, dispatched: float) -> None:
+        if self._run_lock is None:
+            self._run_lock = asyncio.Lock()
+
+        async with self._run_lock:
+            loop = asyncio.get_running_loop()
+            started = time.perf_counter()
+            futures = {
+                loop.run_in_executor(self._executor, self._compute_symbol, jobs): (symbol, jobs)
+                for symbol, jobs in batch.jobs.items()
+            }
+
+            slowest = 0.0
+            errors = 0
+            for future in asyncio.as_completed(list(futures)):
+                results = await future
+                for job, result, error, seconds in results:
+                    slowest = max(slowest, seconds)
+                    if error is not None:
+                        errors += 1
+                        continue
+                    try:
+                        job.apply(result)
+                    except Exception as e:
+                        errors += 1
+                        self.logger.error(f"Error applying {job.timeframe} result: {e}", exc_info=True)
+            finished = time.perf_counter()
+
+        job_count = sum(len(jobs) for jobs in batch.jobs.values())
+        self._stats['batches'] += 1
+        self._stats['jobs'] += job_count
+        self._stats['errors'] += errors
+        self._history.append({
+            'boundary': batch.boundary.isoformat(),
+            'symbols': len(batch.jobs),
+            'jobs': job_count,
+            'wait_ms': round((dispatched - batch.first_submit) * 1000, 3),
+            'compute_ms': round((finished - started) * 1000, 3),
+            'max_job_ms': round(slowest * 1000, 3),
+            'total_ms': round((finished - batch.first_submit) * 1000, 3),
+            'errors': errors,
+        })
+
+    def _compute_symbol(self, jobs: List[_Job]) -> List[Tuple[_Job, Any, Optional[Exception], float]]:
+        """Worker thread: one symbol's jobs, in order."""
+        results = []
+        for job in jobs:
+            started = time.perf_counter()
+            try:
+                result, error = job.compute(), None
+            except Exception as e:
+                result, error = None, e
+                self.logger.error(f"Error computing {job.timeframe} job: {e}", exc_info=True)
+            results.append((job, result, error, time.perf_counter() - started))
+        return results
+
+    def _run_inline(self, symbol: str, job: _Job) -> None:
+        try:
+            job.apply(job.compute())
+        except Exception as e:
+            self._stats['errors'] += 1
+            self.logger.error(f"Error in {symbol} {job.timeframe} job: {e}", exc_info=True)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Totals plus per-boundary latency records (newest last)."""
+        recent = list(self._history)
+        totals = [r['total_ms'] for r in recent]
+        return {
+            **self._stats,
+            'registered_symbols': len(self._symbols),
+            'pending_batches': len(self._batches),
+            'avg_total_ms': round(sum(totals) / len(totals), 3) if totals else 0.0,
+            'max_total_ms': max(totals) if totals else 0.0,
+            'last': recent[-1] if recent else None,
+            'recent': recent,
+        }
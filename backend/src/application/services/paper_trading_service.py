@@ -1,3 +1,5 @@
+import heapq
+import threading
 import uuid
 import json
 from datetime import datetime, timedelta
@@ -8,6 +10,7 @@ from src.domain.entities.trading_signal import TradingSignal, SignalType
 from src.domain.entities.portfolio import Portfolio
 from src.domain.entities.performance_metrics import PerformanceMetrics
 from src.domain.repositories.i_order_repository import IOrderRepository
+from src.domain.services.trigger_index import ABOVE, BELOW, Trigger, TriggerIndex
 # SOTA FIX: Import Market Repository for Price Oracle
 from src.infrastructure.persistence.sqlite_market_data_repository import SQLiteMarketDataRepository
 import logging
@@ -60,6 +63,12 @@ class PaperTradingService:
     DEFAULT_COOLDOWN_SECONDS = 300  # 5 minutes for normal exits
     REVERSAL_COOLDOWN_SECONDS = 600  # 10 minutes after SIGNAL_REVERSAL
     
+    # Matching rules
+    PENDING_TTL_SECONDS = 45 * 60  # 45 minutes (3 candles of 15m)
+    BREAKEVEN_ROE = 0.8            # ROE % that moves SL to entry
+    TRAILING_ROE = 1.2             # ROE % that activates the trailing stop
+    TRAILING_DISTANCE = 0.015      # Trail 1.5% behind the high/low watermark
+    
     def __init__(self, repository: IOrderRepository, market_data_repository: Optional[SQLiteMarketDataRepository] = None):
         self.repo = repository
         self.market_data_repo = market_data_repository
@@ -80,6 +89,22 @@ class PaperTradingService:
         self.on_order_filled: Optional[Callable[[str], None]] = None
         # Called when a position is closed (SL/TP/LIQ/MANUAL)
         self.on_position_closed: Optional[Callable[[str, str], None]] = None
+        
+        # Trigger index over the repository's live orders/positions (fill,
+        # exit and stop-adjustment levels), kept in sync through change
+        # notifications. Repositories without them are matched by scanning.
+        self._triggers = TriggerIndex()
+        self._trigger_lock = threading.RLock()
+        self._expiries: Dict[str, List[Tuple[datetime, str]]] = {}  # symbol -> heap of (deadline, order id)
+        self._deadlines: Dict[str, datetime] = {}
+        self._indexed = self.repo.add_listener(self._on_order_changed)
+        if self._indexed:
+            self._resync_triggers()
+        
+        # Serializes everything that changes orders, positions or the balance
+        # (tick matching and signals on the repository's I/O thread, manual
+        # actions from API handlers), so read-modify-write steps don't interleave.
+        self._book_lock = threading.RLock()
 
     def get_wallet_balance(self) -> float:
         """Get Wallet Balance (Total Deposited + Realized PnL)"""
@@ -209,6 +234,10 @@ class PaperTradingService:
         - Longer cooldown after SIGNAL_REVERSAL (10 min vs 5 min)
         - Allow position flip (close + open opposite direction)
         """
+        with self._book_lock:
+            self._handle_signal(signal, symbol)
+
+    def _handle_signal(self, signal: TradingSignal, symbol: str) -> None:
         # CRITICAL FIX: Per-symbol cooldown check
         symbol_key = symbol.lower()
         if symbol_key in self._cooldowns:
@@ -320,61 +349,150 @@ class PaperTradingService:
         self.repo.save_order(position)
         logger.info(f"⏳ PENDING {position.side} {position.symbol} @ {position.entry_price:.2f} | Size: ${position_size_usd:.2f}")
 
-    def close_position(self, position: PaperPosition, exit_price: float, reason: str) -> None:
+    def close_position(self, position: PaperPosition, exit_price: float, reason: str) -> bool:
         """
         Close a position and update Wallet Balance.
         
         CRITICAL FIX: Sets per-symbol cooldown based on exit reason.
-        """
-        pnl = position.calculate_unrealized_pnl(exit_price)
-        
-        position.status = 'CLOSED'
-        position.close_time = datetime.now()
-        position.realized_pnl = pnl
-        position.exit_reason = reason
-        
-        # Update DB
-        self.repo.update_order(position)
-        
-        # Update Wallet Balance
-        current_balance = self.repo.get_account_balance()
-        self.repo.update_account_balance(current_balance + pnl)
-        
-        # CRITICAL FIX: Set per-symbol cooldown based on exit reason
-        symbol_key = position.symbol.lower()
-        self._cooldowns[symbol_key] = datetime.now()
         
-        # Longer cooldown for reversals (indicates ranging market)
-        if reason == "SIGNAL_REVERSAL":
-            self._cooldown_durations[symbol_key] = self.REVERSAL_COOLDOWN_SECONDS
-        else:
-            self._cooldown_durations[symbol_key] = self.DEFAULT_COOLDOWN_SECONDS
+        Returns:
+            False (nothing changed) if the position is no longer OPEN in the
+            book, e.g. a manual close and an SL/TP hit racing for it
+        """
+        with self._book_lock:
+            current = self.repo.get_order(position.id)
+            if current is None or current.status != 'OPEN':
+                logger.info(f"Close skipped: position {position.id} is no longer open ({reason})")
+                return False
+            
+            pnl = position.calculate_unrealized_pnl(exit_price)
+            
+            position.status = 'CLOSED'
+            position.close_time = datetime.now()
+            position.realized_pnl = pnl
+            position.exit_reason = reason
+            
+            # Update DB
+            self.repo.update_order(position)
+            
+            # Update Wallet Balance
+            current_balance = self.repo.get_account_balance()
+            self.repo.update_account_balance(current_balance + pnl)
+            
+            # CRITICAL FIX: Set per-symbol cooldown based on exit reason
+            symbol_key = position.symbol.lower()
+            self._cooldowns[symbol_key] = datetime.now()
+            
+            # Longer cooldown for reversals (indicates ranging market)
+            if reason == "SIGNAL_REVERSAL":
+                self._cooldown_durations[symbol_key] = self.REVERSAL_COOLDOWN_SECONDS
+            else:
+                self._cooldown_durations[symbol_key] = self.DEFAULT_COOLDOWN_SECONDS
         
         logger.info(
             f"💰 CLOSED {position.side} | PnL: ${pnl:.2f} | Reason: {reason} | "
             f"Cooldown: {self._cooldown_durations.get(symbol_key, 300)}s"
         )
+        return True
 
     def close_position_by_id(self, position_id: str, current_price: float, reason: str = "MANUAL_CLOSE") -> bool:
         """Close a position by its ID"""
-        position = self.repo.get_order(position_id)
-        if position and position.status == 'OPEN':
-            self.close_position(position, current_price, reason)
-            
-            # ISSUE-001 Fix: Notify state machine of manual close
-            if self.on_position_closed:
-                try:
-                    self.on_position_closed(position_id, reason)
-                except Exception as e:
-                    logger.error(f"Error in on_position_closed callback: {e}")
-            return True
-        return False
+        events = self._close_by_id(position_id, current_price, reason)
+        # ISSUE-001 Fix: Notify state machine of manual close
+        self._notify_state_machine(events)
+        return bool(events)
+
+    async def close_position_by_id_async(
+        self, position_id: str, current_price: float, reason: str = "MANUAL_CLOSE"
+    ) -> bool:
+        """close_position_by_id() on the repository's I/O executor (ordered with tick matching)."""
+        events = await self.repo.run_io(self._close_by_id, position_id, current_price, reason)
+        self._notify_state_machine(events)
+        return bool(events)
+
+    def _close_by_id(self, position_id: str, current_price: float, reason: str) -> List[Tuple[str, tuple]]:
+        with self._book_lock:
+            position = self.repo.get_order(position_id)
+            if position and position.status == 'OPEN' and self.close_position(position, current_price, reason):
+                return [('on_position_closed', (position_id, reason))]
+        return []
 
     def reset_account(self) -> None:
         """Reset paper trading account and data"""
-        self.repo.reset_database()
+        with self._book_lock:
+            self.repo.reset_database()
         logger.info("🔄 PAPER TRADING RESET: Database cleared and balance reset to $10,000")
 
+    def cancel_pending_order(self, order_id: str, reason: str = 'USER_CANCELLED') -> Optional[PaperPosition]:
+        """
+        Cancel one PENDING order and refund its margin.
+        
+        Returns:
+            The cancelled order, or None if it is not (or no longer) pending
+        """
+        with self._book_lock:
+            order = self.repo.get_order(order_id)
+            if order is None or order.status != 'PENDING':
+                return None
+            order.status = 'CANCELLED'
+            order.exit_reason = reason
+            self.repo.update_order(order)
+            self.repo.update_account_balance(self.repo.get_account_balance() + order.margin)
+        return order
+
+    def cancel_all_pending_orders(self, reason: str = 'USER_CANCELLED_ALL') -> Tuple[int, float]:
+        """
+        Cancel every PENDING order and refund their margin at once.
+        
+        Returns:
+            (number of cancelled orders, total refunded margin)
+        """
+        with self._book_lock:
+            pending_orders = self.repo.get_pending_orders()
+            if not pending_orders:
+                return 0, 0.0
+            total_refund = 0.0
+            for order in pending_orders:
+                order.status = 'CANCELLED'
+                order.exit_reason = reason
+                self.repo.update_order(order)
+                total_refund += order.margin
+            self.repo.update_account_balance(self.repo.get_account_balance() + total_refund)
+        return len(pending_orders), total_refund
+
+    async def fill_pending_at_market_async(self, order_id: str, current_price: float) -> Optional[PaperPosition]:
+        """
+        Fill a PENDING order now at `current_price` (market order), on the
+        repository's I/O executor; on_order_filled fires on the caller's loop.
+        
+        Returns:
+            The filled position (entry_price = current_price), or None if the
+            order is not (or no longer) pending
+        """
+        order = await self.repo.run_io(self._fill_at_market, order_id, current_price)
+        if order is not None:
+            # Trigger state machine callback
+            self._notify_state_machine([('on_order_filled', (order.id,))])
+        return order
+
+    def _fill_at_market(self, order_id: str, current_price: float) -> Optional[PaperPosition]:
+        with self._book_lock:
+            order = self.repo.get_order(order_id)
+            if order is None or order.status != 'PENDING':
+                return None
+            order.entry_price = current_price  # Fill at market price
+            order.status = 'OPEN'
+            order.open_time = datetime.now()
+            
+            # Recalculate liquidation price
+            if order.side == 'LONG':
+                order.liquidation_price = current_price - (order.margin / order.quantity)
+            else:
+                order.liquidation_price = current_price + (order.margin / order.quantity)
+            
+            self.repo.update_order(order)
+        return order
+
     def process_market_data(self, current_price: float, high: float, low: float, symbol: str) -> None:
         """
         1. Check PENDING orders -> Fill if price hit (Merge if needed) OR TTL Expire.
@@ -383,173 +501,347 @@ class PaperTradingService:
         SOTA FIX: Added 'symbol' parameter to filter processing.
         Prevents applying BTC prices to ETH positions (Cross-Talk Bug).
         """
-        # A. Handle PENDING Orders (Filter by Symbol)
-        all_pending = self.repo.get_pending_orders()
-        pending_orders = [o for o in all_pending if o.symbol.lower() == symbol.lower()]
+        self._notify_state_machine(self._match_market_data(current_price, high, low, symbol))
+
+    async def process_market_data_async(self, current_price: float, high: float, low: float, symbol: str) -> None:
+        """
+        process_market_data() for event-loop callers.
         
-        TTL_SECONDS = 45 * 60 # 45 minutes (3 candles of 15m)
+        Matching (repository reads/writes included) runs on the repository's
+        I/O executor; state machine callbacks fire back on the event loop.
+        """
+        events = await self.repo.run_io(self._match_market_data, current_price, high, low, symbol)
+        self._notify_state_machine(events)
+
+    async def on_signal_received_async(self, signal: TradingSignal, symbol: str = "BTCUSDT") -> None:
+        """on_signal_received() on the repository's I/O executor (ordered with tick matching)."""
+        await self.repo.run_io(self.on_signal_received, signal, symbol)
+
+    def _notify_state_machine(self, events: List[Tuple[str, tuple]]) -> None:
+        """Fire on_order_filled / on_position_closed for matching results."""
+        for name, args in events:
+            callback = getattr(self, name)
+            if not callback:
+                continue
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Error in {name} callback: {e}")
 
+    def _match_market_data(self, current_price: float, high: float, low: float, symbol: str) -> List[Tuple[str, tuple]]:
+        """
+        Match one price update against PENDING orders and OPEN positions.
+        
+        With a trigger index (repositories that report changes), only the
+        orders/positions whose trigger levels the [low, high] range crossed,
+        plus TTL-expired orders, are touched; otherwise every order and
+        position of the symbol is checked.
+        
+        Returns:
+            State machine notifications as (callback attribute, args)
+        """
+        with self._book_lock:
+            return self._match_locked(current_price, high, low, symbol)
+
+    def _match_locked(self, current_price: float, high: float, low: float, symbol: str) -> List[Tuple[str, tuple]]:
+        events: List[Tuple[str, tuple]] = []
+        
+        # A. Handle PENDING Orders (Filter by Symbol)
+        if self._indexed:
+            pending_orders = self._triggered_orders(symbol, high, low, 'PENDING')
+        else:
+            pending_orders = self.repo.get_pending_orders_by_symbol(symbol)
         for order in pending_orders:
-            # Check TTL
-            time_diff = (datetime.now() - order.open_time).total_seconds()
-            if time_diff > TTL_SECONDS:
-                logger.info(f"⏰ TTL EXPIRED: Cancelling pending order {order.id}")
-                order.status = 'CANCELLED'
-                order.exit_reason = 'TTL_EXPIRED'
-                order.close_time = datetime.now()
-                self.repo.update_order(order)
-                continue
+            self._match_pending_order(order, high, low, events)
+        
+        # B. Handle OPEN Positions (Filter by Symbol), including fills from A
+        if self._indexed:
+            active_positions = self._triggered_orders(symbol, high, low, 'OPEN')
+        else:
+            active_positions = self.repo.get_active_orders_by_symbol(symbol)
+        for pos in active_positions:
+            self._match_open_position(pos, current_price, high, low, events)
+        
+        return events
 
-            is_filled = False
-            if order.side == 'LONG':
-                # Buy Limit: Low <= Entry
-                if low <= order.entry_price:
-                    is_filled = True
-            elif order.side == 'SHORT':
-                # Sell Limit: High >= Entry
-                if high >= order.entry_price:
-                    is_filled = True
+    # ==================== TRIGGER INDEX ====================
+
+    def _on_order_changed(self, position: Optional[PaperPosition]) -> None:
+        """Repository change notification (None: the whole book was reloaded)."""
+        if position is None:
+            self._resync_triggers()
+        else:
+            with self._trigger_lock:
+                self._index_order(position)
+
+    def _resync_triggers(self) -> None:
+        positions = self.repo.get_pending_orders() + self.repo.get_active_orders()
+        with self._trigger_lock:
+            self._triggers.clear()
+            self._expiries.clear()
+            self._deadlines.clear()
+            for position in positions:
+                self._index_order(position)
+
+    def _index_order(self, position: PaperPosition) -> None:
+        """(Re)register the trigger levels of one order/position (lock held)."""
+        self._triggers.remove_group(position.id)
+        self._deadlines.pop(position.id, None)
+
+        if position.status == 'PENDING':
+            # Limit fill: buy at/below entry, sell at/above entry
+            direction = BELOW if position.side == 'LONG' else ABOVE
+            self._add_trigger(position, 'fill', position.entry_price, direction)
+            deadline = position.open_time + timedelta(seconds=self.PENDING_TTL_SECONDS)
+            self._deadlines[position.id] = deadline
+            heapq.heappush(self._expiries.setdefault(position.symbol.lower(), []), (deadline, position.id))
+        elif position.status == 'OPEN':
+            for name, level, direction in self._position_levels(position):
+                self._add_trigger(position, name, level, direction)
+
+    def _add_trigger(self, position: PaperPosition, name: str, level: float, direction: str) -> None:
+        self._triggers.add(Trigger(
+            key=(position.id, name), symbol=position.symbol, level=level,
+            direction=direction, group=position.id, payload=position.status
+        ))
+
+    def _position_levels(self, pos: PaperPosition) -> List[Tuple[str, float, str]]:
+        """
+        Levels at which _match_open_position() can change or close `pos`.
+        
+        A bar that crosses none of them leaves the position untouched, so it
+        is skipped. ROE thresholds are evaluated on the close, which lies
+        inside [low, high], so testing them against the range only adds
+        harmless extra checks; they are widened by a relative 1e-9 against
+        float rounding.
+        """
+        levels: List[Tuple[str, float, str]] = []
+        is_long = pos.side == 'LONG'
+        toward_profit, toward_loss = (ABOVE, BELOW) if is_long else (BELOW, ABOVE)
+
+        # Exits
+        if pos.liquidation_price is not None:
+            levels.append(('liquidation', pos.liquidation_price, toward_loss))
+        if pos.stop_loss > 0:
+            levels.append(('stop_loss', pos.stop_loss, toward_loss))
+        if pos.take_profit > 0:
+            levels.append(('take_profit', pos.take_profit, toward_profit))
+
+        # High/low watermark (a SHORT without one yet is checked every bar)
+        if is_long:
+            levels.append(('watermark', pos.highest_price, ABOVE))
+        else:
+            levels.append(('watermark', pos.lowest_price if pos.lowest_price > 0 else float('inf'), BELOW))
+
+        # Price at which ROE reaches a threshold
+        if pos.quantity > 0 and pos.margin > 0:
+            def roe_level(roe: float) -> float:
+                distance = roe * pos.margin / (100 * pos.quantity)
+                level = pos.entry_price + distance if is_long else pos.entry_price - distance
+                return level * (1 - 1e-9) if is_long else level * (1 + 1e-9)
+
+            breakeven_pending = pos.stop_loss < pos.entry_price if is_long else \
+                (pos.stop_loss == 0 or pos.stop_loss > pos.entry_price)
+            if breakeven_pending:
+                levels.append(('breakeven', roe_level(self.BREAKEVEN_ROE), toward_profit))
+
+            if is_long:
+                trail_pending = pos.highest_price * (1 - self.TRAILING_DISTANCE) > pos.stop_loss
+            else:
+                trail_pending = pos.lowest_price > 0 and (
+                    pos.stop_loss == 0 or pos.lowest_price * (1 + self.TRAILING_DISTANCE) < pos.stop_loss
+                )
+            if trail_pending:
+                levels.append(('trailing', roe_level(self.TRAILING_ROE), toward_profit))
+        elif pos.quantity != 0 and pos.margin != 0:
+            # Unusual sign: ROE is not monotonic toward profit, check every bar
+            levels.append(('roe', float('-inf'), ABOVE))
+
+        return levels
+
+    def _triggered_orders(self, symbol: str, high: float, low: float, status: str) -> List[PaperPosition]:
+        """
+        Orders/positions of `symbol` with `status` that this bar must touch:
+        a crossed trigger level, or (PENDING) an expired TTL.
+        
+        O(log n + k) in the number of triggers of the symbol.
+        """
+        with self._trigger_lock:
+            ids = {t.group for t in self._triggers.crossed(symbol, high, low) if t.payload == status}
+            if status == 'PENDING':
+                heap = self._expiries.get(symbol.lower())
+                now = datetime.now()
+                while heap and heap[0][0] < now:
+                    deadline, order_id = heapq.heappop(heap)
+                    if self._deadlines.get(order_id) == deadline:
+                        ids.add(order_id)
+
+        orders = [order for order in map(self.repo.get_order, ids) if order is not None and order.status == status]
+        # Repository (insertion) order is not available here; oldest first is the closest
+        orders.sort(key=lambda o: (o.open_time, o.id))
+        return orders
+
+    def get_trigger_statistics(self) -> Dict:
+        """Trigger index size (None when matching falls back to scans)."""
+        if not self._indexed:
+            return None
+        with self._trigger_lock:
+            return {
+                'triggers': len(self._triggers),
+                'pending_deadlines': len(self._deadlines),
+            }
+
+    def _match_pending_order(self, order: PaperPosition, high: float, low: float, events: List[Tuple[str, tuple]]) -> None:
+        """TTL expiry or limit fill (merged into an existing position if any)."""
+        # Check TTL
+        time_diff = (datetime.now() - order.open_time).total_seconds()
+        if time_diff > self.PENDING_TTL_SECONDS:
+            logger.info(f"⏰ TTL EXPIRED: Cancelling pending order {order.id}")
+            order.status = 'CANCELLED'
+            order.exit_reason = 'TTL_EXPIRED'
+            order.close_time = datetime.now()
+            self.repo.update_order(order)
+            return
+
+        is_filled = False
+        if order.side == 'LONG':
+            # Buy Limit: Low <= Entry
+            if low <= order.entry_price:
+                is_filled = True
+        elif order.side == 'SHORT':
+            # Sell Limit: High >= Entry
+            if high >= order.entry_price:
+                is_filled = True
+        
+        if is_filled:
+            # MERGE LOGIC (One-way Mode)
+            existing_positions = self.repo.get_active_orders_by_symbol(order.symbol, order.side)
             
-            if is_filled:
-                # MERGE LOGIC (One-way Mode)
-                existing_positions = [p for p in self.get_positions() if p.symbol == order.symbol and p.side == order.side]
+            if existing_positions:
+                # Merge into existing position
+                parent_pos = existing_positions[0]
                 
-                if existing_positions:
-                    # Merge into existing position
-                    parent_pos = existing_positions[0]
-                    
-                    total_qty = parent_pos.quantity + order.quantity
-                    total_margin = parent_pos.margin + order.margin
-                    
-                    # Weighted Average Entry Price
-                    avg_entry = ((parent_pos.entry_price * parent_pos.quantity) + (order.entry_price * order.quantity)) / total_qty
-                    
-                    # Update Parent Position
-                    parent_pos.entry_price = avg_entry
-                    parent_pos.quantity = total_qty
-                    parent_pos.margin = total_margin
-                    
-                    # Recalculate Liquidation Price
-                    if parent_pos.side == 'LONG':
-                        parent_pos.liquidation_price = avg_entry - (total_margin / total_qty)
-                    else:
-                        parent_pos.liquidation_price = avg_entry + (total_margin / total_qty)
-                        
-                    self.repo.update_order(parent_pos)
-                    
-                    # Mark Pending Order as MERGED (Closed)
-                    order.status = 'CLOSED'
-                    order.exit_reason = 'MERGED'
-                    order.close_time = datetime.now()
-                    self.repo.update_order(order)
-                    
-                    logger.info(f"🔗 MERGED {order.side} {order.symbol} | New Avg Entry: {avg_entry:.2f}")
-                    
+                total_qty = parent_pos.quantity + order.quantity
+                total_margin = parent_pos.margin + order.margin
+                
+                # Weighted Average Entry Price
+                avg_entry = ((parent_pos.entry_price * parent_pos.quantity) + (order.entry_price * order.quantity)) / total_qty
+                
+                # Update Parent Position
+                parent_pos.entry_price = avg_entry
+                parent_pos.quantity = total_qty
+                parent_pos.margin = total_margin
+                
+                # Recalculate Liquidation Price
+                if parent_pos.side == 'LONG':
+                    parent_pos.liquidation_price = avg_entry - (total_margin / total_qty)
                 else:
-                    # No existing position -> Promote to OPEN
-                    order.status = 'OPEN'
-                    order.open_time = datetime.now() # Update fill time
-                    self.repo.update_order(order)
-                    logger.info(f"✅ FILLED {order.side} {order.symbol} @ {order.entry_price}")
+                    parent_pos.liquidation_price = avg_entry + (total_margin / total_qty)
                     
-                    # ISSUE-001 Fix: Notify state machine of order fill
-                    if self.on_order_filled:
-                        try:
-                            self.on_order_filled(order.id)
-                        except Exception as e:
-                            logger.error(f"Error in on_order_filled callback: {e}")
-
-        # B. Handle OPEN Positions (Filter by Symbol)
-        all_positions = self.get_positions()
-        active_positions = [p for p in all_positions if p.symbol.lower() == symbol.lower()]
-
-        for pos in active_positions:
-            exit_price = None
-            reason = None
-            
-            # --- TRAILING STOP LOGIC (TUNED) ---
-            # 1. Update High/Low Watermark
+                self.repo.update_order(parent_pos)
+                
+                # Mark Pending Order as MERGED (Closed)
+                order.status = 'CLOSED'
+                order.exit_reason = 'MERGED'
+                order.close_time = datetime.now()
+                self.repo.update_order(order)
+                
+                logger.info(f"🔗 MERGED {order.side} {order.symbol} | New Avg Entry: {avg_entry:.2f}")
+                
+            else:
+                # No existing position -> Promote to OPEN
+                order.status = 'OPEN'
+                order.open_time = datetime.now() # Update fill time
+                self.repo.update_order(order)
+                logger.info(f"✅ FILLED {order.side} {order.symbol} @ {order.entry_price}")
+                
+                # ISSUE-001 Fix: Notify state machine of order fill
+                events.append(('on_order_filled', (order.id,)))
+
+    def _match_open_position(
+        self, pos: PaperPosition, current_price: float, high: float, low: float, events: List[Tuple[str, tuple]]
+    ) -> None:
+        """Trailing stop / breakeven, then liquidation, SL and TP exits."""
+        exit_price = None
+        reason = None
+        
+        # --- TRAILING STOP LOGIC (TUNED) ---
+        # 1. Update High/Low Watermark
+        if pos.side == 'LONG':
+            if pos.highest_price == 0 or high > pos.highest_price:
+                pos.highest_price = high
+        else:
+            if pos.lowest_price == 0 or low < pos.lowest_price:
+                pos.lowest_price = low
+        
+        # 2. Calculate ROI
+        roe = pos.calculate_roe(current_price)
+        
+        # 3. Step 1: Breakeven Trigger (ROI > 0.8%)
+        # Move SL to Entry if not already there
+        if roe > self.BREAKEVEN_ROE:
             if pos.side == 'LONG':
-                if pos.highest_price == 0 or high > pos.highest_price:
-                    pos.highest_price = high
+                if pos.stop_loss < pos.entry_price:
+                    pos.stop_loss = pos.entry_price
+                    logger.info(f"🛡️ BREAK EVEN TRIGGERED: {pos.symbol} SL moved to {pos.entry_price}")
             else:
-                if pos.lowest_price == 0 or low < pos.lowest_price:
-                    pos.lowest_price = low
-            
-            # 2. Calculate ROI
-            roe = pos.calculate_roe(current_price)
-            
-            # 3. Step 1: Breakeven Trigger (ROI > 0.8%)
-            # Move SL to Entry if not already there
-            if roe > 0.8:
-                if pos.side == 'LONG':
-                    if pos.stop_loss < pos.entry_price:
-                        pos.stop_loss = pos.entry_price
-                        logger.info(f"🛡️ BREAK EVEN TRIGGERED: {pos.symbol} SL moved to {pos.entry_price}")
-                else:
-                    if pos.stop_loss == 0 or pos.stop_loss > pos.entry_price:
-                        pos.stop_loss = pos.entry_price
-                        logger.info(f"🛡️ BREAK EVEN TRIGGERED: {pos.symbol} SL moved to {pos.entry_price}")
+                if pos.stop_loss == 0 or pos.stop_loss > pos.entry_price:
+                    pos.stop_loss = pos.entry_price
+                    logger.info(f"🛡️ BREAK EVEN TRIGGERED: {pos.symbol} SL moved to {pos.entry_price}")
 
-            # 4. Step 2: Dynamic Trailing (ROI > 1.2%)
-            # Trail by 1.5% distance
-            TRAILING_DIST = 0.015 # 1.5%
-            
-            # Only activate if ROI > 1.2%
-            if roe > 1.2:
-                if pos.side == 'LONG':
-                    # Trail: New SL = High * (1 - Dist)
-                    new_sl = pos.highest_price * (1 - TRAILING_DIST)
-                    if new_sl > pos.stop_loss:
+        # 4. Step 2: Dynamic Trailing (ROI > 1.2%)
+        # Trail by 1.5% distance
+        TRAILING_DIST = self.TRAILING_DISTANCE
+        
+        # Only activate if ROI > 1.2%
+        if roe > self.TRAILING_ROE:
+            if pos.side == 'LONG':
+                # Trail: New SL = High * (1 - Dist)
+                new_sl = pos.highest_price * (1 - TRAILING_DIST)
+                if new_sl > pos.stop_loss:
+                    pos.stop_loss = new_sl
+                    logger.info(f"🎢 TRAILING STOP: {pos.symbol} SL moved to {new_sl:.2f}")
+            else:
+                # Trail: New SL = Low * (1 + Dist)
+                if pos.lowest_price > 0:
+                    new_sl = pos.lowest_price * (1 + TRAILING_DIST)
+                    if (pos.stop_loss == 0) or (new_sl < pos.stop_loss):
                         pos.stop_loss = new_sl
                         logger.info(f"🎢 TRAILING STOP: {pos.symbol} SL moved to {new_sl:.2f}")
-                else:
-                    # Trail: New SL = Low * (1 + Dist)
-                    if pos.lowest_price > 0:
-                        new_sl = pos.lowest_price * (1 + TRAILING_DIST)
-                        if (pos.stop_loss == 0) or (new_sl < pos.stop_loss):
-                            pos.stop_loss = new_sl
-                            logger.info(f"🎢 TRAILING STOP: {pos.symbol} SL moved to {new_sl:.2f}")
-
-            # Update Position in DB (to save SL changes)
-            self.repo.update_order(pos)
-
-            # --- EXIT LOGIC ---
-            # 1. Check Liquidation
-            if pos.side == 'LONG' and low <= pos.liquidation_price:
-                exit_price = pos.liquidation_price
-                reason = 'LIQUIDATION'
-            elif pos.side == 'SHORT' and high >= pos.liquidation_price:
-                exit_price = pos.liquidation_price
-                reason = 'LIQUIDATION'
-            
-            # 2. Check Stop Loss
-            elif pos.stop_loss > 0:
-                if pos.side == 'LONG' and low <= pos.stop_loss:
-                    exit_price = pos.stop_loss
-                    reason = 'STOP_LOSS'
-                elif pos.side == 'SHORT' and high >= pos.stop_loss:
-                    exit_price = pos.stop_loss
-                    reason = 'STOP_LOSS'
-
-            # 3. Check Take Profit
-            elif pos.take_profit > 0:
-                if pos.side == 'LONG' and high >= pos.take_profit:
-                    exit_price = pos.take_profit
-                    reason = 'TAKE_PROFIT'
-                elif pos.side == 'SHORT' and low <= pos.take_profit:
-                    exit_price = pos.take_profit
-                    reason = 'TAKE_PROFIT'
-
-            if exit_price:
-                self.close_position(pos, exit_price, reason)
-                
-                # ISSUE-001 Fix: Notify state machine of position close
-                if self.on_position_closed:
-                    try:
-                        self.on_position_closed(pos.id, reason)
-                    except Exception as e:
-                        logger.error(f"Error in on_position_closed callback: {e}")
+
+        # Update Position in DB (to save SL changes)
+        self.repo.update_order(pos)
+
+        # --- EXIT LOGIC ---
+        # 1. Check Liquidation
+        if pos.side == 'LONG' and low <= pos.liquidation_price:
+            exit_price = pos.liquidation_price
+            reason = 'LIQUIDATION'
+        elif pos.side == 'SHORT' and high >= pos.liquidation_price:
+            exit_price = pos.liquidation_price
+            reason = 'LIQUIDATION'
+        
+        # 2. Check Stop Loss
+        elif pos.stop_loss > 0:
+            if pos.side == 'LONG' and low <= pos.stop_loss:
+                exit_price = pos.stop_loss
+                reason = 'STOP_LOSS'
+            elif pos.side == 'SHORT' and high >= pos.stop_loss:
+                exit_price = pos.stop_loss
+                reason = 'STOP_LOSS'
+
+        # 3. Check Take Profit
+        elif pos.take_profit > 0:
+            if pos.side == 'LONG' and high >= pos.take_profit:
+                exit_price = pos.take_profit
+                reason = 'TAKE_PROFIT'
+            elif pos.side == 'SHORT' and low <= pos.take_profit:
+                exit_price = pos.take_profit
+                reason = 'TAKE_PROFIT'
+
+        if exit_price and self.close_position(pos, exit_price, reason):
+            # ISSUE-001 Fix: Notify state machine of position close
+            events.append(('on_position_closed', (pos.id, reason)))
 
     # ==================== NEW METHODS FOR DESKTOP APP ====================
     
@@ -693,19 +985,20 @@ class PaperTradingService:
         Returns:
             Position ID if created, None otherwise
         """
-        # Store current position count
-        before_count = len(self.get_positions()) + len(self.repo.get_pending_orders())
-        
-        # Execute via existing method
-        self.on_signal_received(signal, symbol)
-        
-        # Check if new position was created
-        after_count = len(self.get_positions()) + len(self.repo.get_pending_orders())
-        
-        if after_count > before_count:
-            # Return the latest pending order ID
-            pending = self.repo.get_pending_orders()
-            if pending:
-                return pending[-1].id
+        with self._book_lock:
+            # Store current position count
+            before_count = len(self.get_positions()) + len(self.repo.get_pending_orders())
+            
+            # Execute via existing method
+            self.on_signal_received(signal, symbol)
+            
+            # Check if new position was created
+            after_count = len(self.get_positions()) + len(self.repo.get_pending_orders())
+            
+            if after_count > before_count:
+                # Return the latest pending order ID
+                pending = self.repo.get_pending_orders()
+                if pending:
+                    return pending[-1].id
         
         return None
@@ -9,13 +9,16 @@ dependencies are injected via constructor, not created internally.
 
 import asyncio
 import logging
+import time
 import pandas as pd
-from typing import Optional, Dict, List, Callable, TYPE_CHECKING
-from datetime import datetime
 from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Callable, Awaitable, Deque, Tuple, TYPE_CHECKING
+from datetime import datetime, timedelta
 
 # Domain imports (allowed)
 from ...domain.entities.candle import Candle
+from ...domain.entities.candle_store import CandleStore, CandleArrays
 from ...domain.interfaces import (
     IWebSocketClient,
     IRestClient,
@@ -27,6 +30,8 @@ from ...domain.interfaces import (
     IADXCalculator,
     IATRCalculator,
     IVolumeSpikeDetector,
+    IIncrementalIndicatorEngine,
+    IndicatorSnapshot,
 )
 
 # Domain repository interface (for candle persistence - Phase 2)
@@ -42,6 +47,23 @@ from ..analysis.trend_filter import TrendFilter, TrendDirection # SOTA: For HTF
 from .confidence_calculator import ConfidenceCalculator
 from .smart_entry_calculator import SmartEntryCalculator
 from .paper_trading_service import PaperTradingService
+from .indicator_worker_pool import IndicatorWorkerPool
+
+
+# Bar length per timeframe (close time = open time + length)
+_TIMEFRAME_DELTAS = {'1m': timedelta(minutes=1), '15m': timedelta(minutes=15), '1h': timedelta(hours=1)}
+
+
+@dataclass
+class _IndicatorCacheEntry:
+    """get_latest_indicators() state for one timeframe."""
+    version: int                                  # CandleStore.version of the closed window
+    closed: List[Candle]                          # closed window (newest 100)
+    key: Optional[tuple] = None                   # (version, forming candle) of `values`
+    values: Dict = field(default_factory=dict)
+    volume_tail: Optional[List[float]] = None     # last 20 closed volumes
+    zones_ready: bool = False
+    liquidity_zones: Optional[Dict] = None
 
 
 class RealtimeService:
@@ -84,7 +106,11 @@ class RealtimeService:
         # SOTA FIX: TrendFilter for HTF Confluence
         trend_filter: Optional[TrendFilter] = None,
         # CRITICAL FIX: SignalConfirmationService for whipsaw prevention
-        signal_confirmation_service: Optional['SignalConfirmationService'] = None
+        signal_confirmation_service: Optional['SignalConfirmationService'] = None,
+        # Streaming indicators (O(1) per closed candle instead of full recompute)
+        indicator_engine: Optional[IIncrementalIndicatorEngine] = None,
+        # Shared pool for closed-candle signal work (None = inline)
+        indicator_pool: Optional[IndicatorWorkerPool] = None
     ):
         """
         Initialize real-time service with dependency injection.
@@ -107,6 +133,9 @@ class RealtimeService:
             atr_calculator: ATR calculator
             volume_spike_detector: Volume spike detector
             signal_generator: Signal generator (pre-configured)
+            indicator_engine: Incremental indicator engine fed with closed candles
+            indicator_pool: Shared worker pool that batches closed-candle signal
+                work across symbols (signals are generated inline without it)
         """
         self.symbol = symbol
         self.interval = interval
@@ -152,16 +181,36 @@ class RealtimeService:
         # CRITICAL FIX: SignalConfirmationService for whipsaw prevention
         self._signal_confirmation_service = signal_confirmation_service
         
+        # Streaming indicator state, kept in step with the candle buffers below
+        self.indicator_engine = indicator_engine
+        
+        # Closed-candle signal generation off the event loop
+        self.indicator_pool = indicator_pool
+        if indicator_pool:
+            indicator_pool.register_symbol(symbol)
+        
+        # Paper engine pipeline: ticks and signals are awaited in order on the
+        # order repository's I/O executor; ticks coalesce while one is in flight
+        self._paper_jobs: Deque[Callable[[], Awaitable[None]]] = deque()
+        self._paper_tick: Optional[Tuple[float, float, float]] = None
+        self._paper_task: Optional[asyncio.Task] = None
+        self._paper_stats = {'ticks': 0, 'coalesced': 0, 'processed': 0, 'signals': 0,
+                             'errors': 0, 'last_ms': 0.0, 'max_ms': 0.0}
+        
+        # get_latest_indicators() cache, one entry per timeframe
+        self._indicator_cache: Dict[str, _IndicatorCacheEntry] = {}
+        self._indicator_cache_stats = {'hits': 0, 'incremental': 0, 'rebuilds': 0}
+        
         # Data storage (in-memory cache)
         self._latest_1m: Optional[Candle] = None
         self._latest_15m: Optional[Candle] = None
         self._latest_1h: Optional[Candle] = None
         self._latest_signal: Optional[TradingSignal] = None
         
-        # Candle buffers for analysis
-        self._candles_1m: deque = deque(maxlen=buffer_size)
-        self._candles_15m: deque = deque(maxlen=buffer_size)
-        self._candles_1h: deque = deque(maxlen=buffer_size)
+        # Candle buffers for analysis (columnar ring buffers, NumPy views via .arrays())
+        self._candles_1m = CandleStore(maxlen=buffer_size)
+        self._candles_15m = CandleStore(maxlen=buffer_size)
+        self._candles_1h = CandleStore(maxlen=buffer_size)
         
         # Callbacks
         self._signal_callbacks: List[Callable] = []
@@ -222,7 +271,7 @@ class RealtimeService:
             # Add portfolio positions to watchlist
             if self.paper_service:
                 try:
-                    positions = self.paper_service.get_positions()
+                    positions = await self.paper_service.repo.get_active_orders_async()
                     for pos in positions:
                         watchlist_symbols.add(pos.symbol.lower())
                     self.logger.info(f"📋 Portfolio Watchlist: {watchlist_symbols}")
@@ -308,11 +357,10 @@ class RealtimeService:
                 
                 if new_candles:
                     self.logger.info(f"💾 Write-through: Saving {len(new_candles)} new {timeframe} candles to SQLite")
-                    for candle in new_candles:
-                        try:
-                            self._market_data_repository.save_candle_simple(candle, timeframe, self.symbol)
-                        except Exception as e:
-                            self.logger.error(f"Failed to save candle: {e}")
+                    try:
+                        self._market_data_repository.enqueue_candles(new_candles, timeframe, self.symbol)
+                    except Exception as e:
+                        self.logger.error(f"Failed to save candles: {e}")
             
             return merged
             
@@ -347,7 +395,8 @@ class RealtimeService:
         Now: ALWAYS fetch fresh candles from Binance, then persist for future sessions.
         
         Architecture:
-        1. Fetch 500 latest from Binance REST API (source of truth)
+        1. Fetch 500 latest from Binance REST API (source of truth),
+           1m / 15m / 1h concurrently
         2. Populate in-memory buffers (L1 cache)
         3. Persist to SQLite for future fast-startup (L2 cache)
         
@@ -360,18 +409,21 @@ class RealtimeService:
             # Frontend requests 400, plus 50 warm-up trim = 450 minimum
             CANDLE_LOAD_LIMIT = 500
             
+            # All three timeframes are fetched concurrently (pooled, rate-limited client)
+            self.logger.info(f"📡 Fetching {CANDLE_LOAD_LIMIT} fresh 1m/15m/1h candles from Binance...")
+            candles_1m, candles_15m, candles_1h = await asyncio.gather(*(
+                self.rest_client.get_klines_async(symbol=self.symbol, interval=timeframe, limit=CANDLE_LOAD_LIMIT)
+                for timeframe in ('1m', '15m', '1h')
+            ))
+            
             # 1. Load 1m candles - ALWAYS from Binance
-            self.logger.info(f"📡 Fetching {CANDLE_LOAD_LIMIT} fresh 1m candles from Binance...")
-            candles_1m = self.rest_client.get_klines(
-                symbol=self.symbol,
-                interval='1m',
-                limit=CANDLE_LOAD_LIMIT
-            )
             if candles_1m:
                 # Clear buffer and populate with fresh data
                 self._candles_1m.clear()
+                self._reset_indicator_engine('1m')
                 for candle in candles_1m:
                     self._candles_1m.append(candle)
+                    self._feed_indicator_engine('1m', candle)
                     self.aggregator.add_candle_1m(candle, is_closed=True)
                 self._latest_1m = candles_1m[-1]
                 self.logger.info(f"✅ Loaded {len(candles_1m)} fresh 1m candles")
@@ -381,22 +433,19 @@ class RealtimeService:
                     self._persist_candles_batch(candles_1m, '1m')
             else:
                 self.logger.warning("⚠️ No 1m data from Binance, trying SQLite fallback...")
-                candles_1m = self._load_candles_hybrid('1m', CANDLE_LOAD_LIMIT)
+                candles_1m = await asyncio.to_thread(self._load_candles_hybrid, '1m', CANDLE_LOAD_LIMIT)
                 for candle in candles_1m:
                     self._candles_1m.append(candle)
+                    self._feed_indicator_engine('1m', candle)
             
             # 2. Load 15m candles - ALWAYS from Binance
-            self.logger.info(f"📡 Fetching {CANDLE_LOAD_LIMIT} fresh 15m candles from Binance...")
-            candles_15m = self.rest_client.get_klines(
-                symbol=self.symbol,
-                interval='15m',
-                limit=CANDLE_LOAD_LIMIT
-            )
             if candles_15m and len(candles_15m) > 1:
                 self._candles_15m.clear()
+                self._reset_indicator_engine('15m')
                 completed_15m = candles_15m[:-1]  # Exclude incomplete
                 for candle in completed_15m:
                     self._candles_15m.append(candle)
+                    self._feed_indicator_engine('15m', candle)
                 self._latest_15m = completed_15m[-1]
                 self.logger.info(f"✅ Loaded {len(completed_15m)} fresh 15m candles")
                 
@@ -407,17 +456,13 @@ class RealtimeService:
                 self.logger.warning("⚠️ No 15m data from Binance")
             
             # 3. Load 1h candles - ALWAYS from Binance
-            self.logger.info(f"📡 Fetching {CANDLE_LOAD_LIMIT} fresh 1h candles from Binance...")
-            candles_1h = self.rest_client.get_klines(
-                symbol=self.symbol,
-                interval='1h',
-                limit=CANDLE_LOAD_LIMIT
-            )
             if candles_1h and len(candles_1h) > 1:
                 self._candles_1h.clear()
+                self._reset_indicator_engine('1h')
                 completed_1h = candles_1h[:-1]
                 for candle in completed_1h:
                     self._candles_1h.append(candle)
+                    self._feed_indicator_engine('1h', candle)
                 self._latest_1h = completed_1h[-1]
                 self.logger.info(f"✅ Loaded {len(completed_1h)} fresh 1h candles")
                 
@@ -440,22 +485,25 @@ class RealtimeService:
         try:
             CANDLE_LOAD_LIMIT = 500
             
-            candles_1m = self._load_candles_hybrid('1m', CANDLE_LOAD_LIMIT)
+            candles_1m = await asyncio.to_thread(self._load_candles_hybrid, '1m', CANDLE_LOAD_LIMIT)
             for candle in candles_1m:
                 self._candles_1m.append(candle)
+                self._feed_indicator_engine('1m', candle)
             if candles_1m:
                 self._latest_1m = candles_1m[-1]
                 
-            candles_15m = self._load_candles_hybrid('15m', CANDLE_LOAD_LIMIT)
+            candles_15m = await asyncio.to_thread(self._load_candles_hybrid, '15m', CANDLE_LOAD_LIMIT)
             if candles_15m:
                 for candle in candles_15m[:-1]:
                     self._candles_15m.append(candle)
+                    self._feed_indicator_engine('15m', candle)
                 self._latest_15m = candles_15m[-2] if len(candles_15m) > 1 else None
                 
-            candles_1h = self._load_candles_hybrid('1h', CANDLE_LOAD_LIMIT)
+            candles_1h = await asyncio.to_thread(self._load_candles_hybrid, '1h', CANDLE_LOAD_LIMIT)
             if candles_1h:
                 for candle in candles_1h[:-1]:
                     self._candles_1h.append(candle)
+                    self._feed_indicator_engine('1h', candle)
                 self._latest_1h = candles_1h[-2] if len(candles_1h) > 1 else None
                 
             self.logger.info("✅ Hybrid fallback load complete")
@@ -463,20 +511,15 @@ class RealtimeService:
             self.logger.error(f"Hybrid fallback also failed: {e}")
     
     def _persist_candles_batch(self, candles: List[Candle], timeframe: str) -> None:
-        """Persist a batch of candles to SQLite asynchronously."""
+        """Queue a batch of candles for the repository's background writer."""
         if not self._market_data_repository or not candles:
             return
             
-        saved_count = 0
-        for candle in candles:
-            try:
-                self._market_data_repository.save_candle_simple(candle, timeframe, self.symbol)
-                saved_count += 1
-            except Exception:
-                pass  # Ignore duplicates
-        
-        if saved_count > 0:
-            self.logger.debug(f"💾 Persisted {saved_count} {timeframe} candles to SQLite")
+        try:
+            self._market_data_repository.enqueue_candles(candles, timeframe, self.symbol)
+            self.logger.debug(f"💾 Queued {len(candles)} {timeframe} candles for SQLite")
+        except Exception as e:
+            self.logger.error(f"Failed to persist {timeframe} candles: {e}")
     
     async def stop(self) -> None:
         """
@@ -538,7 +581,7 @@ class RealtimeService:
         
         # Use metadata for symbol info instead of accessing candle.symbol
         candle_symbol = metadata.get('symbol', self.symbol)
-        self.logger.info(f"🕯️ [{interval}] Candle: {candle.close:.2f} closed={is_closed} symbol={candle_symbol}")
+        self.logger.debug("🕯️ [%s] Candle: %.2f closed=%s symbol=%s", interval, candle.close, is_closed, candle_symbol)
         
         # SOTA: Check if this is the ACTIVE symbol
         is_active_symbol = (candle_symbol.lower() == self.symbol.lower())
@@ -552,7 +595,7 @@ class RealtimeService:
                  
                  # 2. Persist to DB if closed (Slower, for history)
                  if is_closed:
-                    self._market_data_repository.save_candle_simple(candle, interval, candle_symbol.lower())
+                    self._market_data_repository.enqueue_candles([candle], interval, candle_symbol.lower())
              except Exception as e:
                  pass # Ignore persistence errors to keep stream alive
 
@@ -593,6 +636,7 @@ class RealtimeService:
             # New candle started - the previous one is now complete
             self.logger.debug(f"New candle detected: {candle.timestamp} - Saving previous candle")
             self._candles_1m.append(self._latest_1m)
+            self._feed_indicator_engine('1m', self._latest_1m)
             self.logger.debug(f"Buffer size: {len(self._candles_1m)}")
             
             # Add to aggregator
@@ -621,21 +665,17 @@ class RealtimeService:
                 'rsi': indicators.get('rsi'),
             }
             self._event_bus.publish_candle_update(candle_data, symbol=self.symbol)
-            self.logger.debug(f"📡 EventBus: Published 1m candle {candle.close:.2f}")
+            self.logger.debug("📡 EventBus: Published 1m candle %.2f", candle.close)
         
-        # Paper Engine Matching (Run on every tick/candle update)
+        # Paper Engine Matching (Run on every tick/candle update, off the event loop)
         if self.paper_service:
-            self.paper_service.process_market_data(
-                current_price=candle.close,
-                high=candle.high,
-                low=candle.low,
-                symbol=self.symbol
-            )
+            self._submit_paper_tick(candle)
         
         # Also add if explicitly closed by Binance
-        if is_closed and (not self._candles_1m or candle.timestamp != self._candles_1m[-1].timestamp):
+        if is_closed and (not self._candles_1m or candle.timestamp != self._candles_1m.last().timestamp):
             self.logger.debug(f"Candle explicitly closed: {candle.timestamp}")
             self._candles_1m.append(candle)
+            self._feed_indicator_engine('1m', candle)
             self.logger.debug(f"Buffer size: {len(self._candles_1m)}")
             
             # Add to aggregator
@@ -645,7 +685,7 @@ class RealtimeService:
             self._generate_signals()
         
         # Notify update callbacks
-        self.logger.info(f"📢 Calling _notify_update_callbacks with {len(self._update_callbacks)} callbacks")
+        self.logger.debug("📢 Calling _notify_update_callbacks with %d callbacks", len(self._update_callbacks))
         self._notify_update_callbacks()
     
     def _handle_15m_candle(self, candle: Candle, is_closed: bool) -> None:
@@ -665,12 +705,13 @@ class RealtimeService:
         # If closed, add to buffer and persist
         if is_closed:
             self._candles_15m.append(candle)
+            self._feed_indicator_engine('15m', candle)
             
             # Persist to SQLite
             if self._market_data_repository:
                 try:
-                    self._market_data_repository.save_candle_simple(candle, '15m', self.symbol)
-                    self.logger.debug(f"📦 Persisted 15m candle from stream: {candle.timestamp}")
+                    self._market_data_repository.enqueue_candles([candle], '15m', self.symbol)
+                    self.logger.debug(f"📦 Queued 15m candle from stream: {candle.timestamp}")
                 except Exception as e:
                     self.logger.error(f"Failed to persist 15m candle: {e}")
         
@@ -705,12 +746,13 @@ class RealtimeService:
         # If closed, add to buffer and persist
         if is_closed:
             self._candles_1h.append(candle)
+            self._feed_indicator_engine('1h', candle)
             
             # Persist to SQLite
             if self._market_data_repository:
                 try:
-                    self._market_data_repository.save_candle_simple(candle, '1h', self.symbol)
-                    self.logger.debug(f"📦 Persisted 1h candle from stream: {candle.timestamp}")
+                    self._market_data_repository.enqueue_candles([candle], '1h', self.symbol)
+                    self.logger.debug(f"📦 Queued 1h candle from stream: {candle.timestamp}")
                 except Exception as e:
                     self.logger.error(f"Failed to persist 1h candle: {e}")
         
@@ -739,12 +781,13 @@ class RealtimeService:
         
         self._latest_15m = candle
         self._candles_15m.append(candle)
+        self._feed_indicator_engine('15m', candle)
         
         # SOTA FIX: Persist closed 15m candles to SQLite (Phase 2)
         if self._market_data_repository:
             try:
-                self._market_data_repository.save_candle_simple(candle, '15m', self.symbol)
-                self.logger.debug(f"📦 Persisted 15m candle: {candle.timestamp}")
+                self._market_data_repository.enqueue_candles([candle], '15m', self.symbol)
+                self.logger.debug(f"📦 Queued 15m candle: {candle.timestamp}")
             except Exception as e:
                 self.logger.error(f"Failed to persist 15m candle: {e}")
         
@@ -777,12 +820,13 @@ class RealtimeService:
         
         self._latest_1h = candle
         self._candles_1h.append(candle)
+        self._feed_indicator_engine('1h', candle)
         
         # SOTA FIX: Persist closed 1h candles to SQLite (Phase 2)
         if self._market_data_repository:
             try:
-                self._market_data_repository.save_candle_simple(candle, '1h', self.symbol)
-                self.logger.debug(f"📦 Persisted 1h candle: {candle.timestamp}")
+                self._market_data_repository.enqueue_candles([candle], '1h', self.symbol)
+                self.logger.debug(f"📦 Queued 1h candle: {candle.timestamp}")
             except Exception as e:
                 self.logger.error(f"Failed to persist 1h candle: {e}")
         
@@ -804,17 +848,54 @@ class RealtimeService:
         if len(self._candles_1h) >= 20:
             self._generate_signals_1h()
     
+    def _feed_indicator_engine(self, timeframe: str, candle: Candle) -> None:
+        """Feed a closed candle to the streaming indicator engine (if injected)."""
+        if self.indicator_engine:
+            self.indicator_engine.update(self.symbol, timeframe, candle)
+    
+    def _reset_indicator_engine(self, timeframe: str) -> None:
+        """Drop streaming state when a candle buffer is rebuilt from scratch."""
+        if self.indicator_engine:
+            self.indicator_engine.reset(self.symbol, timeframe)
+    
+    def _submit_signal_job(
+        self,
+        timeframe: str,
+        last_candle: Candle,
+        compute: Callable[[], Optional[TradingSignal]],
+        apply: Callable[[Optional[TradingSignal]], None]
+    ) -> None:
+        """
+        Run closed-candle signal work: compute() may run on a worker thread
+        (on snapshots taken here), apply() always runs on the caller's loop.
+        """
+        if not self.indicator_pool:
+            try:
+                apply(compute())
+            except Exception as e:
+                self.logger.error(f"Error generating {timeframe} signals: {e}")
+            return
+        
+        boundary = last_candle.timestamp + _TIMEFRAME_DELTAS[timeframe]
+        self.indicator_pool.submit(self.symbol, timeframe, boundary, compute, apply)
+    
     def _generate_signals(self) -> None:
         """Generate trading signals based on current data."""
         if len(self._candles_1m) < 20:
             return
         
+        candles = self._candles_1m.candles()
+        snapshot = self.get_indicator_snapshot('1m')
+        self._submit_signal_job(
+            '1m',
+            candles[-1],
+            lambda: self.signal_generator.generate_signal(candles, symbol=self.symbol, indicator_snapshot=snapshot),
+            self._apply_signal_1m
+        )
+    
+    def _apply_signal_1m(self, signal: Optional[TradingSignal]) -> None:
+        """Confirm, persist and execute a 1m signal (event loop)."""
         try:
-            signal = self.signal_generator.generate_signal(
-                list(self._candles_1m),
-                symbol=self.symbol
-            )
-            
             if signal and signal.signal_type.value != 'neutral':
                 # CRITICAL FIX: Use SignalConfirmationService to prevent whipsaw
                 # Requires 2 consecutive signals in same direction
@@ -842,59 +923,146 @@ class RealtimeService:
                 
                 # Send to Paper Engine (creates order)
                 if self.paper_service:
+                    self._paper_stats['signals'] += 1
+                    if self._submit_paper_job(lambda: self._execute_signal(signal, saved_signal)):
+                        return
                     self.paper_service.on_signal_received(signal, self.symbol)
-                    
-                    # SOTA FIX: Link signal to order via mark_executed
                     if saved_signal and self._lifecycle_service:
-                        try:
-                            pending_orders = self.paper_service.repo.get_pending_orders()
-                            for order in pending_orders:
-                                if order.symbol.lower() == self.symbol.lower():
-                                    self._lifecycle_service.mark_executed(saved_signal.id, order.id)
-                                    self.logger.info(f"🔗 Signal {saved_signal.id[:8]}... linked to order {order.id[:8]}...")
-                                    break
-                        except Exception as e:
-                            self.logger.error(f"Error linking signal to order: {e}")
+                        self._link_signal_to_order(saved_signal, self.paper_service.repo.get_pending_orders())
                 
         except Exception as e:
             self.logger.error(f"Error generating signals: {e}")
     
+    async def _execute_signal(self, signal: TradingSignal, saved_signal) -> None:
+        """Paper Engine order for a confirmed signal (repository I/O off the loop)."""
+        await self.paper_service.on_signal_received_async(signal, self.symbol)
+        if saved_signal and self._lifecycle_service:
+            self._link_signal_to_order(saved_signal, await self.paper_service.repo.get_pending_orders_async())
+    
+    def _link_signal_to_order(self, saved_signal, pending_orders) -> None:
+        """SOTA FIX: Link signal to order via mark_executed"""
+        try:
+            for order in pending_orders:
+                if order.symbol.lower() == self.symbol.lower():
+                    self._lifecycle_service.mark_executed(saved_signal.id, order.id)
+                    self.logger.info(f"🔗 Signal {saved_signal.id[:8]}... linked to order {order.id[:8]}...")
+                    break
+        except Exception as e:
+            self.logger.error(f"Error linking signal to order: {e}")
+    
+    def _submit_paper_tick(self, candle: Candle) -> None:
+        """
+        Queue a price update for the Paper Engine.
+        
+        Ticks that arrive while an earlier one is still queued merge into it
+        (latest close, widest high/low), so fills are never missed and the
+        backlog stays at one tick per symbol.
+        """
+        self._paper_stats['ticks'] += 1
+        pending = self._paper_tick
+        if pending is not None:
+            self._paper_stats['coalesced'] += 1
+            self._paper_tick = (candle.close, max(pending[1], candle.high), min(pending[2], candle.low))
+            return
+        
+        self._paper_tick = (candle.close, candle.high, candle.low)
+        if not self._submit_paper_job(self._process_paper_tick):
+            # No event loop (scripts, tests): match inline
+            self._paper_tick = None
+            self.paper_service.process_market_data(
+                current_price=candle.close,
+                high=candle.high,
+                low=candle.low,
+                symbol=self.symbol
+            )
+    
+    async def _process_paper_tick(self) -> None:
+        price, high, low = self._paper_tick
+        self._paper_tick = None
+        started = time.perf_counter()
+        await self.paper_service.process_market_data_async(
+            current_price=price,
+            high=high,
+            low=low,
+            symbol=self.symbol
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._paper_stats['processed'] += 1
+        self._paper_stats['last_ms'] = round(elapsed_ms, 3)
+        self._paper_stats['max_ms'] = round(max(self._paper_stats['max_ms'], elapsed_ms), 3)
+    
+    def _submit_paper_job(self, job: Callable[[], Awaitable[None]]) -> bool:
+        """
+        Queue a Paper Engine job; jobs run one at a time, in submit order.
+        
+        Returns:
+            False if there is no running event loop (caller runs it inline)
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        
+        self._paper_jobs.append(job)
+        if self._paper_task is None or self._paper_task.done():
+            self._paper_task = loop.create_task(self._run_paper_jobs())
+        return True
+    
+    async def _run_paper_jobs(self) -> None:
+        while self._paper_jobs:
+            job = self._paper_jobs.popleft()
+            try:
+                await job()
+            except Exception as e:
+                self._paper_stats['errors'] += 1
+                self.logger.error(f"Paper Engine error: {e}", exc_info=True)
+    
+    async def drain_paper_pipeline(self) -> None:
+        """Wait until queued Paper Engine ticks and signals are processed."""
+        while self._paper_task is not None and not self._paper_task.done():
+            await asyncio.shield(self._paper_task)
+    
     def _generate_signals_15m(self) -> None:
         """Generate signals on 15m timeframe."""
-        try:
-            # SOTA: HTF Confluence (Check 1H Trend)
+        candles = self._candles_15m.candles()
+        # SOTA: HTF Confluence (Check 1H Trend) - need 50 for EMA50
+        candles_1h = self._candles_1h.candles() if self.trend_filter and len(self._candles_1h) >= 50 else None
+        snapshot = self.get_indicator_snapshot('15m')
+        
+        def compute() -> Optional[TradingSignal]:
             htf_trend = None
-            if self.trend_filter and len(self._candles_1h) >= 50: # Need 50 for EMA50
-                htf_trend = self.trend_filter.get_trend_direction(list(self._candles_1h))
+            if candles_1h is not None:
+                htf_trend = self.trend_filter.get_trend_direction(candles_1h)
                 self.logger.debug(f"HTF Trend (1h): {htf_trend.value}")
-
-            signal = self.signal_generator.generate_signal(
-                list(self._candles_15m),
+            
+            return self.signal_generator.generate_signal(
+                candles,
                 symbol=self.symbol,
-                htf_trend=htf_trend
+                htf_trend=htf_trend,
+                indicator_snapshot=snapshot
             )
-            
-            if signal and signal.signal_type.value != 'neutral':
-                self.logger.info(f"15m Signal: {signal}")
-                self._notify_signal_callbacks(signal)
-                
-        except Exception as e:
-            self.logger.error(f"Error generating 15m signals: {e}")
+        
+        self._submit_signal_job('15m', candles[-1], compute, lambda signal: self._apply_htf_signal('15m', signal))
     
     def _generate_signals_1h(self) -> None:
         """Generate signals on 1h timeframe."""
+        candles = self._candles_1h.candles()
+        snapshot = self.get_indicator_snapshot('1h')
+        self._submit_signal_job(
+            '1h',
+            candles[-1],
+            lambda: self.signal_generator.generate_signal(candles, symbol=self.symbol, indicator_snapshot=snapshot),
+            lambda signal: self._apply_htf_signal('1h', signal)
+        )
+    
+    def _apply_htf_signal(self, timeframe: str, signal: Optional[TradingSignal]) -> None:
+        """Publish a 15m/1h signal (event loop)."""
         try:
-            signal = self.signal_generator.generate_signal(
-                list(self._candles_1h),
-                symbol=self.symbol
-            )
-            
             if signal and signal.signal_type.value != 'neutral':
-                self.logger.info(f"1h Signal: {signal}")
+                self.logger.info(f"{timeframe} Signal: {signal}")
                 self._notify_signal_callbacks(signal)
-                
         except Exception as e:
-            self.logger.error(f"Error generating 1h signals: {e}")
+            self.logger.error(f"Error generating {timeframe} signals: {e}")
 
     
     def _notify_signal_callbacks(self, signal: TradingSignal) -> Optional[TradingSignal]:
@@ -951,7 +1119,7 @@ class RealtimeService:
     def _notify_update_callbacks(self) -> None:
         """Notify all update callbacks."""
         if self._update_callbacks:
-            self.logger.debug(f"Notifying {len(self._update_callbacks)} update callbacks")
+            self.logger.debug("Notifying %d update callbacks", len(self._update_callbacks))
         for callback in self._update_callbacks:
             try:
                 callback()
@@ -999,166 +1167,300 @@ class RealtimeService:
         Returns:
             List of Candles
         """
+        store = self._get_candle_store(timeframe)
+        if store is None:
+            return []
+
+        return store.candles(limit)
+
+    def get_candle_arrays(self, timeframe: str = '1m', limit: int = 100) -> Optional[CandleArrays]:
+        """
+        Get recent candles for specified timeframe as NumPy columns.
+
+        The arrays are views into the buffer (no copy) and are only valid
+        until the next candle is added; copy them to keep them.
+
+        Args:
+            timeframe: '1m', '15m', or '1h'
+            limit: Maximum number of candles to return
+
+        Returns:
+            CandleArrays or None for an unknown timeframe
+        """
+        store = self._get_candle_store(timeframe)
+        if store is None:
+            return None
+
+        return store.arrays(limit)
+
+    def get_indicator_snapshot(self, timeframe: str) -> Optional[IndicatorSnapshot]:
+        """
+        Latest streaming indicators for a timeframe (None without engine).
+        
+        Check snapshot.matches(candles) before using it in place of a batch
+        calculation over a candle list.
+        """
+        if not self.indicator_engine:
+            return None
+        return self.indicator_engine.get_snapshot(self.symbol, timeframe)
+
+    def _get_candle_store(self, timeframe: str) -> Optional[CandleStore]:
         if timeframe == '1m':
-            candles = list(self._candles_1m)
+            return self._candles_1m
         elif timeframe == '15m':
-            candles = list(self._candles_15m)
+            return self._candles_15m
         elif timeframe == '1h':
-            candles = list(self._candles_1h)
-        else:
-            return []
-        
-        return candles[-limit:] if len(candles) > limit else candles
-    
+            return self._candles_1h
+        return None
+
     def get_latest_indicators(self, timeframe: str = '1m') -> Dict[str, float]:
         """
         Get latest indicator values for dashboard display.
         
+        Cached per timeframe and keyed by the candle buffer's version plus
+        the forming 1m candle, so repeated calls between ticks are dict
+        copies. A forming-candle tick only evaluates the new last bar: the
+        streaming engine peeks it on top of the closed-candle state, and
+        liquidity zones (structural, closed candles) are reused until the
+        next candle closes.
+        
         Args:
             timeframe: '1m', '15m', or '1h'
             
         Returns:
             Dict with indicator values (rsi, ema_7, ema_25, etc.)
         """
-        candles = self.get_candles(timeframe, limit=100)
+        store = self._get_candle_store(timeframe)
+        if store is None:
+            return {}
         
         # CRITICAL FIX: Append current forming candle for real-time price
+        forming = None
         if timeframe == '1m' and self._latest_1m:
-            # Only append if it's not already in the list (timestamps match)
-            if not candles or candles[-1].timestamp != self._latest_1m.timestamp:
-                candles.append(self._latest_1m)
-                
-        if not candles or len(candles) < 20:
+            # Only append if it's not already in the buffer (timestamps match)
+            last = store.last()
+            if last is None or last.timestamp != self._latest_1m.timestamp:
+                forming = self._latest_1m
+        
+        key = (store.version, self._candle_key(forming))
+        entry = self._indicator_cache.get(timeframe)
+        if entry is not None and entry.key == key:
+            self._indicator_cache_stats['hits'] += 1
+            return dict(entry.values)
+        
+        if entry is None or entry.version != store.version:
+            entry = _IndicatorCacheEntry(version=store.version, closed=store.candles(100))
+            self._indicator_cache[timeframe] = entry
+            self._indicator_cache_stats['rebuilds'] += 1
+        else:
+            self._indicator_cache_stats['incremental'] += 1
+        
+        entry.values = self._calculate_latest_indicators(timeframe, entry, forming)
+        entry.key = key
+        return dict(entry.values)
+    
+    @staticmethod
+    def _candle_key(candle: Optional[Candle]) -> Optional[tuple]:
+        if candle is None:
+            return None
+        return (candle.timestamp, candle.open, candle.high, candle.low, candle.close, candle.volume)
+    
+    def _calculate_latest_indicators(
+        self,
+        timeframe: str,
+        entry: '_IndicatorCacheEntry',
+        forming: Optional[Candle]
+    ) -> Dict[str, float]:
+        """Indicator dict for the closed window in `entry` plus the forming candle."""
+        candles = entry.closed + [forming] if forming else list(entry.closed)
+        if len(candles) < 20:
             return {}
             
         try:
-            # Convert to DataFrame
-            df = pd.DataFrame({
-                'open': [c.open for c in candles],
-                'high': [c.high for c in candles],
-                'low': [c.low for c in candles],
-                'close': [c.close for c in candles],
-                'volume': [c.volume for c in candles]
-            })
-            
-            if timeframe == '1h':
-                # Debug logging for 1h timeframe
-                pass
+            computed = self._streaming_indicator_values(timeframe, entry, forming)
+            if computed is None:
+                computed = self._batch_indicator_values(timeframe, candles)
+            latest, bb_result, stoch_result, atr_result = computed
             
-            # Calculate indicators
-            try:
-                result_df = self.talib_calculator.calculate_all(df)
-            except Exception as e:
-                self.logger.error(f"TALib calculation failed for {timeframe}: {e}")
-                result_df = df.copy()
+            # Map specific keys for frontend/demo compatibility
+            if 'rsi_6' in latest:
+                latest['rsi'] = latest['rsi_6']
             
-            # Calculate additional Trend Pullback indicators
-            # VWAP
-            vwap_series = self.vwap_calculator.calculate_vwap_series(candles)
-            if vwap_series is not None:
-                result_df['vwap'] = vwap_series.values
-            else:
-                result_df['vwap'] = 0.0
+            # Construct nested objects for Dashboard
             
-            # Bollinger Bands
-            bb_result = self.bollinger_calculator.calculate_bands(candles)
+            # 1. Bollinger Bands
             if bb_result:
-                result_df['bb_upper'] = bb_result.upper_band
-                result_df['bb_middle'] = bb_result.middle_band
-                result_df['bb_lower'] = bb_result.lower_band
-            else:
-                result_df['bb_upper'] = 0.0
-                result_df['bb_middle'] = 0.0
-                result_df['bb_lower'] = 0.0
+                latest['bollinger'] = {
+                    'upper_band': bb_result.upper_band,
+                    'middle_band': bb_result.middle_band,
+                    'lower_band': bb_result.lower_band,
+                    'bandwidth': bb_result.bandwidth,
+                    'percent_b': bb_result.percent_b
+                }
             
-            # StochRSI
-            stoch_result = self.stoch_rsi_calculator.calculate_stoch_rsi(candles)
+            # 2. StochRSI
             if stoch_result:
-                result_df['stoch_k'] = stoch_result.k_value
-                result_df['stoch_d'] = stoch_result.d_value
-                # Add nested dict for frontend compatibility
-                result_df['stoch_rsi'] = [{'k': stoch_result.k_value, 'd': stoch_result.d_value}] * len(result_df)
+                latest['stoch_rsi'] = {
+                    'k': stoch_result.k_value,
+                    'd': stoch_result.d_value,
+                    'zone': stoch_result.zone.value
+                }
             else:
-                result_df['stoch_k'] = 0.0
-                result_df['stoch_d'] = 0.0
-                result_df['stoch_rsi'] = [{'k': 0.0, 'd': 0.0}] * len(result_df)
+                # Debug logging if StochRSI is missing
+                self.logger.warning(f"StochRSI failed for {timeframe}. Candles: {len(candles)}. Min req: {self.stoch_rsi_calculator.rsi_period + self.stoch_rsi_calculator.stoch_period + self.stoch_rsi_calculator.k_period + self.stoch_rsi_calculator.d_period}")
             
-            # Return latest values as dict
-            if not result_df.empty:
-                # Handle NaN values safely for JSON serialization/display
-                latest = result_df.iloc[-1].to_dict()
-                
-                # Map specific keys for frontend/demo compatibility
-                if 'rsi_6' in latest:
-                    latest['rsi'] = latest['rsi_6']
-                
-                # Construct nested objects for Dashboard
-                
-                # 1. Bollinger Bands
-                if bb_result:
-                    latest['bollinger'] = {
-                        'upper_band': bb_result.upper_band,
-                        'middle_band': bb_result.middle_band,
-                        'lower_band': bb_result.lower_band,
-                        'bandwidth': bb_result.bandwidth,
-                        'percent_b': bb_result.percent_b
-                    }
-                
-                # 2. StochRSI
-                if stoch_result:
-                    latest['stoch_rsi'] = {
-                        'k': stoch_result.k_value,
-                        'd': stoch_result.d_value,
-                        'zone': stoch_result.zone.value
-                    }
-                else:
-                    # Debug logging if StochRSI is missing
-                    self.logger.warning(f"StochRSI failed for {timeframe}. Candles: {len(candles)}. Min req: {self.stoch_rsi_calculator.rsi_period + self.stoch_rsi_calculator.stoch_period + self.stoch_rsi_calculator.k_period + self.stoch_rsi_calculator.d_period}")
-                
-                # 3. Liquidity Zones (Volume Upgrade) - SAFE ACCESS
+            # 3. Liquidity Zones (Volume Upgrade) - SAFE ACCESS
+            # Structural levels: computed once per closed candle, reused by forming ticks
+            if not entry.zones_ready:
+                entry.zones_ready = True
                 try:
                     liquidity_detector = getattr(self.signal_generator, 'liquidity_zone_detector', None)
                     if liquidity_detector is not None:
-                        atr_val = latest.get('atr')
                         zones_result = liquidity_detector.detect_zones(
                             candles, 
                             current_price=latest['close'], 
-                            atr_value=atr_val
+                            atr_value=atr_result.atr_value if atr_result else None
                         )
                         if zones_result:
-                            latest['liquidity_zones'] = zones_result.to_dict()
+                            entry.liquidity_zones = zones_result.to_dict()
                 except Exception as e:
                     self.logger.debug(f"Liquidity zones not available: {e}")
+            if entry.liquidity_zones is not None:
+                latest['liquidity_zones'] = entry.liquidity_zones
 
-                # 4. SFP (SOTA) - SAFE ACCESS
-                try:
-                    sfp_detector = getattr(self.signal_generator, 'sfp_detector', None)
-                    if sfp_detector is not None:
-                        sfp_result = sfp_detector.detect(candles)
-                        if sfp_result.is_valid:
-                            latest['sfp'] = sfp_result.to_dict()
-                except Exception as e:
-                    self.logger.debug(f"SFP not available: {e}")
+            # 4. SFP (SOTA) - SAFE ACCESS
+            try:
+                sfp_detector = getattr(self.signal_generator, 'sfp_detector', None)
+                if sfp_detector is not None:
+                    sfp_result = sfp_detector.detect(candles)
+                    if sfp_result.is_valid:
+                        latest['sfp'] = sfp_result.to_dict()
+            except Exception as e:
+                self.logger.debug(f"SFP not available: {e}")
 
-                # 5. Momentum Velocity (SOTA) - SAFE ACCESS
-                try:
-                    velocity_calc = getattr(self.signal_generator, 'momentum_velocity_calculator', None)
-                    if velocity_calc is not None:
-                        velocity_res = velocity_calc.calculate(candles)
-                        if velocity_res:
-                            latest['velocity'] = {
-                                'value': float(velocity_res.velocity),
-                                'is_fomo': bool(velocity_res.is_fomo_spike),
-                                'is_crash': bool(velocity_res.is_crash_drop)
-                            }
-                except Exception as e:
-                    self.logger.debug(f"Velocity not available: {e}")
+            # 5. Momentum Velocity (SOTA) - SAFE ACCESS
+            try:
+                velocity_calc = getattr(self.signal_generator, 'momentum_velocity_calculator', None)
+                if velocity_calc is not None:
+                    velocity_res = velocity_calc.calculate(candles)
+                    if velocity_res:
+                        latest['velocity'] = {
+                            'value': float(velocity_res.velocity),
+                            'is_fomo': bool(velocity_res.is_fomo_spike),
+                            'is_crash': bool(velocity_res.is_crash_drop)
+                        }
+            except Exception as e:
+                self.logger.debug(f"Velocity not available: {e}")
 
-                return {k: (v if pd.notna(v) else 0.0) for k, v in latest.items()}
-            return {}
+            return {k: (v if pd.notna(v) else 0.0) for k, v in latest.items()}
         except Exception as e:
             self.logger.error(f"Error calculating indicators: {e}")
             return {}
+    
+    def _streaming_indicator_values(
+        self,
+        timeframe: str,
+        entry: '_IndicatorCacheEntry',
+        forming: Optional[Candle]
+    ) -> Optional[tuple]:
+        """
+        Last-bar values from the incremental engine: O(1) per tick.
+        
+        Returns (latest, bollinger, stoch_rsi, atr), or None when the engine
+        is missing or not in step with the candle buffer.
+        """
+        if not self.indicator_engine:
+            return None
+        snapshot = self.indicator_engine.get_snapshot(self.symbol, timeframe)
+        if snapshot is None or not snapshot.matches(entry.closed):
+            return None
+        if forming is not None:
+            snapshot = self.indicator_engine.peek(self.symbol, timeframe, forming)
+            if snapshot is None:
+                return None
+        
+        bar = forming or entry.closed[-1]
+        if entry.volume_tail is None:
+            entry.volume_tail = [c.volume for c in entry.closed[-20:]]
+        volumes = entry.volume_tail[-19:] + [forming.volume] if forming else entry.volume_tail
+        
+        nan = float('nan')
+        latest = {
+            'open': bar.open,
+            'high': bar.high,
+            'low': bar.low,
+            'close': bar.close,
+            'volume': bar.volume,
+            'ema_7': snapshot.ema.get(7, nan),
+            'ema_25': snapshot.ema.get(25, nan),
+            'rsi_6': snapshot.rsi.get(6, nan),
+            'volume_ma_20': sum(volumes) / 20 if len(volumes) == 20 else nan,
+            'vwap': snapshot.vwap.vwap if snapshot.vwap else 0.0,
+        }
+        
+        bb_result = snapshot.bollinger
+        latest['bb_upper'] = bb_result.upper_band if bb_result else 0.0
+        latest['bb_middle'] = bb_result.middle_band if bb_result else 0.0
+        latest['bb_lower'] = bb_result.lower_band if bb_result else 0.0
+        
+        stoch_result = snapshot.stoch_rsi
+        latest['stoch_k'] = stoch_result.k_value if stoch_result else 0.0
+        latest['stoch_d'] = stoch_result.d_value if stoch_result else 0.0
+        latest['stoch_rsi'] = {'k': latest['stoch_k'], 'd': latest['stoch_d']}
+        return latest, bb_result, stoch_result, snapshot.atr
+    
+    def _batch_indicator_values(self, timeframe: str, candles: List[Candle]) -> tuple:
+        """
+        Last-bar values recomputed over the whole window (no engine).
+        
+        Returns (latest, bollinger, stoch_rsi, None); consumers compute ATR
+        themselves on this path.
+        """
+        arrays = CandleArrays.from_candles(candles)
+        
+        # Convert to DataFrame (straight from the columns)
+        df = arrays.to_dataframe()
+        
+        # Calculate indicators
+        try:
+            result_df = self.talib_calculator.calculate_all(df)
+        except Exception as e:
+            self.logger.error(f"TALib calculation failed for {timeframe}: {e}")
+            result_df = df.copy()
+        
+        # Calculate additional Trend Pullback indicators
+        # VWAP
+        vwap_series = self.vwap_calculator.calculate_vwap_series(arrays)
+        if vwap_series is not None:
+            result_df['vwap'] = vwap_series.values
+        else:
+            result_df['vwap'] = 0.0
+        
+        # Bollinger Bands
+        bb_result = self.bollinger_calculator.calculate_bands(arrays)
+        if bb_result:
+            result_df['bb_upper'] = bb_result.upper_band
+            result_df['bb_middle'] = bb_result.middle_band
+            result_df['bb_lower'] = bb_result.lower_band
+        else:
+            result_df['bb_upper'] = 0.0
+            result_df['bb_middle'] = 0.0
+            result_df['bb_lower'] = 0.0
+        
+        # StochRSI
+        stoch_result = self.stoch_rsi_calculator.calculate_stoch_rsi(arrays)
+        if stoch_result:
+            result_df['stoch_k'] = stoch_result.k_value
+            result_df['stoch_d'] = stoch_result.d_value
+            # Add nested dict for frontend compatibility
+            result_df['stoch_rsi'] = [{'k': stoch_result.k_value, 'd': stoch_result.d_value}] * len(result_df)
+        else:
+            result_df['stoch_k'] = 0.0
+            result_df['stoch_d'] = 0.0
+            result_df['stoch_rsi'] = [{'k': 0.0, 'd': 0.0}] * len(result_df)
+        
+        # Latest values as dict
+        return result_df.iloc[-1].to_dict(), bb_result, stoch_result, None
 
     def get_historical_data_with_indicators(
         self, 
@@ -1183,31 +1485,29 @@ class RealtimeService:
         # Use provided candles or fetch from buffer
         if candles is None:
             candles = self.get_candles(timeframe, limit=limit)
+            arrays = self.get_candle_arrays(timeframe, limit=limit)
+        else:
+            arrays = None
         
         # Append current forming candle if available (for 1m)
         if timeframe == '1m' and self._latest_1m:
             if not candles or candles[-1].timestamp != self._latest_1m.timestamp:
                 candles.append(self._latest_1m)
+                if arrays is not None:
+                    arrays = arrays.appended(self._latest_1m)
                 
         if not candles:
             return []
             
         try:
-            # Convert to DataFrame for calculation
-            df = pd.DataFrame({
-                'open': [c.open for c in candles],
-                'high': [c.high for c in candles],
-                'low': [c.low for c in candles],
-                'close': [c.close for c in candles],
-                'volume': [c.volume for c in candles]
-            })
+            # Calculate indicators (buffer columns when available, else the candle list)
+            indicator_input = arrays if arrays is not None else candles
             
-            # Calculate indicators
             # VWAP
-            vwap_series = self.vwap_calculator.calculate_vwap_series(candles)
+            vwap_series = self.vwap_calculator.calculate_vwap_series(indicator_input)
             
             # Bollinger Bands - use series method for arrays
-            bb_series = self.bollinger_calculator.calculate_bands_series(candles)
+            bb_series = self.bollinger_calculator.calculate_bands_series(indicator_input)
             
             # Prepare result list
             result = []
@@ -1301,7 +1601,10 @@ class RealtimeService:
             },
             'signals': {
                 'latest': str(self._latest_signal) if self._latest_signal else None
-            }
+            },
+            'indicator_cache': dict(self._indicator_cache_stats),
+            'indicator_pool': self.indicator_pool.get_statistics() if self.indicator_pool else None,
+            'paper_pipeline': {**self._paper_stats, 'queued': len(self._paper_jobs)}
         }
     
     def is_running(self) -> bool:
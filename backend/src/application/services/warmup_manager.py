@@ -17,16 +17,18 @@ Critical Rules:
 
 import logging
 import time
-from datetime import datetime, timezone
 from typing import List, Optional, Any, TYPE_CHECKING
 
 from ...domain.entities.candle import Candle
 from ...domain.entities.state_models import WarmupResult
+from ...domain.services.anchored_vwap import ANCHOR_DAY, session_key
 from ...domain.interfaces import (
     IRestClient,
     IVWAPCalculator,
     IStochRSICalculator,
     IADXCalculator,
+    IIncrementalIndicatorEngine,
+    IndicatorSnapshot,
 )
 
 if TYPE_CHECKING:
@@ -50,7 +52,8 @@ class WarmupManager:
         vwap_calculator: IVWAPCalculator,
         stoch_rsi_calculator: IStochRSICalculator,
         adx_calculator: IADXCalculator,
-        aggregator: Optional['DataAggregator'] = None
+        aggregator: Optional['DataAggregator'] = None,
+        indicator_engine: Optional[IIncrementalIndicatorEngine] = None
     ):
         """
         Initialize WarmupManager.
@@ -61,12 +64,16 @@ class WarmupManager:
             stoch_rsi_calculator: StochRSI calculator instance
             adx_calculator: ADX calculator instance
             aggregator: Data aggregator (optional)
+            indicator_engine: Streaming indicator engine (optional); warm-up
+                candles are fed through it and the final values read from
+                its snapshot instead of recomputed by the calculators
         """
         self.rest_client = rest_client
         self.vwap_calculator = vwap_calculator
         self.stoch_rsi_calculator = stoch_rsi_calculator
         self.adx_calculator = adx_calculator
         self.aggregator = aggregator
+        self.indicator_engine = indicator_engine
         
         self._is_warming_up = False
         self._candles_processed = 0
@@ -117,12 +124,14 @@ class WarmupManager:
             self.logger.info(f"📊 Loaded {len(candles)} historical candles")
             
             # Step 2: Process candles through indicators (NO SIGNALS!)
-            self._process_candles_for_warmup(candles)
+            snapshot = self._process_candles_for_warmup(candles, symbol, interval)
+            if snapshot is not None and not snapshot.matches(candles):
+                snapshot = None
             
             # Step 3: Get current indicator values
-            vwap_value = self._get_current_vwap(candles)
-            stoch_k, stoch_d = self._get_current_stoch_rsi(candles)
-            adx_value = self._get_current_adx(candles)
+            vwap_value = self._get_current_vwap(candles, snapshot)
+            stoch_k, stoch_d = self._get_current_stoch_rsi(candles, snapshot)
+            adx_value = self._get_current_adx(candles, snapshot)
             
             duration = time.time() - start_time
             
@@ -178,7 +187,12 @@ class WarmupManager:
             self.logger.error(f"Failed to fetch candles: {e}")
             return []
     
-    def _process_candles_for_warmup(self, candles: List[Candle]) -> None:
+    def _process_candles_for_warmup(
+        self,
+        candles: List[Candle],
+        symbol: str = "btcusdt",
+        interval: str = "15m"
+    ) -> Optional[IndicatorSnapshot]:
         """
         Process candles through indicators WITHOUT triggering signals.
         
@@ -187,29 +201,44 @@ class WarmupManager:
         
         Args:
             candles: List of historical candles
+            symbol: Trading symbol (indicator engine stream)
+            interval: Candle interval (indicator engine stream)
+            
+        Returns:
+            Indicator engine snapshot after the last candle (None without engine)
         """
-        prev_date: Optional[datetime] = None
+        prev_session: Optional[int] = None
+        snapshot: Optional[IndicatorSnapshot] = None
+        if self.indicator_engine:
+            self.indicator_engine.reset(symbol, interval)
         
         for candle in candles:
-            # Check for VWAP daily reset (00:00 UTC)
-            current_date = candle.timestamp.date() if candle.timestamp.tzinfo else \
-                          candle.timestamp.replace(tzinfo=timezone.utc).date()
+            # Check for VWAP session reset (00:00 UTC for the default anchor)
+            current_session = self._vwap_session(candle)
             
-            if prev_date and current_date != prev_date:
-                # New day - reset VWAP
+            if prev_session is not None and current_session != prev_session:
+                # New session - reset VWAP
                 self._reset_vwap_for_new_day()
-                self.logger.debug(f"VWAP reset at day boundary: {current_date}")
+                self.logger.debug(f"VWAP reset at session boundary: {candle.timestamp}")
             
-            prev_date = current_date
+            prev_session = current_session
             
             # Feed to aggregator if available (for multi-timeframe)
             if self.aggregator:
                 # Note: is_closed=True for historical data
                 self.aggregator.add_candle_1m(candle, is_closed=True)
             
+            if self.indicator_engine:
+                snapshot = self.indicator_engine.update(symbol, interval, candle)
+            
             self._candles_processed += 1
         
         self.logger.debug(f"Processed {self._candles_processed} candles for warm-up")
+        return snapshot
+    
+    def _vwap_session(self, candle: Candle) -> int:
+        """VWAP session key of a candle, using the calculator's anchor."""
+        return session_key(candle.timestamp, getattr(self.vwap_calculator, 'anchor', ANCHOR_DAY))
     
     def _reset_vwap_for_new_day(self) -> None:
         """
@@ -224,19 +253,19 @@ class WarmupManager:
             self.vwap_calculator._cumulative_volume = 0.0
             self.vwap_calculator._cumulative_vwap = 0.0
     
-    def _get_current_vwap(self, candles: List[Candle]) -> float:
+    def _get_current_vwap(self, candles: List[Candle], snapshot: Optional[IndicatorSnapshot] = None) -> float:
         """Get current VWAP value after warm-up."""
         try:
-            result = self.vwap_calculator.calculate_vwap(candles)
+            result = snapshot.vwap if snapshot else self.vwap_calculator.calculate_vwap(candles)
             return result.vwap if result else 0.0
         except Exception as e:
             self.logger.warning(f"Failed to get VWAP: {e}")
             return 0.0
     
-    def _get_current_stoch_rsi(self, candles: List[Candle]) -> tuple:
+    def _get_current_stoch_rsi(self, candles: List[Candle], snapshot: Optional[IndicatorSnapshot] = None) -> tuple:
         """Get current StochRSI K and D values."""
         try:
-            result = self.stoch_rsi_calculator.calculate_stoch_rsi(candles)
+            result = snapshot.stoch_rsi if snapshot else self.stoch_rsi_calculator.calculate_stoch_rsi(candles)
             if result:
                 return result.k_value, result.d_value
             return 0.0, 0.0
@@ -244,10 +273,10 @@ class WarmupManager:
             self.logger.warning(f"Failed to get StochRSI: {e}")
             return 0.0, 0.0
     
-    def _get_current_adx(self, candles: List[Candle]) -> float:
+    def _get_current_adx(self, candles: List[Candle], snapshot: Optional[IndicatorSnapshot] = None) -> float:
         """Get current ADX value."""
         try:
-            result = self.adx_calculator.calculate_adx(candles)
+            result = snapshot.adx if snapshot else self.adx_calculator.calculate_adx(candles)
             return result.adx_value if result else 0.0
         except Exception as e:
             self.logger.warning(f"Failed to get ADX: {e}")
@@ -267,15 +296,10 @@ class WarmupManager:
         if not prev_candle:
             return False
         
-        # Get dates in UTC
-        current_date = candle.timestamp.date() if candle.timestamp.tzinfo else \
-                      candle.timestamp.replace(tzinfo=timezone.utc).date()
-        prev_date = prev_candle.timestamp.date() if prev_candle.timestamp.tzinfo else \
-                   prev_candle.timestamp.replace(tzinfo=timezone.utc).date()
-        
-        if current_date != prev_date:
+        # Same session index as the VWAP calculator (UTC day by default)
+        if self._vwap_session(candle) != self._vwap_session(prev_candle):
             self._reset_vwap_for_new_day()
-            self.logger.info(f"🔄 VWAP reset for new day: {current_date}")
+            self.logger.info(f"🔄 VWAP reset for new session: {candle.timestamp}")
             return True
         
         return False
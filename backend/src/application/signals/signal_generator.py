@@ -18,7 +18,8 @@ from ...domain.interfaces import (
     IStochRSICalculator,
     ISFPDetector,
     SFPType,
-    IATRCalculator
+    IATRCalculator,
+    IndicatorSnapshot
 )
 from ..services.tp_calculator import TPCalculator
 from ..services.stop_loss_calculator import StopLossCalculator
@@ -43,6 +44,11 @@ class MarketContext:
 
 
 class SignalGenerator:
+    # Limit Sniper parameters (swing lookback in bars, max distance to swing level)
+    SNIPER_LOOKBACK = 20
+    SNIPER_PROXIMITY = 0.015
+    MIN_CANDLES = 50
+
     def __init__(
         self,
         vwap_calculator: IVWAPCalculator,
@@ -68,26 +74,46 @@ class SignalGenerator:
         self.account_size = account_size
         self.logger = logging.getLogger(__name__)
 
-    def _prepare_market_context(self, candles: List[Candle]) -> MarketContext:
+    def _prepare_market_context(
+        self,
+        candles: List[Candle],
+        indicator_snapshot: Optional[IndicatorSnapshot] = None
+    ) -> MarketContext:
         current_candle = candles[-1]
         ctx = MarketContext(candles=candles, current_candle=current_candle, current_price=current_candle.close)
         
-        ctx.vwap_result = self.vwap_calculator.calculate_vwap(candles)
-        ctx.stoch_result = self.stoch_rsi_calculator.calculate_stoch_rsi(candles)
-        ctx.bb_result = self.bollinger_calculator.calculate_bands(candles, ctx.current_price)
-        
-        if self.atr_calculator:
-            ctx.atr_result = self.atr_calculator.calculate_atr(candles)
+        # Reuse streaming results only if they were computed on this exact candle;
+        # otherwise fall back to the batch calculators.
+        if indicator_snapshot is not None and indicator_snapshot.matches(candles):
+            ctx.vwap_result = indicator_snapshot.vwap
+            ctx.stoch_result = indicator_snapshot.stoch_rsi
+            ctx.bb_result = indicator_snapshot.bollinger
+            if self.atr_calculator:
+                ctx.atr_result = indicator_snapshot.atr
+        else:
+            ctx.vwap_result = self.vwap_calculator.calculate_vwap(candles)
+            ctx.stoch_result = self.stoch_rsi_calculator.calculate_stoch_rsi(candles)
+            ctx.bb_result = self.bollinger_calculator.calculate_bands(candles, ctx.current_price)
+            
+            if self.atr_calculator:
+                ctx.atr_result = self.atr_calculator.calculate_atr(candles)
             
         ctx.indicators = {
             'atr': ctx.atr_result.atr_value if ctx.atr_result else 0
         }
         return ctx
 
-    def generate_signal(self, candles: List[Candle], symbol: str, htf_bias: str = 'NEUTRAL', **kwargs) -> Optional[TradingSignal]:
-        if len(candles) < 50: return None
+    def generate_signal(
+        self,
+        candles: List[Candle],
+        symbol: str,
+        htf_bias: str = 'NEUTRAL',
+        indicator_snapshot: Optional[IndicatorSnapshot] = None,
+        **kwargs
+    ) -> Optional[TradingSignal]:
+        if len(candles) < self.MIN_CANDLES: return None
         config = StrategyRegistry.get_config(symbol)
-        ctx = self._prepare_market_context(candles)
+        ctx = self._prepare_market_context(candles, indicator_snapshot)
         
         # Use Limit Sniper Logic
         return self._strategy_liquidity_sniper(ctx, config, symbol, htf_bias)
@@ -96,13 +122,44 @@ class SignalGenerator:
         if not ctx.atr_result: return None
         
         # 1. Find recent Swing High/Low
-        lookback = 20
+        lookback = self.SNIPER_LOOKBACK
         recent_candles = ctx.candles[-(lookback+1):-1]
         swing_low = min([c.low for c in recent_candles])
         swing_high = max([c.high for c in recent_candles])
         
+        # SOTA: HTF Bias Filter DISABLED for SFP (Counter-trend nature)
+        # if signal_type == SignalType.BUY and htf_bias == 'BEARISH':
+        #     return None
+        # if signal_type == SignalType.SELL and htf_bias == 'BULLISH':
+        #     return None
+
+        return self.build_sniper_signal(
+            symbol=symbol,
+            generated_at=ctx.current_candle.timestamp,
+            current_price=ctx.current_price,
+            swing_low=swing_low,
+            swing_high=swing_high,
+            vwap=ctx.vwap_result.vwap if ctx.vwap_result else None,
+            indicators=ctx.indicators
+        )
+
+    def build_sniper_signal(
+        self,
+        symbol: str,
+        generated_at: datetime,
+        current_price: float,
+        swing_low: float,
+        swing_high: float,
+        vwap: Optional[float],
+        indicators: Dict[str, Any]
+    ) -> Optional[TradingSignal]:
+        """
+        Limit Sniper decision for one bar, given its swing levels and VWAP.
+        
+        Shared by the per-candle path above and the vectorized backtest
+        precompute, so both produce identical signals.
+        """
         # 2. Check Proximity
-        current_price = ctx.current_price
         dist_to_low = (current_price - swing_low) / swing_low
         dist_to_high = (swing_high - current_price) / swing_high
         
@@ -110,7 +167,7 @@ class SignalGenerator:
         limit_price = 0.0
         
         # BUY: Price near Swing Low
-        if 0 < dist_to_low < 0.015:
+        if 0 < dist_to_low < self.SNIPER_PROXIMITY:
             limit_price = swing_low * 0.999
             signal_type = SignalType.BUY
             # SL = 0.5% below limit price (Institutional standard)
@@ -118,7 +175,7 @@ class SignalGenerator:
             tp1 = limit_price * 1.02 # 2% Target (4:1 R:R)
             
         # SELL: Price near Swing High
-        elif 0 < dist_to_high < 0.015:
+        elif 0 < dist_to_high < self.SNIPER_PROXIMITY:
             limit_price = swing_high * 1.001
             signal_type = SignalType.SELL
             stop_loss = limit_price * 1.005
@@ -126,31 +183,25 @@ class SignalGenerator:
             
         if not signal_type: return None
 
-        # SOTA: HTF Bias Filter DISABLED for SFP (Counter-trend nature)
-        # if signal_type == SignalType.BUY and htf_bias == 'BEARISH':
-        #     return None
-        # if signal_type == SignalType.SELL and htf_bias == 'BULLISH':
-        #     return None
-
         # 3. Calculate Score (for Shark Tank)
         # Higher score if closer to VWAP stretch or other confluence
         score = 0.7 # Base
-        if ctx.vwap_result:
-            vwap_dist = abs(current_price - ctx.vwap_result.vwap) / ctx.vwap_result.vwap
+        if vwap is not None:
+            vwap_dist = abs(current_price - vwap) / vwap
             score += min(0.2, vwap_dist * 10) # Max +0.2 bonus
 
         signal = TradingSignal(
             symbol=symbol,
             signal_type=signal_type,
             confidence=score,
-            generated_at=ctx.current_candle.timestamp,
-            price=ctx.current_price,
+            generated_at=generated_at,
+            price=current_price,
             entry_price=limit_price,
             is_limit_order=True,
             stop_loss=stop_loss,
             tp_levels={'tp1': tp1, 'tp2': tp1 * 1.05, 'tp3': tp1 * 1.1},
             risk_reward_ratio=(abs(tp1 - limit_price) / abs(limit_price - stop_loss)),
             reasons=[f"Sniper Limit @ {limit_price:.2f}"],
-            indicators=ctx.indicators
+            indicators=indicators
         )
-        return signal
\ No newline at end of file
+        return signal
@@ -129,6 +129,39 @@ class MultiTokenConfig:
             return DEFAULT_SYMBOLS.copy()
 
 
+@dataclass
+class StreamCaptureConfig:
+    """
+    Record / replay of the raw Binance combined streams.
+    
+    Environment:
+        STREAM_RECORD_PATH: Append live messages to this gzip capture
+        STREAM_REPLAY_PATH: Drive the pipeline from this capture instead of Binance
+        STREAM_REPLAY_SPEED: 1 = recorded pace, N = N times faster, "max" = as fast as possible
+    """
+    record_path: Optional[str] = None
+    replay_path: Optional[str] = None
+    replay_speed: Optional[float] = 1.0
+    
+    def __post_init__(self):
+        self.record_path = self.record_path or os.getenv("STREAM_RECORD_PATH") or None
+        self.replay_path = self.replay_path or os.getenv("STREAM_REPLAY_PATH") or None
+        
+        speed = os.getenv("STREAM_REPLAY_SPEED")
+        if speed:
+            if speed.strip().lower() == "max":
+                self.replay_speed = None
+            else:
+                try:
+                    self.replay_speed = float(speed)
+                except ValueError:
+                    logging.warning(f"Invalid STREAM_REPLAY_SPEED: {speed}. Using 1x")
+                    self.replay_speed = 1.0
+        if self.replay_speed is not None and self.replay_speed <= 0:
+            logging.warning(f"Invalid replay speed: {self.replay_speed}. Using 1x")
+            self.replay_speed = 1.0
+
+
 @dataclass
 class BookTickerConfig:
     """
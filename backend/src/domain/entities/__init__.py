@@ -1,6 +1,7 @@
 """Domain entities"""
 
 from .candle import Candle
+from .candle_store import CandleStore, CandleArrays
 from .indicator import Indicator
 from .market_data import MarketData
 from .enhanced_signal import EnhancedSignal, TPLevels
@@ -11,6 +12,8 @@ from .exchange_models import Position, OrderStatus
 
 __all__ = [
     'Candle', 
+    'CandleStore',
+    'CandleArrays',
     'Indicator', 
     'MarketData', 
     'EnhancedSignal', 
@@ -84,6 +84,22 @@ class Candle:
         if self.volume < 0:
             raise ValueError(f"Volume must be non-negative, got {self.volume}")
     
+    @classmethod
+    def trusted(
+        cls, timestamp: datetime, open: float, high: float, low: float, close: float, volume: float
+    ) -> 'Candle':
+        """
+        Build a candle without running the validation rules.
+        
+        For hot paths fed by a trusted source (exchange klines already
+        decoded by the parser); everything else should use the constructor.
+        """
+        candle = object.__new__(cls)
+        candle.__dict__.update(
+            timestamp=timestamp, open=open, high=high, low=low, close=close, volume=volume
+        )
+        return candle
+    
     @property
     def is_bullish(self) -> bool:
         """Check if candle is bullish (close > open)"""
@@ -0,0 +1,293 @@
+"""
+CandleStore - Domain Model
+
+Columnar in-memory candle buffer.
+
+Candles are kept as contiguous float64 columns (timestamp, open, high, low,
+close, volume) in a ring buffer, so indicator code can work on NumPy views
+instead of rebuilding lists of Candle objects on every tick.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .candle import Candle
+
+
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_ONE_MS = timedelta(milliseconds=1)
+
+MS_PER_DAY = 86_400_000
+
+
+def timestamp_to_ms(timestamp: datetime) -> float:
+    """Epoch milliseconds of a candle timestamp (naive timestamps are taken as UTC)."""
+    epoch = _EPOCH_UTC if timestamp.tzinfo is not None else _EPOCH_NAIVE
+    return (timestamp - epoch) / _ONE_MS
+
+
+@dataclass(frozen=True)
+class CandleArrays:
+    """
+    OHLCV columns of a candle sequence (chronological order).
+
+    Attributes:
+        timestamp: Candle open time, epoch milliseconds (UTC)
+        open, high, low, close, volume: Price / volume columns
+
+    Arrays returned by CandleStore.arrays() are views into the store and
+    are only valid until the store is next modified; copy them to keep them.
+    """
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_candles(cls, candles: Sequence[Candle]) -> 'CandleArrays':
+        data = np.array(
+            [(timestamp_to_ms(c.timestamp), c.open, c.high, c.low, c.close, c.volume) for c in candles],
+            dtype=np.float64
+        ).reshape(-1, 6).T.copy()
+        return cls(*data)
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def tail(self, n: int) -> 'CandleArrays':
+        """Last `n` rows (views, no copy)."""
+        start = max(0, len(self) - n)
+        return CandleArrays(
+            self.timestamp[start:], self.open[start:], self.high[start:],
+            self.low[start:], self.close[start:], self.volume[start:]
+        )
+
+    def appended(self, candle: Candle) -> 'CandleArrays':
+        """New arrays with one more candle at the end (copies)."""
+        row = (timestamp_to_ms(candle.timestamp), candle.open, candle.high, candle.low, candle.close, candle.volume)
+        return CandleArrays(*(np.append(column, value) for column, value in zip(self._columns(), row)))
+
+    def to_candles(
+        self,
+        start: int = 0,
+        end: Optional[int] = None,
+        tz: Optional[tzinfo] = timezone.utc,
+        trusted: bool = False
+    ) -> List[Candle]:
+        """
+        Candle entities for rows [start, end) (all rows by default).
+
+        Args:
+            start, end: Row slice, as in self.close[start:end]
+            tz: Timezone of the returned timestamps; None gives naive UTC
+            trusted: Skip Candle validation, for rows that were taken from
+                Candle objects in the first place (Candle.trusted)
+        """
+        epoch = _EPOCH_NAIVE if tz is None else _EPOCH_UTC
+        times = [epoch + timedelta(milliseconds=ms) for ms in self.timestamp[start:end].tolist()]
+        if tz is not None and tz is not timezone.utc:
+            times = [ts.astimezone(tz) for ts in times]
+        make = Candle.trusted if trusted else Candle
+        return [
+            make(ts, o, h, lo, c, v)
+            for ts, o, h, lo, c, v in zip(
+                times, self.open[start:end].tolist(), self.high[start:end].tolist(),
+                self.low[start:end].tolist(), self.close[start:end].tolist(), self.volume[start:end].tolist()
+            )
+        ]
+
+    def day_index(self) -> np.ndarray:
+        """UTC day number of each row (for session-anchored indicators)."""
+        return np.floor_divide(self.timestamp, MS_PER_DAY).astype(np.int64)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """OHLCV DataFrame in the layout TALibCalculator.calculate_all expects."""
+        return pd.DataFrame({
+            'open': self.open,
+            'high': self.high,
+            'low': self.low,
+            'close': self.close,
+            'volume': self.volume
+        })
+
+    def _columns(self):
+        return (self.timestamp, self.open, self.high, self.low, self.close, self.volume)
+
+
+CandleInput = Union[Sequence[Candle], CandleArrays]
+
+
+def candle_column(candles: CandleInput, name: str) -> np.ndarray:
+    """
+    One price/volume column ('open', 'high', 'low', 'close', 'volume').
+
+    A view for CandleArrays; built directly from the attribute for Candle
+    lists (cheaper than converting every column).
+    """
+    if isinstance(candles, CandleArrays):
+        return getattr(candles, name)
+    return np.fromiter((getattr(c, name) for c in candles), dtype=np.float64, count=len(candles))
+
+
+def as_candle_arrays(candles: CandleInput) -> CandleArrays:
+    """Accept either a Candle sequence or CandleArrays; return CandleArrays."""
+    if isinstance(candles, CandleArrays):
+        return candles
+    return CandleArrays.from_candles(candles)
+
+
+class CandleStore:
+    """
+    Fixed-capacity ring buffer of candles with columnar NumPy storage.
+
+    Behaves like the `deque(maxlen=...)` it replaces (append, clear, len,
+    iteration, indexing) while also exposing zero-copy column views.
+
+    Storage is a (6, 2 * maxlen) array written left to right; when the write
+    position reaches the end, the live window is moved back to the front.
+    Every append is amortized O(1) and the live rows are always one
+    contiguous slice, so arrays() never copies.
+
+    Candle objects are built from the columns on first read (equal to the
+    appended candles, in their timezone, but new objects) and kept for the
+    contiguous range of rows read so far. candles() therefore only builds
+    the rows appended since the previous call - one per closed candle -
+    and rows that are never read back as entities cost no Python objects.
+
+    `version` increases on every modification, so derived values (e.g.
+    cached indicators) can tell whether the buffer changed since.
+
+    Usage:
+        store = CandleStore(maxlen=2000)
+        store.append(candle)
+        closes = store.arrays().close            # np.ndarray view
+        recent = store.candles(limit=100)        # List[Candle]
+    """
+
+    COLUMNS = 6
+
+    def __init__(self, maxlen: int = 2000):
+        if maxlen < 1:
+            raise ValueError(f"maxlen must be positive, got {maxlen}")
+        self.maxlen = maxlen
+        self._data = np.zeros((self.COLUMNS, 2 * maxlen), dtype=np.float64)
+        self._tzinfo = None  # timezone of the appended timestamps (None = naive)
+        # Built Candle objects per storage column; [_built_lo, _built_hi) is filled
+        self._objects: List[Optional[Candle]] = [None] * (2 * maxlen)
+        self._built_lo = self._built_hi = 0
+        self._start = 0
+        self._end = 0
+        self.version = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __bool__(self) -> bool:
+        return self._end > self._start
+
+    def __iter__(self) -> Iterator[Candle]:
+        return iter(self.candles())
+
+    def __getitem__(self, index: int) -> Candle:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("CandleStore index out of range")
+        return self._candle_at(self._start + index)
+
+    def _candle_at(self, position: int) -> Candle:
+        if self._built_lo <= position < self._built_hi:
+            return self._objects[position]
+        return self._build(position, position + 1)[0]
+
+    def _build(self, start: int, end: int) -> List[Candle]:
+        """Candle entities for storage columns [start, end)."""
+        # The values were validated when the original candles were built
+        return CandleArrays(*self._data).to_candles(start, end, self._tzinfo, trusted=True)
+
+    def _materialize(self, start: int) -> List[Candle]:
+        """Candles for storage columns [start, _end), building only rows not built yet."""
+        lo, hi = max(self._built_lo, self._start), self._built_hi
+        if lo >= hi or start > hi:
+            # Nothing reusable next to the requested rows
+            lo = hi = start
+        if start < lo:
+            self._objects[start:lo] = self._build(start, lo)
+            lo = start
+        if hi < self._end:
+            self._objects[hi:self._end] = self._build(hi, self._end)
+        self._built_lo, self._built_hi = lo, self._end
+        return self._objects[start:self._end]
+
+    def _compact(self) -> None:
+        size = len(self)
+        self._data[:, :size] = self._data[:, self._start:self._end]
+        lo, hi = max(self._built_lo, self._start), self._built_hi
+        objects = [None] * len(self._objects)
+        if lo < hi:
+            objects[lo - self._start:hi - self._start] = self._objects[lo:hi]
+            self._built_lo, self._built_hi = lo - self._start, hi - self._start
+        else:
+            self._built_lo = self._built_hi = 0
+        self._objects = objects
+        self._start, self._end = 0, size
+
+    def append(self, candle: Candle) -> None:
+        """Add a candle, evicting the oldest one when full."""
+        if self._end == self._data.shape[1]:
+            self._compact()
+        self._data[:, self._end] = (
+            timestamp_to_ms(candle.timestamp), candle.open, candle.high,
+            candle.low, candle.close, candle.volume
+        )
+        self._tzinfo = candle.timestamp.tzinfo
+        self._end += 1
+        self.version += 1
+        if self._end - self._start > self.maxlen:
+            self._objects[self._start] = None
+            self._start += 1
+
+    def extend(self, candles: Sequence[Candle]) -> None:
+        for candle in candles:
+            self.append(candle)
+
+    def replace_last(self, candle: Candle) -> None:
+        """Overwrite the newest candle in place (e.g. an updated forming candle)."""
+        if not self:
+            raise IndexError("replace_last on empty CandleStore")
+        self._end -= 1
+        self._objects[self._end] = None
+        self._built_hi = min(self._built_hi, self._end)
+        self.append(candle)
+
+    def clear(self) -> None:
+        self._objects = [None] * len(self._objects)
+        self._built_lo = self._built_hi = 0
+        self._start = self._end = 0
+        self.version += 1
+
+    def last(self) -> Optional[Candle]:
+        """Newest candle, or None when empty."""
+        return self._candle_at(self._end - 1) if self else None
+
+    def candles(self, limit: Optional[int] = None) -> List[Candle]:
+        """Newest `limit` candles (all when None) as a list, oldest first."""
+        start = self._start if limit is None else max(self._start, self._end - limit)
+        return self._materialize(start)
+
+    def arrays(self, limit: Optional[int] = None) -> CandleArrays:
+        """Newest `limit` rows as zero-copy column views."""
+        start = self._start if limit is None else max(self._start, self._end - limit)
+        window = self._data[:, start:self._end]
+        return CandleArrays(window[0], window[1], window[2], window[3], window[4], window[5])
+
+    def __repr__(self) -> str:
+        return f"CandleStore(size={len(self)}, maxlen={self.maxlen})"
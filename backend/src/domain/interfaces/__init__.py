@@ -19,7 +19,9 @@ from .i_indicator_calculator import (
     StochRSIResult,
     ADXResult,
     SwingPoint,
+    CandleInput,
 )
+from ..entities.candle_store import CandleArrays
 from .i_volume_delta_calculator import (
     IVolumeDeltaCalculator,
     VolumeDeltaResult,
@@ -48,6 +50,7 @@ from .i_rest_client import IRestClient
 from .i_data_aggregator import IDataAggregator
 from .i_book_ticker_client import IBookTickerClient, BookTickerData
 from .i_exchange_service import IExchangeService, ExchangeError
+from .i_incremental_indicator_engine import IIncrementalIndicatorEngine, IndicatorSnapshot
 
 __all__ = [
     # Indicator interfaces
@@ -80,6 +83,9 @@ __all__ = [
     'StochRSIResult',
     'ADXResult',
     'SwingPoint',
+    # Columnar candle input
+    'CandleArrays',
+    'CandleInput',
     # WebSocket
     'IWebSocketClient',
     'ConnectionState',
@@ -94,4 +100,7 @@ __all__ = [
     # Exchange Service
     'IExchangeService',
     'ExchangeError',
+    # Incremental Indicators
+    'IIncrementalIndicatorEngine',
+    'IndicatorSnapshot',
 ]
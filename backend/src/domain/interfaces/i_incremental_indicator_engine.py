@@ -0,0 +1,111 @@
+"""
+IIncrementalIndicatorEngine - Domain Interface
+
+Stateful indicator engine that is fed one closed candle at a time and keeps
+the latest indicator values per (symbol, timeframe) stream, so callers do not
+need to recompute every indicator over the whole history on each candle.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ..entities.candle import Candle
+
+
+@dataclass
+class IndicatorSnapshot:
+    """
+    Indicator values after the latest closed candle of one stream.
+
+    The result objects are the same types returned by the batch calculators
+    (VWAPResult, BollingerResult, StochRSIResult, ATRResult, ADXResult) and
+    are None while the indicator is still warming up.
+    """
+
+    symbol: str
+    timeframe: str
+    timestamp: datetime
+    candle_count: int
+    vwap: Optional[Any] = None
+    bollinger: Optional[Any] = None
+    stoch_rsi: Optional[Any] = None
+    atr: Optional[Any] = None
+    adx: Optional[Any] = None
+    ema: Dict[int, float] = field(default_factory=dict)
+    rsi: Dict[int, float] = field(default_factory=dict)
+
+    def matches(self, candles: List[Candle]) -> bool:
+        """True if this snapshot was produced by the last candle of the list."""
+        return bool(candles) and candles[-1].timestamp == self.timestamp
+
+
+class IIncrementalIndicatorEngine(ABC):
+    """
+    Interface for streaming indicator computation.
+
+    Implementations must return the same values as the batch calculators
+    for the same candle sequence, with O(1) work per update. A stream that
+    has seen more candles than a bounded history buffer holds (e.g. after
+    CandleStore eviction) is computed over the longer sequence.
+    """
+
+    @abstractmethod
+    def update(self, symbol: str, timeframe: str, candle: Candle) -> IndicatorSnapshot:
+        """
+        Feed one closed candle into the (symbol, timeframe) stream.
+
+        Candles that are not newer than the last one seen are ignored and
+        the current snapshot is returned unchanged.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle interval (1m, 15m, 1h, etc.)
+            candle: Closed candle
+
+        Returns:
+            IndicatorSnapshot after the update
+        """
+        pass
+
+    @abstractmethod
+    def get_snapshot(self, symbol: str, timeframe: str) -> Optional[IndicatorSnapshot]:
+        """
+        Get the latest snapshot of a stream.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle interval
+
+        Returns:
+            IndicatorSnapshot or None if the stream has no candles yet
+        """
+        pass
+
+    def peek(self, symbol: str, timeframe: str, candle: Candle) -> Optional[IndicatorSnapshot]:
+        """
+        Snapshot the stream would have if `candle` were its next closed
+        candle, without changing the stream (e.g. for a forming candle).
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Candle interval
+            candle: Candle to evaluate (typically still forming)
+
+        Returns:
+            IndicatorSnapshot, or None if the stream is empty or the
+            implementation does not support peeking
+        """
+        return None
+
+    @abstractmethod
+    def reset(self, symbol: Optional[str] = None, timeframe: Optional[str] = None) -> None:
+        """
+        Drop stream state.
+
+        Args:
+            symbol: Only reset streams of this symbol (all if None)
+            timeframe: Only reset streams of this timeframe (all if None)
+        """
+        pass
@@ -8,9 +8,11 @@ Infrastructure layer provides concrete implementations.
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 
 from ..entities.candle import Candle
+from ..entities.candle_store import CandleInput
 
 
 @dataclass
@@ -91,12 +93,12 @@ class IVWAPCalculator(ABC):
     """Interface for VWAP calculations."""
     
     @abstractmethod
-    def calculate_vwap(self, candles: List[Candle]) -> Optional[float]:
+    def calculate_vwap(self, candles: CandleInput) -> Optional[float]:
         """Calculate Volume Weighted Average Price."""
         pass
     
     @abstractmethod
-    def calculate_vwap_series(self, candles: List[Candle]) -> Optional[pd.Series]:
+    def calculate_vwap_series(self, candles: CandleInput) -> Optional[pd.Series]:
         """Calculate VWAP series for all candles."""
         pass
 
@@ -105,12 +107,12 @@ class IBollingerCalculator(ABC):
     """Interface for Bollinger Bands calculations."""
     
     @abstractmethod
-    def calculate_bands(self, candles: List[Candle]) -> Optional[BollingerBandsResult]:
+    def calculate_bands(self, candles: CandleInput) -> Optional[BollingerBandsResult]:
         """Calculate Bollinger Bands for latest candle."""
         pass
     
     @abstractmethod
-    def calculate_bands_series(self, candles: List[Candle]) -> Optional[BollingerBandsSeriesResult]:
+    def calculate_bands_series(self, candles: CandleInput) -> Optional[BollingerBandsSeriesResult]:
         """Calculate Bollinger Bands series for all candles."""
         pass
 
@@ -119,7 +121,7 @@ class IStochRSICalculator(ABC):
     """Interface for Stochastic RSI calculations."""
     
     @abstractmethod
-    def calculate_stoch_rsi(self, candles: List[Candle]) -> Optional[StochRSIResult]:
+    def calculate_stoch_rsi(self, candles: CandleInput) -> Optional[StochRSIResult]:
         """Calculate Stochastic RSI."""
         pass
 
@@ -137,9 +139,14 @@ class IATRCalculator(ABC):
     """Interface for ATR calculations."""
     
     @abstractmethod
-    def calculate_atr(self, candles: List[Candle]) -> Optional[float]:
+    def calculate_atr(self, candles: CandleInput) -> Optional[float]:
         """Calculate Average True Range."""
         pass
+    
+    @abstractmethod
+    def calculate_atr_series(self, candles: CandleInput) -> np.ndarray:
+        """Calculate ATR after every candle."""
+        pass
 
 
 class IVolumeSpikeDetector(ABC):
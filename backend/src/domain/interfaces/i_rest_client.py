@@ -5,6 +5,7 @@ Abstract interface for REST API client operations.
 Infrastructure layer provides concrete implementations (Binance, etc.).
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
@@ -39,6 +40,20 @@ class IRestClient(ABC):
         """
         pass
     
+    async def get_klines_async(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 100
+    ) -> List[Candle]:
+        """
+        Async variant of get_klines() for event-loop callers.
+        
+        Default runs get_klines() in a worker thread; implementations with
+        a native async transport should override it.
+        """
+        return await asyncio.to_thread(self.get_klines, symbol, interval, limit)
+    
     @abstractmethod
     def get_ticker_price(self, symbol: str) -> Optional[float]:
         """
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 from src.domain.entities.paper_position import PaperPosition
 
 class IOrderRepository(ABC):
@@ -26,6 +27,20 @@ class IOrderRepository(ABC):
         """Get all pending orders (PENDING)"""
         pass
 
+    def get_active_orders_by_symbol(self, symbol: str, side: Optional[str] = None) -> List[PaperPosition]:
+        """OPEN positions of one symbol (optionally one side). Default filters get_active_orders()."""
+        return [
+            p for p in self.get_active_orders()
+            if p.symbol.lower() == symbol.lower() and (side is None or p.side == side)
+        ]
+
+    def get_pending_orders_by_symbol(self, symbol: str, side: Optional[str] = None) -> List[PaperPosition]:
+        """PENDING orders of one symbol (optionally one side). Default filters get_pending_orders()."""
+        return [
+            o for o in self.get_pending_orders()
+            if o.symbol.lower() == symbol.lower() and (side is None or o.side == side)
+        ]
+
     @abstractmethod
     def get_closed_orders(self, limit: int = 50) -> List[PaperPosition]:
         pass
@@ -68,3 +83,40 @@ class IOrderRepository(ABC):
     def get_all_settings(self) -> dict:
         """Get all settings as a dictionary"""
         pass
+    
+    # Async boundary (event-loop callers)
+    async def run_io(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run blocking repository work off the event loop.
+        
+        Default runs fn in a worker thread; implementations should use a
+        dedicated executor (or an async driver) so repository I/O never
+        competes with other to_thread users.
+        """
+        return await asyncio.to_thread(fn, *args)
+    
+    async def get_pending_orders_async(self) -> List[PaperPosition]:
+        return await self.run_io(self.get_pending_orders)
+    
+    async def get_active_orders_async(self) -> List[PaperPosition]:
+        return await self.run_io(self.get_active_orders)
+    
+    async def get_account_balance_async(self) -> float:
+        return await self.run_io(self.get_account_balance)
+    
+    # Change notifications
+    def add_listener(self, listener: Callable[[Optional[PaperPosition]], None]) -> bool:
+        """
+        Subscribe to changes of live (PENDING/OPEN) orders.
+        
+        The listener receives a copy of each saved/updated order, or None
+        when the whole set was reloaded. Called synchronously by the writer.
+        
+        Returns:
+            False if this repository does not publish changes (default)
+        """
+        return False
+    
+    def close(self) -> None:
+        """Release I/O resources (executors, connections). Default: nothing to do."""
+        pass
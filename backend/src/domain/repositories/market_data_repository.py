@@ -6,7 +6,7 @@ This defines the contract that infrastructure implementations must follow.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 from ..entities.candle import Candle
@@ -65,6 +65,57 @@ class MarketDataRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def save_candles_batch(
+        self,
+        candles: List[Candle],
+        timeframe: str,
+        symbol: str = 'btcusdt'
+    ) -> int:
+        """
+        Save many candles (OHLCV only) in a single transaction.
+
+        Args:
+            candles: Candle entities to save
+            timeframe: The timeframe (e.g., '15m', '1h')
+            symbol: Trading symbol
+
+        Returns:
+            Number of candles written
+
+        Raises:
+            RepositoryError: If save operation fails (nothing is written)
+        """
+        pass
+
+    def enqueue_candles(
+        self,
+        candles: List[Candle],
+        timeframe: str,
+        symbol: str = 'btcusdt'
+    ) -> None:
+        """
+        Queue candles for persistence without waiting for the write.
+
+        Implementations with a background writer return immediately; the
+        default writes synchronously via save_candles_batch().
+
+        Args:
+            candles: Candle entities to save
+            timeframe: The timeframe (e.g., '15m', '1h')
+            symbol: Trading symbol
+        """
+        self.save_candles_batch(candles, timeframe, symbol)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until queued writes are on disk.
+
+        Returns:
+            True if everything queued before the call was written
+        """
+        return True
+
     @abstractmethod
     def get_latest_candles(
         self, 
@@ -185,6 +236,21 @@ class MarketDataRepository(ABC):
         """
         pass
     
+    def delete_expired_candles(self, cutoffs: Dict[str, datetime]) -> int:
+        """
+        Apply a retention policy across all symbols.
+        
+        Args:
+            cutoffs: {timeframe: delete candles before this datetime}
+        
+        Returns:
+            Number of records deleted
+        
+        Raises:
+            RepositoryError: If delete operation fails
+        """
+        return sum(self.delete_candles_before(tf, before) for tf, before in cutoffs.items())
+    
     @abstractmethod
     def get_database_size(self) -> float:
         """
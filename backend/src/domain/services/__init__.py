@@ -1 +1,24 @@
 """Domain services"""
+
+from .anchored_vwap import AnchoredVWAP, AnchoredVWAPSeries, anchored_vwap, session_key, session_keys
+from .series_cache import CandleSeriesCache
+from .swing_index import SwingIndex, SwingIndexCache, shared_swing_index
+from .trigger_index import ABOVE, BELOW, Trigger, TriggerIndex
+from .zone_registry import ZoneRegistry
+
+__all__ = [
+    'ABOVE',
+    'AnchoredVWAP',
+    'AnchoredVWAPSeries',
+    'BELOW',
+    'CandleSeriesCache',
+    'SwingIndex',
+    'SwingIndexCache',
+    'Trigger',
+    'TriggerIndex',
+    'ZoneRegistry',
+    'anchored_vwap',
+    'session_key',
+    'session_keys',
+    'shared_swing_index',
+]
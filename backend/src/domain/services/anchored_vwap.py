@@ -0,0 +1,204 @@
+"""
+AnchoredVWAP - Domain Service
+
+Volume Weighted Average Price accumulated from a session anchor, with
+volume-weighted standard deviation bands.
+
+A candle's session is found from its timestamp alone (session_key):
+    'day'    - UTC day (the default; VWAP resets at 00:00 UTC)
+    'week'   - UTC week starting Monday 00:00
+    datetime - one session from the first candle at or after that time
+               (anchor candle); earlier candles belong to no session
+
+AnchoredVWAP keeps the cumulative sums of the current session, so each
+closed candle costs O(1). anchored_vwap() computes the same values for a
+whole CandleArrays at once - session boundaries from the key column, one
+np.cumsum per session - for chart series. Both accumulate left to right in
+the same order as VWAPCalculator, so results are bit-identical.
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from ..entities.candle import Candle
+from ..entities.candle_store import MS_PER_DAY, CandleArrays, timestamp_to_ms
+
+
+Anchor = Union[str, datetime]
+
+ANCHOR_DAY = 'day'
+ANCHOR_WEEK = 'week'
+
+NO_SESSION = -1  # session key of candles before a custom anchor
+
+# 1970-01-01 was a Thursday; shifting by 3 days starts weeks on Monday
+_WEEK_SHIFT_DAYS = 3
+
+
+def validate_anchor(anchor: Anchor) -> None:
+    """Raise ValueError unless `anchor` is 'day', 'week' or a datetime."""
+    if not isinstance(anchor, datetime) and anchor not in (ANCHOR_DAY, ANCHOR_WEEK):
+        raise ValueError(f"Unknown VWAP anchor: {anchor!r} (expected 'day', 'week' or a datetime)")
+
+
+def session_keys(timestamps_ms: np.ndarray, anchor: Anchor = ANCHOR_DAY) -> np.ndarray:
+    """
+    Session key per candle (int64), for epoch-millisecond timestamps.
+
+    Candles share a session iff their keys are equal; NO_SESSION marks
+    candles before a custom anchor.
+    """
+    validate_anchor(anchor)
+    if isinstance(anchor, datetime):
+        return np.where(timestamps_ms >= timestamp_to_ms(anchor), 0, NO_SESSION).astype(np.int64)
+    days = np.floor_divide(timestamps_ms, MS_PER_DAY).astype(np.int64)
+    if anchor == ANCHOR_WEEK:
+        return (days + _WEEK_SHIFT_DAYS) // 7
+    return days
+
+
+def session_key(timestamp: datetime, anchor: Anchor = ANCHOR_DAY) -> int:
+    """session_keys() for a single timestamp."""
+    validate_anchor(anchor)
+    ms = timestamp_to_ms(timestamp)
+    if isinstance(anchor, datetime):
+        return 0 if ms >= timestamp_to_ms(anchor) else NO_SESSION
+    days = int(ms // MS_PER_DAY)
+    if anchor == ANCHOR_WEEK:
+        return (days + _WEEK_SHIFT_DAYS) // 7
+    return days
+
+
+def _std(tp2v: float, volume: float, vwap: float) -> float:
+    """Volume-weighted standard deviation of the typical price."""
+    return math.sqrt(max(0.0, tp2v / volume - vwap * vwap))
+
+
+class AnchoredVWAP:
+    """
+    Anchored VWAP of one candle series, updated per closed candle.
+
+    Usage:
+        vwap = AnchoredVWAP(anchor='day')
+        for candle in closed_candles:
+            vwap.update(candle)
+        vwap.vwap, vwap.std
+        lower, upper = vwap.bands(2.0)
+    """
+
+    def __init__(self, anchor: Anchor = ANCHOR_DAY):
+        validate_anchor(anchor)
+        self.anchor = anchor
+        self.reset()
+
+    def reset(self) -> None:
+        self.session: Optional[int] = None
+        self.session_start: Optional[datetime] = None
+        self.tpv = 0.0      # Σ typical price × volume
+        self.volume = 0.0   # Σ volume
+        self._tp2v = 0.0    # Σ typical price² × volume
+
+    def update(self, candle: Candle) -> Optional[float]:
+        """
+        Add a closed candle (starting a new session when its key changes).
+
+        Returns:
+            VWAP of the session so far, None while it has no volume
+        """
+        key = session_key(candle.timestamp, self.anchor)
+        if key != self.session:
+            self.session = key
+            self.session_start = candle.timestamp
+            self.tpv = 0.0
+            self.volume = 0.0
+            self._tp2v = 0.0
+        if key == NO_SESSION:
+            return None
+
+        typical_price = (candle.high + candle.low + candle.close) / 3.0
+        tpv = typical_price * candle.volume
+        self.tpv += tpv
+        self.volume += candle.volume
+        self._tp2v += tpv * typical_price
+        return self.vwap
+
+    @property
+    def vwap(self) -> Optional[float]:
+        if self.volume == 0:
+            return None
+        return self.tpv / self.volume
+
+    @property
+    def std(self) -> Optional[float]:
+        vwap = self.vwap
+        if vwap is None:
+            return None
+        return _std(self._tp2v, self.volume, vwap)
+
+    def bands(self, multiplier: float = 1.0) -> Optional[Tuple[float, float]]:
+        """(lower, upper) = VWAP ∓ multiplier × σ, None while there is no VWAP."""
+        vwap = self.vwap
+        if vwap is None:
+            return None
+        width = multiplier * _std(self._tp2v, self.volume, vwap)
+        return vwap - width, vwap + width
+
+
+@dataclass
+class AnchoredVWAPSeries:
+    """
+    Anchored VWAP per candle (arrays aligned with the input).
+
+    Attributes:
+        vwap: VWAP of the candle's session so far (NaN without volume)
+        std: Volume-weighted standard deviation (NaN without volume)
+        session: Session key per candle (see session_keys)
+        tpv, volume: Cumulative session sums
+    """
+    vwap: np.ndarray
+    std: np.ndarray
+    session: np.ndarray
+    tpv: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.vwap)
+
+    def bands(self, multiplier: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+        """(lower, upper) arrays = VWAP ∓ multiplier × σ."""
+        width = multiplier * self.std
+        return self.vwap - width, self.vwap + width
+
+
+def anchored_vwap(candles: CandleArrays, anchor: Anchor = ANCHOR_DAY) -> AnchoredVWAPSeries:
+    """AnchoredVWAP.update over every row of `candles`, on whole columns."""
+    n = len(candles)
+    keys = session_keys(candles.timestamp, anchor)
+    typical_price = (candles.high + candles.low + candles.close) / 3.0
+    tpv = typical_price * candles.volume
+    tp2v = tpv * typical_price
+
+    cum_tpv = np.zeros(n)
+    cum_volume = np.zeros(n)
+    cum_tp2v = np.zeros(n)
+    starts = np.flatnonzero(np.diff(keys)) + 1
+    for start, end in zip(np.concatenate(([0], starts)), np.concatenate((starts, [n]))):
+        if n == 0 or keys[start] == NO_SESSION:
+            continue
+        # np.cumsum accumulates left to right, like AnchoredVWAP.update
+        cum_tpv[start:end] = np.cumsum(tpv[start:end])
+        cum_volume[start:end] = np.cumsum(candles.volume[start:end])
+        cum_tp2v[start:end] = np.cumsum(tp2v[start:end])
+
+    vwap = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    has_volume = cum_volume != 0
+    vwap[has_volume] = cum_tpv[has_volume] / cum_volume[has_volume]
+    variance = cum_tp2v[has_volume] / cum_volume[has_volume] - vwap[has_volume] * vwap[has_volume]
+    std[has_volume] = np.sqrt(np.maximum(0.0, variance))
+
+    return AnchoredVWAPSeries(vwap=vwap, std=std, session=keys, tpv=cum_tpv, volume=cum_volume)
@@ -0,0 +1,103 @@
+"""
+CandleSeriesCache - Domain Service
+
+Incremental per-series state for detectors that receive whole candle
+lists on every call.
+
+A detector keeps one state object per candle series (symbol/timeframe).
+sync(candles, count) finds the state whose last stored candle appears near
+the end of `candles` (matched by timestamp, high and low), feeds it the
+candles that closed since and returns it together with the absolute
+position of candles[0]. Lists that match no state (another series, a gap,
+history reaching further back than the state keeps) get a fresh state fed
+in one pass.
+
+State objects expose `start` (first absolute position they can still
+answer for) and `end` (absolute position of the next candle they are fed).
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Optional, Sequence, Tuple, TypeVar
+
+
+S = TypeVar('S')
+
+
+class CandleSeriesCache(Generic[S]):
+    """
+    LRU map from candle series to incremental state.
+
+    Usage:
+        cache = CandleSeriesCache(lambda: SwingIndex(5), lambda s, c: s.append(c.high, c.low))
+        with cache.lock:
+            state, first = cache.sync(candles, len(candles) - 1)
+            ...  # query state; positions are absolute, candles[i] is first + i
+    """
+
+    MAX_GAP = 64  # newly closed candles fed incrementally per call
+
+    def __init__(
+        self,
+        factory: Callable[[], S],
+        feed: Callable[[S, Any], None],
+        max_series: int = 64
+    ):
+        self.factory = factory
+        self.feed = feed
+        self.max_series = max_series
+        self.lock = threading.RLock()
+        self._series: "OrderedDict[tuple, S]" = OrderedDict()
+        self._stats = {'calls': 0, 'appended': 0, 'rebuilds': 0}
+
+    def sync(self, candles: Sequence, count: int) -> Tuple[S, int]:
+        """
+        State holding candles[:count] of this series (count >= 1).
+
+        Call with `lock` held and query the state before releasing it.
+
+        Returns:
+            (state, absolute position of candles[0])
+        """
+        self._stats['calls'] += 1
+        state, last = self._find(candles, count)
+        if state is None:
+            state, last = self.factory(), -1
+            self._stats['rebuilds'] += 1
+        first = state.end - 1 - last
+        for candle in candles[last + 1:count]:
+            self.feed(state, candle)
+        self._stats['appended'] += count - 1 - last
+
+        key = self._key(candles[count - 1])
+        self._series[key] = state
+        self._series.move_to_end(key)
+        while len(self._series) > self.max_series:
+            self._series.popitem(last=False)
+        return state, first
+
+    def get_statistics(self) -> Dict[str, int]:
+        with self.lock:
+            stats = dict(self._stats)
+            stats['series'] = len(self._series)
+        return stats
+
+    def clear(self) -> None:
+        with self.lock:
+            self._series.clear()
+
+    @staticmethod
+    def _key(candle) -> tuple:
+        return (candle.timestamp, candle.high, candle.low)
+
+    def _find(self, candles: Sequence, count: int) -> Tuple[Optional[S], int]:
+        """State continuing `candles` and the list position of its last stored candle."""
+        for last in range(count - 1, max(-1, count - 1 - self.MAX_GAP), -1):
+            state = self._series.pop(self._key(candles[last]), None)
+            if state is None:
+                continue
+            # The whole list must lie within what the state still answers for
+            if state.end - 1 - last >= state.start:
+                return state, last
+            return None, -1
+        return None, -1
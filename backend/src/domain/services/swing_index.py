@@ -0,0 +1,194 @@
+"""
+SwingIndex - Domain Service
+
+Strict swing highs/lows (fractal pivots) of a candle series, maintained
+incrementally as candles close.
+
+A candle i is a swing high when its high is strictly greater than the highs
+of the `lookback` candles before and after it (swing lows mirror this with
+lows). Instead of comparing every candle with its 2 * lookback neighbours,
+the index keeps a monotonic stack per side: appending a candle pops the
+earlier candles it equals or exceeds (they now have a higher-or-equal high
+to their right) and leaves the nearest higher-or-equal high to its left on
+top. A candle is confirmed `lookback` candles later if nothing popped it
+and its left neighbour is further than `lookback` away - O(1) amortized per
+candle.
+
+SwingIndexCache keeps one index per series (see CandleSeriesCache), so
+repeated calls with a growing or sliding window only append the newly
+closed candles and then read the precomputed pivots.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .series_cache import CandleSeriesCache
+
+
+class SwingIndex:
+    """
+    Swing pivots of one series, addressed by absolute candle position.
+
+    Usage:
+        index = SwingIndex(lookback=5)
+        for candle in closed_candles:
+            index.append(candle.high, candle.low)
+        index.swing_highs  # absolute positions of confirmed swing highs
+    """
+
+    def __init__(self, lookback: int, max_length: int = 5000):
+        if lookback < 1:
+            raise ValueError("Lookback must be at least 1")
+        self.lookback = lookback
+        self.max_length = max(max_length, 4 * lookback)
+
+        self.start = 0  # absolute position of the first stored candle
+        self.swing_highs: List[int] = []
+        self.swing_lows: List[int] = []
+        # Per stored candle; lows are kept negated so both sides share the code
+        self._values = ([], [])
+        self._left: Tuple[List[Optional[int]], List[Optional[int]]] = ([], [])
+        self._blocked: Tuple[List[bool], List[bool]] = ([], [])
+        self._stacks: Tuple[List[Tuple[float, int]], List[Tuple[float, int]]] = ([], [])
+
+    def __len__(self) -> int:
+        return len(self._values[0])
+
+    @property
+    def end(self) -> int:
+        """Absolute position the next appended candle gets."""
+        return self.start + len(self._values[0])
+
+    def append(self, high: float, low: float) -> None:
+        """Add the next closed candle."""
+        position = self.end
+        for side, value, pivots in ((0, high, self.swing_highs), (1, -low, self.swing_lows)):
+            self._push(side, value, position)
+            candidate = position - self.lookback
+            if candidate >= self.start and self._is_confirmed(side, candidate):
+                pivots.append(candidate)
+
+        if len(self) > self.max_length:
+            self._trim(self.end - self.max_length // 2)
+
+    def pivots(
+        self,
+        first: int,
+        tail: Optional[Tuple[float, float]] = None
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Swing highs and lows of the window starting at absolute `first` and
+        ending with the stored candles, optionally followed by one more
+        candle `tail` = (high, low) that is not stored (e.g. still forming).
+
+        Returns:
+            (swing_highs, swing_lows) as absolute positions, oldest first
+        """
+        lowest = first + self.lookback
+        highs = self.swing_highs[bisect_left(self.swing_highs, lowest):]
+        lows = self.swing_lows[bisect_left(self.swing_lows, lowest):]
+        if tail is not None:
+            candidate = self.end - self.lookback
+            if candidate >= max(lowest, self.start):
+                i = candidate - self.start
+                if tail[0] < self._values[0][i] and self._is_confirmed(0, candidate):
+                    highs.append(candidate)
+                if -tail[1] < self._values[1][i] and self._is_confirmed(1, candidate):
+                    lows.append(candidate)
+        return highs, lows
+
+    def _push(self, side: int, value: float, position: int) -> None:
+        stack, blocked = self._stacks[side], self._blocked[side]
+        while stack and stack[-1][0] < value:
+            blocked[stack.pop()[1] - self.start] = True
+        left = stack[-1][1] if stack else None
+        if stack and stack[-1][0] == value:
+            blocked[stack.pop()[1] - self.start] = True
+        stack.append((value, position))
+        self._values[side].append(value)
+        self._left[side].append(left)
+        blocked.append(False)
+
+    def _is_confirmed(self, side: int, position: int) -> bool:
+        i = position - self.start
+        if self._blocked[side][i]:
+            return False
+        left = self._left[side][i]
+        return left is None or position - left > self.lookback
+
+    def _trim(self, new_start: int) -> None:
+        """Forget candles before `new_start` (pivots there are no longer queryable)."""
+        drop = new_start - self.start
+        for side in (0, 1):
+            del self._values[side][:drop]
+            del self._left[side][:drop]
+            del self._blocked[side][:drop]
+            stack = self._stacks[side]
+            stack[:] = [entry for entry in stack if entry[1] >= new_start]
+        del self.swing_highs[:bisect_left(self.swing_highs, new_start)]
+        del self.swing_lows[:bisect_left(self.swing_lows, new_start)]
+        self.start = new_start
+
+
+class SwingIndexCache:
+    """
+    One SwingIndex per candle series for a given lookback.
+
+    pivots(candles) treats every candle but the last as closed: the series'
+    index (see CandleSeriesCache) is fed the candles that closed since the
+    previous call, and the answer comes from the stored pivots plus a check
+    of the last candle, which is never stored - a forming candle that keeps
+    changing does not invalidate the index.
+
+    Thread-safe; shared by every detector using the same lookback (see
+    shared_swing_index).
+    """
+
+    def __init__(self, lookback: int, max_series: int = 64):
+        if lookback < 1:
+            raise ValueError("Lookback must be at least 1")
+        self.lookback = lookback
+        self._cache: CandleSeriesCache[SwingIndex] = CandleSeriesCache(
+            lambda: SwingIndex(lookback),
+            lambda index, candle: index.append(candle.high, candle.low),
+            max_series=max_series
+        )
+
+    def pivots(self, candles: Sequence) -> Tuple[List[int], List[int]]:
+        """
+        Swing highs and lows of `candles`.
+
+        Returns:
+            (swing_highs, swing_lows) as indices into `candles`, oldest first
+        """
+        n = len(candles)
+        if n < 2 * self.lookback + 1:
+            return [], []
+
+        with self._cache.lock:
+            index, first = self._cache.sync(candles, n - 1)
+            # Keep at least this window when the index trims old candles
+            index.max_length = max(index.max_length, 4 * n)
+            tail = candles[n - 1]
+            highs, lows = index.pivots(first, (tail.high, tail.low))
+        return [p - first for p in highs], [p - first for p in lows]
+
+    def get_statistics(self) -> Dict[str, int]:
+        return self._cache.get_statistics()
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+_shared: Dict[int, SwingIndexCache] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_swing_index(lookback: int) -> SwingIndexCache:
+    """Process-wide SwingIndexCache for `lookback` (one per lookback)."""
+    with _shared_lock:
+        cache = _shared.get(lookback)
+        if cache is None:
+            cache = _shared[lookback] = SwingIndexCache(lookback)
+        return cache
@@ -0,0 +1,161 @@
+"""
+TriggerIndex - Domain Service
+
+Price-indexed trigger levels for resting orders and position exits.
+
+Each symbol keeps two sorted level lists:
+- BELOW triggers fire when the bar trades at or below the level
+  (buy limits, long stop-losses / liquidations, short take-profits)
+- ABOVE triggers fire when the bar trades at or above the level
+  (sell limits, short stop-losses / liquidations, long take-profits)
+
+crossed(symbol, high, low) bisects both lists against the bar's range, so
+finding the k triggers a bar crossed costs O(log n + k) instead of
+comparing every order and position.
+
+Triggers can share an OCO group (e.g. a position's TP and SL): fire()
+removes the executed trigger together with its siblings.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+
+ABOVE = 'above'
+BELOW = 'below'
+
+
+@dataclass(frozen=True)
+class Trigger:
+    """
+    One trigger level.
+
+    Attributes:
+        key: Unique id (re-adding a key replaces the old trigger)
+        symbol: Symbol whose bars are matched (case-insensitive)
+        level: Trigger price
+        direction: ABOVE or BELOW
+        group: Optional OCO group shared with sibling triggers
+        payload: Caller data (e.g. order id, exit reason)
+    """
+    key: Hashable
+    symbol: str
+    level: float
+    direction: str
+    group: Optional[Hashable] = None
+    payload: Any = None
+
+
+class TriggerIndex:
+    """
+    Sorted per-symbol trigger levels with OCO groups.
+
+    Usage:
+        index = TriggerIndex()
+        index.add(Trigger(('sl', pos_id), 'btcusdt', 95_000.0, BELOW, group=pos_id))
+        index.add(Trigger(('tp', pos_id), 'btcusdt', 99_000.0, ABOVE, group=pos_id))
+        for trigger in index.crossed('btcusdt', high=bar.high, low=bar.low):
+            index.fire(trigger.key)  # also cancels the OCO sibling
+    """
+
+    def __init__(self):
+        # (symbol, direction) -> ascending [(level, seq)]
+        self._levels: Dict[Tuple[str, str], List[Tuple[float, int]]] = {}
+        self._triggers: Dict[int, Trigger] = {}
+        self._seq_by_key: Dict[Hashable, int] = {}
+        self._groups: Dict[Hashable, Set[Hashable]] = {}
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._triggers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._seq_by_key
+
+    def get(self, key: Hashable) -> Optional[Trigger]:
+        seq = self._seq_by_key.get(key)
+        return self._triggers[seq] if seq is not None else None
+
+    def add(self, trigger: Trigger) -> None:
+        """Insert a trigger (replacing any trigger with the same key)."""
+        if trigger.direction not in (ABOVE, BELOW):
+            raise ValueError(f"Unknown trigger direction: {trigger.direction}")
+        if trigger.level != trigger.level:
+            raise ValueError(f"Trigger {trigger.key!r} has a NaN level")
+        self.remove(trigger.key)
+
+        seq = self._next_seq
+        self._next_seq += 1
+        self._triggers[seq] = trigger
+        self._seq_by_key[trigger.key] = seq
+        insort(self._levels.setdefault((trigger.symbol.lower(), trigger.direction), []), (trigger.level, seq))
+        if trigger.group is not None:
+            self._groups.setdefault(trigger.group, set()).add(trigger.key)
+
+    def remove(self, key: Hashable) -> Optional[Trigger]:
+        """Remove one trigger; returns it (None if unknown)."""
+        seq = self._seq_by_key.pop(key, None)
+        if seq is None:
+            return None
+        trigger = self._triggers.pop(seq)
+        levels = self._levels[(trigger.symbol.lower(), trigger.direction)]
+        del levels[bisect_left(levels, (trigger.level, seq))]
+        if trigger.group is not None:
+            siblings = self._groups[trigger.group]
+            siblings.discard(key)
+            if not siblings:
+                del self._groups[trigger.group]
+        return trigger
+
+    def remove_group(self, group: Hashable) -> List[Trigger]:
+        """Remove every trigger of an OCO group."""
+        return [self.remove(key) for key in list(self._groups.get(group, ()))]
+
+    def fire(self, key: Hashable) -> List[Trigger]:
+        """
+        Execute a trigger: remove it and cancel its OCO siblings.
+
+        Returns:
+            The cancelled siblings
+        """
+        trigger = self.remove(key)
+        if trigger is None or trigger.group is None:
+            return []
+        return self.remove_group(trigger.group)
+
+    def crossed(self, symbol: str, high: float, low: float) -> List[Trigger]:
+        """
+        Triggers reached by a bar trading in [low, high].
+
+        BELOW triggers come first, highest level first (the order a falling
+        price reaches them), then ABOVE triggers, lowest level first.
+        Nothing is removed; call fire() for the ones executed.
+        """
+        symbol = symbol.lower()
+        result: List[Trigger] = []
+
+        below = self._levels.get((symbol, BELOW))
+        if below:
+            start = bisect_left(below, (low, -1))
+            result.extend(self._triggers[seq] for _, seq in reversed(below[start:]))
+
+        above = self._levels.get((symbol, ABOVE))
+        if above:
+            end = bisect_right(above, (high, self._next_seq))
+            result.extend(self._triggers[seq] for _, seq in above[:end])
+
+        return result
+
+    def count(self, symbol: Optional[str] = None) -> int:
+        """Number of triggers (for one symbol, or all)."""
+        if symbol is None:
+            return len(self._triggers)
+        symbol = symbol.lower()
+        return sum(len(levels) for (s, _), levels in self._levels.items() if s == symbol)
+
+    def clear(self) -> None:
+        self._levels.clear()
+        self._triggers.clear()
+        self._seq_by_key.clear()
+        self._groups.clear()
@@ -0,0 +1,83 @@
+"""
+ZoneRegistry - Domain Service
+
+Open price zones (Fair Value Gaps, Order Blocks) of one candle series,
+retired as price returns into them.
+
+A bullish zone sits below price and is mitigated when a later candle's low
+reaches its top; a bearish zone sits above price and is mitigated when a
+later candle's high reaches its bottom. Each zone is therefore one
+TriggerIndex level (BELOW at the top, ABOVE at the bottom), and a closed
+candle is checked only against the zones its [low, high] reaches:
+O(log n + k) per candle instead of rescanning every later candle for
+every zone. The active zones are kept in an insertion-ordered dict.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, List, Mapping
+
+from .trigger_index import ABOVE, BELOW, Trigger, TriggerIndex
+
+
+class ZoneRegistry:
+    """
+    Active zones of one series.
+
+    Usage:
+        registry = ZoneRegistry()
+        registry.add(('fvg', position), fvg, bullish=True, top=fvg.top, bottom=fvg.bottom)
+        for candle in closed_candles:
+            for zone in registry.mitigate(candle.high, candle.low):
+                zone.mitigated = True
+        registry.active  # key -> zone, oldest first
+    """
+
+    _SERIES = 'zones'  # TriggerIndex symbol; a registry holds one series
+
+    def __init__(self):
+        self._index = TriggerIndex()
+        self._active: Dict[Hashable, Any] = {}
+        self._view = MappingProxyType(self._active)
+        self.mitigated_count = 0
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._active
+
+    @property
+    def active(self) -> Mapping[Hashable, Any]:
+        """Read-only live view of the active zones (key -> zone), oldest first."""
+        return self._view
+
+    def add(self, key: Hashable, zone: Any, bullish: bool, top: float, bottom: float) -> None:
+        """Register a new zone (checked from the next mitigate() call on)."""
+        if bullish:
+            self._index.add(Trigger(key, self._SERIES, top, BELOW))
+        else:
+            self._index.add(Trigger(key, self._SERIES, bottom, ABOVE))
+        self._active[key] = zone
+
+    def remove(self, key: Hashable) -> Any:
+        """Drop a zone without mitigating it; returns it (None if unknown)."""
+        self._index.remove(key)
+        return self._active.pop(key, None)
+
+    def mitigate(self, high: float, low: float) -> List[Any]:
+        """
+        Retire the zones a candle trading in [low, high] reached.
+
+        Returns:
+            The retired zones
+        """
+        retired = []
+        for trigger in self._index.crossed(self._SERIES, high, low):
+            self._index.remove(trigger.key)
+            retired.append(self._active.pop(trigger.key))
+        self.mitigated_count += len(retired)
+        return retired
+
+    def clear(self) -> None:
+        self._index.clear()
+        self._active.clear()
@@ -2,17 +2,28 @@
 BinanceRestClient - Infrastructure Layer
 
 REST API client for fetching historical data from Binance.
+
+Both the sync and the async methods reuse pooled keep-alive connections
+(requests.Session / httpx.AsyncClient), so only the first call pays for
+the TCP + TLS handshake. Async calls share the process-wide
+BinanceWeightLimiter and identical in-flight requests are coalesced.
 """
 
+import asyncio
 import requests
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+
+import httpx
+from requests.adapters import HTTPAdapter
 
 from ...domain.entities.candle import Candle
+from ...domain.interfaces.i_rest_client import IRestClient
+from .binance_weight_limiter import BinanceWeightLimiter, get_binance_weight_limiter, klines_weight
 
 
-class BinanceRestClient:
+class BinanceRestClient(IRestClient):
     """
     REST API client for Binance market data.
     
@@ -20,20 +31,135 @@ class BinanceRestClient:
     - Fetch historical klines (candles)
     - Support multiple intervals
     - Error handling and retries
-    - Rate limit awareness
+    - Rate limit awareness (shared request-weight limiter)
+    - Async-native variants (*_async) with request coalescing
     """
     
     BASE_URL = "https://api.binance.com/api/v3"
     
-    def __init__(self, timeout: int = 10):
+    # Request weights (GET /api/v3, no symbol filter where relevant)
+    WEIGHT_TICKER_PRICE = 2
+    WEIGHT_TICKER_24HR_ALL = 80
+    WEIGHT_EXCHANGE_INFO = 20
+    
+    def __init__(
+        self,
+        timeout: int = 10,
+        base_url: Optional[str] = None,
+        limiter: Optional[BinanceWeightLimiter] = None,
+        max_connections: int = 16
+    ):
         """
         Initialize REST client.
         
         Args:
             timeout: Request timeout in seconds
+            base_url: Override BASE_URL (tests / testnet)
+            limiter: Weight limiter (default: process-wide Binance limiter)
+            max_connections: Keep-alive pool size
         """
         self.timeout = timeout
+        self.base_url = (base_url or self.BASE_URL).rstrip('/')
+        self.limiter = limiter or get_binance_weight_limiter()
+        self.max_connections = max_connections
         self.logger = logging.getLogger(__name__)
+        
+        # Sync: one pooled session instead of module-level requests.get
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # Async: httpx client + in-flight map, bound to the loop they were created on
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        
+        self._stats = {'requests': 0, 'coalesced': 0, 'errors': 0}
+    
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Sync GET on the pooled session; raises on HTTP errors."""
+        self._stats['requests'] += 1
+        response = self._session.get(f"{self.base_url}{path}", params=params, timeout=self.timeout)
+        self.limiter.update_from_headers(response.headers)
+        response.raise_for_status()
+        return response.json()
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+            self._async_loop = loop
+            self._inflight = {}
+        return self._async_client
+    
+    async def _get_async(self, path: str, params: Optional[Dict[str, Any]] = None, weight: int = 1) -> Any:
+        """
+        Async GET through the weight limiter; raises on HTTP errors.
+        
+        Concurrent calls with the same path and params share one request
+        (and its result or exception).
+        """
+        client = self._get_async_client()
+        key = (path, tuple(sorted((params or {}).items())))
+        task = self._inflight.get(key)
+        if task is not None:
+            self._stats['coalesced'] += 1
+        else:
+            task = asyncio.ensure_future(self._request_async(client, path, params, weight))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield: one caller being cancelled must not cancel the shared request
+        return await asyncio.shield(task)
+    
+    async def _request_async(self, client: httpx.AsyncClient, path: str, params: Optional[Dict[str, Any]], weight: int) -> Any:
+        await self.limiter.acquire(weight)
+        self._stats['requests'] += 1
+        response = await client.get(path, params=params)
+        self.limiter.update_from_headers(response.headers)
+        if response.status_code in (418, 429):
+            self.limiter.on_rate_limited(float(response.headers.get('Retry-After', 60)))
+        response.raise_for_status()
+        return response.json()
+    
+    async def aclose(self) -> None:
+        """Close pooled connections (async client and sync session)."""
+        if self._async_client is not None and not self._async_client.is_closed:
+            await self._async_client.aclose()
+        self._async_client = None
+        self._async_loop = None
+        self._session.close()
+    
+    def get_statistics(self) -> Dict[str, int]:
+        return {**self._stats, 'inflight': len(self._inflight)}
+    
+    def _klines_params(self, symbol: str, interval: str, limit: int, end_time: Optional[int]) -> Dict[str, Any]:
+        if limit > 1000:
+            self.logger.warning(f"Limit {limit} exceeds max 1000, using 1000")
+            limit = 1000
+        params = {
+            'symbol': symbol.upper(),
+            'interval': interval,
+            'limit': limit
+        }
+        if end_time:
+            params['endTime'] = end_time
+        return params
+    
+    def _parse_klines(self, data: List) -> List[Candle]:
+        candles = []
+        for kline in data:
+            candle = self._parse_kline(kline)
+            if candle:
+                candles.append(candle)
+        return candles
     
     def get_klines(
         self,
@@ -54,47 +180,43 @@ class BinanceRestClient:
         Returns:
             List of Candle entities
         """
-        if limit > 1000:
-            self.logger.warning(f"Limit {limit} exceeds max 1000, using 1000")
-            limit = 1000
-        
+        params = self._klines_params(symbol, interval, limit, end_time)
         try:
-            url = f"{self.BASE_URL}/klines"
-            
-            params = {
-                'symbol': symbol.upper(),
-                'interval': interval,
-                'limit': limit
-            }
-            
-            if end_time:
-                params['endTime'] = end_time
-            
             self.logger.debug(f"Fetching klines: {params}")
-            
-            response = requests.get(
-                url,
-                params=params,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Parse klines to Candle entities
-            candles = []
-            for kline in data:
-                candle = self._parse_kline(kline)
-                if candle:
-                    candles.append(candle)
-            
+            candles = self._parse_klines(self._get('/klines', params))
             self.logger.info(f"Fetched {len(candles)} klines for {symbol} {interval}")
             return candles
-            
+        
         except requests.exceptions.RequestException as e:
+            self._stats['errors'] += 1
+            self.logger.error(f"Failed to fetch klines: {e}")
+            return []
+        except Exception as e:
+            self._stats['errors'] += 1
+            self.logger.error(f"Error parsing klines: {e}")
+            return []
+    
+    async def get_klines_async(
+        self,
+        symbol: str = "BTCUSDT",
+        interval: str = "1m",
+        limit: int = 100,
+        end_time: Optional[int] = None
+    ) -> List[Candle]:
+        """Async get_klines(): pooled, rate-limited, coalesced."""
+        params = self._klines_params(symbol, interval, limit, end_time)
+        try:
+            data = await self._get_async('/klines', params, weight=klines_weight(params['limit']))
+            candles = self._parse_klines(data)
+            self.logger.info(f"Fetched {len(candles)} klines for {symbol} {interval}")
+            return candles
+        
+        except httpx.HTTPError as e:
+            self._stats['errors'] += 1
             self.logger.error(f"Failed to fetch klines: {e}")
             return []
         except Exception as e:
+            self._stats['errors'] += 1
             self.logger.error(f"Error parsing klines: {e}")
             return []
     
@@ -145,11 +267,33 @@ class BinanceRestClient:
                 close=close_price,
                 volume=volume
             )
-            
+        
         except (ValueError, IndexError) as e:
             self.logger.error(f"Error parsing kline: {e}")
             return None
     
+    def get_ticker_price(self, symbol: str) -> Optional[float]:
+        """
+        Get current ticker price.
+        
+        Returns:
+            Last price or None if failed
+        """
+        try:
+            return float(self._get('/ticker/price', {'symbol': symbol.upper()})['price'])
+        except Exception as e:
+            self.logger.error(f"Failed to get ticker price: {e}")
+            return None
+    
+    async def get_ticker_price_async(self, symbol: str) -> Optional[float]:
+        """Async get_ticker_price()."""
+        try:
+            data = await self._get_async('/ticker/price', {'symbol': symbol.upper()}, weight=self.WEIGHT_TICKER_PRICE)
+            return float(data['price'])
+        except Exception as e:
+            self.logger.error(f"Failed to get ticker price: {e}")
+            return None
+    
     def get_server_time(self) -> Optional[int]:
         """
         Get server time from Binance.
@@ -158,13 +302,9 @@ class BinanceRestClient:
             Server time in milliseconds or None if failed
         """
         try:
-            url = f"{self.BASE_URL}/time"
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get('/time')
             return data.get('serverTime')
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to get server time: {e}")
             return None
@@ -177,16 +317,20 @@ class BinanceRestClient:
             Exchange info dict or None if failed
         """
         try:
-            url = f"{self.BASE_URL}/exchangeInfo"
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            return response.json()
-            
+            return self._get('/exchangeInfo')
+        
         except Exception as e:
             self.logger.error(f"Failed to get exchange info: {e}")
             return None
-
+    
+    async def get_exchange_info_async(self) -> Optional[Dict[str, Any]]:
+        """Async get_exchange_info() (concurrent callers share one request)."""
+        try:
+            return await self._get_async('/exchangeInfo', weight=self.WEIGHT_EXCHANGE_INFO)
+        except Exception as e:
+            self.logger.error(f"Failed to get exchange info: {e}")
+            return None
+    
     def get_top_volume_pairs(self, limit: int = 10, quote_asset: str = "USDT") -> List[str]:
         """
         Get top trading pairs by 24h quote volume.
@@ -194,38 +338,44 @@ class BinanceRestClient:
         Args:
             limit: Number of pairs to return
             quote_asset: Filter by quote asset (e.g., 'USDT')
-            
+        
         Returns:
             List of symbol strings (e.g., ['BTCUSDT', 'ETHUSDT'])
         """
         try:
-            url = f"{self.BASE_URL}/ticker/24hr"
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Filter and sort
-            filtered = [
-                item for item in data 
-                if item['symbol'].endswith(quote_asset) 
-                and not item['symbol'].startswith('USDC') # Exclude stable pairs
-                and not item['symbol'].startswith('FDUSD')
-            ]
-            
-            # Sort by quoteVolume (descending)
-            sorted_pairs = sorted(
-                filtered, 
-                key=lambda x: float(x['quoteVolume']), 
-                reverse=True
-            )
-            
-            return [item['symbol'] for item in sorted_pairs[:limit]]
-            
+            return self._top_volume_pairs(self._get('/ticker/24hr'), limit, quote_asset)
+        except Exception as e:
+            self.logger.error(f"Failed to get top volume pairs: {e}")
+            return []
+    
+    async def get_top_volume_pairs_async(self, limit: int = 10, quote_asset: str = "USDT") -> List[str]:
+        """Async get_top_volume_pairs() (weight 80: coalesced across callers)."""
+        try:
+            data = await self._get_async('/ticker/24hr', weight=self.WEIGHT_TICKER_24HR_ALL)
+            return self._top_volume_pairs(data, limit, quote_asset)
         except Exception as e:
             self.logger.error(f"Failed to get top volume pairs: {e}")
             return []
     
+    @staticmethod
+    def _top_volume_pairs(data: List[Dict[str, Any]], limit: int, quote_asset: str) -> List[str]:
+        # Filter and sort
+        filtered = [
+            item for item in data
+            if item['symbol'].endswith(quote_asset)
+            and not item['symbol'].startswith('USDC') # Exclude stable pairs
+            and not item['symbol'].startswith('FDUSD')
+        ]
+        
+        # Sort by quoteVolume (descending)
+        sorted_pairs = sorted(
+            filtered,
+            key=lambda x: float(x['quoteVolume']),
+            reverse=True
+        )
+        
+        return [item['symbol'] for item in sorted_pairs[:limit]]
+    
     def __repr__(self) -> str:
         """String representation"""
-        return f"BinanceRestClient(base_url={self.BASE_URL})"
+        return f"BinanceRestClient(base_url={self.base_url})"
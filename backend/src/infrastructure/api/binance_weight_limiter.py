@@ -0,0 +1,132 @@
+"""
+BinanceWeightLimiter - Infrastructure Layer
+
+Request-weight token bucket shared by every Binance REST caller in the
+process.
+
+Binance limits REST traffic by request *weight* per IP per minute (6000
+on /api/v3). The bucket refills continuously at capacity/window; every
+response's X-MBX-USED-WEIGHT-1M header re-syncs it with what the server
+has actually counted (other processes on the same IP included), and a
+429/418 pauses all callers for Retry-After seconds.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Mapping, Optional
+
+
+def klines_weight(limit: int) -> int:
+    """Request weight of GET /api/v3/klines for a given limit."""
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+class BinanceWeightLimiter:
+    """
+    Async token bucket over Binance request weight.
+
+    Usage:
+        limiter = get_binance_weight_limiter()
+        await limiter.acquire(klines_weight(1000))
+        response = await client.get(...)
+        limiter.update_from_headers(response.headers)
+    """
+
+    USED_WEIGHT_HEADERS = ("X-MBX-USED-WEIGHT-1M", "X-MBX-USED-WEIGHT")
+
+    def __init__(self, capacity: int = 6000, window_seconds: float = 60.0, headroom: float = 0.1):
+        """
+        Args:
+            capacity: Weight allowed per window (Binance spot: 6000/min)
+            window_seconds: Window length
+            headroom: Fraction of capacity left unused as a safety margin
+        """
+        self.capacity = capacity * (1.0 - headroom)
+        self.window_seconds = window_seconds
+        self._rate = self.capacity / window_seconds
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self.logger = logging.getLogger(__name__)
+
+        self.server_used_weight: Optional[int] = None
+        self._stats = {
+            'requests': 0,
+            'weight': 0,
+            'waits': 0,
+            'rate_limited': 0,
+        }
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self, weight: int = 1) -> None:
+        """Wait until `weight` is available, then spend it."""
+        waited = False
+        while True:
+            now = time.monotonic()
+            self._refill(now)
+            if self._blocked_until > now:
+                delay = self._blocked_until - now
+            elif self._tokens >= weight:
+                self._tokens -= weight
+                self._stats['requests'] += 1
+                self._stats['weight'] += weight
+                if waited:
+                    self._stats['waits'] += 1
+                return
+            else:
+                delay = (weight - self._tokens) / self._rate
+            waited = True
+            await asyncio.sleep(delay)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Re-sync with the weight the server reports as used this minute."""
+        for name in self.USED_WEIGHT_HEADERS:
+            value = headers.get(name)
+            if value is None:
+                continue
+            try:
+                used = int(value)
+            except ValueError:
+                return
+            self.server_used_weight = used
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, self.capacity - used)
+            return
+
+    def on_rate_limited(self, retry_after: float) -> None:
+        """429/418 received: stop every caller for `retry_after` seconds."""
+        now = time.monotonic()
+        self._blocked_until = max(self._blocked_until, now + retry_after)
+        self._tokens = 0.0
+        self._updated = now
+        self._stats['rate_limited'] += 1
+        self.logger.warning(f"Binance rate limit hit, pausing REST calls for {retry_after:.1f}s")
+
+    def get_statistics(self) -> Dict[str, float]:
+        self._refill(time.monotonic())
+        return {
+            **self._stats,
+            'available_weight': round(self._tokens, 1),
+            'server_used_weight': self.server_used_weight,
+        }
+
+
+_limiter: Optional[BinanceWeightLimiter] = None
+
+
+def get_binance_weight_limiter() -> BinanceWeightLimiter:
+    """Process-wide limiter (Binance counts weight per IP, not per client)."""
+    global _limiter
+    if _limiter is None:
+        _limiter = BinanceWeightLimiter()
+    return _limiter
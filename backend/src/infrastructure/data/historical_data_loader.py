@@ -4,13 +4,19 @@ HistoricalDataLoader - Smart Local Data Warehouse
 SOTA Implementation (Jan 2026):
 - Parquet-based caching for historical data
 - Incremental sync (only fetch missing data)
+- Async backfill: concurrent pages over pooled connections, shared
+  request-weight limiter, resumable progress in metadata.json; batches are
+  appended as part files and compacted into the cache once per backfill
 - ZSTD compression for minimal storage
+- Columnar reads (NumPy / Arrow) with memory mapping and timestamp
+  predicate pushdown; Candle objects only built on request
 - First run: ~2-5 min. Subsequent runs: <1 sec
 
 Storage Structure:
   backend/data/cache/
   ├── BTCUSDT/
   │   ├── 15m.parquet  (~500KB for 1 year)
+  │   ├── 15m.parts/   (backfill batches not yet compacted)
   │   └── 1h.parquet
   └── metadata.json    (last sync timestamps)
 """
@@ -19,15 +25,19 @@ import logging
 import asyncio
 import json
 import os
-from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict
+from datetime import datetime, timezone
+from typing import List, Optional, Dict, Tuple
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from ...domain.entities.candle import Candle
+from ...domain.entities.candle_store import CandleArrays
 from ...domain.interfaces.i_historical_data_loader import IHistoricalDataLoader
-from ..api.binance_rest_client import BinanceRestClient
+from .kline_backfill import KlineBackfiller, KlineBackfillError, interval_to_ms
 
 
 class HistoricalDataLoader(IHistoricalDataLoader):
@@ -52,14 +62,22 @@ class HistoricalDataLoader(IHistoricalDataLoader):
     # Parquet compression (ZSTD = best speed/ratio balance)
     COMPRESSION = "zstd"
     
-    def __init__(self, rest_client: Optional[BinanceRestClient] = None):
+    # Rows per row group: the unit the timestamp filter can skip (~35 days of 1m)
+    ROW_GROUP_SIZE = 50_000
+    
+    COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+    
+    # Integer divisors, so whole-ms timestamps convert exactly ('s' is multiplied)
+    _TICKS_PER_MS = {'ms': 1, 'us': 1_000, 'ns': 1_000_000}
+    
+    def __init__(self, backfiller: Optional[KlineBackfiller] = None):
         """
         Initialize loader with cache directory setup.
         
         Args:
-            rest_client: Injected Binance REST client
+            backfiller: Injected kline backfill engine (pooled, rate-limited)
         """
-        self.rest_client = rest_client or BinanceRestClient()
+        self.backfiller = backfiller or KlineBackfiller()
         self.logger = logging.getLogger(__name__)
         
         # Ensure cache directory exists
@@ -79,10 +97,12 @@ class HistoricalDataLoader(IHistoricalDataLoader):
         return {}
     
     def _save_metadata(self):
-        """Save sync metadata to JSON file."""
+        """Save sync metadata to JSON file (temp file + rename, never half-written)."""
         try:
-            with open(self.METADATA_FILE, 'w') as f:
+            tmp_path = self.METADATA_FILE.with_suffix('.json.tmp')
+            with open(tmp_path, 'w') as f:
                 json.dump(self._metadata, f, indent=2, default=str)
+            os.replace(tmp_path, self.METADATA_FILE)
         except Exception as e:
             self.logger.warning(f"Failed to save metadata: {e}")
     
@@ -110,12 +130,8 @@ class HistoricalDataLoader(IHistoricalDataLoader):
         """
         Load historical candles with Smart Sync caching.
         
-        Flow:
-        1. Check Parquet cache
-        2. If cache exists, check if incremental update needed
-        3. Only fetch missing data from API
-        4. Merge and save back to cache
-        5. Return filtered data for requested range
+        Compatibility wrapper over load_arrays() for code that wants
+        Candle entities; columnar callers should use load_arrays().
         
         Args:
             symbol: Trading pair (e.g. 'BTCUSDT')
@@ -126,6 +142,45 @@ class HistoricalDataLoader(IHistoricalDataLoader):
         Returns:
             List of Candle entities sorted by timestamp
         """
+        arrays = await self.load_arrays(symbol, interval, start_time, end_time)
+        return arrays.to_candles()
+    
+    async def load_arrays(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: datetime,
+        end_time: Optional[datetime] = None
+    ) -> CandleArrays:
+        """
+        Load historical candles as NumPy columns (no Candle objects).
+        
+        Returns:
+            CandleArrays (timestamp in epoch ms) sorted by timestamp
+        """
+        table = await self.load_table(symbol, interval, start_time, end_time)
+        return self._table_to_arrays(table)
+    
+    async def load_table(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: datetime,
+        end_time: Optional[datetime] = None
+    ) -> pa.Table:
+        """
+        Load historical candles as an Arrow table.
+        
+        Flow:
+        1. Check Parquet cache coverage (footer statistics only)
+        2. Only fetch missing data from API
+        3. Merge and save back to cache
+        4. Read the requested range: memory-mapped, timestamp filter
+           pushed down so row groups outside the range are skipped
+        
+        Returns:
+            Table with timestamp (UTC) and OHLCV columns, sorted by timestamp
+        """
         if end_time is None:
             end_time = datetime.now(timezone.utc)
             
@@ -136,189 +191,296 @@ class HistoricalDataLoader(IHistoricalDataLoader):
             end_time = end_time.replace(tzinfo=timezone.utc)
         
         cache_path = self._get_cache_path(symbol, interval)
-        meta_key = self._get_metadata_key(symbol, interval)
         
         self.logger.info(f"📂 Smart Sync: {symbol} {interval} | {start_time.date()} → {end_time.date()}")
         
-        # === Step 1: Try to load from cache ===
-        df_cache = None
+        await self._sync_cache(symbol, interval, start_time, end_time)
+        
+        if not cache_path.exists():
+            return self._empty_table()
+        
+        # pyarrow releases the GIL: portfolio loads decode symbols in parallel
+        table = await asyncio.to_thread(self._read_cache, cache_path, start_time, end_time)
+        self.logger.info(f"  ✅ Returning {table.num_rows} candles for requested range")
+        return table
+    
+    async def _sync_cache(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> None:
+        """Fetch whatever part of [start_time, end_time] the cache is missing."""
+        cache_path = self._get_cache_path(symbol, interval)
+        meta_key = self._get_metadata_key(symbol, interval)
+        interval_ms = interval_to_ms(interval)
+        
+        # Batches left behind by a crashed backfill join the cache first
+        summary = await asyncio.to_thread(self._compact_parts, cache_path)
+        if summary:
+            self._metadata.setdefault(meta_key, {}).update(summary)
+            self._save_metadata()
+        
+        # === Step 1: Cache bounds from the Parquet footer ===
+        bounds = None
         if cache_path.exists():
             try:
-                df_cache = pd.read_parquet(cache_path)
-                self.logger.info(f"  📦 Cache hit: {len(df_cache)} candles from disk")
+                bounds = self._cache_bounds(cache_path)
+                if bounds:
+                    self.logger.info(f"  📦 Cache hit: {bounds[2]} candles on disk")
             except Exception as e:
                 self.logger.warning(f"  ⚠️ Cache corrupted, will refetch: {e}")
-                df_cache = None
+                bounds = None
         
         # === Step 2: Determine what to fetch ===
-        need_fetch = False
-        fetch_start = start_time
-        fetch_end = end_time
-        
-        if df_cache is not None and not df_cache.empty:
-            cache_start = pd.to_datetime(df_cache['timestamp'].min()).to_pydatetime().replace(tzinfo=timezone.utc)
-            cache_end = pd.to_datetime(df_cache['timestamp'].max()).to_pydatetime().replace(tzinfo=timezone.utc)
+        # Ranges left over from an interrupted backfill come first: the cache
+        # bounds alone cannot see a hole between a half-filled prefix and the
+        # data that was already cached
+        ranges = [tuple(r) for r in self._metadata.get(meta_key, {}).get('backfill', [])]
+        if ranges:
+            self.logger.info(f"  ⏯️ Resuming interrupted backfill: {len(ranges)} range(s)")
+        
+        start_ms, end_ms = self._to_ms(start_time), self._to_ms(end_time)
+        if bounds:
+            cache_start, cache_end = self._to_ms(bounds[0]), self._to_ms(bounds[1])
             
-            # Check if we need data BEFORE cache
-            if start_time < cache_start:
-                self.logger.info(f"  ⬅️ Need historical data before cache: {start_time} < {cache_start}")
-                fetch_start = start_time
-                fetch_end = cache_start - timedelta(minutes=1)
-                need_fetch = True
+            # Data BEFORE cache
+            if start_ms < cache_start:
+                self.logger.info(f"  ⬅️ Need historical data before cache: {start_time} < {bounds[0]}")
+                ranges.append((start_ms, cache_start - 1))
             
-            # Check if we need data AFTER cache (incremental update)
-            if end_time > cache_end + timedelta(minutes=self._interval_to_minutes(interval)):
-                self.logger.info(f"  ➡️ Incremental update: {cache_end} → {end_time}")
-                fetch_start = cache_end + timedelta(minutes=1)
-                fetch_end = end_time
-                need_fetch = True
-            
-            # If cache fully covers the range
-            if not need_fetch:
-                self.logger.info(f"  ✅ Cache fully covers range, no fetch needed")
+            # Data AFTER cache (incremental update)
+            if end_ms >= cache_end + interval_ms:
+                self.logger.info(f"  ➡️ Incremental update: {bounds[1]} → {end_time}")
+                ranges.append((cache_end + interval_ms, end_ms))
         else:
-            # No cache, fetch everything
-            need_fetch = True
             self.logger.info(f"  📥 Cache miss, fetching full range from API")
+            ranges.append((start_ms, end_ms))
         
-        # === Step 3: Fetch missing data from API ===
-        new_candles = []
-        if need_fetch:
-            new_candles = await self._fetch_from_api(symbol, interval, fetch_start, fetch_end)
-            self.logger.info(f"  📡 Fetched {len(new_candles)} new candles from Binance")
+        ranges = self._merge_ranges(ranges)
+        if not ranges:
+            self.logger.info(f"  ✅ Cache fully covers range, no fetch needed")
+            return
         
-        # === Step 4: Merge and save cache ===
-        if new_candles:
-            df_new = self._candles_to_dataframe(new_candles)
-            
-            if df_cache is not None and not df_cache.empty:
-                df_merged = pd.concat([df_cache, df_new], ignore_index=True)
-                df_merged = df_merged.drop_duplicates(subset=['timestamp'])
-                df_merged = df_merged.sort_values('timestamp').reset_index(drop=True)
-            else:
-                df_merged = df_new
-            
-            # Save to Parquet with ZSTD compression
-            df_merged.to_parquet(cache_path, compression=self.COMPRESSION, index=False)
-            self.logger.info(f"  💾 Saved {len(df_merged)} candles to cache ({cache_path.stat().st_size / 1024:.1f} KB)")
-            
-            # Update metadata
-            self._metadata[meta_key] = {
-                "last_sync": datetime.now(timezone.utc).isoformat(),
-                "candle_count": len(df_merged),
-                "date_range": f"{df_merged['timestamp'].min()} - {df_merged['timestamp'].max()}"
-            }
-            self._save_metadata()
-            
-            df_cache = df_merged
+        # === Step 3: Fetch missing data, persisting after every batch ===
+        try:
+            await self._backfill(symbol, interval, cache_path, ranges)
+        except KlineBackfillError as e:
+            # Progress is checkpointed; the next load resumes from there
+            self.logger.error(f"  ❌ Backfill interrupted for {symbol} {interval}: {e}")
+    
+    async def _backfill(self, symbol: str, interval: str, cache_path: Path, ranges: List[Tuple[int, int]]) -> None:
+        """
+        Download `ranges` (epoch ms, inclusive) into the cache file.
         
-        # === Step 5: Filter to requested range and return ===
-        if df_cache is None or df_cache.empty:
-            return []
+        The remaining ranges are kept in metadata.json under the pair's
+        'backfill' key and advanced after each batch, so an interrupted run
+        (crash, Ctrl+C, API errors) picks up where it stopped.
         
-        # Convert timestamp column to datetime for filtering
-        df_cache['timestamp'] = pd.to_datetime(df_cache['timestamp'])
+        Each batch is written as its own part file before the checkpoint
+        moves past it (O(batch) I/O); the parts are merged into the cache
+        file once, when the backfill ends or fails.
+        """
+        meta_key = self._get_metadata_key(symbol, interval)
+        entry = self._metadata.setdefault(meta_key, {})
+        pending = [list(r) for r in ranges]
+        entry['backfill'] = pending
+        self._save_metadata()
         
-        mask = (df_cache['timestamp'] >= start_time) & (df_cache['timestamp'] <= end_time)
-        df_filtered = df_cache[mask]
+        # Time covered by one yielded batch
+        span = self.backfiller.checkpoint_pages * self.backfiller.page_limit * interval_to_ms(interval)
+        fetched = 0
+        try:
+            while pending:
+                range_start, range_end = pending[0]
+                cursor = range_start
+                async for batch in self.backfiller.iter_batches(symbol, interval, range_start, range_end):
+                    cursor = min(cursor + span, range_end + 1)
+                    if len(batch):
+                        await asyncio.to_thread(self._write_part, cache_path, batch)
+                        fetched += len(batch)
+                    pending[0][0] = cursor
+                    self._save_metadata()
+                pending.pop(0)
+        finally:
+            # Partial progress is readable right away, not only after the next sync
+            summary = await asyncio.to_thread(self._compact_parts, cache_path)
+            if summary:
+                entry.update(summary)
+                self._save_metadata()
+        
+        del entry['backfill']
+        entry['last_sync'] = datetime.now(timezone.utc).isoformat()
+        self._save_metadata()
+        self.logger.info(f"  📡 Fetched {fetched} new candles from Binance")
+    
+    @staticmethod
+    def _parts_dir(cache_path: Path) -> Path:
+        """Directory of backfill batches not yet compacted (e.g. 15m.parts/)."""
+        return cache_path.with_suffix('.parts')
+    
+    def _write_part(self, cache_path: Path, batch: CandleArrays) -> None:
+        """Append a batch as the next part file (temp file + rename)."""
+        parts_dir = self._parts_dir(cache_path)
+        parts_dir.mkdir(exist_ok=True)
+        index = max((int(p.stem) for p in parts_dir.glob('*.parquet')), default=-1) + 1
+        part_path = parts_dir / f"{index:06d}.parquet"
+        tmp_path = part_path.with_suffix('.parquet.tmp')
+        self._arrays_to_dataframe(batch).to_parquet(tmp_path, compression=self.COMPRESSION, index=False)
+        os.replace(tmp_path, part_path)
+    
+    def _compact_parts(self, cache_path: Path) -> Optional[Dict]:
+        """
+        Merge pending part files into the cache file (one rewrite).
         
-        candles = self._dataframe_to_candles(df_filtered, symbol)
-        self.logger.info(f"  ✅ Returning {len(candles)} candles for requested range")
+        Later parts win on duplicate timestamps. Parts are deleted only
+        after the cache file is replaced, so a crash in between just merges
+        them again.
         
-        return candles
+        Returns:
+            The metadata summary, or None if there was nothing to merge
+        """
+        parts_dir = self._parts_dir(cache_path)
+        parts = sorted(parts_dir.glob('*.parquet')) if parts_dir.exists() else []
+        if not parts:
+            return None
+        
+        frames = [pd.read_parquet(cache_path)] if cache_path.exists() else []
+        frames.extend(pd.read_parquet(part) for part in parts)
+        for df in frames:
+            df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True)
+        df_merged = pd.concat(frames, ignore_index=True)
+        df_merged = df_merged.drop_duplicates(subset=['timestamp'], keep='last')
+        df_merged = df_merged.sort_values('timestamp').reset_index(drop=True)
+        
+        # Save to Parquet with ZSTD compression (temp file + rename: readers never see a partial file)
+        tmp_path = cache_path.with_suffix('.parquet.tmp')
+        df_merged.to_parquet(tmp_path, compression=self.COMPRESSION, index=False, row_group_size=self.ROW_GROUP_SIZE)
+        os.replace(tmp_path, cache_path)
+        for part in parts:
+            part.unlink()
+        parts_dir.rmdir()
+        self.logger.info(
+            f"  💾 Compacted {len(parts)} batch file(s): {len(df_merged)} candles in cache "
+            f"({cache_path.stat().st_size / 1024:.1f} KB)"
+        )
+        
+        return {
+            "candle_count": len(df_merged),
+            "date_range": f"{df_merged['timestamp'].min()} - {df_merged['timestamp'].max()}"
+        }
     
-    async def _fetch_from_api(
-        self,
-        symbol: str,
-        interval: str,
-        start_time: datetime,
-        end_time: datetime
-    ) -> List[Candle]:
+    @staticmethod
+    def _merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Sort and coalesce overlapping / adjacent inclusive ranges."""
+        merged: List[List[int]] = []
+        for start, end in sorted(r for r in ranges if r[0] <= r[1]):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return [tuple(r) for r in merged]
+    
+    @staticmethod
+    def _to_ms(value: datetime) -> int:
+        return int(round(value.timestamp() * 1000))
+    
+    def _cache_bounds(self, cache_path: Path) -> Optional[Tuple[datetime, datetime, int]]:
         """
-        Fetch candles from Binance API with pagination.
+        (first timestamp, last timestamp, row count) of a cache file.
         
-        Uses backwards pagination from end_time.
+        Uses row-group statistics from the footer when available, so no
+        column data is decoded.
         """
-        all_candles: List[Candle] = []
-        
-        current_end_ms = int(end_time.timestamp() * 1000)
-        start_ms = int(start_time.timestamp() * 1000)
-        
-        request_count = 0
-        max_requests = 100  # Safety limit
-        
-        while current_end_ms > start_ms and request_count < max_requests:
-            limit = 1000
-            chunk = self.rest_client.get_klines(
-                symbol=symbol,
-                interval=interval,
-                limit=limit,
-                end_time=current_end_ms
+        parquet_file = pq.ParquetFile(cache_path, memory_map=True)
+        metadata = parquet_file.metadata
+        if metadata.num_rows == 0:
+            return None
+        
+        index = parquet_file.schema_arrow.get_field_index('timestamp')
+        field_type = parquet_file.schema_arrow.field(index).type
+        lows, highs = [], []
+        if pa.types.is_timestamp(field_type):
+            for i in range(metadata.num_row_groups):
+                stats = metadata.row_group(i).column(index).statistics
+                if stats is None or not stats.has_min_max:
+                    lows = highs = []
+                    break
+                lows.append(stats.min)
+                highs.append(stats.max)
+        
+        if lows:
+            first, last = min(lows), max(highs)
+        else:
+            column = pd.to_datetime(parquet_file.read(columns=['timestamp']).column(0).to_pandas(), utc=True)
+            first, last = column.min(), column.max()
+        return self._as_utc(first), self._as_utc(last), metadata.num_rows
+    
+    @staticmethod
+    def _as_utc(value) -> datetime:
+        ts = pd.Timestamp(value)
+        ts = ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')
+        return ts.to_pydatetime()
+    
+    def _read_cache(self, cache_path: Path, start_time: datetime, end_time: datetime) -> pa.Table:
+        """Read [start_time, end_time] from a cache file (memory-mapped, filter pushed down)."""
+        try:
+            return pq.read_table(
+                cache_path,
+                columns=list(self.COLUMNS),
+                memory_map=True,
+                filters=[('timestamp', '>=', start_time), ('timestamp', '<=', end_time)]
             )
-            
-            if not chunk:
-                break
-            
-            # Filter candles within range
-            chunk_filtered = [c for c in chunk if int(c.timestamp.timestamp() * 1000) >= start_ms]
-            all_candles = chunk_filtered + all_candles
-            
-            # Move backwards
-            first_candle_ms = int(chunk[0].timestamp.timestamp() * 1000)
-            current_end_ms = first_candle_ms - 1
-            
-            if first_candle_ms <= start_ms:
-                break
-            
-            request_count += 1
-            await asyncio.sleep(0.05)  # Rate limiting
-        
-        # Deduplicate and sort
-        seen = set()
-        unique = []
-        for c in sorted(all_candles, key=lambda x: x.timestamp):
-            if c.timestamp not in seen:
-                unique.append(c)
-                seen.add(c.timestamp)
-        
-        return unique
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            # Older caches stored naive or string timestamps: normalise, then filter
+            df = pq.read_table(cache_path, columns=list(self.COLUMNS), memory_map=True).to_pandas()
+            df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True)
+            df = df[(df['timestamp'] >= start_time) & (df['timestamp'] <= end_time)]
+            return pa.Table.from_pandas(df.sort_values('timestamp'), preserve_index=False)
+    
+    def _empty_table(self) -> pa.Table:
+        return pa.table({
+            'timestamp': pa.array([], type=pa.timestamp('ms', tz='UTC')),
+            **{name: pa.array([], type=pa.float64()) for name in self.COLUMNS[1:]}
+        })
+    
+    def _table_to_arrays(self, table: pa.Table) -> CandleArrays:
+        """Arrow table -> CandleArrays (timestamps to epoch ms, prices to float64)."""
+        ts = table.column('timestamp')
+        if pa.types.is_timestamp(ts.type):
+            ticks = ts.cast(pa.int64()).to_numpy()
+            if ts.type.unit == 's':
+                timestamp = ticks * 1000.0
+            else:
+                timestamp = ticks / self._TICKS_PER_MS[ts.type.unit]
+        else:
+            timestamp = pd.to_datetime(ts.to_pandas(), utc=True).to_numpy('datetime64[ms]').astype(np.int64)
+        return CandleArrays(
+            np.asarray(timestamp, dtype=np.float64),
+            *(table.column(name).to_numpy().astype(np.float64, copy=False) for name in self.COLUMNS[1:])
+        )
     
     def _candles_to_dataframe(self, candles: List[Candle]) -> pd.DataFrame:
-        """Convert list of Candle entities to DataFrame."""
-        data = []
-        for c in candles:
-            data.append({
-                'timestamp': c.timestamp,
-                'open': c.open,
-                'high': c.high,
-                'low': c.low,
-                'close': c.close,
-                'volume': c.volume
-            })
-        return pd.DataFrame(data)
+        """Convert list of Candle entities to DataFrame (built column-wise)."""
+        return self._arrays_to_dataframe(CandleArrays.from_candles(candles))
+    
+    def _arrays_to_dataframe(self, arrays: CandleArrays) -> pd.DataFrame:
+        """Convert CandleArrays to the cache DataFrame layout."""
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(arrays.timestamp.astype(np.int64), unit='ms', utc=True),
+            'open': arrays.open,
+            'high': arrays.high,
+            'low': arrays.low,
+            'close': arrays.close,
+            'volume': arrays.volume
+        })
     
     def _dataframe_to_candles(self, df: pd.DataFrame, symbol: str) -> List[Candle]:
         """Convert DataFrame back to list of Candle entities."""
-        candles = []
-        for _, row in df.iterrows():
-            ts = row['timestamp']
-            if isinstance(ts, str):
-                ts = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            elif isinstance(ts, pd.Timestamp):
-                ts = ts.to_pydatetime()
-            if ts.tzinfo is None:
-                ts = ts.replace(tzinfo=timezone.utc)
-                
-            # Note: Candle entity doesn't have symbol/interval fields
-            candles.append(Candle(
-                timestamp=ts,
-                open=float(row['open']),
-                high=float(row['high']),
-                low=float(row['low']),
-                close=float(row['close']),
-                volume=float(row['volume'])
-            ))
-        return candles
+        # Note: Candle entity doesn't have symbol/interval fields
+        table = pa.Table.from_pandas(df[list(self.COLUMNS)], preserve_index=False)
+        return self._table_to_arrays(table).to_candles()
     
     def _interval_to_minutes(self, interval: str) -> int:
         """Convert interval string to minutes."""
@@ -347,13 +509,12 @@ class HistoricalDataLoader(IHistoricalDataLoader):
         self.logger.info(f"📊 Loading portfolio data for {len(symbols)} symbols...")
         
         # Load all data in parallel (each with its own cache)
-        tasks = [self.load_candles(sym, interval, start_time, end_time) for sym in symbols]
-        results = await asyncio.gather(*tasks)
+        arrays_by_symbol = await self.load_portfolio_arrays(symbols, interval, start_time, end_time)
         
         # Merge into timeline
         timeline = {}
-        for sym, candles in zip(symbols, results):
-            for c in candles:
+        for sym, arrays in arrays_by_symbol.items():
+            for c in arrays.to_candles():
                 if c.timestamp not in timeline:
                     timeline[c.timestamp] = {}
                 timeline[c.timestamp][sym] = c
@@ -365,6 +526,23 @@ class HistoricalDataLoader(IHistoricalDataLoader):
         self.logger.info(f"✅ Portfolio timeline ready: {len(sorted_timeline)} timestamps")
         return sorted_timeline
     
+    async def load_portfolio_arrays(
+        self,
+        symbols: List[str],
+        interval: str,
+        start_time: datetime,
+        end_time: Optional[datetime] = None
+    ) -> Dict[str, CandleArrays]:
+        """
+        Load columnar data for multiple symbols in parallel.
+        
+        Returns:
+            {symbol: CandleArrays} (each on its own time axis)
+        """
+        tasks = [self.load_arrays(sym, interval, start_time, end_time) for sym in symbols]
+        results = await asyncio.gather(*tasks)
+        return dict(zip(symbols, results))
+    
     def clear_cache(self, symbol: Optional[str] = None, interval: Optional[str] = None):
         """
         Clear cache files.
@@ -378,6 +556,10 @@ class HistoricalDataLoader(IHistoricalDataLoader):
             if cache_path.exists():
                 cache_path.unlink()
                 self.logger.info(f"🗑️ Cleared cache: {symbol}/{interval}")
+            parts_dir = self._parts_dir(cache_path)
+            if parts_dir.exists():
+                import shutil
+                shutil.rmtree(parts_dir)
         elif symbol:
             symbol_dir = self.CACHE_DIR / symbol.upper()
             if symbol_dir.exists():
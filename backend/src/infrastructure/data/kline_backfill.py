@@ -0,0 +1,205 @@
+"""
+KlineBackfiller - Infrastructure Layer
+
+Async kline backfill engine for HistoricalDataLoader.
+
+- One pooled httpx.AsyncClient (keep-alive) per event loop
+- Range split into fixed pages (interval * limit) fetched concurrently
+  with startTime/endTime, so no page depends on the previous response
+- Every request goes through the shared BinanceWeightLimiter, which
+  follows the X-MBX-USED-WEIGHT-1M header and Retry-After on 429/418
+- Pages are delivered in chronological waves so callers can persist
+  and checkpoint progress between waves
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, List, Optional
+
+import httpx
+import numpy as np
+
+from ...domain.entities.candle_store import CandleArrays
+from ..api.binance_rest_client import BinanceRestClient
+from ..api.binance_weight_limiter import BinanceWeightLimiter, get_binance_weight_limiter, klines_weight
+
+
+INTERVAL_MS = {
+    '1s': 1_000,
+    '1m': 60_000, '3m': 180_000, '5m': 300_000, '15m': 900_000, '30m': 1_800_000,
+    '1h': 3_600_000, '2h': 7_200_000, '4h': 14_400_000, '6h': 21_600_000,
+    '8h': 28_800_000, '12h': 43_200_000,
+    '1d': 86_400_000, '3d': 259_200_000, '1w': 604_800_000,
+}
+
+
+def interval_to_ms(interval: str) -> int:
+    """Kline interval string -> milliseconds."""
+    try:
+        return INTERVAL_MS[interval]
+    except KeyError:
+        raise ValueError(f"Unsupported kline interval: {interval}") from None
+
+
+class KlineBackfillError(RuntimeError):
+    """A page could not be fetched after all retries."""
+
+
+class KlineBackfiller:
+    """
+    Concurrent, rate-limited kline downloader.
+
+    Usage:
+        backfiller = KlineBackfiller()
+        async for batch in backfiller.iter_batches('BTCUSDT', '1m', start_ms, end_ms):
+            save(batch)          # CandleArrays, chronological, batches in order
+    """
+
+    def __init__(
+        self,
+        base_url: str = BinanceRestClient.BASE_URL,
+        limiter: Optional[BinanceWeightLimiter] = None,
+        max_concurrency: int = 8,
+        page_limit: int = 1000,
+        timeout: float = 10.0,
+        max_retries: int = 5,
+        checkpoint_pages: int = 32
+    ):
+        """
+        Args:
+            base_url: REST base URL (…/api/v3); point at a stub server in tests
+            limiter: Weight limiter (default: process-wide Binance limiter)
+            max_concurrency: Pages in flight at once (also the connection pool size)
+            page_limit: Klines per request (Binance max 1000)
+            timeout: Per-request timeout in seconds
+            max_retries: Retries per page on 429/418, 5xx and transport errors
+            checkpoint_pages: Pages per yielded batch
+        """
+        self.base_url = base_url.rstrip('/')
+        self.limiter = limiter or get_binance_weight_limiter()
+        self.max_concurrency = max_concurrency
+        self.page_limit = page_limit
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.checkpoint_pages = checkpoint_pages
+        self.logger = logging.getLogger(__name__)
+
+        # httpx clients are bound to the loop they were first used on
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.request_count = 0
+        self.retry_count = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                )
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+    def page_ranges(self, interval: str, start_ms: int, end_ms: int) -> List[tuple]:
+        """
+        Split [start_ms, end_ms] into inclusive (start, end) windows that
+        each hold at most page_limit klines.
+        """
+        span = interval_to_ms(interval) * self.page_limit
+        return [(page_start, min(page_start + span - 1, end_ms)) for page_start in range(start_ms, end_ms + 1, span)]
+
+    async def iter_batches(
+        self,
+        symbol: str,
+        interval: str,
+        start_ms: int,
+        end_ms: int
+    ) -> AsyncIterator[CandleArrays]:
+        """
+        Yield the klines opening in [start_ms, end_ms], one CandleArrays per
+        wave of checkpoint_pages pages, in chronological order.
+
+        Everything up to the end of a yielded batch's window has been
+        fetched, so a caller can record that as its resume point.
+        """
+        pages = self.page_ranges(interval, start_ms, end_ms)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(page):
+            async with semaphore:
+                return await self._fetch_page(symbol, interval, *page)
+
+        for offset in range(0, len(pages), self.checkpoint_pages):
+            wave = pages[offset:offset + self.checkpoint_pages]
+            results = await asyncio.gather(*(fetch(page) for page in wave))
+            yield self._concat(results)
+
+    async def fetch_range(self, symbol: str, interval: str, start_ms: int, end_ms: int) -> CandleArrays:
+        """All klines opening in [start_ms, end_ms] as one CandleArrays."""
+        batches = [batch async for batch in self.iter_batches(symbol, interval, start_ms, end_ms)]
+        if not batches:
+            return self._concat([])
+        return CandleArrays(*(np.concatenate(columns) for columns in zip(*(b._columns() for b in batches))))
+
+    async def _fetch_page(self, symbol: str, interval: str, start_ms: int, end_ms: int) -> np.ndarray:
+        client = self._get_client()
+        params = {
+            'symbol': symbol.upper(),
+            'interval': interval,
+            'startTime': start_ms,
+            'endTime': end_ms,
+            'limit': self.page_limit,
+        }
+        weight = klines_weight(self.page_limit)
+
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.acquire(weight)
+            self.request_count += 1
+            try:
+                response = await client.get('/klines', params=params)
+            except httpx.TransportError as e:
+                error = f"{type(e).__name__}: {e}"
+            else:
+                self.limiter.update_from_headers(response.headers)
+                if response.status_code == 200:
+                    return self._parse(response.json())
+                error = f"HTTP {response.status_code}"
+                if response.status_code in (418, 429):
+                    self.limiter.on_rate_limited(float(response.headers.get('Retry-After', 60)))
+                    self.retry_count += 1
+                    continue
+                if response.status_code < 500:
+                    raise KlineBackfillError(f"{symbol} {interval} page {start_ms}: {error} {response.text[:200]}")
+
+            if attempt < self.max_retries:
+                self.retry_count += 1
+                delay = min(0.5 * 2 ** attempt, 10.0)
+                self.logger.warning(f"{symbol} {interval} page {start_ms}: {error}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        raise KlineBackfillError(f"{symbol} {interval} page {start_ms}: gave up after {self.max_retries} retries")
+
+    @staticmethod
+    def _parse(klines: list) -> np.ndarray:
+        """Binance kline rows -> (n, 6) float64 [open_time, o, h, l, c, v]."""
+        if not klines:
+            return np.empty((0, 6), dtype=np.float64)
+        return np.array([row[:6] for row in klines], dtype=np.float64)
+
+    @staticmethod
+    def _concat(pages: List) -> CandleArrays:
+        rows = [page for page in pages if len(page)]
+        data = np.concatenate(rows) if rows else np.empty((0, 6), dtype=np.float64)
+        return CandleArrays(*data.T.copy())
@@ -14,10 +14,13 @@ Production Readiness Update:
 
 from typing import Optional, Dict, Any
 import logging
+import os
 
 from .persistence.sqlite_market_data_repository import SQLiteMarketDataRepository
 from .persistence.sqlite_state_repository import SQLiteStateRepository
 from .persistence.sqlite_order_repository import SQLiteOrderRepository
+from .persistence.order_book_repository import OrderBookRepository
+from .persistence.sqlite_connection_pool import SQLiteConnectionPool
 from .api.binance_client import BinanceClient
 from .api.binance_rest_client import BinanceRestClient
 from .exchange.paper_exchange_service import PaperExchangeService
@@ -29,6 +32,7 @@ from .indicators.bollinger_calculator import BollingerCalculator
 from .indicators.stoch_rsi_calculator import StochRSICalculator
 from .indicators.adx_calculator import ADXCalculator
 from .indicators.atr_calculator import ATRCalculator
+from .indicators.incremental_indicator_engine import IncrementalIndicatorEngine
 from .indicators.volume_spike_detector import VolumeSpikeDetector
 from .indicators.regime_detector import RegimeDetector  # SOTA: For Layer 0 filtering
 from .indicators.sfp_detector import SFPDetector  # SOTA: Phase 1 SFP
@@ -47,6 +51,7 @@ from ..application.services.warmup_manager import WarmupManager
 from ..application.services.hard_filters import HardFilters
 from ..application.services.state_recovery_service import StateRecoveryService
 from ..application.services.smart_entry_calculator import SmartEntryCalculator
+from ..application.services.indicator_worker_pool import IndicatorWorkerPool
 from ..application.analysis.trend_filter import TrendFilter # SOTA: For HTF Confluence
 
 
@@ -115,6 +120,26 @@ class DIContainer:
         
         return self._instances['indicator_calculator']
     
+    def get_sqlite_pool(self, db_path: str) -> SQLiteConnectionPool:
+        """
+        Get the shared SQLiteConnectionPool for a database file (one per path).
+        
+        All SQLite repositories on the same file share thread-local
+        connections and the created-tables cache.
+        
+        Args:
+            db_path: SQLite file path
+        
+        Returns:
+            SQLiteConnectionPool instance
+        """
+        key = f'sqlite_pool:{db_path if db_path == ":memory:" else os.path.abspath(db_path)}'
+        if key not in self._instances:
+            self._instances[key] = SQLiteConnectionPool(db_path)
+            self.logger.debug(f"Created SQLiteConnectionPool for db: {db_path}")
+        
+        return self._instances[key]
+    
     def get_market_data_repository(self) -> SQLiteMarketDataRepository:
         """
         Get SQLiteMarketDataRepository instance (singleton).
@@ -127,7 +152,8 @@ class DIContainer:
             db_path = self.get_config('DATABASE_PATH', 'data/market_data.db')
             
             self._instances['market_data_repository'] = SQLiteMarketDataRepository(
-                db_path=db_path
+                db_path=db_path,
+                pool=self.get_sqlite_pool(db_path)
             )
             self.logger.debug(f"Created SQLiteMarketDataRepository with db: {db_path}")
         
@@ -276,7 +302,8 @@ class DIContainer:
                 rest_client=rest_client,
                 vwap_calculator=vwap_calculator,
                 stoch_rsi_calculator=stoch_rsi_calculator,
-                adx_calculator=adx_calculator
+                adx_calculator=adx_calculator,
+                indicator_engine=self.get_incremental_indicator_engine()
             )
             self.logger.debug("Created WarmupManager instance")
         
@@ -319,17 +346,24 @@ class DIContainer:
         
         return self._instances['config_instance']
     
-    def get_order_repository(self) -> SQLiteOrderRepository:
+    def get_order_repository(self) -> OrderBookRepository:
         """
-        Get SQLiteOrderRepository instance (singleton).
+        Get the order repository (singleton).
+        
+        PENDING/OPEN positions are served from an in-memory book rebuilt
+        from SQLite here; writes reach SQLite through a write-behind journal
+        (synchronous for ":memory:" databases).
         
         Returns:
-            SQLiteOrderRepository for order/position persistence
+            OrderBookRepository over SQLiteOrderRepository
         """
         if 'order_repository' not in self._instances:
             db_path = self.get_config('DATABASE_PATH', 'data/trading_system.db')
-            self._instances['order_repository'] = SQLiteOrderRepository(db_path=db_path)
-            self.logger.debug(f"Created SQLiteOrderRepository with db: {db_path}")
+            store = SQLiteOrderRepository(db_path=db_path, pool=self.get_sqlite_pool(db_path))
+            self._instances['order_repository'] = OrderBookRepository(
+                store, write_behind=db_path != ":memory:"
+            )
+            self.logger.debug(f"Created OrderBookRepository with db: {db_path}")
         
         return self._instances['order_repository']
     
@@ -385,7 +419,9 @@ class DIContainer:
         """
         if 'state_repository' not in self._instances:
             db_path = self.get_config('DATABASE_PATH', 'data/trading_system.db')
-            self._instances['state_repository'] = SQLiteStateRepository(db_path=db_path)
+            self._instances['state_repository'] = SQLiteStateRepository(
+                db_path=db_path, pool=self.get_sqlite_pool(db_path)
+            )
             self.logger.debug(f"Created SQLiteStateRepository with db: {db_path}")
         
         return self._instances['state_repository']
@@ -486,6 +522,32 @@ class DIContainer:
             self._instances['atr_calculator'] = ATRCalculator()
         return self._instances['atr_calculator']
     
+    def get_incremental_indicator_engine(self) -> IncrementalIndicatorEngine:
+        """
+        Get IncrementalIndicatorEngine instance (Transient).
+        
+        Transient for the same reason as DataAggregator: it holds per-stream
+        candle state, so every consumer (RealtimeService, BacktestEngine) owns
+        its own engine. Parameters are taken from the singleton calculators so
+        snapshots stay interchangeable with the batch results.
+        
+        Returns:
+            New IncrementalIndicatorEngine instance
+        """
+        bollinger = self.get_bollinger_calculator()
+        stoch_rsi = self.get_stoch_rsi_calculator()
+        return IncrementalIndicatorEngine(
+            bb_period=bollinger.period,
+            bb_std_multiplier=bollinger.std_multiplier,
+            stoch_k_period=stoch_rsi.k_period,
+            stoch_d_period=stoch_rsi.d_period,
+            stoch_rsi_period=stoch_rsi.rsi_period,
+            stoch_period=stoch_rsi.stoch_period,
+            atr_period=self.get_atr_calculator().period,
+            adx_period=self.get_adx_calculator().period,
+            vwap_anchor=self.get_vwap_calculator().anchor,
+        )
+    
     def get_volume_spike_detector(self) -> VolumeSpikeDetector:
         """Get VolumeSpikeDetector instance (singleton)."""
         if 'volume_spike_detector' not in self._instances:
@@ -704,6 +766,25 @@ class DIContainer:
         
         return self._instances['paper_trading_service']
     
+    def get_signal_repository(self):
+        """
+        Get SQLiteSignalRepository instance (singleton).
+        
+        Returns:
+            SQLiteSignalRepository for signal persistence
+        """
+        if 'signal_repository' not in self._instances:
+            from ..infrastructure.repositories.sqlite_signal_repository import SQLiteSignalRepository
+            
+            # SOTA FIX: Unify DB to trading_system.db
+            db_path = self.get_config('DATABASE_PATH', 'data/trading_system.db')
+            self._instances['signal_repository'] = SQLiteSignalRepository(
+                db_path=db_path, pool=self.get_sqlite_pool(db_path)
+            )
+            self.logger.debug(f"Created SQLiteSignalRepository with db: {db_path}")
+        
+        return self._instances['signal_repository']
+    
     def get_signal_lifecycle_service(self):
         """
         Get SignalLifecycleService instance (singleton).
@@ -716,14 +797,9 @@ class DIContainer:
         if 'signal_lifecycle_service' not in self._instances:
             # Lazy import to avoid circular dependency
             from ..application.services.signal_lifecycle_service import SignalLifecycleService
-            from ..infrastructure.repositories.sqlite_signal_repository import SQLiteSignalRepository
-            
-            # SOTA FIX: Unify DB to trading_system.db
-            db_path = self.get_config('DATABASE_PATH', 'data/trading_system.db')
-            signal_repository = SQLiteSignalRepository(db_path=db_path)
             
             self._instances['signal_lifecycle_service'] = SignalLifecycleService(
-                signal_repository=signal_repository
+                signal_repository=self.get_signal_repository()
             )
             self.logger.info("Created SignalLifecycleService with signal repository")
         
@@ -768,6 +844,17 @@ class DIContainer:
             self._instances['trend_filter'] = TrendFilter(ema_period=50) # Standard 1H/4H period
         return self._instances['trend_filter']
 
+    def get_indicator_worker_pool(self) -> IndicatorWorkerPool:
+        """
+        Get IndicatorWorkerPool instance (singleton).
+        
+        Shared by every RealtimeService so closed candles of all symbols at
+        the same boundary are computed as one batch off the event loop.
+        """
+        if 'indicator_worker_pool' not in self._instances:
+            self._instances['indicator_worker_pool'] = IndicatorWorkerPool()
+        return self._instances['indicator_worker_pool']
+    
     def get_realtime_service(self, symbol: str = "btcusdt"):
         """
         Get RealtimeService instance with all dependencies (singleton per symbol).
@@ -808,6 +895,10 @@ class DIContainer:
                 trend_filter=self.get_trend_filter(),
                 # CRITICAL FIX: Inject signal confirmation for whipsaw prevention!
                 signal_confirmation_service=self.get_signal_confirmation_service(),
+                # Streaming indicators (per-service state)
+                indicator_engine=self.get_incremental_indicator_engine(),
+                # Closed-candle signal work batched across symbols
+                indicator_pool=self.get_indicator_worker_pool(),
             )
             self.logger.info(f"✅ Created RealtimeService for {symbol} with all services injected!")
         
@@ -826,7 +917,28 @@ class DIContainer:
                 self.logger.debug("Closed BinanceClient")
             except Exception as e:
                 self.logger.warning(f"Error closing BinanceClient: {e}")
-        
+
+        # Let in-flight indicator jobs finish
+        if 'indicator_worker_pool' in self._instances:
+            self._instances['indicator_worker_pool'].shutdown()
+
+        # Write the order journal and finish queued awaitable order I/O
+        if 'order_repository' in self._instances:
+            self._instances['order_repository'].close()
+
+        # Drain queued candle writes before dropping the repository
+        if 'market_data_repository' in self._instances:
+            try:
+                self._instances['market_data_repository'].close()
+                self.logger.debug("Closed market data writer")
+            except Exception as e:
+                self.logger.warning(f"Error closing market data writer: {e}")
+
+        # Close pooled SQLite connections last (repositories above may still write)
+        for key, instance in self._instances.items():
+            if key.startswith('sqlite_pool:'):
+                instance.close()
+
         # Clear all instances
         self._instances.clear()
         self.logger.info("DI Container cleaned up")
@@ -2,15 +2,58 @@
 ADX Calculator - Infrastructure Layer
 
 Calculate Average Directional Index (ADX) for trend strength measurement.
+
++DM/-DM, true ranges and the per-window DX series are computed on NumPy
+columns; the Wilder recursions stay in plain floats (they are sequential
+and must reproduce the scalar arithmetic exactly). StreamingADX in
+incremental_indicator_engine is the O(1)-per-candle counterpart.
 """
 
 import logging
+import sys
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 from ...domain.entities.candle import Candle
+from ...domain.entities.candle_store import CandleInput, candle_column
 from .atr_calculator import ATRCalculator
 
+# Python 3.12 made sum() of floats compensated (Neumaier)
+_COMPENSATED_SUM = sys.version_info >= (3, 12)
+
+
+def window_sums(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    sum(values[i:i + period]) for every full window, as the builtin sum()
+    would compute it (left to right, compensated on Python 3.12+).
+    
+    Args:
+        values: 1-D float array
+        period: Window length (>= 1)
+    
+    Returns:
+        Array of len(values) - period + 1 window sums (empty if too short)
+    """
+    count = len(values) - period + 1
+    if count <= 0:
+        return np.empty(0)
+    total = values[:count].copy()
+    compensation = np.zeros(count)
+    for k in range(1, period):
+        term = values[k:k + count]
+        step = total + term
+        if _COMPENSATED_SUM:
+            compensation += np.where(
+                np.abs(total) >= np.abs(term), (total - step) + term, (term - step) + total
+            )
+        total = step
+    if _COMPENSATED_SUM:
+        apply = (compensation != 0) & np.isfinite(compensation)
+        total = np.where(apply, total + compensation, total)
+    return total
+
 
 @dataclass
 class ADXResult:
@@ -118,14 +161,14 @@ class ADXCalculator:
     
     def calculate_adx(
         self,
-        candles: List[Candle],
+        candles: CandleInput,
         period: Optional[int] = None
     ) -> ADXResult:
         """
         Calculate ADX value for given candles.
         
         Args:
-            candles: List of Candle entities (chronological order)
+            candles: List of Candle entities or CandleArrays (chronological order)
             period: Override default period (optional)
         
         Returns:
@@ -201,7 +244,7 @@ class ADXCalculator:
         # If we have enough data, calculate proper ADX with smoothing
         if len(candles) >= calc_period * 3:
             adx_value = self._calculate_adx_with_smoothing(
-                candles, calc_period, plus_dm_list, minus_dm_list, true_ranges
+                calc_period, plus_dm_list, minus_dm_list, true_ranges
             )
         
         self.logger.debug(
@@ -269,29 +312,29 @@ class ADXCalculator:
     
     def _calculate_directional_movements(
         self,
-        candles: List[Candle]
+        candles: CandleInput
     ) -> Tuple[List[float], List[float]]:
         """
         Calculate +DM and -DM for all candles.
         
+        Same rules as calculate_directional_movement, applied to the
+        high/low columns at once.
+        
         Args:
-            candles: List of candles
+            candles: List of candles or CandleArrays
         
         Returns:
             Tuple of (+DM list, -DM list)
         """
-        plus_dm_list = []
-        minus_dm_list = []
+        high = candle_column(candles, 'high')
+        low = candle_column(candles, 'low')
+        up_move = high[1:] - high[:-1]
+        down_move = low[:-1] - low[1:]
         
-        # Start from index 1 (need previous candle)
-        for i in range(1, len(candles)):
-            plus_dm, minus_dm = self.calculate_directional_movement(
-                candles[i], candles[i-1]
-            )
-            plus_dm_list.append(plus_dm)
-            minus_dm_list.append(minus_dm)
+        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
         
-        return plus_dm_list, minus_dm_list
+        return plus_dm.tolist(), minus_dm.tolist()
     
     def _apply_wilders_smoothing(
         self,
@@ -324,7 +367,6 @@ class ADXCalculator:
     
     def _calculate_adx_with_smoothing(
         self,
-        candles: List[Candle],
         period: int,
         plus_dm_list: List[float],
         minus_dm_list: List[float],
@@ -333,10 +375,12 @@ class ADXCalculator:
         """
         Calculate ADX with proper smoothing of DX values.
         
-        This calculates multiple DX values and then smooths them to get ADX.
+        DX is taken over each `period`-long window of +DM/-DM/TR ending at
+        index period .. len - 1 (a full window's Wilder seed is its mean),
+        skipping windows with no range or no directional movement, and
+        the DX series is then Wilder-smoothed.
         
         Args:
-            candles: List of candles
             period: Calculation period
             plus_dm_list: List of +DM values
             minus_dm_list: List of -DM values
@@ -345,34 +389,19 @@ class ADXCalculator:
         Returns:
             Smoothed ADX value
         """
-        dx_values = []
-        
-        # Calculate DX for each period
-        for i in range(period, len(plus_dm_list)):
-            # Get slice of data for this period
-            pdm_slice = plus_dm_list[i-period+1:i+1]
-            mdm_slice = minus_dm_list[i-period+1:i+1]
-            tr_slice = true_ranges[i-period+1:i+1]
-            
-            # Smooth the slices
-            smoothed_pdm = self._apply_wilders_smoothing(pdm_slice, period)
-            smoothed_mdm = self._apply_wilders_smoothing(mdm_slice, period)
-            smoothed_tr = self._apply_wilders_smoothing(tr_slice, period)
-            
-            # Calculate DI values
-            if smoothed_tr == 0:
-                continue
-            
+        # Windows ending at index period .. len - 1 start at 1 .. len - period
+        smoothed_pdm = window_sums(np.asarray(plus_dm_list[1:]), period) / period
+        smoothed_mdm = window_sums(np.asarray(minus_dm_list[1:]), period) / period
+        smoothed_tr = window_sums(np.asarray(true_ranges[1:]), period) / period
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
             plus_di = (smoothed_pdm / smoothed_tr) * 100
             minus_di = (smoothed_mdm / smoothed_tr) * 100
-            
-            # Calculate DX
             di_sum = plus_di + minus_di
-            if di_sum == 0:
-                continue
-            
-            dx = (abs(plus_di - minus_di) / di_sum) * 100
-            dx_values.append(dx)
+            dx = (np.abs(plus_di - minus_di) / di_sum) * 100
+        
+        # Windows without range or directional movement yield no DX
+        dx_values = dx[(smoothed_tr != 0) & (di_sum != 0)].tolist()
         
         # Smooth DX values to get ADX
         if len(dx_values) >= period:
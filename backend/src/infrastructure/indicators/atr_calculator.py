@@ -5,10 +5,12 @@ Calculate Average True Range (ATR) for volatility measurement using Wilder's smo
 """
 
 import logging
+import numpy as np
 from typing import List, Optional
 from dataclasses import dataclass
 
 from ...domain.entities.candle import Candle
+from ...domain.entities.candle_store import CandleInput, candle_column
 
 
 @dataclass
@@ -94,7 +96,7 @@ class ATRCalculator:
     
     def calculate_atr(
         self,
-        candles: List[Candle],
+        candles: CandleInput,
         period: Optional[int] = None,
         timeframe: str = '15m'
     ) -> ATRResult:
@@ -102,7 +104,7 @@ class ATRCalculator:
         Calculate ATR value for given candles.
         
         Args:
-            candles: List of Candle entities (chronological order)
+            candles: List of Candle entities or CandleArrays (chronological order)
             period: Override default period (optional)
             timeframe: Timeframe identifier (default: '15m')
         
@@ -165,6 +167,31 @@ class ATRCalculator:
             num_candles=len(candles)
         )
     
+    def calculate_atr_series(
+        self,
+        candles: CandleInput,
+        period: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        ATR after every candle in one pass (for backtests).
+        
+        Element i equals calculate_atr(candles[:i + 1]).atr_value.
+        
+        Args:
+            candles: List of Candle entities or CandleArrays (chronological order)
+            period: Override default period (optional)
+        
+        Returns:
+            Array of ATR values, 0.0 until period + 1 candles are available
+        """
+        calc_period = period if period is not None else self.period
+        atr = np.zeros(len(candles) if candles else 0)
+        if len(atr) < calc_period + 1:
+            return atr
+        
+        atr[calc_period:] = self._wilders_smoothing_series(self._calculate_true_ranges(candles), calc_period)
+        return atr
+    
     def calculate_true_range(
         self,
         current_candle: Candle,
@@ -206,24 +233,25 @@ class ATRCalculator:
         
         return true_range
     
-    def _calculate_true_ranges(self, candles: List[Candle]) -> List[float]:
+    def _calculate_true_ranges(self, candles: CandleInput) -> List[float]:
         """
         Calculate true ranges for all candles.
         
         Args:
-            candles: List of candles
+            candles: List of candles or CandleArrays
         
         Returns:
             List of true range values
         """
-        true_ranges = []
-        
-        # Start from index 1 (need previous candle)
-        for i in range(1, len(candles)):
-            tr = self.calculate_true_range(candles[i], candles[i-1])
-            true_ranges.append(tr)
-        
-        return true_ranges
+        high = candle_column(candles, 'high')
+        low = candle_column(candles, 'low')
+        prev_close = candle_column(candles, 'close')[:-1]
+        # Same three differences and max as calculate_true_range, per column
+        return np.maximum.reduce([
+            high[1:] - low[1:],
+            np.abs(high[1:] - prev_close),
+            np.abs(low[1:] - prev_close)
+        ]).tolist()
     
     def _apply_wilders_smoothing(
         self,
@@ -249,17 +277,22 @@ class ATRCalculator:
         if len(true_ranges) < period:
             return 0.0
         
+        return self._wilders_smoothing_series(true_ranges, period)[-1]
+    
+    @staticmethod
+    def _wilders_smoothing_series(true_ranges: List[float], period: int) -> List[float]:
+        """ATR after each true range from the period-th on (len(true_ranges) >= period)."""
         # Step 1: Calculate initial ATR as simple average of first N true ranges
-        initial_atr = sum(true_ranges[:period]) / period
+        atr = sum(true_ranges[:period]) / period
+        values = [atr]
         
         # Step 2: Apply Wilder's smoothing for remaining true ranges
-        atr = initial_atr
-        
         for tr in true_ranges[period:]:
             # Wilder's smoothing: ((ATR_prev × (N-1)) + TR_current) / N
             atr = ((atr * (period - 1)) + tr) / period
+            values.append(atr)
         
-        return atr
+        return values
     
     def get_atr_multiplier_for_timeframe(self, timeframe: str) -> float:
         """
@@ -10,6 +10,7 @@ import pandas as pd
 import numpy as np
 
 from ...domain.entities.candle import Candle
+from ...domain.entities.candle_store import CandleInput, candle_column
 
 
 @dataclass
@@ -50,14 +51,14 @@ class BollingerCalculator:
     
     def calculate_bands(
         self, 
-        candles: List[Candle],
+        candles: CandleInput,
         current_price: Optional[float] = None
     ) -> Optional[BollingerResult]:
         """
         Calculate Bollinger Bands for given candles.
         
         Args:
-            candles: List of Candle objects (chronological order)
+            candles: List of Candle objects or CandleArrays (chronological order)
             current_price: Current price for %B calculation (defaults to last close)
             
         Returns:
@@ -67,7 +68,7 @@ class BollingerCalculator:
             return None
         
         # Extract close prices
-        closes = [c.close for c in candles]
+        closes = candle_column(candles, 'close')
         
         # Use pandas for rolling calculations
         series = pd.Series(closes)
@@ -91,7 +92,7 @@ class BollingerCalculator:
         bandwidth = (upper_band - lower_band) / middle_band if middle_band != 0 else 0
         
         # Calculate %B (where price is within bands)
-        price = current_price if current_price is not None else candles[-1].close
+        price = current_price if current_price is not None else float(closes[-1])
         
         if upper_band != lower_band:
             percent_b = (price - lower_band) / (upper_band - lower_band)
@@ -178,13 +179,13 @@ class BollingerCalculator:
     
     def calculate_bands_series(
         self, 
-        candles: List[Candle]
+        candles: CandleInput
     ) -> Optional['BollingerSeriesResult']:
         """
         Calculate Bollinger Bands for all candles (returns arrays).
         
         Args:
-            candles: List of Candle objects (chronological order)
+            candles: List of Candle objects or CandleArrays (chronological order)
             
         Returns:
             BollingerSeriesResult with arrays for each band, or None if insufficient data
@@ -193,7 +194,7 @@ class BollingerCalculator:
             return None
         
         # Extract close prices
-        closes = [c.close for c in candles]
+        closes = candle_column(candles, 'close')
         
         # Use pandas for rolling calculations
         series = pd.Series(closes)
@@ -5,75 +5,111 @@ Detects Fair Value Gaps (Imbalance) in price action.
 SOTA Implementation: Identifying gaps between wicks of non-adjacent candles.
 """
 
+from collections import deque
 from typing import List
 from ...domain.entities.candle import Candle
 from ...domain.interfaces.i_fvg_detector import IFVGDetector, FVG
+from ...domain.services.series_cache import CandleSeriesCache
+from ...domain.services.zone_registry import ZoneRegistry
 
-class FVGDetector(IFVGDetector):
-    def detect(self, candles: List[Candle], lookback: int = 100) -> List[FVG]:
-        if len(candles) < 3:
-            return []
-            
-        fvgs = []
-        # Iterate through candles (starting from index 1 to len-2)
-        start_index = max(1, len(candles) - lookback)
-        
-        for i in range(start_index, len(candles) - 1):
-            prev_candle = candles[i-1] # i-1
-            # curr_candle = candles[i] # i (The expansion candle)
-            next_candle = candles[i+1] # i+1
-            
+
+class FVGTracker:
+    """
+    Open Fair Value Gaps of one series (symbol/timeframe), kept as candles close.
+
+    Each closed candle first retires the gaps it fills (ZoneRegistry: only
+    gaps within its range are touched), then opens the gap between itself
+    and the candle two bars back. Gaps are keyed by the absolute position
+    of their middle (expansion) candle.
+
+    Usage:
+        tracker = FVGTracker()
+        tracker.on_candle_closed(candle)
+        tracker.registry.active  # position -> FVG, oldest first
+    """
+
+    def __init__(self, max_age: int = 5000):
+        self.registry = ZoneRegistry()
+        self.max_age = max_age
+        self.start = 0  # oldest position still tracked
+        self.end = 0    # position of the next candle
+        self._previous = deque(maxlen=2)
+
+    def on_candle_closed(self, candle: Candle) -> None:
+        for fvg in self.registry.mitigate(candle.high, candle.low):
+            fvg.mitigated = True
+
+        if len(self._previous) == 2:
+            prev_candle, curr_candle = self._previous
             # 1. Bullish FVG Detection (Gap Up)
             # Condition: Low of (i+1) > High of (i-1)
-            if next_candle.low > prev_candle.high:
-                gap_size = next_candle.low - prev_candle.high
-                # Optional: Filter tiny gaps
-                if gap_size > 0:
-                    fvg = FVG(
-                        top=next_candle.low,
-                        bottom=prev_candle.high,
-                        midpoint=(next_candle.low + prev_candle.high) / 2,
-                        fvg_type='BULLISH',
-                        creation_time=candles[i].timestamp,
-                        mitigated=False
-                    )
-                    # Check mitigation in future candles
-                    if self._is_mitigated(fvg, candles[i+2:]):
-                        fvg.mitigated = True
-                    
-                    if not fvg.mitigated:
-                        fvgs.append(fvg)
-            
+            if candle.low > prev_candle.high:
+                fvg = FVG(
+                    top=candle.low,
+                    bottom=prev_candle.high,
+                    midpoint=(candle.low + prev_candle.high) / 2,
+                    fvg_type='BULLISH',
+                    creation_time=curr_candle.timestamp,
+                    mitigated=False
+                )
+                self.registry.add(self.end - 1, fvg, bullish=True, top=fvg.top, bottom=fvg.bottom)
             # 2. Bearish FVG Detection (Gap Down)
             # Condition: High of (i+1) < Low of (i-1)
-            elif next_candle.high < prev_candle.low:
-                gap_size = prev_candle.low - next_candle.high
-                if gap_size > 0:
-                    fvg = FVG(
-                        top=prev_candle.low,
-                        bottom=next_candle.high,
-                        midpoint=(prev_candle.low + next_candle.high) / 2,
-                        fvg_type='BEARISH',
-                        creation_time=candles[i].timestamp,
-                        mitigated=False
-                    )
-                    if self._is_mitigated(fvg, candles[i+2:]):
-                        fvg.mitigated = True
-                        
-                    if not fvg.mitigated:
-                        fvgs.append(fvg)
-                        
-        return fvgs
-
-    def _is_mitigated(self, fvg: FVG, future_candles: List[Candle]) -> bool:
-        """Check if price has returned to fill the gap."""
-        for c in future_candles:
-            if fvg.fvg_type == 'BULLISH':
-                # Price drops into gap
-                if c.low <= fvg.top:
-                    return True
-            else:
-                # Price rises into gap
-                if c.high >= fvg.bottom:
-                    return True
-        return False
+            elif candle.high < prev_candle.low:
+                fvg = FVG(
+                    top=prev_candle.low,
+                    bottom=candle.high,
+                    midpoint=(prev_candle.low + candle.high) / 2,
+                    fvg_type='BEARISH',
+                    creation_time=curr_candle.timestamp,
+                    mitigated=False
+                )
+                self.registry.add(self.end - 1, fvg, bullish=False, top=fvg.top, bottom=fvg.bottom)
+
+        self._previous.append(candle)
+        self.end += 1
+        if self.end - self.start > 2 * self.max_age:
+            self._prune(self.end - self.max_age)
+
+    def gaps(self, since: int = 0) -> List[FVG]:
+        """Unmitigated gaps whose middle candle is at position >= since, oldest first."""
+        result = []
+        for position in reversed(self.registry.active):
+            if position < since:
+                break
+            result.append(self.registry.active[position])
+        result.reverse()
+        return result
+
+    def _prune(self, cutoff: int) -> None:
+        """Stop tracking gaps created before `cutoff`."""
+        for position in list(self.registry.active):
+            if position >= cutoff:
+                break
+            self.registry.remove(position)
+        self.start = cutoff
+
+
+class FVGDetector(IFVGDetector):
+    """
+    Fair Value Gaps of a candle list.
+
+    Keeps one FVGTracker per series, so each call only feeds the candles
+    that closed since the previous call and reads the open gaps. Returned
+    gaps are the tracker's objects; mitigated is set on them once filled.
+    """
+
+    def __init__(self):
+        self._trackers: CandleSeriesCache[FVGTracker] = CandleSeriesCache(
+            FVGTracker, FVGTracker.on_candle_closed
+        )
+
+    def detect(self, candles: List[Candle], lookback: int = 100) -> List[FVG]:
+        if len(candles) < 3:
+            return []
+
+        with self._trackers.lock:
+            tracker, first = self._trackers.sync(candles, len(candles))
+            tracker.max_age = max(tracker.max_age, len(candles))
+            # Middle candles from max(1, len - lookback) to len - 2
+            return tracker.gaps(first + max(1, len(candles) - lookback))
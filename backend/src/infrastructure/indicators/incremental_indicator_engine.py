@@ -0,0 +1,757 @@
+"""
+Incremental Indicator Engine - Infrastructure Layer
+
+Streaming versions of the indicators used by SignalGenerator (VWAP, Bollinger,
+StochRSI, ATR) plus ADX, EMA and RSI. Every update is O(1) per candle.
+
+The rolling kernels below replicate pandas' rolling mean/var arithmetic
+(Kahan-compensated running sums, Welford variance) step for step, so the
+streaming results are bit-identical to the pandas-based batch calculators
+for the same candle sequence.
+
+A stream keeps the state of every candle it was fed, while RealtimeService
+keeps only the last CandleStore.maxlen candles for the batch path. Once the
+store starts evicting, the two see different sequences: EMA, Wilder
+RSI/ATR/ADX state carries older history (its weight decays geometrically,
+so values agree to ~1e-12 relative), rolling sums drift by a few ulps and
+num_candles counts the whole stream. Results are then close, not identical.
+"""
+
+import math
+from collections import deque
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ...domain.entities.candle import Candle
+from ...domain.services.anchored_vwap import ANCHOR_DAY, Anchor, AnchoredVWAP
+from ...domain.interfaces.i_incremental_indicator_engine import (
+    IIncrementalIndicatorEngine,
+    IndicatorSnapshot,
+)
+from .adx_calculator import ADXResult
+from .atr_calculator import ATRResult
+from .bollinger_calculator import BollingerResult
+from .stoch_rsi_calculator import StochRSIResult, StochRSIZone
+from .vwap_calculator import VWAPResult
+
+
+# pandas 3 replaced the "consecutive same value" shortcut in rolling var with
+# a numerical-stability recompute; mirror whichever version is installed.
+_PANDAS_LEGACY_ROLLING_VAR = int(pd.__version__.split('.')[0]) < 3
+_INV_COND_TOL = float(np.finfo(np.float64).eps) * 1e3
+
+_NAN = float('nan')
+
+
+def _is_negative(value: float) -> bool:
+    """signbit() semantics: -0.0 counts as negative."""
+    return math.copysign(1.0, value) < 0
+
+
+def _ieee_div(a: float, b: float) -> float:
+    """Division with NumPy semantics (x/0 -> ±inf, 0/0 -> nan)."""
+    if b == 0:
+        if a != a or a == 0:
+            return _NAN
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+    return a / b
+
+
+class RollingMean:
+    """Fixed-window mean, matching ``Series.rolling(window).mean()``."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values: deque = deque()
+        self._count = 0
+        self._nobs = 0
+        self._sum = 0.0
+        self._neg_ct = 0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+        self._same = 0
+        self._prev = _NAN
+
+    def _add(self, value: float) -> None:
+        if value != value:
+            return
+        self._nobs += 1
+        y = value - self._comp_add
+        t = self._sum + y
+        self._comp_add = t - self._sum - y
+        self._sum = t
+        if _is_negative(value):
+            self._neg_ct += 1
+        if value == self._prev:
+            self._same += 1
+        else:
+            self._same = 1
+        self._prev = value
+
+    def _remove(self, value: float) -> None:
+        if value != value:
+            return
+        self._nobs -= 1
+        y = -value - self._comp_remove
+        t = self._sum + y
+        self._comp_remove = t - self._sum - y
+        self._sum = t
+        if _is_negative(value):
+            self._neg_ct -= 1
+
+    def update(self, value: float) -> float:
+        """Push a value and return the mean of the current window (NaN if not full)."""
+        if self._count == 0 or self.window <= 1:
+            self._values.clear()
+            self._nobs = self._neg_ct = self._same = 0
+            self._sum = self._comp_add = self._comp_remove = 0.0
+            self._prev = value
+        elif len(self._values) == self.window:
+            self._remove(self._values.popleft())
+
+        self._values.append(value)
+        self._add(value)
+        self._count += 1
+
+        if self._nobs >= self.window and self._nobs > 0:
+            result = self._sum / self._nobs
+            if self._same >= self._nobs:
+                result = self._prev
+            elif self._neg_ct == 0 and result < 0:
+                result = 0.0
+            elif self._neg_ct == self._nobs and result > 0:
+                result = 0.0
+            return result
+        return _NAN
+
+
+class RollingVariance:
+    """Fixed-window sample variance, matching ``Series.rolling(window).var()``."""
+
+    def __init__(self, window: int, ddof: int = 1):
+        self.window = window
+        self.ddof = ddof
+        self._values: deque = deque()
+        self._count = 0
+        self._unstable = False
+        self._same = 0
+        self._prev = _NAN
+        self._reset()
+
+    def _reset(self) -> None:
+        self._nobs = 0.0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+
+    def _add(self, value: float) -> None:
+        if value != value:
+            return
+        prev_m2 = self._ssqdm
+        self._nobs += 1
+        if value == self._prev:
+            self._same += 1
+        else:
+            self._same = 1
+        self._prev = value
+
+        prev_mean = self._mean - self._comp_add
+        y = value - self._comp_add
+        t = y - self._mean
+        self._comp_add = t + self._mean - y
+        if self._nobs:
+            self._mean = self._mean + t / self._nobs
+        else:
+            self._mean = 0.0
+        self._ssqdm = self._ssqdm + (value - prev_mean) * (value - self._mean)
+        if prev_m2 * _INV_COND_TOL > self._ssqdm:
+            self._unstable = True
+
+    def _remove(self, value: float) -> None:
+        if value != value:
+            return
+        prev_m2 = self._ssqdm
+        self._nobs -= 1
+        if self._nobs:
+            prev_mean = self._mean - self._comp_remove
+            y = value - self._comp_remove
+            t = y - self._mean
+            self._comp_remove = t + self._mean - y
+            self._mean = self._mean - t / self._nobs
+            self._ssqdm = self._ssqdm - (value - prev_mean) * (value - self._mean)
+            if prev_m2 * _INV_COND_TOL > self._ssqdm:
+                self._unstable = True
+        else:
+            self._mean = 0.0
+            self._ssqdm = 0.0
+            self._unstable = False
+
+    def update(self, value: float) -> float:
+        """Push a value and return the variance of the current window (NaN if not full)."""
+        first = self._count == 0 or self.window <= 1
+        if first:
+            self._values.clear()
+            self._same = 0
+            self._prev = value
+            self._reset()
+        elif len(self._values) == self.window:
+            self._remove(self._values.popleft())
+
+        self._values.append(value)
+        self._add(value)
+        self._count += 1
+
+        if not _PANDAS_LEGACY_ROLLING_VAR and self._unstable:
+            self._reset()
+            for v in self._values:
+                self._add(v)
+            self._unstable = False
+
+        min_periods = max(self.window, 1)
+        if self._nobs >= min_periods and self._nobs > self.ddof:
+            if _PANDAS_LEGACY_ROLLING_VAR and (self._nobs == 1 or self._same >= self._nobs):
+                return 0.0
+            return self._ssqdm / (self._nobs - self.ddof)
+        return _NAN
+
+    def std(self, value: float) -> float:
+        """Push a value and return the standard deviation of the current window."""
+        var = self.update(value)
+        if var != var:
+            return var
+        return math.sqrt(var) if var >= 0 else 0.0
+
+
+class RollingExtremes:
+    """Fixed-window min/max with NaN propagation (``rolling(window).min()/.max()``)."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values: deque = deque(maxlen=window)
+        self._nan_count = 0
+
+    def update(self, value: float) -> Tuple[float, float]:
+        if len(self._values) == self.window and self._values[0] != self._values[0]:
+            self._nan_count -= 1
+        self._values.append(value)
+        if value != value:
+            self._nan_count += 1
+        if len(self._values) < self.window or self._nan_count:
+            return _NAN, _NAN
+        return min(self._values), max(self._values)
+
+
+class StreamingEMA:
+    """EMA seeded with the SMA of the first ``period`` values (TA-Lib convention)."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self._k = 2.0 / (period + 1)
+        self._seed: list = []
+        self.value: Optional[float] = None
+
+    def update(self, value: float) -> Optional[float]:
+        if self.value is None:
+            self._seed.append(value)
+            if len(self._seed) == self.period:
+                total = 0.0
+                for v in self._seed:
+                    total += v
+                self.value = total / self.period
+                self._seed = []
+        else:
+            self.value = ((value - self.value) * self._k) + self.value
+        return self.value
+
+
+class StreamingWilderRSI:
+    """RSI with Wilder smoothing (TA-Lib convention)."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self._prev_close: Optional[float] = None
+        self._diffs = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self.value: Optional[float] = None
+
+    def update(self, close: float) -> Optional[float]:
+        if self._prev_close is None:
+            self._prev_close = close
+            return None
+        diff = close - self._prev_close
+        self._prev_close = close
+        self._diffs += 1
+        period = self.period
+
+        if self._diffs <= period:
+            if diff < 0:
+                self._avg_loss -= diff
+            else:
+                self._avg_gain += diff
+            if self._diffs < period:
+                return None
+            self._avg_gain /= period
+            self._avg_loss /= period
+        else:
+            self._avg_loss *= (period - 1)
+            self._avg_gain *= (period - 1)
+            if diff < 0:
+                self._avg_loss -= diff
+            else:
+                self._avg_gain += diff
+            self._avg_loss /= period
+            self._avg_gain /= period
+
+        total = self._avg_gain + self._avg_loss
+        self.value = 100.0 * (self._avg_gain / total) if not (-1e-8 < total < 1e-8) else 0.0
+        return self.value
+
+
+class StreamingStochRSI:
+    """Streaming counterpart of StochRSICalculator.calculate_stoch_rsi."""
+
+    def __init__(self, k_period: int = 3, d_period: int = 3, rsi_period: int = 14, stoch_period: int = 14):
+        self.min_required = rsi_period + stoch_period + k_period + d_period
+        self._gain = RollingMean(rsi_period)
+        self._loss = RollingMean(rsi_period)
+        self._extremes = RollingExtremes(stoch_period)
+        self._k = RollingMean(k_period)
+        self._d = RollingMean(d_period)
+        self._prev_close: Optional[float] = None
+        self._prev_k = _NAN
+        self._prev_d = _NAN
+        self._count = 0
+
+    def update(self, close: float) -> Optional[StochRSIResult]:
+        delta = _NAN if self._prev_close is None else close - self._prev_close
+        self._prev_close = close
+        self._count += 1
+
+        gain = delta if delta > 0 else 0.0
+        loss = -(delta if delta < 0 else 0.0)
+        avg_gain = self._gain.update(gain)
+        avg_loss = self._loss.update(loss)
+        rsi = 100 - (100 / (1 + _ieee_div(avg_gain, avg_loss)))
+
+        rsi_min, rsi_max = self._extremes.update(rsi)
+        denominator = rsi_max - rsi_min
+        if denominator != denominator or denominator == 0:
+            stoch = 50.0
+        else:
+            stoch = (rsi - rsi_min) / denominator * 100
+            if stoch != stoch:
+                stoch = 50.0
+
+        k_current = self._k.update(stoch)
+        d_current = self._d.update(k_current)
+        k_previous, d_previous = self._prev_k, self._prev_d
+        self._prev_k, self._prev_d = k_current, d_current
+
+        if self._count < self.min_required or k_current != k_current or d_current != d_current:
+            return None
+
+        if k_current < 20:
+            zone = StochRSIZone.OVERSOLD
+        elif k_current > 80:
+            zone = StochRSIZone.OVERBOUGHT
+        else:
+            zone = StochRSIZone.NEUTRAL
+
+        return StochRSIResult(
+            k_value=float(k_current),
+            d_value=float(d_current),
+            rsi_value=float(rsi),
+            zone=zone,
+            is_oversold=k_current < 20,
+            is_overbought=k_current > 80,
+            k_cross_up=(k_previous <= d_previous) and (k_current > d_current),
+            k_cross_down=(k_previous >= d_previous) and (k_current < d_current)
+        )
+
+
+class StreamingBollinger:
+    """Streaming counterpart of BollingerCalculator.calculate_bands."""
+
+    def __init__(self, period: int = 20, std_multiplier: float = 2.0):
+        self.period = period
+        self.std_multiplier = std_multiplier
+        self._mean = RollingMean(period)
+        self._var = RollingVariance(period)
+        self._count = 0
+
+    def update(self, close: float) -> Optional[BollingerResult]:
+        middle_band = self._mean.update(close)
+        std = self._var.std(close)
+        self._count += 1
+        if self._count < self.period:
+            return None
+
+        upper_band = middle_band + (std * self.std_multiplier)
+        lower_band = middle_band - (std * self.std_multiplier)
+        bandwidth = (upper_band - lower_band) / middle_band if middle_band != 0 else 0
+
+        if upper_band != lower_band:
+            percent_b = (close - lower_band) / (upper_band - lower_band)
+        else:
+            percent_b = 0.5
+
+        return BollingerResult(
+            upper_band=upper_band,
+            middle_band=middle_band,
+            lower_band=lower_band,
+            bandwidth=bandwidth,
+            percent_b=percent_b
+        )
+
+
+class StreamingATR:
+    """Streaming counterpart of ATRCalculator.calculate_atr (Wilder smoothing)."""
+
+    def __init__(self, period: int = 14, timeframe: str = '15m'):
+        self.period = period
+        self.timeframe = timeframe
+        self._prev_close: Optional[float] = None
+        self._seed: list = []
+        self._atr: Optional[float] = None
+        self._count = 0
+
+    def update(self, candle: Candle) -> ATRResult:
+        self._count += 1
+        if self._prev_close is not None:
+            tr = max(
+                candle.high - candle.low,
+                abs(candle.high - self._prev_close),
+                abs(candle.low - self._prev_close)
+            )
+            if self._atr is None:
+                self._seed.append(tr)
+                if len(self._seed) == self.period:
+                    self._atr = sum(self._seed) / self.period
+                    self._seed = []
+            else:
+                self._atr = ((self._atr * (self.period - 1)) + tr) / self.period
+        self._prev_close = candle.close
+
+        return ATRResult(
+            atr_value=self._atr if self._atr is not None else 0.0,
+            period=self.period,
+            timeframe=self.timeframe,
+            num_candles=self._count
+        )
+
+
+class StreamingADX:
+    """
+    Streaming counterpart of ADXCalculator.calculate_adx.
+
+    Keeps the whole-series Wilder state of +DM/-DM/TR (for +DI/-DI), the
+    last `period` DM/TR values (for each window's DX) and the Wilder state
+    of the DX series, so each candle costs O(period) float additions
+    instead of a pass over the history. Sums use the same order as the
+    batch calculator, so results are bit-identical.
+    """
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._prev_high: Optional[float] = None
+        self._prev_low: Optional[float] = None
+        self._prev_close: Optional[float] = None
+        self._count = 0
+        # Whole-series Wilder smoothing of +DM, -DM, TR
+        self._seed: list = []
+        self._smoothed: Optional[Tuple[float, float, float]] = None
+        # Last `period` +DM, -DM, TR values
+        self._plus_window = deque(maxlen=period)
+        self._minus_window = deque(maxlen=period)
+        self._tr_window = deque(maxlen=period)
+        self._movements = 0
+        # DX series: mean of the first `period` values, then Wilder
+        self._dx_seed: list = []
+        self._adx: Optional[float] = None
+
+    def update(self, candle: Candle) -> ADXResult:
+        self._count += 1
+        if self._prev_close is not None:
+            self._add_movement(candle)
+        self._prev_high = candle.high
+        self._prev_low = candle.low
+        self._prev_close = candle.close
+
+        period = self.period
+        if self._count < period * 2:
+            return ADXResult(adx_value=0.0, plus_di=0.0, minus_di=0.0, period=period, num_candles=self._count)
+
+        smoothed_pdm, smoothed_mdm, smoothed_tr = self._smoothed
+        if smoothed_tr == 0:
+            plus_di = 0.0
+            minus_di = 0.0
+        else:
+            plus_di = (smoothed_pdm / smoothed_tr) * 100
+            minus_di = (smoothed_mdm / smoothed_tr) * 100
+
+        if self._count >= period * 3:
+            if self._adx is not None:
+                adx_value = self._adx
+            elif self._dx_seed:
+                adx_value = sum(self._dx_seed) / len(self._dx_seed)
+            else:
+                adx_value = 0.0
+        else:
+            di_sum = plus_di + minus_di
+            adx_value = 0.0 if di_sum == 0 else (abs(plus_di - minus_di) / di_sum) * 100
+
+        return ADXResult(
+            adx_value=adx_value,
+            plus_di=plus_di,
+            minus_di=minus_di,
+            period=period,
+            num_candles=self._count
+        )
+
+    def _add_movement(self, candle: Candle) -> None:
+        period = self.period
+        up_move = candle.high - self._prev_high
+        down_move = self._prev_low - candle.low
+        plus_dm = 0.0
+        minus_dm = 0.0
+        if up_move > down_move and up_move > 0:
+            plus_dm = up_move
+        elif down_move > up_move and down_move > 0:
+            minus_dm = down_move
+        tr = max(
+            candle.high - candle.low,
+            abs(candle.high - self._prev_close),
+            abs(candle.low - self._prev_close)
+        )
+
+        if self._smoothed is None:
+            self._seed.append((plus_dm, minus_dm, tr))
+            if len(self._seed) == period:
+                self._smoothed = tuple(sum(column) / period for column in zip(*self._seed))
+                self._seed = []
+        else:
+            pdm, mdm, tr_sum = self._smoothed
+            self._smoothed = (
+                ((pdm * (period - 1)) + plus_dm) / period,
+                ((mdm * (period - 1)) + minus_dm) / period,
+                ((tr_sum * (period - 1)) + tr) / period
+            )
+
+        self._plus_window.append(plus_dm)
+        self._minus_window.append(minus_dm)
+        self._tr_window.append(tr)
+        self._movements += 1
+        # DX windows end at movement index `period` onwards
+        if self._movements > period:
+            self._add_dx()
+
+    def _add_dx(self) -> None:
+        period = self.period
+        smoothed_tr = sum(self._tr_window) / period
+        if smoothed_tr == 0:
+            return
+        plus_di = ((sum(self._plus_window) / period) / smoothed_tr) * 100
+        minus_di = ((sum(self._minus_window) / period) / smoothed_tr) * 100
+        di_sum = plus_di + minus_di
+        if di_sum == 0:
+            return
+        dx = (abs(plus_di - minus_di) / di_sum) * 100
+
+        if self._adx is None:
+            self._dx_seed.append(dx)
+            if len(self._dx_seed) == period:
+                self._adx = sum(self._dx_seed) / period
+                self._dx_seed = []
+        else:
+            self._adx = ((self._adx * (period - 1)) + dx) / period
+
+
+class StreamingVWAP:
+    """Streaming counterpart of VWAPCalculator.calculate_vwap (AnchoredVWAP, UTC day by default)."""
+
+    def __init__(self, anchor: Anchor = ANCHOR_DAY):
+        self._anchored = AnchoredVWAP(anchor)
+
+    def update(self, candle: Candle) -> Optional[VWAPResult]:
+        vwap = self._anchored.update(candle)
+        if vwap is None:
+            return None
+
+        return VWAPResult(
+            vwap=vwap,
+            period_volume=self._anchored.volume,
+            typical_price_volume=self._anchored.tpv
+        )
+
+
+class IndicatorStream:
+    """All streaming indicators for one (symbol, timeframe) pair."""
+
+    def __init__(
+        self,
+        symbol: str,
+        timeframe: str,
+        bb_period: int,
+        bb_std_multiplier: float,
+        stoch_params: Tuple[int, int, int, int],
+        atr_period: int,
+        ema_periods: Iterable[int],
+        rsi_periods: Iterable[int],
+        adx_period: int = 14,
+        vwap_anchor: Anchor = ANCHOR_DAY
+    ):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.last_timestamp = None
+        self.snapshot: Optional[IndicatorSnapshot] = None
+        self._count = 0
+
+        k_period, d_period, rsi_period, stoch_period = stoch_params
+        self._vwap = StreamingVWAP(vwap_anchor)
+        self._bollinger = StreamingBollinger(bb_period, bb_std_multiplier)
+        self._stoch_rsi = StreamingStochRSI(k_period, d_period, rsi_period, stoch_period)
+        # ATRCalculator defaults to '15m' when SignalGenerator calls it
+        self._atr = StreamingATR(atr_period)
+        self._adx = StreamingADX(adx_period)
+        self._emas = {p: StreamingEMA(p) for p in ema_periods}
+        self._rsis = {p: StreamingWilderRSI(p) for p in rsi_periods}
+
+    def update(self, candle: Candle) -> IndicatorSnapshot:
+        self._count += 1
+        self.last_timestamp = candle.timestamp
+        close = candle.close
+
+        ema = {}
+        for period, stream in self._emas.items():
+            value = stream.update(close)
+            if value is not None:
+                ema[period] = value
+        rsi = {}
+        for period, stream in self._rsis.items():
+            value = stream.update(close)
+            if value is not None:
+                rsi[period] = value
+
+        self.snapshot = IndicatorSnapshot(
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            timestamp=candle.timestamp,
+            candle_count=self._count,
+            vwap=self._vwap.update(candle),
+            bollinger=self._bollinger.update(close),
+            stoch_rsi=self._stoch_rsi.update(close),
+            atr=self._atr.update(candle),
+            adx=self._adx.update(candle),
+            ema=ema,
+            rsi=rsi
+        )
+        return self.snapshot
+
+    def peek(self, candle: Candle) -> IndicatorSnapshot:
+        """Snapshot `candle` would produce, computed on a copy (this stream is unchanged)."""
+        return _clone_state(self).update(candle)
+
+
+_STATEFUL_TYPES = (
+    RollingMean, RollingVariance, RollingExtremes, StreamingEMA, StreamingWilderRSI,
+    StreamingStochRSI, StreamingBollinger, StreamingATR, StreamingADX, StreamingVWAP, AnchoredVWAP,
+    IndicatorStream,
+)
+
+
+def _clone_state(value):
+    """
+    Copy of a stream's mutable state (containers and nested kernels).
+
+    Much cheaper than copy.deepcopy: numbers, timestamps and result
+    objects are immutable here and shared with the original.
+    """
+    if isinstance(value, _STATEFUL_TYPES):
+        clone = object.__new__(type(value))
+        clone.__dict__ = {name: _clone_state(item) for name, item in value.__dict__.items()}
+        return clone
+    if isinstance(value, (deque, list)):
+        return value.copy()
+    if isinstance(value, dict):
+        return {key: _clone_state(item) for key, item in value.items()}
+    return value
+
+
+class IncrementalIndicatorEngine(IIncrementalIndicatorEngine):
+    """
+    Keeps one IndicatorStream per (symbol, timeframe).
+
+    Usage:
+        engine = IncrementalIndicatorEngine()
+        for candle in candles:
+            snapshot = engine.update('btcusdt', '15m', candle)
+        signal = generator.generate_signal(candles, 'btcusdt', indicator_snapshot=snapshot)
+    """
+
+    def __init__(
+        self,
+        bb_period: int = 20,
+        bb_std_multiplier: float = 2.0,
+        stoch_k_period: int = 3,
+        stoch_d_period: int = 3,
+        stoch_rsi_period: int = 14,
+        stoch_period: int = 14,
+        atr_period: int = 14,
+        ema_periods: Iterable[int] = (7, 25),
+        rsi_periods: Iterable[int] = (6,),
+        adx_period: int = 14,
+        vwap_anchor: Anchor = ANCHOR_DAY
+    ):
+        """
+        Initialize engine. Parameters must match the batch calculators the
+        snapshots stand in for (see DIContainer.get_incremental_indicator_engine).
+        """
+        self.bb_period = bb_period
+        self.bb_std_multiplier = bb_std_multiplier
+        self.stoch_params = (stoch_k_period, stoch_d_period, stoch_rsi_period, stoch_period)
+        self.atr_period = atr_period
+        self.ema_periods = tuple(ema_periods)
+        self.rsi_periods = tuple(rsi_periods)
+        self.adx_period = adx_period
+        self.vwap_anchor = vwap_anchor
+        self._streams: Dict[Tuple[str, str], IndicatorStream] = {}
+
+    def update(self, symbol: str, timeframe: str, candle: Candle) -> IndicatorSnapshot:
+        key = (symbol.lower(), timeframe)
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = IndicatorStream(
+                key[0], timeframe,
+                self.bb_period, self.bb_std_multiplier,
+                self.stoch_params, self.atr_period,
+                self.ema_periods, self.rsi_periods, self.adx_period, self.vwap_anchor
+            )
+            self._streams[key] = stream
+        elif candle.timestamp <= stream.last_timestamp:
+            return stream.snapshot
+        return stream.update(candle)
+
+    def get_snapshot(self, symbol: str, timeframe: str) -> Optional[IndicatorSnapshot]:
+        stream = self._streams.get((symbol.lower(), timeframe))
+        return stream.snapshot if stream else None
+
+    def peek(self, symbol: str, timeframe: str, candle: Candle) -> Optional[IndicatorSnapshot]:
+        stream = self._streams.get((symbol.lower(), timeframe))
+        if stream is None:
+            return None
+        if candle.timestamp <= stream.last_timestamp:
+            return stream.snapshot
+        return stream.peek(candle)
+
+    def reset(self, symbol: Optional[str] = None, timeframe: Optional[str] = None) -> None:
+        if symbol is None and timeframe is None:
+            self._streams.clear()
+            return
+        sym = symbol.lower() if symbol else None
+        for key in list(self._streams):
+            if (sym is None or key[0] == sym) and (timeframe is None or key[1] == timeframe):
+                del self._streams[key]
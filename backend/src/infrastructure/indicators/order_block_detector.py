@@ -5,108 +5,165 @@ Detects Order Blocks based on Market Structure Break (MSB).
 SOTA Implementation: Identifies the last opposing candle before a significant move.
 """
 
-from typing import List, Optional
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from typing import Dict, List, Optional, Tuple
 from ...domain.entities.candle import Candle
 from ...domain.interfaces.i_order_block_detector import IOrderBlockDetector, OrderBlock
+from ...domain.services.series_cache import CandleSeriesCache
+from ...domain.services.swing_index import SwingIndex
+from ...domain.services.zone_registry import ZoneRegistry
+
+
+class OrderBlockTracker:
+    """
+    Open Order Blocks of one series (symbol/timeframe), kept as candles close.
+
+    For each closed candle:
+    1. Active OBs the candle trades into are retired (ZoneRegistry)
+    2. Unbroken swings the close breaks (sorted by level, bisected) become
+       OBs - the last opposing candle before the swing
+    3. A newly confirmed 5-candle fractal swing (SwingIndex, lookback 2)
+       waits for its break
+
+    OBs are keyed by (ob_type, swing position, OB candle position), so a
+    caller reading a sliding window can skip OBs whose candle lies before it.
+
+    Usage:
+        tracker = OrderBlockTracker()
+        tracker.on_candle_closed(candle)
+        tracker.registry.active  # (ob_type, swing, OB candle position) -> OrderBlock
+    """
+
+    FRACTAL = 2  # candles on each side of a swing
+    OB_SEARCH = 20  # candles searched back from the swing for the OB candle
+
+    def __init__(self, max_age: int = 5000):
+        self.registry = ZoneRegistry()
+        self.max_age = max_age
+        self.start = 0  # oldest position still tracked
+        self.end = 0    # position of the next candle
+        self._swings = SwingIndex(self.FRACTAL)
+        self._recent = deque(maxlen=self.OB_SEARCH + self.FRACTAL + 1)
+        # Unbroken swings with an OB candle, ascending (level, position)
+        self._pending_highs: List[Tuple[float, int]] = []
+        self._pending_lows: List[Tuple[float, int]] = []
+        self._ob_candles: Dict[Tuple[str, int], Tuple[int, Candle]] = {}
+
+    def on_candle_closed(self, candle: Candle) -> None:
+        position = self.end
+
+        # Check mitigation
+        for ob in self.registry.mitigate(candle.high, candle.low):
+            ob.mitigated = True
+
+        # Bullish MSB (close above a swing high) / Bearish MSB (close below a swing low)
+        broken = bisect_left(self._pending_highs, (candle.close, -1))
+        for _, swing in self._pending_highs[:broken]:
+            self._open('BULLISH', swing)
+        del self._pending_highs[:broken]
+        broken = bisect_right(self._pending_lows, (candle.close, position))
+        for _, swing in self._pending_lows[broken:]:
+            self._open('BEARISH', swing)
+        del self._pending_lows[broken:]
+
+        self._swings.append(candle.high, candle.low)
+        self._recent.append((position, candle))
+        swing = position - self.FRACTAL
+        # Swings need 4 earlier candles (fractal plus the detector's margin)
+        if swing >= 4:
+            if self._swings.swing_highs and self._swings.swing_highs[-1] == swing:
+                # Look for the OB (last red candle) before the move started
+                found = self._find_last_candle(swing, red=True)
+                if found:
+                    self._ob_candles[('BULLISH', swing)] = found
+                    insort(self._pending_highs, (self._candle_at(swing).high, swing))
+            if self._swings.swing_lows and self._swings.swing_lows[-1] == swing:
+                # Look for OB (last green candle)
+                found = self._find_last_candle(swing, red=False)
+                if found:
+                    self._ob_candles[('BEARISH', swing)] = found
+                    insort(self._pending_lows, (self._candle_at(swing).low, swing))
+
+        self.end += 1
+        if self.end - self.start > 2 * self.max_age:
+            self._prune(self.end - self.max_age)
+
+    def order_blocks(self, first_swing: int, last_swing: int, window_start: int = 0) -> List[OrderBlock]:
+        """
+        Unmitigated OBs of swings in [first_swing, last_swing], newest swing first.
+
+        The OB candle search of a window starting at `window_start` never
+        reaches that window's first candle, so OBs whose candle is at or
+        before it are skipped (a rescan of the window finds no candle for
+        those swings).
+        """
+        keys = [
+            key for key in self.registry.active
+            if first_swing <= key[1] <= last_swing and key[2] > window_start
+        ]
+        keys.sort(key=lambda key: (-key[1], key[0] != 'BULLISH'))
+        return [self.registry.active[key] for key in keys]
+
+    def _open(self, ob_type: str, swing: int) -> None:
+        position, ob_candle = self._ob_candles.pop((ob_type, swing))
+        ob = OrderBlock(
+            top=ob_candle.high,
+            bottom=ob_candle.low,
+            mitigated=False,
+            ob_type=ob_type,
+            creation_time=ob_candle.timestamp,
+            volume=ob_candle.volume
+        )
+        # Bullish OBs are mitigated when price drops into them, bearish when it rises
+        self.registry.add((ob_type, swing, position), ob, bullish=ob_type == 'BULLISH', top=ob.top, bottom=ob.bottom)
+
+    def _candle_at(self, position: int) -> Candle:
+        return self._recent[len(self._recent) - 1 - (self.end - position)][1]
+
+    def _find_last_candle(self, start_position: int, red: bool) -> Optional[Tuple[int, Candle]]:
+        # Search backwards from the swing (up to OB_SEARCH candles, never the first one)
+        lowest = max(0, start_position - self.OB_SEARCH) + 1
+        for position, candle in reversed(self._recent):
+            if position > start_position:
+                continue
+            if position < lowest:
+                break
+            if (candle.close < candle.open) if red else (candle.close > candle.open):
+                return position, candle
+        return None
+
+    def _prune(self, cutoff: int) -> None:
+        """Stop tracking swings (and their OBs) before `cutoff`."""
+        for key in [key for key in self.registry.active if key[1] < cutoff]:
+            self.registry.remove(key)
+        self._pending_highs = [entry for entry in self._pending_highs if entry[1] >= cutoff]
+        self._pending_lows = [entry for entry in self._pending_lows if entry[1] >= cutoff]
+        self._ob_candles = {key: c for key, c in self._ob_candles.items() if key[1] >= cutoff}
+        self.start = cutoff
+
 
 class OrderBlockDetector(IOrderBlockDetector):
+    """
+    Order Blocks of a candle list.
+
+    Keeps one OrderBlockTracker per series, so each call only feeds the
+    candles that closed since the previous call and reads the open OBs.
+    Returned OBs are the tracker's objects; mitigated is set on them once
+    price trades back into them.
+    """
+
+    def __init__(self):
+        self._trackers: CandleSeriesCache[OrderBlockTracker] = CandleSeriesCache(
+            OrderBlockTracker, OrderBlockTracker.on_candle_closed
+        )
+
     def detect(self, candles: List[Candle], lookback: int = 50) -> List[OrderBlock]:
         if len(candles) < lookback:
             return []
-            
-        order_blocks = []
-        
-        # Simple Pivot High/Low detection for MSB
-        # Iterate backwards to find recent OBs
-        for i in range(len(candles) - 5, 5, -1):
-            # Bullish MSB Detection (Price broke above a recent high)
-            # 1. Identify a local high at i-2
-            if self._is_swing_high(candles, i-2):
-                swing_high = candles[i-2].high
-                # 2. Check if a later candle broke this high
-                for j in range(i-1, len(candles)):
-                    if candles[j].close > swing_high:
-                        # MSB Confirmed. Look for the OB (last red candle) before the move started
-                        # Search backwards from the breakout start (approx i-2)
-                        ob_candle = self._find_last_red_candle(candles, i-2)
-                        if ob_candle:
-                            ob = OrderBlock(
-                                top=ob_candle.high,
-                                bottom=ob_candle.low,
-                                mitigated=False, # Naive check
-                                ob_type='BULLISH',
-                                creation_time=ob_candle.timestamp,
-                                volume=ob_candle.volume
-                            )
-                            # Check mitigation
-                            if self._is_mitigated(ob, candles[j+1:]):
-                                ob.mitigated = True
-                            
-                            # Only add if not mitigated (or keep track)
-                            if not ob.mitigated:
-                                order_blocks.append(ob)
-                        break
-                        
-            # Bearish MSB Detection (Price broke below a recent low)
-            if self._is_swing_low(candles, i-2):
-                swing_low = candles[i-2].low
-                for j in range(i-1, len(candles)):
-                    if candles[j].close < swing_low:
-                        # MSB Confirmed. Look for OB (last green candle)
-                        ob_candle = self._find_last_green_candle(candles, i-2)
-                        if ob_candle:
-                            ob = OrderBlock(
-                                top=ob_candle.high,
-                                bottom=ob_candle.low,
-                                mitigated=False,
-                                ob_type='BEARISH',
-                                creation_time=ob_candle.timestamp,
-                                volume=ob_candle.volume
-                            )
-                            if self._is_mitigated(ob, candles[j+1:]):
-                                ob.mitigated = True
-                            if not ob.mitigated:
-                                order_blocks.append(ob)
-                        break
-                        
-        return order_blocks
-
-    def _is_swing_high(self, candles, index):
-        # Fractal High (5 candles)
-        return (candles[index].high > candles[index-1].high and 
-                candles[index].high > candles[index-2].high and
-                candles[index].high > candles[index+1].high and
-                candles[index].high > candles[index+2].high)
-
-    def _is_swing_low(self, candles, index):
-        # Fractal Low
-        return (candles[index].low < candles[index-1].low and 
-                candles[index].low < candles[index-2].low and
-                candles[index].low < candles[index+1].low and
-                candles[index].low < candles[index+2].low)
-
-    def _find_last_red_candle(self, candles, start_index) -> Optional[Candle]:
-        # Search backwards from start_index
-        for k in range(start_index, max(0, start_index - 20), -1):
-            if candles[k].close < candles[k].open: # Red
-                return candles[k]
-        return None
-
-    def _find_last_green_candle(self, candles, start_index) -> Optional[Candle]:
-        for k in range(start_index, max(0, start_index - 20), -1):
-            if candles[k].close > candles[k].open: # Green
-                return candles[k]
-        return None
 
-    def _is_mitigated(self, ob: OrderBlock, future_candles: List[Candle]) -> bool:
-        """Check if price has returned to touch the OB."""
-        for c in future_candles:
-            if ob.ob_type == 'BULLISH':
-                # Price drops into OB zone
-                if c.low <= ob.top: 
-                    return True
-            else:
-                # Price rises into OB zone
-                if c.high >= ob.bottom:
-                    return True
-        return False
+        with self._trackers.lock:
+            tracker, first = self._trackers.sync(candles, len(candles))
+            tracker.max_age = max(tracker.max_age, len(candles))
+            # Swings at indices 4 .. len - 7 of the list
+            return tracker.order_blocks(first + 4, first + len(candles) - 7, first)
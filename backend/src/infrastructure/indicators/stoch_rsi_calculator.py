@@ -12,6 +12,7 @@ import pandas as pd
 import numpy as np
 
 from ...domain.entities.candle import Candle
+from ...domain.entities.candle_store import CandleInput, candle_column
 
 
 class StochRSIZone(Enum):
@@ -83,13 +84,13 @@ class StochRSICalculator:
     
     def calculate_stoch_rsi(
         self, 
-        candles: List[Candle]
+        candles: CandleInput
     ) -> Optional[StochRSIResult]:
         """
         Calculate Stochastic RSI for given candles.
         
         Args:
-            candles: List of Candle objects (chronological order)
+            candles: List of Candle objects or CandleArrays (chronological order)
             
         Returns:
             StochRSIResult or None if insufficient data
@@ -100,7 +101,7 @@ class StochRSICalculator:
             return None
         
         # Extract close prices and ensure numeric type
-        closes = pd.Series([c.close for c in candles])
+        closes = pd.Series(candle_column(candles, 'close'))
         
         closes = pd.to_numeric(closes, errors='coerce')
         
@@ -168,13 +169,13 @@ class StochRSICalculator:
     
     def get_series(
         self, 
-        candles: List[Candle]
+        candles: CandleInput
     ) -> Optional[Tuple[pd.Series, pd.Series]]:
         """
         Get full StochRSI series for plotting.
         
         Args:
-            candles: List of Candle objects
+            candles: List of Candle objects or CandleArrays
             
         Returns:
             Tuple of (%K series, %D series) or None
@@ -184,7 +185,7 @@ class StochRSICalculator:
         if not candles or len(candles) < min_required:
             return None
         
-        closes = pd.Series([c.close for c in candles])
+        closes = pd.Series(candle_column(candles, 'close'))
         
         # Calculate RSI
         rsi = self.calculate_rsi(closes, self.rsi_period)
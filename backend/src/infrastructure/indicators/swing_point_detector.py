@@ -9,6 +9,7 @@ from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
 from ...domain.entities.candle import Candle
+from ...domain.services.swing_index import shared_swing_index
 
 
 @dataclass
@@ -62,6 +63,9 @@ class SwingPointDetector:
         self.lookback = lookback
         self.logger = logging.getLogger(__name__)
         
+        # Pivots shared with other detectors using the same lookback
+        self._swing_index = shared_swing_index(lookback)
+        
         self.logger.info(f"SwingPointDetector initialized with lookback={lookback}")
     
     def find_recent_swing_high(
@@ -95,30 +99,28 @@ class SwingPointDetector:
             )
             return None
         
-        # Search from most recent to oldest (excluding last 'lookback' candles)
-        # We can't identify a swing until we have 'lookback' candles after it
-        search_end = len(candles) - self.lookback
+        # The index only reports swings with 'lookback' candles after them
         search_start = self.lookback
         
         # Apply max_age filter if specified
         if max_age:
             search_start = max(search_start, len(candles) - max_age)
         
-        # Search backwards for most recent swing high
-        for i in range(search_end - 1, search_start - 1, -1):
-            if self._is_swing_high(candles, i):
-                swing_point = SwingPoint(
-                    price=candles[i].high,
-                    index=i,
-                    candle=candles[i],
-                    strength=self.lookback
-                )
-                
-                self.logger.debug(
-                    f"Swing high found at index {i}: ${swing_point.price:.2f}"
-                )
-                
-                return swing_point
+        swing_highs, _ = self._swing_index.pivots(candles)
+        if swing_highs and swing_highs[-1] >= search_start:
+            i = swing_highs[-1]
+            swing_point = SwingPoint(
+                price=candles[i].high,
+                index=i,
+                candle=candles[i],
+                strength=self.lookback
+            )
+            
+            self.logger.debug(
+                f"Swing high found at index {i}: ${swing_point.price:.2f}"
+            )
+            
+            return swing_point
         
         self.logger.debug("No swing high found")
         return None
@@ -154,29 +156,27 @@ class SwingPointDetector:
             )
             return None
         
-        # Search from most recent to oldest (excluding last 'lookback' candles)
-        search_end = len(candles) - self.lookback
         search_start = self.lookback
         
         # Apply max_age filter if specified
         if max_age:
             search_start = max(search_start, len(candles) - max_age)
         
-        # Search backwards for most recent swing low
-        for i in range(search_end - 1, search_start - 1, -1):
-            if self._is_swing_low(candles, i):
-                swing_point = SwingPoint(
-                    price=candles[i].low,
-                    index=i,
-                    candle=candles[i],
-                    strength=self.lookback
-                )
-                
-                self.logger.debug(
-                    f"Swing low found at index {i}: ${swing_point.price:.2f}"
-                )
-                
-                return swing_point
+        _, swing_lows = self._swing_index.pivots(candles)
+        if swing_lows and swing_lows[-1] >= search_start:
+            i = swing_lows[-1]
+            swing_point = SwingPoint(
+                price=candles[i].low,
+                index=i,
+                candle=candles[i],
+                strength=self.lookback
+            )
+            
+            self.logger.debug(
+                f"Swing low found at index {i}: ${swing_point.price:.2f}"
+            )
+            
+            return swing_point
         
         self.logger.debug("No swing low found")
         return None
@@ -206,18 +206,9 @@ class SwingPointDetector:
             return ([], [])
         
         # Find all swing highs and lows
-        swing_highs = []
-        swing_lows = []
-        
-        search_end = len(candles) - self.lookback
-        search_start = self.lookback
-        
-        for i in range(search_start, search_end):
-            if self._is_swing_high(candles, i):
-                swing_highs.append(candles[i].high)
-            
-            if self._is_swing_low(candles, i):
-                swing_lows.append(candles[i].low)
+        high_indices, low_indices = self._swing_index.pivots(candles)
+        swing_highs = [candles[i].high for i in high_indices]
+        swing_lows = [candles[i].low for i in low_indices]
         
         # Sort and get most significant levels
         resistance_levels = sorted(swing_highs, reverse=True)[:num_levels]
@@ -230,62 +221,6 @@ class SwingPointDetector:
         
         return (support_levels, resistance_levels)
     
-    def _is_swing_high(self, candles: List[Candle], index: int) -> bool:
-        """
-        Check if candle at index is a swing high.
-        
-        Args:
-            candles: List of candles
-            index: Index to check
-        
-        Returns:
-            True if swing high, False otherwise
-        """
-        if index < self.lookback or index >= len(candles) - self.lookback:
-            return False
-        
-        current_high = candles[index].high
-        
-        # Check previous candles
-        for i in range(index - self.lookback, index):
-            if candles[i].high >= current_high:
-                return False
-        
-        # Check next candles
-        for i in range(index + 1, index + self.lookback + 1):
-            if candles[i].high >= current_high:
-                return False
-        
-        return True
-    
-    def _is_swing_low(self, candles: List[Candle], index: int) -> bool:
-        """
-        Check if candle at index is a swing low.
-        
-        Args:
-            candles: List of candles
-            index: Index to check
-        
-        Returns:
-            True if swing low, False otherwise
-        """
-        if index < self.lookback or index >= len(candles) - self.lookback:
-            return False
-        
-        current_low = candles[index].low
-        
-        # Check previous candles
-        for i in range(index - self.lookback, index):
-            if candles[i].low <= current_low:
-                return False
-        
-        # Check next candles
-        for i in range(index + 1, index + self.lookback + 1):
-            if candles[i].low <= current_low:
-                return False
-        
-        return True
-    
     def get_nearest_level(
         self,
         price: float,
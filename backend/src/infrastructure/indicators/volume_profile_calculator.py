@@ -18,11 +18,13 @@ Created: 2025-12-31
 Author: Quant Specialist AI
 """
 
-from typing import List, Dict, Optional, Tuple
+from collections import deque
+from typing import Deque, List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime
 import numpy as np
 import logging
+import math
+import time
 
 from ...domain.entities.candle import Candle
 
@@ -30,6 +32,85 @@ from ...domain.entities.candle import Candle
 logger = logging.getLogger(__name__)
 
 
+def bin_weights(levels: np.ndarray, ohlcv: np.ndarray, use_vwap: bool) -> np.ndarray:
+    """
+    Share of each candle's volume assigned to each price level.
+    
+    Weight is higher for:
+    - Prices near the close (30%, shows where price settled)
+    - Prices near VWAP (30%, institutional equilibrium); without VWAP,
+      a further 15% close-proximity weight
+    - Prices within the candle body (40%; wicks get 15%)
+    Levels outside [low, high] (or zero-range candles) get nothing.
+    
+    Args:
+        levels: Bin center prices, shape (bins,)
+        ohlcv: Candles as rows of (open, high, low, close, volume)
+        use_vwap: Use the typical price as the candle's VWAP
+        
+    Returns:
+        Weights, shape (candles, bins)
+    """
+    price = levels[np.newaxis, :]
+    open_, high, low, close = (ohlcv[:, i, np.newaxis] for i in range(4))
+    candle_range = high - low
+    safe_range = np.where(candle_range > 0, candle_range, 1.0)
+    
+    close_distance = np.abs(price - close) / safe_range
+    weight = np.maximum(0.0, 0.30 * (1.0 - close_distance))
+    if use_vwap:
+        vwap = (high + low + close) / 3
+        weight = weight + np.maximum(0.0, 0.30 * (1.0 - np.abs(price - vwap) / safe_range))
+    else:
+        weight = weight + 0.15 * (1.0 - close_distance)
+    
+    in_body = (price >= np.minimum(open_, close)) & (price <= np.maximum(open_, close))
+    weight = weight + np.where(in_body, 0.40, 0.15)
+    
+    in_range = (price >= low) & (price <= high) & (candle_range > 0)
+    return np.where(in_range, weight, 0.0)
+
+
+def value_area_indices(volumes: np.ndarray, value_area_pct: float) -> Tuple[int, int, int]:
+    """
+    POC index and the value area around it, as (poc, low, high) indices.
+    
+    Expands from the POC one bin at a time toward the side with more
+    volume until value_area_pct of the total is covered.
+    """
+    poc_idx = int(np.argmax(volumes))
+    total_volume = float(volumes.sum())
+    if total_volume == 0:
+        return poc_idx, 0, len(volumes) - 1
+    
+    target_volume = total_volume * value_area_pct
+    vols = volumes.tolist()
+    accumulated_volume = vols[poc_idx]
+    low_idx = high_idx = poc_idx
+    last = len(vols) - 1
+    
+    while accumulated_volume < target_volume:
+        can_expand_low = low_idx > 0
+        can_expand_high = high_idx < last
+        if not can_expand_low and not can_expand_high:
+            break
+        
+        low_vol = vols[low_idx - 1] if can_expand_low else 0
+        high_vol = vols[high_idx + 1] if can_expand_high else 0
+        
+        if low_vol >= high_vol and can_expand_low:
+            low_idx -= 1
+            accumulated_volume += vols[low_idx]
+        elif can_expand_high:
+            high_idx += 1
+            accumulated_volume += vols[high_idx]
+        else:
+            low_idx -= 1
+            accumulated_volume += vols[low_idx]
+    
+    return poc_idx, low_idx, high_idx
+
+
 @dataclass
 class VolumeProfileResult:
     """Result of Volume Profile calculation."""
@@ -149,6 +230,10 @@ class VolumeProfileCalculator:
         """
         Calculate Volume Profile from candles.
         
+        The per-candle weights of all bins are computed as one
+        (candles x bins) array expression and reduced with a single
+        matrix-vector product.
+        
         Args:
             candles: List of OHLCV candles
             custom_high: Optional custom high for range
@@ -157,52 +242,51 @@ class VolumeProfileCalculator:
         Returns:
             VolumeProfileResult with POC, VAH, VAL, and full profile
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         if not candles or len(candles) < 10:
             logger.warning("Not enough candles for Volume Profile calculation")
             return None
         
         try:
+            ohlcv = np.array(
+                [(c.open, c.high, c.low, c.close, c.volume) for c in candles], dtype=np.float64
+            )
+            
             # 1. Determine price range
             if custom_high is not None and custom_low is not None:
                 period_high = custom_high
                 period_low = custom_low
             else:
-                period_high = max(c.high for c in candles)
-                period_low = min(c.low for c in candles)
+                period_high = float(ohlcv[:, 1].max())
+                period_low = float(ohlcv[:, 2].min())
             
             price_range = period_high - period_low
             if price_range <= 0:
                 logger.warning("Invalid price range for Volume Profile")
                 return None
             
-            # 2. Initialize bins
+            # 2. Bin centers (rounded keys, duplicates merged like dict keys)
             bin_size = price_range / self.num_bins
-            profile: Dict[float, float] = {}
-            
-            for i in range(self.num_bins):
-                price_level = period_low + (bin_size * (i + 0.5))  # Bin center
-                profile[round(price_level, 4)] = 0.0
+            keys = list(dict.fromkeys(
+                round(period_low + (bin_size * (i + 0.5)), 4) for i in range(self.num_bins)
+            ))
+            levels = np.array(keys, dtype=np.float64)
             
             # 3. Distribute volume from each candle to bins
-            total_volume = 0.0
+            weights = bin_weights(levels, ohlcv, use_vwap=self.vwap_calculator is not None)
+            volumes = ohlcv[:, 4] @ weights
+            total_volume = float(ohlcv[:, 4].sum())
             
-            for candle in candles:
-                total_volume += candle.volume
-                self._distribute_candle_volume(candle, profile, bin_size, period_low)
-            
-            # 4. Calculate POC (highest volume price level)
-            poc = max(profile.keys(), key=lambda k: profile[k])
-            
-            # 5. Calculate Value Area (VAH and VAL)
-            vah, val = self._calculate_value_area(profile, self.value_area_pct)
+            # 4./5. POC (highest volume price level), Value Area (VAH and VAL)
+            poc_idx, low_idx, high_idx = value_area_indices(volumes, self.value_area_pct)
+            poc, vah, val = keys[poc_idx], keys[high_idx], keys[low_idx]
             
             # 6. Create result
-            calc_time = (datetime.now() - start_time).total_seconds() * 1000
+            calc_time = (time.perf_counter() - start_time) * 1000
             
             result = VolumeProfileResult(
-                profile=profile,
+                profile=dict(zip(keys, volumes.tolist())),
                 poc=poc,
                 vah=vah,
                 val=val,
@@ -224,105 +308,17 @@ class VolumeProfileCalculator:
             logger.error(f"Error calculating Volume Profile: {e}")
             return None
     
-    def _distribute_candle_volume(
-        self,
-        candle: Candle,
-        profile: Dict[float, float],
-        bin_size: float,
-        period_low: float
-    ) -> None:
+    def rolling(self, window: int, bin_size: float) -> 'RollingVolumeProfile':
         """
-        Distribute a candle's volume across price bins.
-        
-        Uses weighted distribution based on:
-        - Proximity to close price (30% weight)
-        - Proximity to VWAP if available (30% weight)
-        - Uniform distribution across body range (40% weight)
+        Rolling profile over the last `window` candles with this calculator's
+        weighting and value area (see RollingVolumeProfile).
         """
-        candle_high = candle.high
-        candle_low = candle.low
-        candle_close = candle.close
-        candle_open = candle.open
-        volume = candle.volume
-        
-        # Get VWAP if calculator available
-        vwap = None
-        if self.vwap_calculator:
-            try:
-                # Single candle VWAP approximation
-                vwap = (candle_high + candle_low + candle_close) / 3
-            except:
-                pass
-        
-        # Calculate body range
-        body_high = max(candle_open, candle_close)
-        body_low = min(candle_open, candle_close)
-        
-        # Distribute volume to each bin
-        for price_level in profile.keys():
-            weight = self._calculate_price_weight(
-                price_level=price_level,
-                candle_high=candle_high,
-                candle_low=candle_low,
-                candle_close=candle_close,
-                body_high=body_high,
-                body_low=body_low,
-                vwap=vwap
-            )
-            
-            profile[price_level] += volume * weight
-    
-    def _calculate_price_weight(
-        self,
-        price_level: float,
-        candle_high: float,
-        candle_low: float,
-        candle_close: float,
-        body_high: float,
-        body_low: float,
-        vwap: Optional[float]
-    ) -> float:
-        """
-        Calculate weight for a price level based on candle structure.
-        
-        Weight is higher for:
-        - Prices near the close (shows where price settled)
-        - Prices near VWAP (institutional equilibrium)
-        - Prices within the candle body (more trading activity)
-        """
-        # Skip if price outside candle range
-        if price_level < candle_low or price_level > candle_high:
-            return 0.0
-        
-        candle_range = candle_high - candle_low
-        if candle_range <= 0:
-            return 0.0
-        
-        weight = 0.0
-        
-        # 1. Close proximity weight (30%)
-        close_distance = abs(price_level - candle_close) / candle_range
-        close_weight = 0.30 * (1.0 - close_distance)
-        weight += max(0, close_weight)
-        
-        # 2. VWAP proximity weight (30%)
-        if vwap is not None:
-            vwap_distance = abs(price_level - vwap) / candle_range
-            vwap_weight = 0.30 * (1.0 - vwap_distance)
-            weight += max(0, vwap_weight)
-        else:
-            # If no VWAP, add to close weight
-            weight += 0.15 * (1.0 - close_distance)
-        
-        # 3. Body range weight (40%)
-        if body_low <= price_level <= body_high:
-            # Inside body - full weight
-            weight += 0.40
-        else:
-            # In wicks - reduced weight
-            weight += 0.15
-        
-        return weight
+        return RollingVolumeProfile(
+            window=window,
+            bin_size=bin_size,
+            value_area_pct=self.value_area_pct,
+            use_vwap=self.vwap_calculator is not None
+        )
     
     def _calculate_value_area(
         self,
@@ -335,50 +331,10 @@ class VolumeProfileCalculator:
         Value Area contains value_area_pct (typically 70%) of total volume,
         centered around the POC.
         """
-        # Sort profile by price
-        sorted_levels = sorted(profile.items(), key=lambda x: x[0])
-        price_levels = [x[0] for x in sorted_levels]
-        volumes = [x[1] for x in sorted_levels]
-        
-        total_volume = sum(volumes)
-        target_volume = total_volume * value_area_pct
-        
-        if total_volume == 0:
-            return price_levels[-1], price_levels[0]
-        
-        # Find POC index
-        poc_idx = volumes.index(max(volumes))
-        
-        # Expand outward from POC until value_area_pct volume reached
-        accumulated_volume = volumes[poc_idx]
-        low_idx = poc_idx
-        high_idx = poc_idx
-        
-        while accumulated_volume < target_volume:
-            # Expand to whichever side has more volume
-            can_expand_low = low_idx > 0
-            can_expand_high = high_idx < len(volumes) - 1
-            
-            if not can_expand_low and not can_expand_high:
-                break
-            
-            low_vol = volumes[low_idx - 1] if can_expand_low else 0
-            high_vol = volumes[high_idx + 1] if can_expand_high else 0
-            
-            if low_vol >= high_vol and can_expand_low:
-                low_idx -= 1
-                accumulated_volume += volumes[low_idx]
-            elif can_expand_high:
-                high_idx += 1
-                accumulated_volume += volumes[high_idx]
-            elif can_expand_low:
-                low_idx -= 1
-                accumulated_volume += volumes[low_idx]
-        
-        val = price_levels[low_idx]
-        vah = price_levels[high_idx]
-        
-        return vah, val
+        price_levels = sorted(profile)
+        volumes = np.array([profile[p] for p in price_levels], dtype=np.float64)
+        _, low_idx, high_idx = value_area_indices(volumes, value_area_pct)
+        return price_levels[high_idx], price_levels[low_idx]
     
     def get_high_volume_nodes(
         self,
@@ -433,3 +389,168 @@ class VolumeProfileCalculator:
         ]
         
         return sorted(lvns)
+
+
+class RollingVolumeProfile:
+    """
+    Volume Profile of the last `window` candles, updated incrementally.
+    
+    Bins have a fixed width and are anchored at price 0 (bin i is centered
+    on (i + 0.5) * bin_size), so they do not move when the window's high or
+    low changes. add() spreads the new candle's volume over the bins its
+    [low, high] covers (same weighting as VolumeProfileCalculator) and
+    subtracts the stored contribution of the evicted candle: O(bins per
+    candle). key_levels() is O(occupied bins).
+    
+    Subtracting floats leaves rounding residue, so the bins are re-summed
+    from the stored contributions once per `window` evictions (amortized
+    O(bins) per candle), which also drops bins the window has left.
+    
+    Example usage:
+        profile = calculator.rolling(window=500, bin_size=10.0)
+        for candle in closed_candles:
+            profile.add(candle)
+            poc, vah, val = profile.key_levels()
+    """
+    
+    def __init__(
+        self,
+        window: int,
+        bin_size: float,
+        value_area_pct: float = 0.70,
+        use_vwap: bool = False
+    ):
+        if window <= 0:
+            raise ValueError(f"window must be positive, got {window}")
+        if not bin_size > 0:
+            raise ValueError(f"bin_size must be positive, got {bin_size}")
+        self.window = window
+        self.bin_size = bin_size
+        self.value_area_pct = value_area_pct
+        self.use_vwap = use_vwap
+        
+        # (first bin, per-bin volumes, candle high, candle low, candle volume)
+        self._candles: Deque[Tuple[int, np.ndarray, float, float, float]] = deque()
+        self._origin = 0                     # absolute bin index of _volumes[0]
+        self._volumes = np.zeros(0)
+        self._coverage = np.zeros(0, dtype=np.int64)  # candles touching each bin
+        self._total_volume = 0.0
+        self._evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._candles)
+    
+    def add(self, candle: Candle) -> None:
+        """Add the newest candle, evicting the oldest when the window is full."""
+        # Bins whose centers lie inside [low, high]
+        first = math.ceil(candle.low / self.bin_size - 0.5)
+        last = math.floor(candle.high / self.bin_size - 0.5)
+        if last >= first and candle.high > candle.low:
+            levels = (np.arange(first, last + 1) + 0.5) * self.bin_size
+            row = np.array([[candle.open, candle.high, candle.low, candle.close, candle.volume]])
+            contribution = candle.volume * bin_weights(levels, row, self.use_vwap)[0]
+            self._apply(first, contribution, 1)
+        else:
+            contribution = np.zeros(0)
+        
+        self._candles.append((first, contribution, candle.high, candle.low, candle.volume))
+        self._total_volume += candle.volume
+        
+        if len(self._candles) > self.window:
+            first, contribution, _, _, volume = self._candles.popleft()
+            if len(contribution):
+                self._apply(first, contribution, -1)
+            self._total_volume -= volume
+            self._evictions += 1
+            if self._evictions >= self.window:
+                self._rebuild()
+    
+    def key_levels(self) -> Optional[Tuple[float, float, float]]:
+        """(POC, VAH, VAL) of the current window, None if it holds no volume."""
+        span = self._occupied()
+        if span is None:
+            return None
+        lo, hi = span
+        poc_idx, low_idx, high_idx = value_area_indices(self._volumes[lo:hi + 1], self.value_area_pct)
+        price = lambda i: (self._origin + lo + i + 0.5) * self.bin_size
+        return price(poc_idx), price(high_idx), price(low_idx)
+    
+    def result(self) -> Optional[VolumeProfileResult]:
+        """Full VolumeProfileResult of the current window."""
+        start_time = time.perf_counter()
+        span = self._occupied()
+        if span is None:
+            return None
+        lo, hi = span
+        volumes = self._volumes[lo:hi + 1]
+        poc_idx, low_idx, high_idx = value_area_indices(volumes, self.value_area_pct)
+        keys = [round((self._origin + lo + i + 0.5) * self.bin_size, 4) for i in range(hi - lo + 1)]
+        
+        return VolumeProfileResult(
+            profile=dict(zip(keys, volumes.tolist())),
+            poc=keys[poc_idx],
+            vah=keys[high_idx],
+            val=keys[low_idx],
+            period_high=max(entry[2] for entry in self._candles),
+            period_low=min(entry[3] for entry in self._candles),
+            total_volume=self._total_volume,
+            num_bins=len(keys),
+            calculation_time_ms=round((time.perf_counter() - start_time) * 1000, 2)
+        )
+    
+    def reset(self) -> None:
+        self._candles.clear()
+        self._origin = 0
+        self._volumes = np.zeros(0)
+        self._coverage = np.zeros(0, dtype=np.int64)
+        self._total_volume = 0.0
+        self._evictions = 0
+    
+    # Internals
+    
+    def _occupied(self) -> Optional[Tuple[int, int]]:
+        covered = np.flatnonzero(self._coverage)
+        if not len(covered):
+            return None
+        return int(covered[0]), int(covered[-1])
+    
+    def _apply(self, first: int, contribution: np.ndarray, sign: int) -> None:
+        last = first + len(contribution) - 1
+        self._ensure_capacity(first, last)
+        start = first - self._origin
+        section = slice(start, start + len(contribution))
+        self._coverage[section] += sign
+        if sign > 0:
+            self._volumes[section] += contribution
+        else:
+            volumes = self._volumes[section] - contribution
+            # Bins no candle touches any more hold exactly nothing
+            self._volumes[section] = np.where(self._coverage[section] > 0, np.maximum(volumes, 0.0), 0.0)
+    
+    def _ensure_capacity(self, first: int, last: int) -> None:
+        size = len(self._volumes)
+        if size and first >= self._origin and last < self._origin + size:
+            return
+        # Grow with headroom so a trending price does not reallocate every candle
+        lo = min(first, self._origin) if size else first
+        hi = max(last, self._origin + size - 1) if size else last
+        pad = max(16, (hi - lo + 1) // 2)
+        lo, hi = lo - pad, hi + pad
+        volumes = np.zeros(hi - lo + 1)
+        coverage = np.zeros(hi - lo + 1, dtype=np.int64)
+        if size:
+            offset = self._origin - lo
+            volumes[offset:offset + size] = self._volumes
+            coverage[offset:offset + size] = self._coverage
+        self._origin, self._volumes, self._coverage = lo, volumes, coverage
+    
+    def _rebuild(self) -> None:
+        """Re-sum bins from the stored contributions (drops drift and stale bins)."""
+        self._evictions = 0
+        self._origin = 0
+        self._volumes = np.zeros(0)
+        self._coverage = np.zeros(0, dtype=np.int64)
+        for first, contribution, _, _, _ in self._candles:
+            if len(contribution):
+                self._apply(first, contribution, 1)
+        self._total_volume = sum(entry[4] for entry in self._candles)
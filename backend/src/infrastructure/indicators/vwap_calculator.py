@@ -7,9 +7,21 @@ VWAP shows the average price weighted by volume - where institutional money is.
 
 from typing import List, Optional
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 
 from ...domain.entities.candle import Candle
+from ...domain.entities.candle_store import CandleArrays, CandleInput, as_candle_arrays
+from ...domain.services.anchored_vwap import (
+    ANCHOR_DAY,
+    NO_SESSION,
+    Anchor,
+    AnchoredVWAPSeries,
+    anchored_vwap,
+    session_key,
+    session_keys,
+    validate_anchor,
+)
 
 
 @dataclass
@@ -27,22 +39,34 @@ class VWAPCalculator:
     VWAP = Σ(Typical Price × Volume) / Σ(Volume)
     Typical Price = (High + Low + Close) / 3
     
+    Sums run from the session anchor (UTC day by default, see
+    domain.services.anchored_vwap): only the candles of the last session are
+    summed, found from the end of the list, and series come from one
+    cumulative sum per session.
+    
     Usage:
         - Price > VWAP: Bullish bias (buy pullbacks)
         - Price < VWAP: Bearish bias (sell rallies)
         - VWAP acts as dynamic support/resistance
     """
     
-    def __init__(self):
-        """Initialize VWAP calculator"""
-        pass
+    def __init__(self, anchor: Anchor = ANCHOR_DAY):
+        """
+        Initialize VWAP calculator.
+        
+        Args:
+            anchor: Session anchor - 'day' (UTC), 'week' (UTC, from Monday)
+                    or a datetime (VWAP from the first candle at/after it)
+        """
+        validate_anchor(anchor)
+        self.anchor = anchor
     
-    def calculate_vwap(self, candles: List[Candle]) -> Optional[VWAPResult]:
+    def calculate_vwap(self, candles: CandleInput) -> Optional[VWAPResult]:
         """
         Calculate VWAP for given candles.
         
         Args:
-            candles: List of Candle objects (chronological order)
+            candles: List of Candle objects or CandleArrays (chronological order)
             
         Returns:
             VWAPResult with VWAP value, or None if insufficient data
@@ -50,34 +74,27 @@ class VWAPCalculator:
         if not candles or len(candles) < 1:
             return None
         
-        # Filter candles for the current day (Anchored VWAP)
-        if not candles:
+        if isinstance(candles, CandleArrays):
+            return self._calculate_vwap_arrays(candles)
+        
+        # Walk back from the last candle to the start of its session (Anchored VWAP)
+        current_session = session_key(candles[-1].timestamp, self.anchor)
+        if current_session == NO_SESSION:
             return None
-            
-        last_candle = candles[-1]
-        current_date = last_candle.timestamp.date()
         
-        # Filter candles that belong to the same day as the last candle
-        day_candles = [c for c in candles if c.timestamp.date() == current_date]
+        start = len(candles) - 1
+        while start > 0 and session_key(candles[start - 1].timestamp, self.anchor) == current_session:
+            start -= 1
         
-        if not day_candles:
-            return None
-            
-        # Calculate typical price for each candle
-        typical_prices = [
-            (c.high + c.low + c.close) / 3.0
-            for c in day_candles
-        ]
-        
-        # Calculate TPV (Typical Price × Volume)
-        typical_price_volume = [
-            tp * c.volume
-            for tp, c in zip(typical_prices, day_candles)
-        ]
-        
-        # Sum values
-        total_tpv = sum(typical_price_volume)
-        total_volume = sum(c.volume for c in day_candles)
+        # Sum TPV (Typical Price × Volume) and volume (plain left-to-right
+        # accumulation, so AnchoredVWAP and the streaming VWAP in
+        # IncrementalIndicatorEngine reproduce it exactly)
+        total_tpv = 0.0
+        total_volume = 0.0
+        for i in range(start, len(candles)):
+            c = candles[i]
+            total_tpv += ((c.high + c.low + c.close) / 3.0) * c.volume
+            total_volume += c.volume
         
         # Avoid division by zero
         if total_volume == 0:
@@ -92,46 +109,58 @@ class VWAPCalculator:
             typical_price_volume=total_tpv
         )
     
-    def calculate_vwap_series(self, candles: List[Candle]) -> Optional[pd.Series]:
+    def _calculate_vwap_arrays(self, candles: CandleArrays) -> Optional[VWAPResult]:
+        """calculate_vwap() over columns: same session and summation order."""
+        keys = session_keys(candles.timestamp, self.anchor)
+        if keys[-1] == NO_SESSION:
+            return None
+        session = keys == keys[-1]
+        
+        typical_price_volume = (
+            (candles.high[session] + candles.low[session] + candles.close[session]) / 3.0
+        ) * candles.volume[session]
+        
+        # np.cumsum accumulates left to right (np.sum would sum pairwise)
+        total_tpv = float(np.cumsum(typical_price_volume)[-1])
+        total_volume = float(np.cumsum(candles.volume[session])[-1])
+        
+        if total_volume == 0:
+            return None
+        
+        return VWAPResult(
+            vwap=total_tpv / total_volume,
+            period_volume=total_volume,
+            typical_price_volume=total_tpv
+        )
+    
+    def calculate_anchored_vwap(self, candles: CandleInput) -> Optional[AnchoredVWAPSeries]:
         """
-        Calculate rolling VWAP series (useful for charting).
+        VWAP, standard deviation and session of every candle (arrays for charting).
         
         Args:
-            candles: List of Candle objects
+            candles: List of Candle objects or CandleArrays
             
         Returns:
-            Pandas Series with VWAP values for each candle
+            AnchoredVWAPSeries (use .bands(k) for VWAP ± k·σ), or None if no candles
         """
         if not candles or len(candles) < 1:
             return None
+        return anchored_vwap(as_candle_arrays(candles), self.anchor)
+    
+    def calculate_vwap_series(self, candles: CandleInput) -> Optional[pd.Series]:
+        """
+        Calculate rolling VWAP series (useful for charting).
         
-        # Convert to DataFrame
-        df = pd.DataFrame({
-            'timestamp': [c.timestamp for c in candles],
-            'high': [c.high for c in candles],
-            'low': [c.low for c in candles],
-            'close': [c.close for c in candles],
-            'volume': [c.volume for c in candles]
-        })
-        
-        # Calculate typical price
-        df['typical_price'] = (df['high'] + df['low'] + df['close']) / 3
-        
-        # Calculate TPV
-        df['tpv'] = df['typical_price'] * df['volume']
-        
-        # Group by date to implement Anchored VWAP (reset daily)
-        # We use the date part of the timestamp for grouping
-        df['date'] = df['timestamp'].dt.date
-        
-        # Calculate cumulative sums per group (day)
-        df['cum_tpv'] = df.groupby('date')['tpv'].cumsum()
-        df['cum_volume'] = df.groupby('date')['volume'].cumsum()
-        
-        # Calculate VWAP
-        df['vwap'] = df['cum_tpv'] / df['cum_volume']
-        
-        return df['vwap']
+        Args:
+            candles: List of Candle objects or CandleArrays
+            
+        Returns:
+            Pandas Series with VWAP values for each candle
+        """
+        series = self.calculate_anchored_vwap(candles)
+        if series is None:
+            return None
+        return pd.Series(series.vwap, name='vwap')
     
     def is_above_vwap(self, price: float, vwap: float, buffer_pct: float = 0.0) -> bool:
         """
@@ -0,0 +1,178 @@
+"""
+CandleWriteBehindQueue - Infrastructure Layer
+
+Background writer for candle persistence.
+
+Callers (WebSocket handlers, startup loaders) enqueue candles and return
+immediately; a dedicated thread drains the queue, merges rows per
+(symbol, timeframe) and hands each group to a batch writer
+(SQLiteMarketDataRepository.save_candles_batch) as one transaction.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ...domain.entities.candle import Candle
+
+
+BatchWriter = Callable[[List[Candle], str, str], int]
+
+
+@dataclass
+class _FlushRequest:
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+_STOP = object()
+
+
+class CandleWriteBehindQueue:
+    """
+    Write-behind queue with a single writer thread.
+
+    - enqueue() never blocks: when the queue is full the candles are
+      dropped and counted (stream data is re-fetchable from Binance).
+    - Pending rows are de-duplicated by timestamp per table, so a candle
+      updated several times before a flush is written once (last wins,
+      same as INSERT OR REPLACE).
+    - Rows are written when `max_batch` rows are pending or
+      `flush_interval` seconds after the first pending row.
+
+    Usage:
+        writer = CandleWriteBehindQueue(repo.save_candles_batch)
+        writer.enqueue([candle], '1m', 'btcusdt')
+        writer.flush(timeout=5)
+        writer.close()
+    """
+
+    def __init__(
+        self,
+        batch_writer: BatchWriter,
+        max_batch: int = 500,
+        flush_interval: float = 0.5,
+        max_queue: int = 10000
+    ):
+        self._batch_writer = batch_writer
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self.logger = logging.getLogger(__name__)
+
+        self._stats = {
+            'enqueued': 0,
+            'written': 0,
+            'batches': 0,
+            'dropped': 0,
+            'failed': 0,
+        }
+        self._stats_lock = threading.Lock()
+
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="candle-writer", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, candles: List[Candle], timeframe: str, symbol: str) -> bool:
+        """
+        Queue candles for writing.
+
+        Returns:
+            False if the queue was full (candles dropped) or the writer is closed
+        """
+        if not candles:
+            return True
+        if self._closed:
+            self._count('dropped', len(candles))
+            return False
+        try:
+            self._queue.put_nowait((symbol.lower(), timeframe, list(candles)))
+        except queue.Full:
+            self._count('dropped', len(candles))
+            self.logger.warning(f"Candle write queue full, dropped {len(candles)} {symbol}/{timeframe} candles")
+            return False
+        self._count('enqueued', len(candles))
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until everything enqueued before this call is written.
+
+        Returns:
+            True if the flush completed within `timeout`
+        """
+        if self._closed or not self._thread.is_alive():
+            return self._queue.empty()
+        request = _FlushRequest()
+        self._queue.put(request)
+        return request.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Write remaining rows and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def get_statistics(self) -> Dict[str, int]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['queued'] = self._queue.qsize()
+        return stats
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    # Writer thread
+
+    def _run(self) -> None:
+        pending: Dict[Tuple[str, str], Dict[object, Candle]] = {}
+        pending_rows = 0
+        deadline: Optional[float] = None
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, tuple):
+                symbol, timeframe, candles = item
+                rows = pending.setdefault((symbol, timeframe), {})
+                before = len(rows)
+                for candle in candles:
+                    rows[candle.timestamp] = candle
+                pending_rows += len(rows) - before
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            due = item is None or pending_rows >= self.max_batch or \
+                isinstance(item, _FlushRequest) or item is _STOP
+            if due and pending:
+                self._write(pending)
+                pending = {}
+                pending_rows = 0
+                deadline = None
+            elif not pending:
+                deadline = None
+
+            if isinstance(item, _FlushRequest):
+                item.done.set()
+            elif item is _STOP:
+                return
+
+    def _write(self, pending: Dict[Tuple[str, str], Dict[object, Candle]]) -> None:
+        for (symbol, timeframe), rows in pending.items():
+            candles = sorted(rows.values(), key=lambda c: c.timestamp)
+            try:
+                written = self._batch_writer(candles, timeframe, symbol)
+                self._count('written', written)
+                self._count('batches')
+            except Exception as e:
+                self._count('failed', len(candles))
+                self.logger.error(f"Failed to write {len(candles)} {symbol}/{timeframe} candles: {e}")
@@ -0,0 +1,246 @@
+"""
+OrderBookRepository - Infrastructure Layer
+
+Authoritative in-memory order book in front of SQLiteOrderRepository.
+
+The Paper Engine matches every tick against PENDING orders and OPEN
+positions. Reading them from SQLite meant two full table scans (plus
+row -> PaperPosition conversion) per tick, filtered by symbol in Python.
+Instead:
+
+- Live positions (PENDING / OPEN) are held in memory, indexed by
+  (status, symbol, side); the book is rebuilt from SQLite on startup
+- Writes update the book first and are journaled to SQLite by a
+  write-behind thread (OrderWriteBehindQueue)
+- Closed history, pagination and settings are still read from SQLite,
+  after the journal is flushed, so they always see the latest writes
+
+Reads return copies, so callers keep the old contract: changes reach the
+book only through save_order()/update_order(). Listeners (add_listener)
+see every change to a live position, e.g. to maintain a trigger index.
+"""
+
+import copy
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.domain.entities.paper_position import PaperPosition
+from src.domain.repositories.i_order_repository import IOrderRepository
+from .order_write_behind import OrderWriteBehindQueue
+from .sqlite_order_repository import SQLiteOrderRepository
+
+
+LIVE_STATUSES = ('PENDING', 'OPEN')
+SIDES = ('LONG', 'SHORT')
+
+_BookKey = Tuple[str, str, str]  # (status, symbol, side)
+
+
+class OrderBookRepository(IOrderRepository):
+    """
+    In-memory PENDING/OPEN book with write-behind persistence.
+
+    Usage:
+        repo = OrderBookRepository(SQLiteOrderRepository(db_path))
+        repo.get_pending_orders_by_symbol('btcusdt')   # no DB read
+        repo.update_order(position)                     # journaled
+        repo.close()                                    # flush + stop
+    """
+
+    # How long history reads wait for the journal before reading SQLite anyway
+    FLUSH_TIMEOUT = 5.0
+
+    def __init__(self, store: SQLiteOrderRepository, write_behind: bool = True):
+        """
+        Args:
+            store: SQLite repository the book is persisted to
+            write_behind: Journal writes from a background thread
+                (False: write through to SQLite synchronously)
+        """
+        self.store = store
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._live: Dict[str, PaperPosition] = {}
+        self._index: Dict[_BookKey, Dict[str, PaperPosition]] = {}
+        self._balance = 0.0
+        self._listeners: List[Callable[[Optional[PaperPosition]], None]] = []
+        self._journal: Optional[OrderWriteBehindQueue] = \
+            OrderWriteBehindQueue(store.apply_batch) if write_behind else None
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Reload the book and the wallet balance from SQLite."""
+        self.flush()
+        positions = self.store.get_active_orders() + self.store.get_pending_orders()
+        balance = self.store.get_account_balance()
+        with self._lock:
+            self._live.clear()
+            self._index.clear()
+            for position in positions:
+                self._insert(position)
+            self._balance = balance
+            self._notify(None)
+        self.logger.info(f"📒 Order book rebuilt: {len(positions)} live positions")
+
+    # Book maintenance (callers hold the lock)
+
+    @staticmethod
+    def _key(position: PaperPosition) -> _BookKey:
+        return position.status, position.symbol.lower(), position.side
+
+    def _insert(self, position: PaperPosition) -> None:
+        self._live[position.id] = position
+        self._index.setdefault(self._key(position), {})[position.id] = position
+
+    def _remove(self, position_id: str) -> None:
+        position = self._live.pop(position_id, None)
+        if position is not None:
+            bucket = self._index.get(self._key(position))
+            if bucket is not None:
+                bucket.pop(position_id, None)
+
+    # Writes
+
+    def save_order(self, position: PaperPosition) -> None:
+        with self._lock:
+            was_live = position.id in self._live
+            self._remove(position.id)
+            if position.status in LIVE_STATUSES:
+                self._insert(copy.copy(position))
+            self._persist(self.store.save_order, 'save', position)
+            if was_live or position.status in LIVE_STATUSES:
+                self._notify(position)
+
+    def update_order(self, position: PaperPosition) -> None:
+        with self._lock:
+            # Like UPDATE ... WHERE id = ?: unknown ids do not create rows
+            was_live = position.id in self._live
+            if was_live:
+                self._remove(position.id)
+                if position.status in LIVE_STATUSES:
+                    self._insert(copy.copy(position))
+            self._persist(self.store.update_order, 'update', position)
+            if was_live:
+                self._notify(position)
+
+    def update_account_balance(self, balance: float) -> None:
+        with self._lock:
+            self._balance = balance
+            if self._journal:
+                self._journal.set_balance(balance)
+            else:
+                self.store.update_account_balance(balance)
+
+    def _persist(self, write: Callable[[PaperPosition], None], kind: str, position: PaperPosition) -> None:
+        if self._journal:
+            getattr(self._journal, kind)(position)
+        else:
+            write(position)
+
+    def add_listener(self, listener: Callable[[Optional[PaperPosition]], None]) -> bool:
+        with self._lock:
+            self._listeners.append(listener)
+        return True
+
+    def _notify(self, position: Optional[PaperPosition]) -> None:
+        # Under the book lock, so listeners see changes in book order
+        for listener in self._listeners:
+            try:
+                listener(copy.copy(position) if position is not None else None)
+            except Exception as e:
+                self.logger.error(f"Order book listener failed: {e}")
+
+    def reset_database(self) -> None:
+        self.flush()
+        self.store.reset_database()
+        self.rebuild()
+
+    # Live reads (memory only)
+
+    def get_order(self, position_id: str) -> Optional[PaperPosition]:
+        with self._lock:
+            position = self._live.get(position_id)
+            if position is not None:
+                return copy.copy(position)
+        self.flush()
+        return self.store.get_order(position_id)
+
+    def get_active_orders(self) -> List[PaperPosition]:
+        return self._live_orders('OPEN')
+
+    def get_pending_orders(self) -> List[PaperPosition]:
+        return self._live_orders('PENDING')
+
+    def get_active_orders_by_symbol(self, symbol: str, side: Optional[str] = None) -> List[PaperPosition]:
+        return self._bucket_orders('OPEN', symbol, side)
+
+    def get_pending_orders_by_symbol(self, symbol: str, side: Optional[str] = None) -> List[PaperPosition]:
+        return self._bucket_orders('PENDING', symbol, side)
+
+    def get_account_balance(self) -> float:
+        with self._lock:
+            return self._balance
+
+    def _live_orders(self, status: str) -> List[PaperPosition]:
+        with self._lock:
+            return [copy.copy(p) for p in self._live.values() if p.status == status]
+
+    def _bucket_orders(self, status: str, symbol: str, side: Optional[str]) -> List[PaperPosition]:
+        symbol = symbol.lower()
+        with self._lock:
+            result = []
+            for bucket_side in (side,) if side else SIDES:
+                bucket = self._index.get((status, symbol, bucket_side))
+                if bucket:
+                    result.extend(copy.copy(p) for p in bucket.values())
+            return result
+
+    # History and settings (SQLite, after the journal is flushed)
+
+    def get_closed_orders(self, limit: int = 50) -> List[PaperPosition]:
+        self.flush()
+        return self.store.get_closed_orders(limit)
+
+    def get_closed_orders_paginated(
+        self, page: int, limit: int,
+        symbol: Optional[str] = None,
+        side: Optional[str] = None,
+        pnl_filter: Optional[str] = None
+    ) -> Tuple[List[PaperPosition], int]:
+        self.flush()
+        return self.store.get_closed_orders_paginated(page, limit, symbol, side, pnl_filter)
+
+    def get_setting(self, key: str) -> Optional[str]:
+        return self.store.get_setting(key)
+
+    def set_setting(self, key: str, value: str) -> None:
+        self.store.set_setting(key, value)
+
+    def get_all_settings(self) -> dict:
+        return self.store.get_all_settings()
+
+    # Lifecycle
+
+    async def run_io(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Same dedicated I/O thread as the SQLite store (keeps call order)"""
+        return await self.store.run_io(fn, *args)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until journaled writes are in SQLite."""
+        if self._journal is None:
+            return True
+        return self._journal.flush(self.FLUSH_TIMEOUT if timeout is None else timeout)
+
+    def close(self) -> None:
+        """Write the remaining journal, then close the store."""
+        if self._journal:
+            self._journal.close()
+        self.store.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = sum(1 for p in self._live.values() if p.status == 'PENDING')
+            stats = {'live': len(self._live), 'pending': pending, 'open': len(self._live) - pending}
+        stats['journal'] = self._journal.get_statistics() if self._journal else None
+        return stats
@@ -0,0 +1,188 @@
+"""
+OrderWriteBehindQueue - Infrastructure Layer
+
+Background journal for paper order/position persistence.
+
+OrderBookRepository applies every change to its in-memory book first and
+journals a snapshot here; a dedicated thread folds pending entries per
+position id and hands them to a batch writer
+(SQLiteOrderRepository.apply_batch) as one transaction.
+"""
+
+import copy
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ...domain.entities.paper_position import PaperPosition
+
+
+BatchWriter = Callable[[List[PaperPosition], List[PaperPosition], Optional[float]], int]
+
+SAVE = 'save'
+UPDATE = 'update'
+
+
+@dataclass
+class _FlushRequest:
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+_STOP = object()
+_BALANCE = object()
+
+
+def _fold(older: Tuple[str, PaperPosition], newer: Tuple[str, PaperPosition]) -> Tuple[str, PaperPosition]:
+    """
+    Combine two journal entries of one position (newest snapshot wins).
+
+    A pending save absorbs later updates: the row may not exist yet, and
+    an UPDATE of a missing row would be lost.
+    """
+    kind = SAVE if SAVE in (older[0], newer[0]) else UPDATE
+    return kind, newer[1]
+
+
+class OrderWriteBehindQueue:
+    """
+    Write-behind journal with a single writer thread.
+
+    - save()/update()/set_balance() never block and never drop: the
+      in-memory book is authoritative, so losing a journal entry would
+      leave SQLite behind it after a restart.
+    - Entries are folded per position id (and the balance is last-wins),
+      so a position touched on every tick is written once per batch.
+    - Entries are written when `max_batch` positions are pending or
+      `flush_interval` seconds after the first pending entry. A failed
+      batch stays pending and is retried with the next one.
+
+    Usage:
+        journal = OrderWriteBehindQueue(repo.apply_batch)
+        journal.update(position)
+        journal.flush(timeout=5)
+        journal.close()
+    """
+
+    def __init__(self, batch_writer: BatchWriter, max_batch: int = 200, flush_interval: float = 0.2):
+        self._batch_writer = batch_writer
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue" = queue.Queue()
+        self.logger = logging.getLogger(__name__)
+
+        self._stats = {
+            'journaled': 0,
+            'written': 0,
+            'batches': 0,
+            'failed_batches': 0,
+        }
+        self._stats_lock = threading.Lock()
+
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="order-journal", daemon=True)
+        self._thread.start()
+
+    def save(self, position: PaperPosition) -> None:
+        """Journal a new (or replaced) position."""
+        self._put((SAVE, copy.copy(position)))
+
+    def update(self, position: PaperPosition) -> None:
+        """Journal a change to an existing position."""
+        self._put((UPDATE, copy.copy(position)))
+
+    def set_balance(self, balance: float) -> None:
+        """Journal the wallet balance."""
+        self._put((_BALANCE, balance))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until everything journaled before this call is written.
+
+        Returns:
+            True if the flush completed within `timeout`
+        """
+        if self._closed or not self._thread.is_alive():
+            return self._queue.empty()
+        request = _FlushRequest()
+        self._queue.put(request)
+        return request.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Write remaining entries and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def get_statistics(self) -> Dict[str, int]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['queued'] = self._queue.qsize()
+        return stats
+
+    def _put(self, entry: tuple) -> None:
+        if self._closed:
+            raise RuntimeError("Order journal is closed")
+        self._queue.put(entry)
+        self._count('journaled')
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    # Writer thread
+
+    def _run(self) -> None:
+        pending: Dict[str, Tuple[str, PaperPosition]] = {}
+        balance: Optional[float] = None
+        deadline: Optional[float] = None
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, tuple):
+                kind, value = item
+                if kind is _BALANCE:
+                    balance = value
+                else:
+                    entry = (kind, value)
+                    older = pending.get(value.id)
+                    pending[value.id] = _fold(older, entry) if older else entry
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            due = item is None or len(pending) >= self.max_batch or \
+                isinstance(item, _FlushRequest) or item is _STOP
+            if due and (pending or balance is not None):
+                if self._write(pending, balance):
+                    pending, balance, deadline = {}, None, None
+                else:
+                    deadline = time.monotonic() + self.flush_interval
+            elif not pending and balance is None:
+                deadline = None
+
+            if isinstance(item, _FlushRequest):
+                item.done.set()
+            elif item is _STOP:
+                return
+
+    def _write(self, pending: Dict[str, Tuple[str, PaperPosition]], balance: Optional[float]) -> bool:
+        saved = [position for kind, position in pending.values() if kind == SAVE]
+        updated = [position for kind, position in pending.values() if kind == UPDATE]
+        try:
+            written = self._batch_writer(saved, updated, balance)
+        except Exception as e:
+            self._count('failed_batches')
+            self.logger.error(f"Failed to write {len(pending)} journaled positions (will retry): {e}")
+            return False
+        self._count('written', written)
+        self._count('batches')
+        return True
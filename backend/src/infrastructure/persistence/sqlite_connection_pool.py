@@ -0,0 +1,152 @@
+"""
+SQLiteConnectionPool - Infrastructure Layer
+
+Shared per-database connection pool for the SQLite repositories.
+
+Each thread borrows one long-lived connection instead of opening and
+closing a connection per repository call, so connection setup, PRAGMAs
+and sqlite3's per-connection statement cache are paid once per thread.
+Repositories that point at the same database file share one pool (see
+DIContainer.get_sqlite_pool), including its set of already-created tables.
+"""
+
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+
+
+class SQLiteConnectionPool:
+    """
+    Thread-local SQLite connections for one database.
+
+    - One connection per thread (":memory:" shares a single connection,
+      since every in-memory connection would be a separate database; a
+      thread holds it exclusively from acquire() until its outermost
+      release(), so transactions of different threads never interleave).
+    - WAL journal (set once, persistent per file) so readers never block
+      the writer; synchronous=NORMAL, in-memory temp store, mmap reads.
+    - Rows are sqlite3.Row: indexable like tuples and by column name.
+    - Borrowing is re-entrant per thread. When the outermost borrower
+      releases the connection, an uncommitted transaction is rolled back,
+      exactly what closing the connection used to do.
+
+    Usage:
+        pool = SQLiteConnectionPool("data/trading_system.db")
+        with pool.connection() as conn:
+            conn.execute("INSERT ...")
+            conn.commit()
+    """
+
+    PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-16000",
+        "PRAGMA mmap_size=268435456",
+    )
+
+    def __init__(self, db_path: str, timeout: float = 30.0, cached_statements: int = 256):
+        """
+        Args:
+            db_path: SQLite file path (":memory:" for tests)
+            timeout: Seconds to wait on a locked database
+            cached_statements: Prepared statements kept per connection
+        """
+        self.db_path = db_path
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self.is_memory = db_path == ":memory:"
+        self.logger = logging.getLogger(__name__)
+
+        # Tables known to exist (skips CREATE TABLE / sqlite_master lookups)
+        self.known_tables: Set[str] = set()
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self._shared: Optional[sqlite3.Connection] = None
+        # Held by the thread borrowing the shared ":memory:" connection (re-entrant like borrowing)
+        self._shared_lock = threading.RLock()
+
+        if not self.is_memory:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            with self.connection() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            check_same_thread=False,  # only close() touches other threads' connections
+            cached_statements=self.cached_statements
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Borrow this thread's connection (pair with release())."""
+        if self.is_memory:
+            self._shared_lock.acquire()
+            with self._lock:
+                if self._shared is None:
+                    self._shared = sqlite3.connect(
+                        ":memory:", check_same_thread=False, cached_statements=self.cached_statements
+                    )
+                    self._shared.row_factory = sqlite3.Row
+                    self._connections.append(self._shared)
+            conn = self._shared
+        else:
+            conn = getattr(self._local, 'conn', None)
+            if conn is None:
+                conn = self._connect()
+                self._local.conn = conn
+        self._local.depth = getattr(self._local, 'depth', 0) + 1
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection borrowed with acquire()."""
+        depth = getattr(self._local, 'depth', 1) - 1
+        self._local.depth = depth
+        try:
+            if depth == 0 and conn.in_transaction:
+                conn.rollback()
+        finally:
+            if self.is_memory:
+                self._shared_lock.release()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Context manager around acquire()/release()."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close every connection; threads reconnect lazily on next use."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._shared = None
+            self._local = threading.local()
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing SQLite connection: {e}")
+
+    def get_statistics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'connections': len(self._connections),
+                'known_tables': len(self.known_tables),
+            }
+
+    def __repr__(self) -> str:
+        return f"SQLiteConnectionPool(db_path={self.db_path})"
@@ -2,131 +2,140 @@
 SQLiteMarketDataRepository - Infrastructure Layer
 
 SQLite implementation of MarketDataRepository interface.
+
+Storage: one `candles` table clustered on (symbol, timeframe, ts) with
+`ts` as INTEGER epoch milliseconds (UTC open time). Older databases used
+one `{symbol}_{timeframe}` table per stream with ISO TEXT timestamps;
+migrate_legacy_tables() copies those into `candles` while the app runs.
 """
 
-import sqlite3
+import re
 import shutil
 import logging
-from datetime import datetime
-from typing import List, Optional
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
 from pathlib import Path
-from contextlib import contextmanager
 
 from ...domain.repositories.market_data_repository import MarketDataRepository, RepositoryError
 from ...domain.entities.candle import Candle
+from ...domain.entities.candle_store import timestamp_to_ms
 from ...domain.entities.indicator import Indicator
 from ...domain.entities.market_data import MarketData
+from .candle_write_behind import CandleWriteBehindQueue
+from .sqlite_connection_pool import SQLiteConnectionPool
+
+
+# Legacy per-stream table names: {symbol}_{timeframe}
+_LEGACY_TABLE_RE = re.compile(r'^([a-z0-9]+)_(1m|3m|5m|15m|30m|1h|2h|4h|6h|8h|12h|1d|3d|1w)$')
+
+_CANDLE_COLUMNS = "ts, open, high, low, close, volume, ema_7, rsi_6, volume_ma_20"
+
+
+def _to_ms(timestamp: datetime) -> int:
+    """Epoch milliseconds (naive timestamps are taken as UTC, like CandleArrays)."""
+    return int(round(timestamp_to_ms(timestamp)))
+
+
+def _from_ms(ts: int) -> datetime:
+    return datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
 
 
 class SQLiteMarketDataRepository(MarketDataRepository):
     """SQLite implementation of MarketDataRepository"""
     
-    def __init__(self, db_path: str = "crypto_data.db"):
+    TABLE_NAME = "candles"
+    
+    def __init__(
+        self,
+        db_path: str = "crypto_data.db",
+        write_behind: bool = True,
+        pool: Optional[SQLiteConnectionPool] = None
+    ):
+        """
+        Args:
+            db_path: SQLite file path (":memory:" for tests)
+            write_behind: Persist enqueue_candles() from a background writer thread
+                (ignored for ":memory:", which writes synchronously)
+            pool: Shared connection pool for db_path (created if not given)
+        """
         self.db_path = db_path
-        self._memory_conn = None
+        self._pool = pool or SQLiteConnectionPool(db_path)
+        self._owns_pool = pool is None
+        self._writer: Optional[CandleWriteBehindQueue] = None
+        self._migration_stop = threading.Event()
         self.logger = logging.getLogger(__name__)
         
-        # SOTA FIX: Create parent directory if needed (prevents init failure)
-        if db_path != ":memory:":
-            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-        
-        if db_path == ":memory:":
-            self._memory_conn = sqlite3.connect(":memory:")
         self._init_database()
         
+        if write_behind and db_path != ":memory:":
+            self._writer = CandleWriteBehindQueue(self.save_candles_batch)
+        
         # SOTA: Hinto In-Memory Price Cache (Hot Path)
         # Stores the latest real-time price tick for each symbol.
         # Used by PaperTradingService for sub-second PnL updates without DB latency.
         self._price_cache: dict[str, float] = {}
     
-    @contextmanager
     def _get_connection(self):
-        """Context manager for database connections"""
-        if self._memory_conn:
-            yield self._memory_conn
-        else:
-            conn = sqlite3.connect(self.db_path)
-            try:
-                yield conn
-            finally:
-                conn.close()
+        """Borrow this thread's pooled connection (context manager)"""
+        return self._pool.connection()
     
     def _init_database(self) -> None:
         """
-        Initialize database with default tables.
+        Create the candles table.
         
-        SOTA Multi-Symbol: Creates btcusdt tables for backward compatibility.
-        Other symbol tables are created dynamically via _ensure_table_exists().
+        WITHOUT ROWID stores rows in primary-key order, so per-stream range
+        scans and "latest N" queries read contiguous pages. The
+        (timeframe, ts) index serves retention deletes across all symbols.
         """
-        # Create default btcusdt tables for backward compatibility
-        default_symbols = ['btcusdt']
-        timeframes = ['1m', '15m', '1h']
+        if self.TABLE_NAME in self._pool.known_tables:
+            return
         
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            
-            for symbol in default_symbols:
-                for tf in timeframes:
-                    table = self._get_table_name(symbol, tf)
-                    self._create_table_if_not_exists(cursor, table)
-            
+            cursor.execute(f'''
+                CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                    symbol TEXT NOT NULL,
+                    timeframe TEXT NOT NULL,
+                    ts INTEGER NOT NULL,
+                    open REAL,
+                    high REAL,
+                    low REAL,
+                    close REAL,
+                    volume REAL,
+                    ema_7 REAL,
+                    rsi_6 REAL,
+                    volume_ma_20 REAL,
+                    PRIMARY KEY (symbol, timeframe, ts)
+                ) WITHOUT ROWID
+            ''')
+            cursor.execute(f'''
+                CREATE INDEX IF NOT EXISTS idx_{self.TABLE_NAME}_timeframe_ts
+                ON {self.TABLE_NAME}(timeframe, ts)
+            ''')
             conn.commit()
-            self.logger.debug(f"Initialized database with default tables")
-    
-    def _create_table_if_not_exists(self, cursor, table: str) -> None:
-        """Create OHLCV table if it doesn't exist."""
-        cursor.execute(f'''
-            CREATE TABLE IF NOT EXISTS {table} (
-                timestamp TEXT PRIMARY KEY,
-                open REAL,
-                high REAL,
-                low REAL,
-                close REAL,
-                volume REAL,
-                ema_7 REAL,
-                rsi_6 REAL,
-                volume_ma_20 REAL
-            )
-        ''')
-        cursor.execute(f'''
-            CREATE INDEX IF NOT EXISTS idx_{table}_timestamp 
-            ON {table}(timestamp)
-        ''')
-    
-    def _ensure_table_exists(self, symbol: str, timeframe: str) -> str:
-        """
-        Ensure table exists for symbol/timeframe, create if needed.
-        
-        SOTA Multi-Symbol: Dynamic table creation per symbol.
         
-        Returns:
-            Table name
-        """
-        table = self._get_table_name(symbol, timeframe)
-        
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            # Check if table exists
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-                (table,)
-            )
-            if not cursor.fetchone():
-                self._create_table_if_not_exists(cursor, table)
-                conn.commit()
-                self.logger.info(f"📊 Created new table: {table}")
-        
-        return table
+        self._pool.known_tables.add(self.TABLE_NAME)
+        self.logger.debug("Initialized candles table")
     
     def _get_table_name(self, symbol: str, timeframe: str) -> str:
         """
-        Get table name for symbol and timeframe.
+        Legacy per-stream table name (pre-`candles` layout).
         
-        SOTA Multi-Symbol: Per-symbol tables for data isolation.
         Format: {symbol}_{timeframe} (e.g., ethusdt_15m)
         """
         return f"{symbol.lower()}_{timeframe}"
     
+    @staticmethod
+    def _row_to_market_data(row, timeframe: str) -> MarketData:
+        candle = Candle(
+            timestamp=_from_ms(row[0]),
+            open=row[1], high=row[2], low=row[3],
+            close=row[4], volume=row[5]
+        )
+        indicator = Indicator(ema_7=row[6], rsi_6=row[7], volume_ma_20=row[8])
+        return MarketData(candle, indicator, timeframe)
+    
     def save_candle(self, candle: Candle, indicator: Indicator, timeframe: str, symbol: str = 'btcusdt') -> None:
         """
         Save candle with indicators.
@@ -138,16 +147,16 @@ class SQLiteMarketDataRepository(MarketDataRepository):
             symbol: Trading symbol (default: btcusdt for backward compat)
         """
         try:
-            table = self._ensure_table_exists(symbol, timeframe)
-            
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(f'''
-                    INSERT OR REPLACE INTO {table}
-                    (timestamp, open, high, low, close, volume, ema_7, rsi_6, volume_ma_20)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    INSERT OR REPLACE INTO {self.TABLE_NAME}
+                    (symbol, timeframe, {_CANDLE_COLUMNS})
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', (
-                    candle.timestamp.isoformat(),
+                    symbol.lower(),
+                    timeframe,
+                    _to_ms(candle.timestamp),
                     candle.open,
                     candle.high,
                     candle.low,
@@ -164,7 +173,7 @@ class SQLiteMarketDataRepository(MarketDataRepository):
     def save_market_data(self, market_data: MarketData, symbol: str = 'btcusdt') -> None:
         """Save MarketData object (candle with indicators)"""
         self.save_candle(market_data.candle, market_data.indicator, market_data.timeframe, symbol)
-
+    
     def save_candle_simple(self, candle: Candle, timeframe: str, symbol: str = 'btcusdt') -> None:
         """
         Save candle OHLCV only (without indicators).
@@ -176,85 +185,100 @@ class SQLiteMarketDataRepository(MarketDataRepository):
             timeframe: '1m', '15m', or '1h'
             symbol: Trading symbol (e.g., 'btcusdt', 'ethusdt')
         """
+        self.save_candles_batch([candle], timeframe, symbol)
+        self.logger.debug(f"📦 Persisted {symbol}/{timeframe} candle: {candle.timestamp}")
+    
+    def save_candles_batch(self, candles: List[Candle], timeframe: str, symbol: str = 'btcusdt') -> int:
+        """
+        Save many candles (OHLCV only) with one executemany in one transaction.
+        
+        Args:
+            candles: Candle entities
+            timeframe: '1m', '15m', or '1h'
+            symbol: Trading symbol (e.g., 'btcusdt', 'ethusdt')
+        
+        Returns:
+            Number of candles written
+        """
+        if not candles:
+            return 0
         try:
-            table = self._ensure_table_exists(symbol, timeframe)
+            symbol = symbol.lower()
+            rows = [
+                (symbol, timeframe, _to_ms(c.timestamp), c.open, c.high, c.low, c.close, c.volume)
+                for c in candles
+            ]
             
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(f'''
-                    INSERT OR REPLACE INTO {table}
-                    (timestamp, open, high, low, close, volume, ema_7, rsi_6, volume_ma_20)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    candle.timestamp.isoformat(),
-                    candle.open,
-                    candle.high,
-                    candle.low,
-                    candle.close,
-                    candle.volume,
-                    None,  # ema_7
-                    None,  # rsi_6
-                    None   # volume_ma_20
-                ))
-                conn.commit()
-                self.logger.debug(f"📦 Persisted {symbol}/{timeframe} candle: {candle.timestamp}")
+                with conn:  # single transaction: commit on success, rollback on error
+                    conn.executemany(f'''
+                        INSERT OR REPLACE INTO {self.TABLE_NAME}
+                        (symbol, timeframe, ts, open, high, low, close, volume)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', rows)
+            return len(rows)
         except Exception as e:
-            raise RepositoryError(f"Failed to save simple candle: {e}", e)
+            raise RepositoryError(f"Failed to save candle batch: {e}", e)
+    
+    def enqueue_candles(self, candles: List[Candle], timeframe: str, symbol: str = 'btcusdt') -> None:
+        """
+        Queue candles for the background writer (returns immediately).
+        
+        Falls back to a synchronous batch write when write-behind is off.
+        """
+        if self._writer:
+            self._writer.enqueue(candles, timeframe, symbol)
+        else:
+            self.save_candles_batch(candles, timeframe, symbol)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued candle writes to reach the database."""
+        if self._writer:
+            return self._writer.flush(timeout)
+        return True
+    
+    def stop_migration(self) -> None:
+        """Ask a running migrate_legacy_tables() to return after its current chunk."""
+        self._migration_stop.set()
+    
+    def close(self) -> None:
+        """Drain the background writer (call on shutdown)."""
+        self.stop_migration()
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+        if self._owns_pool:
+            self._pool.close()
+    
+    def get_write_statistics(self) -> dict:
+        """Background writer counters (empty without write-behind)."""
+        return self._writer.get_statistics() if self._writer else {}
     
     def get_latest_candles(self, symbol: str, timeframe: str, limit: int = 100) -> List[MarketData]:
         """
         Get latest N candles for a symbol.
         
-        SOTA Multi-Symbol: Returns data from symbol-specific table.
-        
         Args:
             symbol: Trading symbol (e.g., 'btcusdt', 'ethusdt')
             timeframe: '1m', '15m', or '1h'
             limit: Max candles to return
+        
+        Returns:
+            MarketData list, newest first (empty if nothing is stored -
+            callers fall back to Binance)
         """
         try:
-            table = self._get_table_name(symbol, timeframe)
-            
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                
-                # Check if table exists first
-                cursor.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-                    (table,)
-                )
-                if not cursor.fetchone():
-                    # Table doesn't exist - return empty (Binance fallback will be used)
-                    self.logger.debug(f"Table {table} not found, returning empty")
-                    return []
-                
                 cursor.execute(f'''
-                    SELECT timestamp, open, high, low, close, volume,
-                           ema_7, rsi_6, volume_ma_20
-                    FROM {table}
-                    ORDER BY timestamp DESC
+                    SELECT {_CANDLE_COLUMNS}
+                    FROM {self.TABLE_NAME}
+                    WHERE symbol = ? AND timeframe = ?
+                    ORDER BY ts DESC
                     LIMIT ?
-                ''', (limit,))
+                ''', (symbol.lower(), timeframe, limit))
                 
-                results = []
-                for row in cursor.fetchall():
-                    candle = Candle(
-                        timestamp=datetime.fromisoformat(row[0]),
-                        open=row[1],
-                        high=row[2],
-                        low=row[3],
-                        close=row[4],
-                        volume=row[5]
-                    )
-                    indicator = Indicator(
-                        ema_7=row[6],
-                        rsi_6=row[7],
-                        volume_ma_20=row[8]
-                    )
-                    market_data = MarketData(candle, indicator, timeframe)
-                    results.append(market_data)
-                
-                return results
+                return [self._row_to_market_data(row, timeframe) for row in cursor.fetchall()]
         except Exception as e:
             raise RepositoryError(f"Failed to get candles: {e}", e)
     
@@ -265,34 +289,54 @@ class SQLiteMarketDataRepository(MarketDataRepository):
         end: datetime,
         symbol: str = 'btcusdt'  # SOTA: Added for multi-symbol support
     ) -> List[MarketData]:
-        """Get candles within date range"""
+        """Get candles within date range (inclusive, newest first)"""
         try:
-            table = self._get_table_name(symbol, timeframe)
-            
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(f'''
-                    SELECT timestamp, open, high, low, close, volume,
-                           ema_7, rsi_6, volume_ma_20
-                    FROM {table}
-                    WHERE timestamp BETWEEN ? AND ?
-                    ORDER BY timestamp DESC
-                ''', (start.isoformat(), end.isoformat()))
-                
-                results = []
-                for row in cursor.fetchall():
-                    candle = Candle(
-                        timestamp=datetime.fromisoformat(row[0]),
-                        open=row[1], high=row[2], low=row[3],
-                        close=row[4], volume=row[5]
-                    )
-                    indicator = Indicator(ema_7=row[6], rsi_6=row[7], volume_ma_20=row[8])
-                    results.append(MarketData(candle, indicator, timeframe))
+                    SELECT {_CANDLE_COLUMNS}
+                    FROM {self.TABLE_NAME}
+                    WHERE symbol = ? AND timeframe = ? AND ts BETWEEN ? AND ?
+                    ORDER BY ts DESC
+                ''', (symbol.lower(), timeframe, _to_ms(start), _to_ms(end)))
                 
-                return results
+                return [self._row_to_market_data(row, timeframe) for row in cursor.fetchall()]
         except Exception as e:
             raise RepositoryError(f"Failed to get candles by date range: {e}", e)
     
+    def get_candles_for_symbols(
+        self,
+        symbols: Sequence[str],
+        timeframe: str,
+        start: datetime,
+        end: datetime
+    ) -> Dict[str, List[MarketData]]:
+        """
+        Get candles for several symbols in one query.
+        
+        Returns:
+            {symbol: MarketData list (oldest first)} for every requested symbol
+        """
+        result: Dict[str, List[MarketData]] = {s.lower(): [] for s in symbols}
+        if not result:
+            return result
+        try:
+            placeholders = ", ".join("?" for _ in result)
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f'''
+                    SELECT symbol, {_CANDLE_COLUMNS}
+                    FROM {self.TABLE_NAME}
+                    WHERE symbol IN ({placeholders}) AND timeframe = ? AND ts BETWEEN ? AND ?
+                    ORDER BY symbol, ts
+                ''', (*result, timeframe, _to_ms(start), _to_ms(end)))
+                
+                for row in cursor.fetchall():
+                    result[row[0]].append(self._row_to_market_data(tuple(row)[1:], timeframe))
+            return result
+        except Exception as e:
+            raise RepositoryError(f"Failed to get candles for symbols: {e}", e)
+    
     def get_candle_by_timestamp(
         self,
         timeframe: str,
@@ -301,39 +345,28 @@ class SQLiteMarketDataRepository(MarketDataRepository):
     ) -> Optional[MarketData]:
         """Get specific candle by timestamp"""
         try:
-            table = self._get_table_name(symbol, timeframe)
-            
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(f'''
-                    SELECT timestamp, open, high, low, close, volume,
-                           ema_7, rsi_6, volume_ma_20
-                    FROM {table}
-                    WHERE timestamp = ?
-                ''', (timestamp.isoformat(),))
+                    SELECT {_CANDLE_COLUMNS}
+                    FROM {self.TABLE_NAME}
+                    WHERE symbol = ? AND timeframe = ? AND ts = ?
+                ''', (symbol.lower(), timeframe, _to_ms(timestamp)))
                 
                 row = cursor.fetchone()
-                if not row:
-                    return None
-                
-                candle = Candle(
-                    timestamp=datetime.fromisoformat(row[0]),
-                    open=row[1], high=row[2], low=row[3],
-                    close=row[4], volume=row[5]
-                )
-                indicator = Indicator(ema_7=row[6], rsi_6=row[7], volume_ma_20=row[8])
-                return MarketData(candle, indicator, timeframe)
+                return self._row_to_market_data(row, timeframe) if row else None
         except Exception as e:
             raise RepositoryError(f"Failed to get candle: {e}", e)
     
     def get_record_count(self, timeframe: str, symbol: str = 'btcusdt') -> int:
         """Get total record count"""
         try:
-            table = self._get_table_name(symbol, timeframe)
-            
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(f'SELECT COUNT(*) FROM {table}')
+                cursor.execute(
+                    f'SELECT COUNT(*) FROM {self.TABLE_NAME} WHERE symbol = ? AND timeframe = ?',
+                    (symbol.lower(), timeframe)
+                )
                 return cursor.fetchone()[0]
         except Exception as e:
             raise RepositoryError(f"Failed to get record count: {e}", e)
@@ -341,13 +374,14 @@ class SQLiteMarketDataRepository(MarketDataRepository):
     def get_latest_timestamp(self, timeframe: str, symbol: str = 'btcusdt') -> Optional[datetime]:
         """Get latest timestamp"""
         try:
-            table = self._get_table_name(symbol, timeframe)
-            
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(f'SELECT MAX(timestamp) FROM {table}')
+                cursor.execute(
+                    f'SELECT MAX(ts) FROM {self.TABLE_NAME} WHERE symbol = ? AND timeframe = ?',
+                    (symbol.lower(), timeframe)
+                )
                 result = cursor.fetchone()[0]
-                return datetime.fromisoformat(result) if result else None
+                return _from_ms(result) if result is not None else None
         except Exception as e:
             raise RepositoryError(f"Failed to get latest timestamp: {e}", e)
     
@@ -358,19 +392,37 @@ class SQLiteMarketDataRepository(MarketDataRepository):
         SOTA Multi-Symbol: Now supports per-symbol cleanup.
         """
         try:
-            table = self._get_table_name(symbol, timeframe)
-            
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(f'''
-                    DELETE FROM {table}
-                    WHERE timestamp < ?
-                ''', (before.isoformat(),))
+                    DELETE FROM {self.TABLE_NAME}
+                    WHERE symbol = ? AND timeframe = ? AND ts < ?
+                ''', (symbol.lower(), timeframe, _to_ms(before)))
                 conn.commit()
                 return cursor.rowcount
         except Exception as e:
             raise RepositoryError(f"Failed to delete candles: {e}", e)
     
+    def delete_expired_candles(self, cutoffs: Dict[str, datetime]) -> int:
+        """
+        Apply a retention policy to every symbol with one DELETE.
+        
+        Each `timeframe = ? AND ts < ?` term is a range on the
+        (timeframe, ts) index.
+        """
+        if not cutoffs:
+            return 0
+        try:
+            terms = " OR ".join("(timeframe = ? AND ts < ?)" for _ in cutoffs)
+            params = [value for tf, before in cutoffs.items() for value in (tf, _to_ms(before))]
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f'DELETE FROM {self.TABLE_NAME} WHERE {terms}', params)
+                conn.commit()
+                return cursor.rowcount
+        except Exception as e:
+            raise RepositoryError(f"Failed to delete expired candles: {e}", e)
+    
     def get_database_size(self) -> float:
         """Get database size in MB"""
         try:
@@ -384,6 +436,14 @@ class SQLiteMarketDataRepository(MarketDataRepository):
         except Exception as e:
             raise RepositoryError(f"Failed to get database size: {e}", e)
     
+    def vacuum(self) -> None:
+        """Rebuild the database file to return free pages (blocks writers while it runs)."""
+        try:
+            with self._get_connection() as conn:
+                conn.execute("VACUUM")
+        except Exception as e:
+            raise RepositoryError(f"Failed to vacuum database: {e}", e)
+    
     def backup_database(self, backup_path: str) -> None:
         """Backup database"""
         try:
@@ -401,32 +461,108 @@ class SQLiteMarketDataRepository(MarketDataRepository):
     def get_table_info(self, timeframe: str, symbol: str = 'btcusdt') -> dict:
         """Get table information"""
         try:
-            table = self._get_table_name(symbol, timeframe)
-            
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                
-                # Get record count
-                cursor.execute(f'SELECT COUNT(*) FROM {table}')
-                record_count = cursor.fetchone()[0]
-                
-                # Get latest record
-                cursor.execute(f'SELECT MAX(timestamp) FROM {table}')
-                latest = cursor.fetchone()[0]
-                
-                # Get oldest record
-                cursor.execute(f'SELECT MIN(timestamp) FROM {table}')
-                oldest = cursor.fetchone()[0]
+                cursor.execute(f'''
+                    SELECT COUNT(*), MAX(ts), MIN(ts)
+                    FROM {self.TABLE_NAME}
+                    WHERE symbol = ? AND timeframe = ?
+                ''', (symbol.lower(), timeframe))
+                record_count, latest, oldest = cursor.fetchone()
                 
                 return {
                     'record_count': record_count,
                     'size_mb': self.get_database_size(),
-                    'latest_record': latest,
-                    'oldest_record': oldest
+                    'latest_record': _from_ms(latest).isoformat() if latest is not None else None,
+                    'oldest_record': _from_ms(oldest).isoformat() if oldest is not None else None
                 }
         except Exception as e:
             raise RepositoryError(f"Failed to get table info: {e}", e)
-
+    
+    # Legacy layout migration
+    
+    def get_legacy_tables(self) -> List[str]:
+        """Per-stream tables from the old `{symbol}_{timeframe}` layout."""
+        with self._get_connection() as conn:
+            names = [
+                row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
+                if _LEGACY_TABLE_RE.match(row[0])
+            ]
+            legacy = []
+            for table in names:
+                columns = {info[1] for info in conn.execute(f"PRAGMA table_info({table})")}
+                if {'timestamp', 'open', 'high', 'low', 'close', 'volume'} <= columns:
+                    legacy.append(table)
+            return legacy
+    
+    def migrate_legacy_tables(self, batch_size: int = 5000, drop_legacy: bool = True) -> Dict[str, Dict[str, int]]:
+        """
+        Copy legacy per-stream tables into `candles` (safe while running).
+        
+        Rows are copied in `batch_size` chunks, each its own short
+        transaction, so live writers are only blocked briefly. INSERT OR
+        IGNORE keeps rows already written to `candles` (they are newer).
+        A legacy table is dropped only after all its rows were copied; an
+        interrupted migration simply re-runs. Rows whose timestamp does not
+        parse are skipped and keep their table (never dropped), so they can
+        be fixed by hand. stop_migration() makes it return between chunks
+        (before any further DROP).
+        
+        Returns:
+            {legacy table: {'copied': rows, 'skipped': unparseable rows}}
+        """
+        migrated: Dict[str, Dict[str, int]] = {}
+        for table in self.get_legacy_tables():
+            symbol, timeframe = _LEGACY_TABLE_RE.match(table).groups()
+            copied = skipped = 0
+            last = ''
+            while True:
+                if self._migration_stop.is_set():
+                    self.logger.info(f"📦 Migration stopped at {table} ({copied} rows copied); resumes next start")
+                    return migrated
+                with self._get_connection() as conn:
+                    rows = conn.execute(f'''
+                        SELECT timestamp, open, high, low, close, volume, ema_7, rsi_6, volume_ma_20
+                        FROM {table}
+                        WHERE timestamp > ?
+                        ORDER BY timestamp
+                        LIMIT ?
+                    ''', (last, batch_size)).fetchall()
+                    if not rows:
+                        break
+                    last = rows[-1][0]
+                    
+                    converted = []
+                    for row in rows:
+                        try:
+                            ts = _to_ms(datetime.fromisoformat(str(row[0]).replace('Z', '+00:00')))
+                        except ValueError:
+                            skipped += 1
+                            continue
+                        converted.append((symbol, timeframe, ts, *tuple(row)[1:]))
+                    
+                    with conn:
+                        conn.executemany(f'''
+                            INSERT OR IGNORE INTO {self.TABLE_NAME}
+                            (symbol, timeframe, {_CANDLE_COLUMNS})
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ''', converted)
+                    copied += len(converted)
+            
+            if skipped:
+                self.logger.warning(
+                    f"⚠️ {table}: {skipped} rows with unparseable timestamps not migrated; table kept"
+                )
+            elif drop_legacy and not self._migration_stop.is_set():
+                with self._get_connection() as conn:
+                    with conn:
+                        conn.execute(f"DROP TABLE IF EXISTS {table}")
+            
+            migrated[table] = {'copied': copied, 'skipped': skipped}
+            self.logger.info(f"📦 Migrated {table} -> {self.TABLE_NAME}: {copied} rows")
+        
+        return migrated
+    
     def update_realtime_price(self, symbol: str, price: float) -> None:
         """
         Update the real-time price cache for a symbol.
@@ -437,7 +573,7 @@ class SQLiteMarketDataRepository(MarketDataRepository):
         """
         if symbol and price > 0:
             self._price_cache[symbol.lower()] = price
-
+    
     def get_realtime_price(self, symbol: str) -> float:
         """
         Get the latest real-time price from cache.
@@ -1,10 +1,12 @@
-import sqlite3
+import asyncio
+import functools
 import json
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
 from datetime import datetime
-from contextlib import contextmanager
 from src.domain.entities.paper_position import PaperPosition
 from src.domain.repositories.i_order_repository import IOrderRepository
+from .sqlite_connection_pool import SQLiteConnectionPool
 
 
 def _parse_datetime(value) -> Optional[datetime]:
@@ -45,8 +47,12 @@ def _parse_datetime(value) -> Optional[datetime]:
 class SQLiteOrderRepository(IOrderRepository):
     """SQLite implementation of Position Repository (Futures)"""
     
-    def __init__(self, db_path: str = "data/trading_system.db"):
+    def __init__(self, db_path: str = "data/trading_system.db", pool: Optional[SQLiteConnectionPool] = None):
         self.db_path = db_path
+        self._pool = pool or SQLiteConnectionPool(db_path)
+        # One I/O thread: awaitable calls are serialized in submit order and
+        # reuse that thread's pooled connection
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='order-repo-io')
         self._init_tables()
 
     def _init_tables(self) -> None:
@@ -106,73 +112,107 @@ class SQLiteOrderRepository(IOrderRepository):
             
             conn.commit()
 
-    @contextmanager
     def _get_connection(self):
-        """Context manager for database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """Borrow this thread's pooled connection (context manager, rows are sqlite3.Row)"""
+        return self._pool.connection()
+
+    async def run_io(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run blocking repository work on the dedicated order I/O thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_executor, functools.partial(fn, *args))
+
+    def close(self) -> None:
+        """Finish queued I/O calls and stop the I/O thread"""
+        self._io_executor.shutdown(wait=True)
+
+    _INSERT_SQL = '''
+        INSERT OR REPLACE INTO paper_positions (
+            id, symbol, side, status, entry_price, quantity, 
+            leverage, margin, liquidation_price,
+            stop_loss, take_profit, 
+            open_time, close_time, realized_pnl, exit_reason,
+            highest_price, lowest_price
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+    _UPDATE_SQL = '''
+        UPDATE paper_positions SET
+            status = ?,
+            close_time = ?,
+            realized_pnl = ?,
+            exit_reason = ?,
+            entry_price = ?,
+            quantity = ?,
+            margin = ?,
+            liquidation_price = ?,
+            stop_loss = ?,
+            highest_price = ?,
+            lowest_price = ?
+        WHERE id = ?
+    '''
+
+    @staticmethod
+    def _insert_params(position: PaperPosition) -> tuple:
+        return (
+            position.id, position.symbol, position.side, position.status, 
+            position.entry_price, position.quantity, 
+            position.leverage, position.margin, position.liquidation_price,
+            position.stop_loss, position.take_profit, 
+            position.open_time.isoformat(), 
+            position.close_time.isoformat() if position.close_time else None, 
+            position.realized_pnl, position.exit_reason,
+            position.highest_price, position.lowest_price
+        )
+
+    @staticmethod
+    def _update_params(position: PaperPosition) -> tuple:
+        return (
+            position.status,
+            position.close_time.isoformat() if position.close_time else None,
+            position.realized_pnl,
+            position.exit_reason,
+            position.entry_price,
+            position.quantity,
+            position.margin,
+            position.liquidation_price,
+            position.stop_loss,
+            position.highest_price,
+            position.lowest_price,
+            position.id
+        )
 
     def save_order(self, position: PaperPosition) -> None:
         """Save a new position (or replace if exists)"""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO paper_positions (
-                    id, symbol, side, status, entry_price, quantity, 
-                    leverage, margin, liquidation_price,
-                    stop_loss, take_profit, 
-                    open_time, close_time, realized_pnl, exit_reason,
-                    highest_price, lowest_price
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                position.id, position.symbol, position.side, position.status, 
-                position.entry_price, position.quantity, 
-                position.leverage, position.margin, position.liquidation_price,
-                position.stop_loss, position.take_profit, 
-                position.open_time.isoformat(), 
-                position.close_time.isoformat() if position.close_time else None, 
-                position.realized_pnl, position.exit_reason,
-                position.highest_price, position.lowest_price
-            ))
+            conn.execute(self._INSERT_SQL, self._insert_params(position))
             conn.commit()
 
     def update_order(self, position: PaperPosition) -> None:
         """Update an existing position"""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE paper_positions SET
-                    status = ?,
-                    close_time = ?,
-                    realized_pnl = ?,
-                    exit_reason = ?,
-                    entry_price = ?,
-                    quantity = ?,
-                    margin = ?,
-                    liquidation_price = ?,
-                    stop_loss = ?,
-                    highest_price = ?,
-                    lowest_price = ?
-                WHERE id = ?
-            ''', (
-                position.status,
-                position.close_time.isoformat() if position.close_time else None,
-                position.realized_pnl,
-                position.exit_reason,
-                position.entry_price,
-                position.quantity,
-                position.margin,
-                position.liquidation_price,
-                position.stop_loss,
-                position.highest_price,
-                position.lowest_price,
-                position.id
-            ))
+            conn.execute(self._UPDATE_SQL, self._update_params(position))
+            conn.commit()
+
+    def apply_batch(
+        self,
+        saved: List[PaperPosition],
+        updated: List[PaperPosition],
+        balance: Optional[float] = None
+    ) -> int:
+        """
+        Write a journal batch in one transaction: saves (INSERT OR REPLACE),
+        then updates, then the wallet balance.
+        
+        Returns:
+            Number of position rows written
+        """
+        with self._get_connection() as conn:
+            conn.executemany(self._INSERT_SQL, [self._insert_params(p) for p in saved])
+            conn.executemany(self._UPDATE_SQL, [self._update_params(p) for p in updated])
+            if balance is not None:
+                conn.execute('UPDATE paper_account SET balance = ? WHERE id = 1', (balance,))
             conn.commit()
+        return len(saved) + len(updated)
 
     def get_order(self, position_id: str) -> Optional[PaperPosition]:
         """Get position by ID"""
@@ -4,16 +4,15 @@ SQLiteStateRepository - Infrastructure Layer
 SQLite implementation of IStateRepository for state persistence.
 """
 
-import sqlite3
 import logging
 import json
 from datetime import datetime
 from typing import Optional
-from pathlib import Path
 
 from ...domain.repositories.i_state_repository import IStateRepository
 from ...domain.entities.state_models import PersistedState
 from ...domain.state_machine import SystemState
+from .sqlite_connection_pool import SQLiteConnectionPool
 
 
 class SQLiteStateRepository(IStateRepository):
@@ -38,27 +37,31 @@ class SQLiteStateRepository(IStateRepository):
     
     TABLE_NAME = "trading_state"
     
-    def __init__(self, db_path: str = "data/trading_system.db"):
+    def __init__(self, db_path: str = "data/trading_system.db", pool: Optional[SQLiteConnectionPool] = None):
         """
         Initialize SQLite state repository.
         
         Args:
             db_path: Path to SQLite database file
+            pool: Shared connection pool for db_path (created if not given,
+                which also creates the parent directory)
         """
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
-        
-        # Ensure directory exists
-        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._pool = pool or SQLiteConnectionPool(db_path)
         
         # Initialize database
         self._init_db()
         
         self.logger.info(f"SQLiteStateRepository initialized: {db_path}")
     
+    def _get_connection(self):
+        """Borrow this thread's pooled connection (context manager)."""
+        return self._pool.connection()
+    
     def _init_db(self) -> None:
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
@@ -80,7 +83,7 @@ class SQLiteStateRepository(IStateRepository):
         Uses UPSERT (INSERT OR REPLACE) to handle both new and existing states.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(f"""
                     INSERT OR REPLACE INTO {self.TABLE_NAME}
@@ -109,7 +112,7 @@ class SQLiteStateRepository(IStateRepository):
         Load persisted state from SQLite.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(f"""
                     SELECT state, order_id, position_id, cooldown_remaining, timestamp
@@ -146,7 +149,7 @@ class SQLiteStateRepository(IStateRepository):
         Delete persisted state from SQLite.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(f"""
                     DELETE FROM {self.TABLE_NAME}
@@ -166,7 +169,7 @@ class SQLiteStateRepository(IStateRepository):
         Check if state exists for symbol.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(f"""
                     SELECT 1 FROM {self.TABLE_NAME}
@@ -10,11 +10,11 @@ import json
 import logging
 from datetime import datetime, timedelta
 from typing import List, Optional
-from pathlib import Path
 
 from src.domain.entities.trading_signal import TradingSignal, SignalType
 from src.domain.value_objects.signal_status import SignalStatus
 from src.domain.repositories.i_signal_repository import ISignalRepository
+from src.infrastructure.persistence.sqlite_connection_pool import SQLiteConnectionPool
 
 
 class NumpyJSONEncoder(json.JSONEncoder):
@@ -59,28 +59,32 @@ class SQLiteSignalRepository(ISignalRepository):
     the existing paper_trading.db database.
     """
     
-    def __init__(self, db_path: str = "data/paper_trading.db"):
+    def __init__(self, db_path: str = "data/paper_trading.db", pool: Optional[SQLiteConnectionPool] = None):
         """
         Initialize repository with database path.
         
         Args:
             db_path: Path to SQLite database file
+            pool: Shared connection pool for db_path (created if not given)
         """
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
+        self._pool = pool or SQLiteConnectionPool(db_path)
         self._ensure_table()
         self.logger.info(f"SQLiteSignalRepository initialized: {db_path}")
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Borrow this thread's pooled connection (row factory: sqlite3.Row)."""
+        return self._pool.acquire()
+    
+    def _release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection from _get_connection() to the pool."""
+        self._pool.release(conn)
     
     def _ensure_table(self) -> None:
         """Create signals table if not exists."""
-        # Ensure data directory exists
-        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        if 'signals' in self._pool.known_tables:
+            return
         
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -161,7 +165,8 @@ class SQLiteSignalRepository(ISignalRepository):
             self.logger.error(f"Migration check failed: {e}")
         
         conn.commit()
-        conn.close()
+        self._release(conn)
+        self._pool.known_tables.add('signals')
 
     
     def save(self, signal: TradingSignal) -> None:
@@ -211,7 +216,7 @@ class SQLiteSignalRepository(ISignalRepository):
             self.logger.error(f"Error saving signal: {e}")
             raise
         finally:
-            conn.close()
+            self._release(conn)
     
     def update(self, signal: TradingSignal) -> None:
         """Update existing signal."""
@@ -245,7 +250,7 @@ class SQLiteSignalRepository(ISignalRepository):
             self.logger.error(f"Error updating signal: {e}")
             raise
         finally:
-            conn.close()
+            self._release(conn)
     
     def get_by_id(self, signal_id: str) -> Optional[TradingSignal]:
         """Get signal by ID."""
@@ -261,7 +266,7 @@ class SQLiteSignalRepository(ISignalRepository):
             return None
             
         finally:
-            conn.close()
+            self._release(conn)
     
     def get_by_status(
         self, 
@@ -284,7 +289,7 @@ class SQLiteSignalRepository(ISignalRepository):
             return [self._row_to_signal(row) for row in rows]
             
         finally:
-            conn.close()
+            self._release(conn)
     
     def get_by_order_id(self, order_id: str) -> Optional[TradingSignal]:
         """Get signal linked to an order."""
@@ -300,7 +305,7 @@ class SQLiteSignalRepository(ISignalRepository):
             return None
             
         finally:
-            conn.close()
+            self._release(conn)
     
     def get_history(
         self,
@@ -334,7 +339,7 @@ class SQLiteSignalRepository(ISignalRepository):
             return [self._row_to_signal(row) for row in rows]
             
         finally:
-            conn.close()
+            self._release(conn)
     
     def get_pending_count(self) -> int:
         """Count pending signals."""
@@ -349,7 +354,7 @@ class SQLiteSignalRepository(ISignalRepository):
             return cursor.fetchone()[0]
             
         finally:
-            conn.close()
+            self._release(conn)
     
     def get_total_count(
         self,
@@ -376,7 +381,7 @@ class SQLiteSignalRepository(ISignalRepository):
             return cursor.fetchone()[0]
             
         finally:
-            conn.close()
+            self._release(conn)
     
     def get_filtered_history(
         self,
@@ -441,7 +446,7 @@ class SQLiteSignalRepository(ISignalRepository):
             return [self._row_to_signal(row) for row in rows]
             
         finally:
-            conn.close()
+            self._release(conn)
     
     def get_filtered_count(
         self,
@@ -495,7 +500,7 @@ class SQLiteSignalRepository(ISignalRepository):
             return cursor.fetchone()[0]
             
         finally:
-            conn.close()
+            self._release(conn)
 
     def expire_old_pending(self, ttl_seconds: int = 300) -> int:
         """Expire pending signals older than TTL."""
@@ -524,7 +529,7 @@ class SQLiteSignalRepository(ISignalRepository):
             return count
             
         finally:
-            conn.close()
+            self._release(conn)
     
     def _row_to_signal(self, row: sqlite3.Row) -> TradingSignal:
         """Convert database row to TradingSignal entity."""
@@ -5,13 +5,18 @@ Real-time data streaming components.
 """
 
 from .binance_websocket_client import BinanceWebSocketClient, ConnectionStatus, ConnectionState
-from .message_parser import BinanceMessageParser
+from .message_parser import BinanceMessageParser, KlineRecord
 from .binance_book_ticker_client import BinanceBookTickerClient
+from .stream_capture import StreamRecorder, StreamReplayer, read_capture
 
 __all__ = [
     'BinanceWebSocketClient',
     'ConnectionStatus',
     'ConnectionState',
     'BinanceMessageParser',
+    'KlineRecord',
     'BinanceBookTickerClient',
+    'StreamRecorder',
+    'StreamReplayer',
+    'read_capture',
 ]
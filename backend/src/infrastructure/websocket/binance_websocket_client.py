@@ -7,6 +7,7 @@ WebSocket client for real-time Binance market data streaming.
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Optional, Callable, Dict, Any
 from dataclasses import dataclass
@@ -23,6 +24,7 @@ except ImportError:
 
 from .message_parser import BinanceMessageParser
 from ...domain.entities.candle import Candle
+from ...utils.latency_probe import get_latency_probe, reset_ingress, set_ingress
 
 
 class ConnectionState(Enum):
@@ -93,8 +95,11 @@ class BinanceWebSocketClient:
         self._should_run = False
         self._receive_task: Optional[asyncio.Task] = None
         
-        # Message parser
-        self._parser = BinanceMessageParser()
+        # Message parser (exchange klines are trusted: no Candle re-validation)
+        self._parser = BinanceMessageParser(trusted=True)
+        
+        # Optional raw message recorder (StreamRecorder)
+        self._recorder = None
         
         # Connection parameters (for reconnection)
         self._symbol: Optional[str] = None
@@ -238,6 +243,8 @@ class BinanceWebSocketClient:
                 # Receive message
                 message = await self._websocket.recv()
                 # print(f"DEBUG: Received message: {message[:50]}...") # Uncomment for extreme debug
+                if self._recorder is not None:
+                    self._recorder.record(message)
                 
                 # Update last update time
                 self._last_update = datetime.now()
@@ -323,9 +330,27 @@ class BinanceWebSocketClient:
         SOTA: Handles both single stream and combined stream formats.
         Combined stream format: {"stream": "btcusdt@kline_15m", "data": {...}}
         
+        Fast path: kline frames are decoded in one pass into a KlineRecord
+        (see BinanceMessageParser.parse_stream); raw-message subscribers,
+        non-kline and malformed frames take the dict-based path below.
+        
         Args:
             message: Raw JSON message from WebSocket
         """
+        probe = get_latency_probe()
+        started = time.perf_counter() if probe else 0.0
+        if not self._message_callbacks:
+            parsed = self._parser.parse_stream(message)
+            if parsed is not None:
+                record, candle, metadata = parsed
+                if record.event_time:
+                    self._latency_ms = int(time.time() * 1000 - record.event_time)
+                await self._deliver(candle, metadata, record.interval, probe, started)
+                return
+        await self._process_message_dict(message, probe, started)
+    
+    async def _process_message_dict(self, message: str, probe, started: float) -> None:
+        """Dict-based parsing with structure validation (and raw-message callbacks)."""
         try:
             raw_data = json.loads(message)
             
@@ -369,24 +394,56 @@ class BinanceWebSocketClient:
                 except Exception as e:
                     self.logger.error(f"Error in message callback: {e}")
             
-            # Notify candle callbacks if parsing successful
-            if candle:
-                # SOTA: Log with interval info
-                self.logger.info(f"📊 [{interval}] Candle: {candle.close:.2f} - notifying {len(self._candle_callbacks)} callbacks")
-                for callback in self._candle_callbacks:
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(candle, metadata)
-                        else:
-                            callback(candle, metadata)
-                    except Exception as e:
-                        self.logger.error(f"Error in candle callback: {e}", exc_info=True)
+            await self._deliver(candle, metadata, interval, probe, started)
         
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse message: {e}")
         except Exception as e:
             self.logger.error(f"Error processing message: {e}")
     
+    async def _deliver(self, candle: Optional[Candle], metadata: Dict[str, Any], interval: str, probe, started: float) -> None:
+        """Notify candle callbacks (timing parse/dispatch when a probe is installed)."""
+        if not probe:
+            await self._dispatch(candle, metadata, interval)
+            return
+        probe.since('parse', started)
+        parsed = time.perf_counter()
+        token = set_ingress(started)
+        try:
+            await self._dispatch(candle, metadata, interval)
+        finally:
+            reset_ingress(token)
+            probe.since('dispatch', parsed)
+    
+    async def _dispatch(self, candle: Optional[Candle], metadata: Dict[str, Any], interval: str) -> None:
+        """Notify candle callbacks if parsing was successful."""
+        if not candle:
+            return
+        # SOTA: Log with interval info (lazy: this runs for every tick)
+        self.logger.debug("📊 [%s] Candle: %.2f - notifying %d callbacks", interval, candle.close, len(self._candle_callbacks))
+        for callback in self._candle_callbacks:
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    await callback(candle, metadata)
+                else:
+                    callback(candle, metadata)
+            except Exception as e:
+                self.logger.error(f"Error in candle callback: {e}", exc_info=True)
+    
+    async def feed_message(self, message: str) -> None:
+        """
+        Process a raw stream message as if it had been received.
+        
+        Entry point for StreamReplayer: replayed messages take the same
+        parse/dispatch path as live ones.
+        """
+        self._last_update = datetime.now()
+        await self._process_message(message)
+    
+    def set_recorder(self, recorder) -> None:
+        """Record raw received messages to a StreamRecorder (None: stop)."""
+        self._recorder = recorder
+    
     async def _notify_connection_status(self) -> None:
         """Notify all connection status callbacks"""
         status = self.get_connection_status()
@@ -2,15 +2,51 @@
 Message Parser - Infrastructure Layer
 
 Parses Binance WebSocket messages and converts them to domain entities.
+
+Two paths:
+- parse_kline_message / extract_metadata: validated parsing of an
+  already-decoded message dict (REST-style callers, tests)
+- parse_stream_message: hot path for raw stream frames. Decodes once
+  (orjson when installed), reads the kline fields in a single pass into
+  a compact KlineRecord, and builds the Candle without re-validation
+  when the source is trusted (exchange data). Bar open times repeat for
+  every tick of a bar, so their datetimes are cached.
 """
 
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional, Tuple, Union
+import json
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ...domain.entities.candle import Candle
 
 
+JSON_DECODER = 'orjson' if orjson is not None else 'json'
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+class KlineRecord(NamedTuple):
+    """One kline update, decoded from a stream frame (times in epoch ms)."""
+    symbol: str          # lowercase, e.g. 'btcusdt'
+    interval: str        # e.g. '1m'
+    open_time: int
+    event_time: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    is_closed: bool
+    first_trade_id: Optional[int]
+    last_trade_id: Optional[int]
+    number_of_trades: int
+
+
 class BinanceMessageParser:
     """
     Parser for Binance WebSocket kline/candle messages.
@@ -19,9 +55,84 @@ class BinanceMessageParser:
     into domain Candle entities.
     """
     
-    def __init__(self):
-        """Initialize message parser"""
+    # Bar open times kept in the datetime cache (cleared when full)
+    TIMESTAMP_CACHE_SIZE = 4096
+    
+    def __init__(self, trusted: bool = False):
+        """
+        Initialize message parser
+        
+        Args:
+            trusted: Skip Candle validation on the stream fast path
+                (exchange data); message structure is still required
+        """
+        self.trusted = trusted
         self.logger = logging.getLogger(__name__)
+        self._timestamps: Dict[int, datetime] = {}
+    
+    def parse_stream_message(self, raw: Union[str, bytes]) -> Optional[KlineRecord]:
+        """
+        Decode a raw stream frame (combined or single stream) into a KlineRecord.
+        
+        Returns:
+            None for non-kline frames and malformed klines
+        """
+        try:
+            payload = _loads(raw)
+            data = payload.get('data', payload)
+            if data.get('e') != 'kline':
+                return None
+            k = data['k']
+            return KlineRecord(
+                k['s'].lower(), k['i'], k['t'], data.get('E', 0),
+                float(k['o']), float(k['h']), float(k['l']), float(k['c']), float(k['v']),
+                k.get('x', False), k.get('f'), k.get('L'), k.get('n', 0),
+            )
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            # orjson.JSONDecodeError is a ValueError
+            self.logger.error(f"Malformed stream message: {e}")
+            return None
+    
+    def to_candle(self, record: KlineRecord) -> Optional[Candle]:
+        """Candle for a record (validated unless the parser is trusted)."""
+        timestamp = self._timestamps.get(record.open_time)
+        if timestamp is None:
+            if len(self._timestamps) >= self.TIMESTAMP_CACHE_SIZE:
+                self._timestamps.clear()
+            timestamp = self._timestamps[record.open_time] = \
+                datetime.fromtimestamp(record.open_time / 1000, tz=timezone.utc)
+        
+        if self.trusted:
+            return Candle.trusted(timestamp, record.open, record.high, record.low, record.close, record.volume)
+        try:
+            return Candle(timestamp, record.open, record.high, record.low, record.close, record.volume)
+        except ValueError as e:
+            self.logger.error(f"Validation error parsing kline: {e}")
+            return None
+    
+    @staticmethod
+    def record_metadata(record: KlineRecord) -> Dict[str, Any]:
+        """Same keys as extract_metadata(), from a record."""
+        return {
+            'event_type': 'kline',
+            'event_time': datetime.fromtimestamp(record.event_time / 1000, tz=timezone.utc),
+            'symbol': record.symbol,
+            'interval': record.interval,
+            'is_closed': record.is_closed,
+            'first_trade_id': record.first_trade_id,
+            'last_trade_id': record.last_trade_id,
+            'number_of_trades': record.number_of_trades,
+        }
+    
+    def parse_stream(self, raw: Union[str, bytes]) -> Optional[Tuple[KlineRecord, Candle, Dict[str, Any]]]:
+        """parse_stream_message + to_candle + record_metadata in one call."""
+        record = self.parse_stream_message(raw)
+        if record is None:
+            return None
+        candle = self.to_candle(record)
+        if candle is None:
+            return None
+        return record, candle, self.record_metadata(record)
     
     def parse_kline_message(self, message: Dict[str, Any]) -> Optional[Candle]:
         """
@@ -9,6 +9,10 @@ Usage:
     client.register_handler('btcusdt', my_callback)
     client.register_handler('ethusdt', other_callback)
     await client.connect()  # 1 connection for ALL symbols
+
+Record / replay (load testing without Binance):
+    client.start_recording('capture.jsonl.gz')   # while connected
+    report = await client.replay('capture.jsonl.gz', speed=10)
 """
 
 import asyncio
@@ -17,7 +21,9 @@ from typing import Callable, Dict, List, Optional, Any
 from datetime import datetime
 
 from .binance_websocket_client import BinanceWebSocketClient, ConnectionStatus
+from .stream_capture import StreamRecorder, StreamReplayer
 from ...domain.entities.candle import Candle
+from ...utils.latency_probe import get_latency_probe, install_latency_probe, uninstall_latency_probe
 
 
 class SharedBinanceClient:
@@ -54,6 +60,7 @@ class SharedBinanceClient:
         self._symbols: List[str] = []
         self._intervals: List[str] = ['1m', '15m', '1h']  # Default timeframes
         self._is_running = False
+        self._recorder: Optional[StreamRecorder] = None
         self.logger = logging.getLogger(__name__)
         
         # Subscribe to client callbacks and route to handlers
@@ -109,6 +116,55 @@ class SharedBinanceClient:
         """Disconnect from Binance"""
         self._is_running = False
         await self._client.disconnect()
+        self.stop_recording()
+    
+    def start_recording(self, path: str) -> StreamRecorder:
+        """Append every raw combined-stream message (with receive time) to `path`."""
+        self.stop_recording()
+        self._recorder = StreamRecorder(path)
+        self._client.set_recorder(self._recorder)
+        self.logger.info(f"⏺️ Recording combined streams to {path}")
+        return self._recorder
+    
+    def stop_recording(self) -> Optional[Dict[str, Any]]:
+        """Stop recording; returns the recorder statistics (None if not recording)."""
+        recorder, self._recorder = self._recorder, None
+        if recorder is None:
+            return None
+        self._client.set_recorder(None)
+        recorder.close()
+        stats = recorder.get_statistics()
+        self.logger.info(f"⏹️ Recorded {stats['written']} messages to {stats['path']} ({stats['dropped']} dropped)")
+        return stats
+    
+    async def replay(self, path: str, speed: Optional[float] = 1.0, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Drive the registered handlers from a capture instead of Binance.
+        
+        Messages go through the same parser and routing as live data. Stage
+        latencies are collected for the run; install a probe beforehand
+        (install_latency_probe) to also capture stages that finish after
+        this returns, e.g. EventBus broadcasts.
+        
+        Args:
+            path: Capture written by start_recording()
+            speed: 1.0 = recorded pace, N = N times faster, None = max speed
+            limit: Replay at most this many messages
+            
+        Returns:
+            Replay report with per-stage latency percentiles under 'stages'
+        """
+        probe = get_latency_probe()
+        own_probe = probe is None
+        if own_probe:
+            probe = install_latency_probe()
+        try:
+            report = await StreamReplayer(path, speed).run(self._client.feed_message, limit=limit)
+        finally:
+            if own_probe:
+                uninstall_latency_probe()
+        report['stages'] = probe.get_statistics()
+        return report
     
     def _route_candle(self, candle: Candle, metadata: Dict[str, Any]) -> None:
         """Route candle data to the correct symbol handler"""
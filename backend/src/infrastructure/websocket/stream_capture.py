@@ -0,0 +1,232 @@
+"""
+Stream Capture - record and replay raw Binance combined-stream messages.
+
+Recording: StreamRecorder appends every raw message with its receive time
+(epoch seconds) to a gzip file, one "<received_at>\\t<message>" line per
+message. Each recording session appends a new gzip member, so a capture
+can be extended across restarts and is readable by any gzip tool. The
+writer runs on its own thread; the receive loop only enqueues.
+
+Replay: StreamReplayer feeds a capture back through a sink (normally
+BinanceWebSocketClient.feed_message, i.e. the real BinanceMessageParser
+and candle callbacks) at the recorded pace (speed=1), N times faster
+(speed=N) or as fast as the pipeline accepts (speed=None).
+"""
+
+import asyncio
+import gzip
+import logging
+import queue
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+def read_capture(path: str) -> Iterator[Tuple[float, str]]:
+    """
+    Yield (received_at, raw_message) from a capture file.
+
+    A truncated last gzip member (recorder killed mid-write) ends the
+    iteration instead of raising.
+    """
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                received_at, sep, message = line.rstrip('\n').partition('\t')
+                if not sep:
+                    continue
+                try:
+                    yield float(received_at), message
+                except ValueError:
+                    continue
+    except EOFError:
+        logger.warning(f"Capture {path} ends with a truncated block, replaying what was flushed")
+
+
+class StreamRecorder:
+    """
+    Append-only compressed recorder for raw stream messages.
+
+    - record() never blocks the receive loop; when the writer falls
+      `max_queue` messages behind, new messages are dropped and counted.
+    - The gzip stream is sync-flushed every `flush_interval` seconds, so
+      a crash loses at most that much of the capture.
+
+    Usage:
+        recorder = StreamRecorder('captures/2026-01-05.jsonl.gz')
+        client.set_recorder(recorder)
+        ...
+        recorder.close()
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0, max_queue: int = 100_000):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._stats = {'recorded': 0, 'written': 0, 'dropped': 0, 'bytes': 0}
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        # Open on the caller's thread so a bad path fails fast
+        self._file = gzip.open(path, 'at', encoding='utf-8')
+        self._thread = threading.Thread(target=self._run, name="stream-recorder", daemon=True)
+        self._thread.start()
+
+    def record(self, message: Any, received_at: Optional[float] = None) -> bool:
+        """
+        Queue one raw message (str or bytes).
+
+        Returns:
+            False if the recorder is closed or the message was dropped
+        """
+        if self._closed:
+            return False
+        if isinstance(message, (bytes, bytearray)):
+            message = message.decode('utf-8', errors='replace')
+        entry = (time.time() if received_at is None else received_at, message)
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self._count('dropped')
+            return False
+        self._count('recorded')
+        return True
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until everything recorded so far is written and flushed."""
+        if self._closed or not self._thread.is_alive():
+            return self._queue.empty()
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Write the remaining messages and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['queued'] = self._queue.qsize()
+        stats['path'] = self.path
+        return stats
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    # Writer thread
+
+    def _run(self) -> None:
+        next_flush = time.monotonic() + self.flush_interval
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=max(0.0, next_flush - time.monotonic()))
+                except queue.Empty:
+                    item = None
+
+                if isinstance(item, tuple):
+                    received_at, message = item
+                    line = f"{received_at:.6f}\t{message}\n"
+                    self._file.write(line)
+                    self._count('written')
+                    self._count('bytes', len(line))
+                    if time.monotonic() < next_flush:
+                        continue
+
+                self._file.flush()
+                next_flush = time.monotonic() + self.flush_interval
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is _STOP:
+                    return
+        except Exception as e:
+            logger.error(f"Stream recorder stopped writing {self.path}: {e}")
+        finally:
+            self._file.close()
+
+
+class StreamReplayer:
+    """
+    Replays a capture into the live pipeline.
+
+    Timing follows the recorded receive times divided by `speed`; messages
+    that could not be delivered on schedule are sent immediately and their
+    lateness is reported (a pipeline that cannot keep up at 1x shows a
+    growing lag). With speed=None the replayer only yields to the event
+    loop between messages, which measures maximum throughput.
+
+    Usage:
+        replayer = StreamReplayer('capture.jsonl.gz', speed=10)
+        report = await replayer.run(client.feed_message)
+        report['messages_per_second'], report['lag_p99_ms']
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0):
+        if speed is not None and speed <= 0:
+            raise ValueError(f"speed must be positive or None (max speed), got {speed}")
+        self.path = path
+        self.speed = speed
+
+    async def run(self, sink: Callable[[str], Awaitable[None]], limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Deliver the capture to `sink` (awaited per message).
+
+        Args:
+            sink: Async callable receiving each raw message
+            limit: Stop after this many messages
+
+        Returns:
+            Throughput and schedule-lag report
+        """
+        lags: List[float] = []
+        messages = errors = 0
+        first_recorded: Optional[float] = None
+        started = time.perf_counter()
+
+        for received_at, message in read_capture(self.path):
+            if limit is not None and messages >= limit:
+                break
+            if self.speed is None:
+                await asyncio.sleep(0)
+            else:
+                if first_recorded is None:
+                    first_recorded = received_at
+                due = started + (received_at - first_recorded) / self.speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                lags.append(max(0.0, time.perf_counter() - due))
+
+            try:
+                await sink(message)
+            except Exception as e:
+                errors += 1
+                logger.error(f"Replay sink failed: {e}")
+            messages += 1
+
+        elapsed = time.perf_counter() - started
+        report = {
+            'path': self.path,
+            'speed': self.speed,
+            'messages': messages,
+            'errors': errors,
+            'duration_s': round(elapsed, 3),
+            'messages_per_second': round(messages / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+        if lags:
+            lags.sort()
+            report['lag_p50_ms'] = round(lags[len(lags) // 2] * 1000, 3)
+            report['lag_p99_ms'] = round(lags[min(len(lags) - 1, int(len(lags) * 0.99))] * 1000, 3)
+            report['lag_max_ms'] = round(lags[-1] * 1000, 3)
+        logger.info(f"▶️ Replayed {messages} messages from {self.path} in {elapsed:.2f}s")
+        return report
@@ -0,0 +1,118 @@
+"""
+Latency probe for the real-time pipeline.
+
+Stage timings (seconds, from time.perf_counter) are collected only while a
+probe is installed, so the live path pays one module-global read per stage
+when profiling is off.
+
+Stages recorded by the pipeline:
+- parse: raw message -> Candle + metadata (BinanceWebSocketClient)
+- dispatch: candle handlers (SharedBinanceClient -> RealtimeService ->
+  aggregator -> signal generation)
+- bus_queue: EventBus publish -> worker pick-up
+- broadcast: WebSocketManager.broadcast()
+- end_to_end: message ingress -> broadcast done, for events published
+  while that message was being dispatched
+
+The ingress time of the message being dispatched is kept in a context
+variable, so events published synchronously from its handlers can be
+traced back to it.
+"""
+
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from typing import Deque, Dict, Optional
+
+
+_ingress: ContextVar[Optional[float]] = ContextVar('pipeline_ingress', default=None)
+
+
+def set_ingress(started: float) -> Token:
+    """Mark the message being dispatched (perf_counter timestamp)."""
+    return _ingress.set(started)
+
+
+def reset_ingress(token: Token) -> None:
+    _ingress.reset(token)
+
+
+def current_ingress() -> Optional[float]:
+    """Ingress time of the message being dispatched (None outside dispatch)."""
+    return _ingress.get()
+
+
+class LatencyProbe:
+    """
+    Bounded per-stage latency samples with percentile summaries.
+
+    Usage:
+        probe = install_latency_probe()
+        ...  # replay / load test
+        probe.get_statistics()['end_to_end']['p99_ms']
+        uninstall_latency_probe()
+    """
+
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self, window: int = 100_000):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.window)
+                self._counts[stage] = 0
+            samples.append(seconds)
+            self._counts[stage] += 1
+
+    def since(self, stage: str, started: float) -> None:
+        """Record the time elapsed since a perf_counter timestamp."""
+        self.record(stage, time.perf_counter() - started)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+    def get_statistics(self) -> Dict[str, Dict[str, float]]:
+        """Per stage: count, p50/p90/p99/max in milliseconds (over the window)."""
+        with self._lock:
+            snapshot = {stage: sorted(samples) for stage, samples in self._samples.items()}
+            counts = dict(self._counts)
+
+        stats = {}
+        for stage, samples in snapshot.items():
+            if not samples:
+                continue
+            entry = {'count': counts[stage]}
+            for p in self.PERCENTILES:
+                index = min(len(samples) - 1, int(len(samples) * p / 100))
+                entry[f'p{p}_ms'] = round(samples[index] * 1000, 3)
+            entry['max_ms'] = round(samples[-1] * 1000, 3)
+            stats[stage] = entry
+        return stats
+
+
+_probe: Optional[LatencyProbe] = None
+
+
+def get_latency_probe() -> Optional[LatencyProbe]:
+    """The installed probe, or None when profiling is off."""
+    return _probe
+
+
+def install_latency_probe(probe: Optional[LatencyProbe] = None) -> LatencyProbe:
+    global _probe
+    _probe = probe or LatencyProbe()
+    return _probe
+
+
+def uninstall_latency_probe() -> None:
+    global _probe
+    _probe = None
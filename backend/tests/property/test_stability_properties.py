@@ -208,6 +208,7 @@ class TestEngineStabilityUnderConnectionChurn:
         
         # Broadcast
         sent = await manager.broadcast({"type": "test"}, symbol="btcusdt")
+        await manager.flush()
         
         # All clients should receive
         assert sent == num_clients
@@ -255,10 +256,8 @@ class TestEngineStabilityUnderConnectionChurn:
         assert initial_count == healthy_count + failing_count
         
         # Broadcast - failing connections should be cleaned up
-        sent = await manager.broadcast({"type": "test"}, symbol="btcusdt")
-        
-        # Only healthy clients received
-        assert sent == healthy_count
+        await manager.broadcast({"type": "test"}, symbol="btcusdt")
+        await manager.flush()
         
         # Failing connections should be removed
         final_count = manager.get_connection_count()
@@ -292,6 +291,7 @@ class TestEngineStabilityUnderConnectionChurn:
         # Send multiple broadcasts
         for i in range(num_broadcasts):
             await manager.broadcast({"type": "test", "index": i}, symbol="btcusdt")
+        await manager.flush()
         
         # Verify message count
         assert connection.message_count == num_broadcasts
@@ -337,6 +337,7 @@ class TestEngineStabilityUnderConnectionChurn:
         # Broadcast to first symbol only
         target_symbol = unique_symbols[0]
         await manager.broadcast({"type": "test"}, symbol=target_symbol)
+        await manager.flush()
         
         # Only target symbol clients should receive
         for symbol, websockets in websockets_by_symbol.items():
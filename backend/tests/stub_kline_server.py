@@ -0,0 +1,102 @@
+"""
+Local stand-in for Binance GET /api/v3/klines, for REST client and backfill tests.
+
+Serves a deterministic kline series over real HTTP (threaded server on
+127.0.0.1), honours startTime/endTime/limit like Binance, reports the
+request weight it has counted in X-MBX-USED-WEIGHT-1M and can inject
+429s and server errors.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Set
+from urllib.parse import parse_qs, urlparse
+
+
+def make_klines(start_ms: int, interval_ms: int, count: int) -> list:
+    """Binance-format kline rows (prices as strings) for a synthetic series."""
+    rows = []
+    for i in range(count):
+        close = 100.0 + (i % 50) * 0.5 + i * 0.01
+        open_time = start_ms + i * interval_ms
+        rows.append([
+            open_time, f"{close - 0.1:.4f}", f"{close + 0.7:.4f}", f"{close - 0.8:.4f}", f"{close:.4f}",
+            f"{10 + i % 7:.1f}", open_time + interval_ms - 1, "0", 1, "0", "0", "0"
+        ])
+    return rows
+
+
+class StubKlineServer:
+    """
+    Usage:
+        with StubKlineServer(make_klines(start, 60_000, 5000)) as server:
+            backfiller = KlineBackfiller(base_url=server.base_url)
+    """
+
+    def __init__(self, klines: list, used_weight: int = 0):
+        self.klines = klines
+        self.used_weight = used_weight
+        self.requests = 0
+        self.rate_limit_next = 0          # respond 429 to the next N requests
+        self.fail_after = None            # respond 500 once this many requests were served
+        self.served_starts: Set[int] = set()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/api/v3"
+
+    def __enter__(self) -> 'StubKlineServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _respond(self, query: dict):
+        with self._lock:
+            self.requests += 1
+            if self.rate_limit_next:
+                self.rate_limit_next -= 1
+                return 429, {'Retry-After': '0'}, {'code': -1003, 'msg': 'Too many requests'}
+            if self.fail_after is not None and self.requests > self.fail_after:
+                return 500, {}, {'code': -1000, 'msg': 'Internal error'}
+            limit = int(query.get('limit', 500))
+            self.used_weight += 5 if limit >= 500 else 2
+            start = int(query.get('startTime', 0))
+            end = int(query.get('endTime', 2 ** 62))
+            self.served_starts.add(start)
+            rows = [k for k in self.klines if start <= k[0] <= end][:limit]
+            return 200, {'X-MBX-USED-WEIGHT-1M': str(self.used_weight)}, rows
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path != '/api/v3/klines':
+                    status, headers, body = 404, {}, {'msg': 'not found'}
+                else:
+                    query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                    status, headers, body = stub._respond(query)
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
@@ -2,10 +2,17 @@
 Unit tests for ADX Calculator
 """
 
+import math
+import random
+
+import numpy as np
 import pytest
 from datetime import datetime, timedelta
-from src.infrastructure.indicators.adx_calculator import ADXCalculator, ADXResult
+from src.infrastructure.indicators import adx_calculator
+from src.infrastructure.indicators.adx_calculator import ADXCalculator, ADXResult, window_sums
+from src.infrastructure.indicators.incremental_indicator_engine import StreamingADX
 from src.domain.entities.candle import Candle
+from src.domain.entities.candle_store import CandleArrays
 
 
 def create_test_candle(
@@ -404,5 +411,102 @@ class TestADXCalculatorEdgeCases:
         assert 0 <= result.adx_value <= 100
 
 
+def scalar_adx(candles: list, period: int) -> float:
+    """Reference: the per-candle loops ADXCalculator replaced (windowed DX, then Wilder)."""
+    calculator = ADXCalculator(period=period)
+    pdm, mdm, trs = [], [], []
+    for prev, curr in zip(candles, candles[1:]):
+        plus_dm, minus_dm = calculator.calculate_directional_movement(curr, prev)
+        pdm.append(plus_dm)
+        mdm.append(minus_dm)
+        trs.append(calculator.atr_calculator.calculate_true_range(curr, prev))
+
+    dx_values = []
+    for i in range(period, len(pdm)):
+        smoothed_tr = sum(trs[i - period + 1:i + 1]) / period
+        if smoothed_tr == 0:
+            continue
+        plus_di = ((sum(pdm[i - period + 1:i + 1]) / period) / smoothed_tr) * 100
+        minus_di = ((sum(mdm[i - period + 1:i + 1]) / period) / smoothed_tr) * 100
+        if plus_di + minus_di == 0:
+            continue
+        dx_values.append((abs(plus_di - minus_di) / (plus_di + minus_di)) * 100)
+
+    if len(dx_values) >= period:
+        return calculator._apply_wilders_smoothing(dx_values, period)
+    return sum(dx_values) / len(dx_values) if dx_values else 0.0
+
+
+def create_random_candles(count: int, seed: int) -> list:
+    """Random walk with flat stretches (zero range and zero directional movement)."""
+    rng = random.Random(seed)
+    candles, price = [], 100.0
+    base_time = datetime(2025, 1, 1)
+    for i in range(count):
+        if i % 50 < 40:
+            price = max(1.0, price + rng.gauss(0, 1))
+            high, low = price + abs(rng.gauss(0, 0.5)), price - abs(rng.gauss(0, 0.5))
+        else:
+            high = low = price
+        candles.append(create_test_candle(base_time + timedelta(minutes=i), price, high, low, price))
+    return candles
+
+
+class TestADXVectorized:
+    """Array paths and the streaming state against the scalar definition"""
+
+    @pytest.mark.parametrize("period", [3, 14])
+    def test_matches_scalar_loops_exactly(self, period):
+        calculator = ADXCalculator(period=period)
+        candles = create_random_candles(400, seed=period)
+
+        for end in (period * 3, period * 3 + 1, 100, 399, 400):
+            history = candles[:end]
+            result = calculator.calculate_adx(history)
+            assert result.adx_value == scalar_adx(history, period)
+            assert calculator.calculate_adx(CandleArrays.from_candles(history)) == result
+
+    def test_streaming_matches_batch_every_step(self):
+        calculator = ADXCalculator(period=5)
+        stream = StreamingADX(period=5)
+        candles = create_random_candles(300, seed=7)
+
+        for i, candle in enumerate(candles):
+            assert stream.update(candle) == calculator.calculate_adx(candles[:i + 1])
+
+    def test_window_sums_match_builtin_sum(self):
+        rng = random.Random(1)
+        values = np.array([rng.uniform(-1e6, 1e6) for _ in range(200)])
+        expected = [sum(values[i:i + 14].tolist()) for i in range(len(values) - 13)]
+
+        assert window_sums(values, 14).tolist() == expected
+        assert len(window_sums(values[:5], 14)) == 0
+
+    @pytest.mark.parametrize("compensated", [False, True])
+    def test_window_sums_follow_both_sum_algorithms(self, monkeypatch, compensated):
+        def reference_sum(window):
+            # builtin sum(): plain left-to-right before 3.12, Neumaier compensated after
+            total = compensation = 0.0
+            for x in window:
+                step = total + x
+                if abs(total) >= abs(x):
+                    compensation += (total - step) + x
+                else:
+                    compensation += (x - step) + total
+                total = step
+            if compensated and compensation and math.isfinite(compensation):
+                total += compensation
+            return total
+
+        monkeypatch.setattr(adx_calculator, '_COMPENSATED_SUM', compensated)
+        rng = random.Random(2)
+        values = np.array([rng.choice([1e16, -1e16, 1.0, 0.1]) * rng.uniform(0.5, 2) for _ in range(200)])
+        expected = [reference_sum(values[i:i + 14].tolist()) for i in range(len(values) - 13)]
+        naive = [float(np.cumsum(values[i:i + 14])[-1]) for i in range(len(values) - 13)]
+
+        assert window_sums(values, 14).tolist() == expected
+        assert (expected != naive) == compensated
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,114 @@
+"""
+Tests for the anchored VWAP engine: session keys, streaming AnchoredVWAP
+against the array form and VWAPCalculator (exact equality), bands and
+custom anchors.
+"""
+
+import math
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.domain.entities.candle import Candle
+from src.domain.entities.candle_store import CandleArrays
+from src.domain.services.anchored_vwap import (
+    NO_SESSION,
+    AnchoredVWAP,
+    anchored_vwap,
+    session_key,
+)
+from src.infrastructure.indicators.vwap_calculator import VWAPCalculator
+
+
+def make_candles(count: int, seed: int = 1, start=datetime(2026, 1, 3, 18, 0), step_minutes: int = 37):
+    """Random walk crossing several day and week boundaries, with some zero-volume candles."""
+    rng = random.Random(seed)
+    candles, price = [], 100.0
+    for i in range(count):
+        price = max(1.0, price + rng.gauss(0, 1))
+        close = max(0.5, price + rng.gauss(0, 0.5))
+        candles.append(Candle(
+            timestamp=start + timedelta(minutes=step_minutes * i),
+            open=price,
+            high=max(price, close) + abs(rng.gauss(0, 0.3)),
+            low=min(price, close) * 0.999,
+            close=close,
+            volume=rng.choice([0.0, rng.uniform(0, 1000)])
+        ))
+    return candles
+
+
+class TestSessionKey:
+    def test_day_and_week_boundaries(self):
+        sunday_night = datetime(2026, 1, 4, 23, 59)
+        monday = datetime(2026, 1, 5, 0, 0)
+
+        assert session_key(monday) == session_key(sunday_night) + 1
+        assert session_key(monday, 'week') == session_key(sunday_night, 'week') + 1
+        assert session_key(datetime(2026, 1, 11, 23, 59), 'week') == session_key(monday, 'week')
+
+    def test_aware_timestamps_use_utc_day(self):
+        ict = timezone(timedelta(hours=7))
+        assert session_key(datetime(2026, 1, 5, 6, 0, tzinfo=ict)) == session_key(datetime(2026, 1, 4, 23, 0))
+
+    def test_custom_anchor_and_validation(self):
+        anchor = datetime(2026, 1, 5, 12, 0)
+        assert session_key(datetime(2026, 1, 5, 11, 59), anchor) == NO_SESSION
+        assert session_key(datetime(2026, 2, 1), anchor) == session_key(anchor, anchor) == 0
+        with pytest.raises(ValueError):
+            AnchoredVWAP('month')
+
+
+class TestAnchoredVWAP:
+    @pytest.mark.parametrize("anchor", ['day', 'week', datetime(2026, 1, 5, 9, 30)])
+    def test_streaming_matches_arrays_and_calculator(self, anchor):
+        candles = make_candles(600, seed=2)
+        stream = AnchoredVWAP(anchor)
+        series = anchored_vwap(CandleArrays.from_candles(candles), anchor)
+        calculator = VWAPCalculator(anchor)
+
+        for i, candle in enumerate(candles):
+            vwap = stream.update(candle)
+            if vwap is None:
+                assert math.isnan(series.vwap[i]) and math.isnan(series.std[i])
+                continue
+            assert vwap == series.vwap[i]
+            assert stream.std == series.std[i]
+            assert stream.bands(2.0) == (series.bands(2.0)[0][i], series.bands(2.0)[1][i])
+            if i % 25 == 0:
+                result = calculator.calculate_vwap(candles[:i + 1])
+                assert (result.vwap, result.period_volume) == (vwap, stream.volume)
+
+    def test_calculator_list_and_array_paths_agree(self):
+        candles = make_candles(300, seed=3)
+        calculator = VWAPCalculator()
+        arrays = CandleArrays.from_candles(candles)
+
+        for end in range(1, len(candles), 7):
+            history = candles[:end]
+            assert calculator.calculate_vwap(history) == calculator.calculate_vwap(CandleArrays.from_candles(history))
+
+        series = calculator.calculate_vwap_series(candles)
+        np.testing.assert_array_equal(series.values, calculator.calculate_vwap_series(arrays).values)
+        assert len(series) == len(candles)
+
+    def test_bands_and_session_reset(self):
+        day = datetime(2026, 1, 5)
+        candles = [
+            Candle(day, 10, 10, 10, 10, 1.0),
+            Candle(day + timedelta(hours=1), 20, 20, 20, 20, 1.0),
+            Candle(day + timedelta(days=1), 30, 30, 30, 30, 2.0),
+        ]
+        stream = AnchoredVWAP()
+
+        stream.update(candles[0])
+        assert stream.update(candles[1]) == 15.0
+        assert stream.std == 5.0 and stream.bands(2.0) == (5.0, 25.0)
+        assert stream.update(candles[2]) == 30.0 and stream.std == 0.0
+        assert stream.session_start == candles[2].timestamp
+
+        series = anchored_vwap(CandleArrays.from_candles(candles))
+        assert series.vwap.tolist() == [10.0, 15.0, 30.0]
+        assert series.volume.tolist() == [1.0, 2.0, 2.0]
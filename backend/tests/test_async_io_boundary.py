@@ -0,0 +1,116 @@
+"""
+Tests for the async I/O boundary: awaitable order repository calls on a
+dedicated executor, off-loop Paper Engine tick matching with coalescing,
+and event loop lag instrumentation.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from src.api.loop_monitor import EventLoopLagMonitor
+from src.application.services.paper_trading_service import PaperTradingService
+from src.domain.entities.candle import Candle
+from src.domain.entities.paper_position import PaperPosition
+from src.infrastructure.di_container import DIContainer
+from src.infrastructure.persistence.sqlite_order_repository import SQLiteOrderRepository
+
+
+def pending_long(entry_price: float = 100.0) -> PaperPosition:
+    return PaperPosition(
+        id="order-1", symbol="BTCUSDT", side="LONG", status="PENDING",
+        entry_price=entry_price, quantity=1.0, leverage=1, margin=entry_price,
+        liquidation_price=0.0, stop_loss=90.0, take_profit=120.0,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = SQLiteOrderRepository(db_path=str(tmp_path / "orders.db"))
+    yield repo
+    repo.close()
+
+
+class TestOrderRepositoryAsync:
+    async def test_calls_run_on_dedicated_io_thread(self, repo):
+        repo.save_order(pending_long())
+
+        thread_name = await repo.run_io(lambda: threading.current_thread().name)
+        pending = await repo.get_pending_orders_async()
+
+        assert thread_name.startswith('order-repo-io')
+        assert [o.id for o in pending] == ["order-1"]
+        assert await repo.get_account_balance_async() == 10000.0
+
+
+class TestPaperTradingAsync:
+    async def test_fill_off_loop_and_callback_on_loop(self, repo):
+        service = PaperTradingService(repo)
+        repo.save_order(pending_long())
+        loop_thread = threading.current_thread()
+        filled = []
+        service.on_order_filled = lambda order_id: filled.append((order_id, threading.current_thread()))
+
+        await service.process_market_data_async(current_price=100.2, high=100.5, low=99.9, symbol="btcusdt")
+
+        assert filled == [("order-1", loop_thread)]
+        assert [p.id for p in await repo.get_active_orders_async()] == ["order-1"]
+
+
+class RecordingPaperService:
+    def __init__(self):
+        self.ticks = []
+        self.release = asyncio.Event()
+
+    async def process_market_data_async(self, current_price, high, low, symbol):
+        await self.release.wait()
+        self.ticks.append((current_price, high, low))
+
+
+def tick(close: float, high: float, low: float) -> Candle:
+    return Candle(timestamp=datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc),
+                  open=100.0, high=high, low=low, close=close, volume=1.0)
+
+
+class TestPaperPipeline:
+    async def test_ticks_coalesce_while_one_is_in_flight(self, tmp_path):
+        container = DIContainer({'DATABASE_PATH': str(tmp_path / "pipeline.db")})
+        service = container.get_realtime_service('btcusdt')
+        paper = RecordingPaperService()
+        service.paper_service = paper
+
+        service._submit_paper_tick(tick(100.0, 100.5, 99.5))
+        await asyncio.sleep(0)  # first tick is now in flight
+        service._submit_paper_tick(tick(101.0, 101.5, 99.0))
+        service._submit_paper_tick(tick(100.2, 101.2, 99.8))
+        service._submit_paper_tick(tick(100.7, 100.9, 99.9))
+        paper.release.set()
+        await service.drain_paper_pipeline()
+
+        # Latest close, widest high/low of the merged ticks
+        assert paper.ticks == [(100.0, 100.5, 99.5), (100.7, 101.5, 99.0)]
+        stats = service._paper_stats
+        assert stats['ticks'] == 4 and stats['coalesced'] == 2 and stats['processed'] == 2
+        container.cleanup()
+
+
+class TestEventLoopLagMonitor:
+    async def test_blocking_call_shows_up_as_lag(self):
+        monitor = EventLoopLagMonitor(interval=0.01, stall_threshold=0.05)
+        await monitor.start()
+        try:
+            await asyncio.sleep(0.05)
+            time.sleep(0.12)  # stands in for a synchronous SQLite/HTTP call on the loop
+            await asyncio.sleep(0.05)
+        finally:
+            await monitor.stop()
+
+        stats = monitor.get_statistics()
+        assert stats['samples'] >= 3
+        assert stats['stalls'] >= 1
+        assert stats['max_ms'] >= 100
+        assert stats['p50_ms'] < 50
+        assert not stats['running']
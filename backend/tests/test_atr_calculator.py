@@ -6,6 +6,7 @@ import pytest
 from datetime import datetime, timedelta
 from src.infrastructure.indicators.atr_calculator import ATRCalculator, ATRResult
 from src.domain.entities.candle import Candle
+from src.domain.entities.candle_store import CandleArrays
 
 
 def create_test_candle(
@@ -265,6 +266,25 @@ class TestATRCalculator:
         # All TRs are 20, so ATR should be 20
         assert result.atr_value == 20.0
     
+    def test_atr_series_matches_prefix_calculations(self):
+        """Test each series element equals calculate_atr on that prefix"""
+        calculator = ATRCalculator(period=5)
+        base_time = datetime(2025, 1, 1)
+        candles = [
+            create_test_candle(
+                base_time + timedelta(minutes=15 * i), 100 + i % 7, 103 + (i * 3) % 5, 97 - i % 4, 100 + (i * 5) % 9
+            )
+            for i in range(40)
+        ]
+        
+        series = calculator.calculate_atr_series(candles)
+        
+        assert len(series) == 40
+        assert series[:5].tolist() == [0.0] * 5
+        assert series.tolist() == [calculator.calculate_atr(candles[:i + 1]).atr_value for i in range(40)]
+        assert calculator.calculate_atr_series(CandleArrays.from_candles(candles)).tolist() == series.tolist()
+        assert len(calculator.calculate_atr_series([])) == 0
+    
     def test_repr(self):
         """Test string representation"""
         calculator = ATRCalculator(period=14)
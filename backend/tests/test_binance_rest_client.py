@@ -0,0 +1,78 @@
+"""
+Tests for BinanceRestClient's pooled async path (coalescing, weight
+limiter) against the local stub kline server.
+"""
+
+import asyncio
+
+import pytest
+
+from src.domain.interfaces import IRestClient
+from src.infrastructure.api.binance_rest_client import BinanceRestClient
+from src.infrastructure.api.binance_weight_limiter import BinanceWeightLimiter
+from tests.stub_kline_server import StubKlineServer, make_klines
+
+
+START_MS = 1_740_787_200_000
+MINUTE_MS = 60_000
+
+
+@pytest.fixture
+def server():
+    with StubKlineServer(make_klines(START_MS, MINUTE_MS, 1500)) as stub:
+        yield stub
+
+
+@pytest.fixture
+def client(server):
+    return BinanceRestClient(base_url=server.base_url, limiter=BinanceWeightLimiter())
+
+
+class TestAsyncRestClient:
+    async def test_identical_inflight_requests_are_coalesced(self, client, server):
+        results = await asyncio.gather(*(client.get_klines_async('btcusdt', '1m', limit=500) for _ in range(5)))
+        await client.aclose()
+
+        assert server.requests == 1
+        assert client.get_statistics()['coalesced'] == 4
+        assert all(r == results[0] for r in results) and len(results[0]) == 500
+        assert results[0][0].timestamp.tzinfo is not None
+
+    async def test_distinct_requests_run_concurrently_and_feed_limiter(self, client, server):
+        server.used_weight = 100
+        candles_1m, candles_15m = await asyncio.gather(
+            client.get_klines_async('BTCUSDT', '1m', limit=500),
+            client.get_klines_async('BTCUSDT', '15m', limit=50),
+        )
+        # Once finished, the same request goes to the server again
+        await client.get_klines_async('BTCUSDT', '15m', limit=50)
+        await client.aclose()
+
+        assert (len(candles_1m), len(candles_15m)) == (500, 50)
+        assert server.requests == 3
+        assert client.limiter.server_used_weight == 109
+        assert client.limiter.get_statistics()['weight'] == 5 + 1 + 1
+
+    async def test_errors_return_empty(self, client, server):
+        server.fail_after = 0
+        assert await client.get_klines_async('BTCUSDT', '1m') == []
+        await client.aclose()
+        assert client.get_statistics()['errors'] == 1
+
+    def test_sync_calls_share_session(self, client, server):
+        assert len(client.get_klines('BTCUSDT', '1m', limit=10)) == 10
+        assert len(client.get_klines('BTCUSDT', '1m', limit=20)) == 20
+        assert server.requests == 2
+        assert client.limiter.server_used_weight == 4
+
+
+class _SyncOnlyClient(IRestClient):
+    def get_klines(self, symbol, interval, limit=100):
+        return [symbol, interval, limit]
+
+    def get_ticker_price(self, symbol):
+        return None
+
+
+async def test_interface_default_async_runs_sync_client():
+    assert await _SyncOnlyClient().get_klines_async('BTCUSDT', '1h', 3) == ['BTCUSDT', '1h', 3]
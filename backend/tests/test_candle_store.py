@@ -0,0 +1,200 @@
+"""
+Tests for CandleStore (columnar ring buffer) and array input to the
+indicator calculators.
+"""
+
+import random
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.domain.entities.candle import Candle
+from src.domain.entities.candle_store import CandleArrays, CandleStore, timestamp_to_ms
+from src.infrastructure.indicators.vwap_calculator import VWAPCalculator
+from src.infrastructure.indicators.bollinger_calculator import BollingerCalculator
+from src.infrastructure.indicators.stoch_rsi_calculator import StochRSICalculator
+from src.infrastructure.indicators.atr_calculator import ATRCalculator
+
+
+def create_random_candles(count: int, seed: int, minutes: int = 15) -> List[Candle]:
+    """Random-walk candles starting late in the day so VWAP crosses a session boundary."""
+    rng = random.Random(seed)
+    candles = []
+    price = 100.0
+    timestamp = datetime(2025, 1, 1, 20, 0, 0, tzinfo=timezone.utc)
+
+    for _ in range(count):
+        price = max(1.0, price + rng.gauss(0, 1))
+        close = max(0.5, price + rng.gauss(0, 0.5))
+        candles.append(Candle(
+            timestamp=timestamp,
+            open=price,
+            high=max(price, close) + abs(rng.gauss(0, 0.3)),
+            low=min(price, close) * 0.999,
+            close=close,
+            volume=rng.choice([0.0, rng.uniform(0, 1000)])
+        ))
+        timestamp += timedelta(minutes=minutes)
+    return candles
+
+
+class TestCandleStore:
+    """Ring buffer behaves like deque(maxlen) and exposes consistent columns"""
+
+    @pytest.mark.parametrize("maxlen", [1, 7, 50])
+    def test_matches_deque_through_wraparound(self, maxlen):
+        candles = create_random_candles(173, 1, minutes=1)
+        store = CandleStore(maxlen=maxlen)
+        reference = deque(maxlen=maxlen)
+
+        for candle in candles:
+            store.append(candle)
+            reference.append(candle)
+
+            assert len(store) == len(reference)
+            assert store.last() == reference[-1]
+            assert store.candles() == list(reference)
+            assert store.candles(limit=3) == list(reference)[-3:]
+
+            arrays = store.arrays()
+            assert arrays.close.tolist() == [c.close for c in reference]
+            assert arrays.volume.tolist() == [c.volume for c in reference]
+            assert arrays.timestamp.tolist() == [timestamp_to_ms(c.timestamp) for c in reference]
+
+        assert list(store) == list(reference)
+        assert store[0] == reference[0] and store[-1] == reference[-1]
+        with pytest.raises(IndexError):
+            store[maxlen]
+
+    def test_arrays_are_contiguous_views(self):
+        store = CandleStore(maxlen=10)
+        for candle in create_random_candles(25, 2):
+            store.append(candle)
+
+        arrays = store.arrays(limit=4)
+        assert len(arrays) == 4
+        assert arrays.close.flags['C_CONTIGUOUS']
+        assert np.shares_memory(arrays.close, store.arrays().close)
+
+    def test_replace_last_and_clear(self):
+        candles = create_random_candles(5, 3)
+        store = CandleStore(maxlen=3)
+        store.extend(candles[:4])
+        store.replace_last(candles[4])
+
+        assert store.candles() == [candles[1], candles[2], candles[4]]
+        assert store.arrays().close.tolist() == [candles[1].close, candles[2].close, candles[4].close]
+
+        store.clear()
+        assert len(store) == 0 and not store
+        assert store.last() is None
+        assert len(store.arrays()) == 0
+
+    @pytest.mark.parametrize("tz", [None, timezone.utc, timezone(timedelta(hours=7))])
+    def test_candles_are_rebuilt_from_columns(self, tz):
+        candles = [
+            Candle(c.timestamp.astimezone(tz) if tz else c.timestamp.replace(tzinfo=None), c.open, c.high, c.low, c.close, c.volume)
+            for c in create_random_candles(12, 6)
+        ]
+        store = CandleStore(maxlen=10)
+        store.extend(candles)
+
+        rebuilt = store.candles()
+        assert rebuilt == candles[2:]
+        assert [c.timestamp.utcoffset() for c in rebuilt] == [c.timestamp.utcoffset() for c in candles[2:]]
+        assert store.last() == candles[-1] and store.last() is not candles[-1]
+
+    def test_built_candles_are_reused(self, monkeypatch):
+        candles = create_random_candles(30, 8, minutes=1)
+        store = CandleStore(maxlen=10)
+        store.extend(candles[:25])
+        first = store.candles()
+
+        built = []
+        build = store._build
+        monkeypatch.setattr(store, '_build', lambda start, end: built.append(end - start) or build(start, end))
+        store.append(candles[25])
+        second = store.candles()
+
+        # Only the new candle is built; the others are the objects from the first call
+        assert built == [1]
+        assert second[:-1] == first[1:] and all(a is b for a, b in zip(second, first[1:]))
+        assert store.last() is second[-1]
+
+        store.extend(candles[26:])  # wraps the storage (compaction keeps the built rows)
+        assert store.candles() == candles[-10:] and built == [1, 4]
+
+    def test_to_candles_slice_timezone_and_validation(self):
+        candles = create_random_candles(20, 7)
+        arrays = CandleArrays.from_candles(candles)
+
+        assert arrays.to_candles() == candles
+        assert arrays.to_candles(5, 9) == candles[5:9]
+        naive = arrays.to_candles(-3, tz=None)
+        assert [c.timestamp for c in naive] == [c.timestamp.replace(tzinfo=None) for c in candles[-3:]]
+
+        broken = CandleArrays(*(column.copy() for column in arrays._columns()))
+        broken.high[0] = broken.low[0] - 1.0
+        with pytest.raises(ValueError):
+            broken.to_candles(0, 1)
+        assert broken.to_candles(0, 1, trusted=True)[0].high == broken.high[0]
+
+    def test_timestamp_column_is_epoch_ms(self):
+        aware = datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc)
+        assert timestamp_to_ms(aware) == aware.timestamp() * 1000
+        assert timestamp_to_ms(aware.replace(tzinfo=None)) == timestamp_to_ms(aware)
+
+    def test_appended_copies(self):
+        candles = create_random_candles(6, 4)
+        store = CandleStore(maxlen=10)
+        store.extend(candles[:5])
+
+        extended = store.arrays().appended(candles[5])
+        assert extended.close.tolist() == [c.close for c in candles]
+        assert len(store.arrays()) == 5
+
+
+class TestCalculatorsAcceptArrays:
+    """Array input gives exactly the same results as Candle lists"""
+
+    def setup_method(self):
+        self.candles = create_random_candles(300, 5)
+        store = CandleStore(maxlen=250)
+        store.extend(self.candles)
+        self.history = store.candles()
+        self.arrays = store.arrays()
+
+    def test_from_candles_matches_store(self):
+        built = CandleArrays.from_candles(self.history)
+        for name in ('timestamp', 'open', 'high', 'low', 'close', 'volume'):
+            assert np.array_equal(getattr(built, name), getattr(self.arrays, name))
+
+    def test_vwap(self):
+        calculator = VWAPCalculator()
+        assert calculator.calculate_vwap(self.arrays) == calculator.calculate_vwap(self.history)
+        pd.testing.assert_series_equal(
+            calculator.calculate_vwap_series(self.arrays),
+            calculator.calculate_vwap_series(self.history)
+        )
+
+    def test_bollinger(self):
+        calculator = BollingerCalculator()
+        assert calculator.calculate_bands(self.arrays) == calculator.calculate_bands(self.history)
+        assert calculator.calculate_bands_series(self.arrays) == calculator.calculate_bands_series(self.history)
+
+    def test_stoch_rsi(self):
+        calculator = StochRSICalculator()
+        assert calculator.calculate_stoch_rsi(self.arrays) == calculator.calculate_stoch_rsi(self.history)
+
+    def test_atr(self):
+        calculator = ATRCalculator()
+        assert calculator.calculate_atr(self.arrays) == calculator.calculate_atr(self.history)
+
+    def test_dataframe_layout(self):
+        df = self.arrays.to_dataframe()
+        assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert df['close'].tolist() == [c.close for c in self.history]
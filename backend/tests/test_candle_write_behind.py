@@ -0,0 +1,122 @@
+"""
+Tests for batched candle persistence and the write-behind queue.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from src.domain.entities.candle import Candle
+from src.infrastructure.persistence.candle_write_behind import CandleWriteBehindQueue
+from src.infrastructure.persistence.sqlite_market_data_repository import SQLiteMarketDataRepository
+
+
+def create_candles(count: int, price: float = 100.0) -> List[Candle]:
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        Candle(
+            timestamp=start + timedelta(minutes=i),
+            open=price + i, high=price + i + 1, low=price + i - 1, close=price + i + 0.5, volume=10.0 + i
+        )
+        for i in range(count)
+    ]
+
+
+class TestSaveCandlesBatch:
+    def test_round_trip_and_upsert(self, tmp_path):
+        repo = SQLiteMarketDataRepository(str(tmp_path / "market.db"), write_behind=False)
+        candles = create_candles(500)
+
+        assert repo.save_candles_batch(candles, '1m', 'ethusdt') == 500
+        assert repo.get_record_count('1m', 'ethusdt') == 500
+
+        # Same timestamps again with new prices: replaced, not duplicated
+        repo.save_candles_batch(create_candles(10, price=200.0), '1m', 'ethusdt')
+        assert repo.get_record_count('1m', 'ethusdt') == 500
+        latest = repo.get_candle_by_timestamp('1m', candles[0].timestamp, 'ethusdt')
+        assert latest.candle.close == 200.5
+
+    def test_empty_batch_is_noop(self):
+        repo = SQLiteMarketDataRepository(":memory:")
+        assert repo.save_candles_batch([], '1m', 'btcusdt') == 0
+
+    def test_file_database_uses_wal(self, tmp_path):
+        path = tmp_path / "market.db"
+        repo = SQLiteMarketDataRepository(str(path))
+        try:
+            conn = sqlite3.connect(path)
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+            conn.close()
+        finally:
+            repo.close()
+
+
+class TestWriteBehind:
+    def test_enqueue_then_flush(self, tmp_path):
+        repo = SQLiteMarketDataRepository(str(tmp_path / "market.db"))
+        try:
+            candles = create_candles(50)
+            for candle in candles:
+                repo.enqueue_candles([candle], '1m', 'BTCUSDT')
+            repo.enqueue_candles(candles[:5], '15m', 'btcusdt')
+
+            assert repo.flush(timeout=10)
+            assert repo.get_record_count('1m', 'btcusdt') == 50
+            assert repo.get_record_count('15m', 'btcusdt') == 5
+
+            stats = repo.get_write_statistics()
+            assert stats['written'] == 55
+            assert stats['dropped'] == 0 and stats['failed'] == 0
+        finally:
+            repo.close()
+
+    def test_close_drains_queue(self, tmp_path):
+        path = str(tmp_path / "market.db")
+        repo = SQLiteMarketDataRepository(path)
+        repo.enqueue_candles(create_candles(20), '1h', 'solusdt')
+        repo.close()
+
+        reopened = SQLiteMarketDataRepository(path, write_behind=False)
+        assert reopened.get_record_count('1h', 'solusdt') == 20
+
+    def test_memory_database_writes_synchronously(self):
+        repo = SQLiteMarketDataRepository(":memory:")
+        repo.enqueue_candles(create_candles(3), '1m', 'btcusdt')
+        assert repo.get_record_count('1m', 'btcusdt') == 3
+
+    def test_pending_updates_are_merged(self):
+        written = []
+        writer = CandleWriteBehindQueue(
+            lambda candles, timeframe, symbol: written.append((symbol, timeframe, candles)) or len(candles),
+            flush_interval=60
+        )
+        first, updated = create_candles(1)[0], create_candles(1, price=300.0)[0]
+        writer.enqueue([first], '1m', 'BTCUSDT')
+        writer.enqueue([updated], '1m', 'btcusdt')
+        assert writer.flush(timeout=5)
+        writer.close()
+
+        assert written == [('btcusdt', '1m', [updated])]
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_writer(candles, timeframe, symbol):
+            started.set()
+            release.wait(5)
+            return len(candles)
+
+        writer = CandleWriteBehindQueue(slow_writer, max_batch=1, max_queue=1)
+        candles = create_candles(5)
+        writer.enqueue([candles[0]], '1m', 'btcusdt')
+        assert started.wait(5)  # writer thread is busy
+
+        assert writer.enqueue([candles[1]], '1m', 'btcusdt') is True
+        assert writer.enqueue([candles[2]], '1m', 'btcusdt') is False
+        assert writer.get_statistics()['dropped'] == 1
+
+        release.set()
+        writer.close()
+        assert writer.get_statistics()['written'] == 2
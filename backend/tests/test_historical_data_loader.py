@@ -0,0 +1,171 @@
+"""
+Tests for HistoricalDataLoader's columnar Parquet cache path and its
+resumable backfill (against the local stub kline server).
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from src.domain.entities.candle import Candle
+from src.domain.entities.candle_store import CandleArrays
+from src.infrastructure.api.binance_weight_limiter import BinanceWeightLimiter
+from src.infrastructure.data.historical_data_loader import HistoricalDataLoader
+from src.infrastructure.data.kline_backfill import KlineBackfiller
+from tests.stub_kline_server import StubKlineServer
+
+
+START = datetime(2025, 3, 1, tzinfo=timezone.utc)
+STEP = timedelta(minutes=15)
+
+
+def make_series(count: int):
+    rng = np.random.default_rng(11)
+    closes = 100 + np.cumsum(rng.normal(0, 0.5, count))
+    return [
+        Candle(
+            timestamp=START + STEP * i,
+            open=float(c) - 0.1, high=float(c) + 0.7, low=float(c) - 0.8, close=float(c), volume=float(10 + i % 7)
+        )
+        for i, c in enumerate(closes)
+    ]
+
+
+def to_klines(candles):
+    return [
+        [int(c.timestamp.timestamp() * 1000), repr(c.open), repr(c.high), repr(c.low), repr(c.close), repr(c.volume)]
+        for c in candles
+    ]
+
+
+@pytest.fixture
+def loader_factory(tmp_path, monkeypatch):
+    monkeypatch.setattr(HistoricalDataLoader, 'CACHE_DIR', tmp_path / "cache")
+    monkeypatch.setattr(HistoricalDataLoader, 'METADATA_FILE', tmp_path / "cache" / "metadata.json")
+    servers = []
+
+    def make(candles, fail_after=None, page_limit=1000):
+        server = StubKlineServer(to_klines(candles)).__enter__()
+        server.fail_after = fail_after
+        servers.append(server)
+        backfiller = KlineBackfiller(
+            base_url=server.base_url, limiter=BinanceWeightLimiter(), max_concurrency=2,
+            page_limit=page_limit, max_retries=0, checkpoint_pages=2
+        )
+        return HistoricalDataLoader(backfiller=backfiller)
+
+    yield make
+    for server in servers:
+        server.__exit__(None, None, None)
+
+
+class TestColumnarLoad:
+    async def test_cold_then_cached_load(self, loader_factory):
+        series = make_series(400)
+        loader = loader_factory(series)
+        end = series[-1].timestamp
+
+        candles = await loader.load_candles('BTCUSDT', '15m', START, end)
+        assert candles == series
+        assert candles[0].timestamp.tzinfo is not None
+        calls = loader.backfiller.request_count
+
+        # Second load is served from the Parquet cache
+        arrays = await loader.load_arrays('BTCUSDT', '15m', START + STEP * 100, START + STEP * 199)
+        assert loader.backfiller.request_count == calls
+        assert isinstance(arrays, CandleArrays) and len(arrays) == 100
+        assert arrays.timestamp[0] == (START + STEP * 100).timestamp() * 1000
+        np.testing.assert_array_equal(arrays.close, [c.close for c in series[100:200]])
+
+    async def test_timestamp_filter_is_pushed_down(self, loader_factory, monkeypatch):
+        monkeypatch.setattr(HistoricalDataLoader, 'ROW_GROUP_SIZE', 50)
+        series = make_series(300)
+        loader = loader_factory(series)
+        await loader.load_candles('ETHUSDT', '15m', START, series[-1].timestamp)
+
+        cache_path = loader._get_cache_path('ETHUSDT', '15m')
+        assert pq.ParquetFile(cache_path).metadata.num_row_groups == 6
+        first, last, rows = loader._cache_bounds(cache_path)
+        assert (first, last, rows) == (START, series[-1].timestamp, 300)
+
+        table = await loader.load_table('ETHUSDT', '15m', START + STEP * 60, START + STEP * 69)
+        assert table.num_rows == 10
+        assert table.column_names == list(HistoricalDataLoader.COLUMNS)
+
+    async def test_legacy_string_timestamps(self, loader_factory):
+        series = make_series(50)
+        loader = loader_factory(series)
+        df = pd.DataFrame({
+            'timestamp': [c.timestamp.isoformat() for c in series],
+            'open': [c.open for c in series], 'high': [c.high for c in series],
+            'low': [c.low for c in series], 'close': [c.close for c in series],
+            'volume': [c.volume for c in series],
+        })
+        df.to_parquet(loader._get_cache_path('SOLUSDT', '15m'), index=False)
+
+        candles = await loader.load_candles('SOLUSDT', '15m', START + STEP * 10, START + STEP * 19)
+        assert loader.backfiller.request_count == 0
+        assert candles == series[10:20]
+
+    async def test_portfolio_data(self, loader_factory):
+        series = make_series(40)
+        loader = loader_factory(series)
+        timeline = await loader.load_portfolio_data(['BTCUSDT', 'ETHUSDT'], '15m', START, series[-1].timestamp)
+
+        assert list(timeline) == [c.timestamp for c in series]
+        assert set(timeline[START]) == {'BTCUSDT', 'ETHUSDT'}
+        assert timeline[START]['ETHUSDT'] == series[0]
+
+
+class TestResumableBackfill:
+    async def test_interrupted_backfill_resumes_and_fills_hole(self, loader_factory):
+        series = make_series(1200)
+        end = series[-1].timestamp
+
+        # Newest half cached first
+        loader = loader_factory(series, page_limit=100)
+        assert len(await loader.load_candles('BTCUSDT', '15m', START + STEP * 600, end)) == 600
+
+        # Extending backwards dies after the first batch (2 pages of 100)
+        loader = loader_factory(series, fail_after=2, page_limit=100)
+        partial = await loader.load_candles('BTCUSDT', '15m', START, end)
+        assert len(partial) == 800
+        meta_key = loader._get_metadata_key('BTCUSDT', '15m')
+        resume_ms = int((START + STEP * 200).timestamp() * 1000)
+        assert loader._load_metadata()[meta_key]['backfill'] == [[resume_ms, int((START + STEP * 600).timestamp() * 1000) - 1]]
+
+        # A fresh loader resumes from the checkpoint, not from START, and closes the hole
+        loader = loader_factory(series, page_limit=100)
+        candles = await loader.load_candles('BTCUSDT', '15m', START, end)
+        assert candles == series
+        assert loader.backfiller.request_count == 4
+        assert 'backfill' not in loader._load_metadata()[meta_key]
+
+    async def test_batches_are_compacted_once(self, loader_factory, monkeypatch):
+        series = make_series(1200)
+        loader = loader_factory(series, page_limit=100)
+        written, compacted = [], []
+        write_part, compact_parts = loader._write_part, loader._compact_parts
+        monkeypatch.setattr(loader, '_write_part', lambda path, batch: written.append(len(batch)) or write_part(path, batch))
+        monkeypatch.setattr(loader, '_compact_parts', lambda path: compacted.append(compact_parts(path)) or compacted[-1])
+
+        assert await loader.load_candles('BTCUSDT', '15m', START, series[-1].timestamp) == series
+        # Six checkpointed batches of 2 pages, one cache rewrite
+        assert written == [200] * 6
+        assert [summary['candle_count'] for summary in compacted if summary] == [1200]
+        assert not loader._parts_dir(loader._get_cache_path('BTCUSDT', '15m')).exists()
+
+    async def test_leftover_parts_are_compacted_before_sync(self, loader_factory):
+        series = make_series(300)
+        loader = loader_factory(series)
+        cache_path = loader._get_cache_path('BTCUSDT', '15m')
+        # A crash after writing both batches, before compaction
+        loader._write_part(cache_path, CandleArrays.from_candles(series[:150]))
+        loader._write_part(cache_path, CandleArrays.from_candles(series[150:]))
+
+        assert await loader.load_candles('BTCUSDT', '15m', START, series[-1].timestamp) == series
+        assert loader.backfiller.request_count == 0
+        assert loader._cache_bounds(cache_path)[2] == 300
@@ -0,0 +1,249 @@
+"""
+Tests for IncrementalIndicatorEngine.
+
+Streaming results must be identical (==, not approx) to the batch
+calculators used by SignalGenerator for the same candle sequence.
+"""
+
+import asyncio
+import random
+from datetime import datetime, timedelta
+from typing import List
+
+import numpy as np
+import pytest
+
+from src.domain.entities.candle import Candle
+from src.domain.entities.candle_store import CandleStore
+from src.domain.interfaces.i_historical_data_loader import IHistoricalDataLoader
+from src.infrastructure.indicators.incremental_indicator_engine import IncrementalIndicatorEngine
+from src.infrastructure.indicators.vwap_calculator import VWAPCalculator
+from src.infrastructure.indicators.bollinger_calculator import BollingerCalculator
+from src.infrastructure.indicators.stoch_rsi_calculator import StochRSICalculator
+from src.infrastructure.indicators.atr_calculator import ATRCalculator
+from src.infrastructure.indicators.adx_calculator import ADXCalculator
+from src.application.signals.signal_generator import SignalGenerator
+from src.application.backtest.backtest_engine import BacktestEngine
+from src.application.backtest.execution_simulator import ExecutionSimulator
+
+
+def create_random_candles(count: int, seed: int, flat: bool = False) -> List[Candle]:
+    """Random-walk candles starting late in the day so VWAP crosses a session boundary."""
+    rng = random.Random(seed)
+    candles = []
+    price = 100.0
+    timestamp = datetime(2025, 1, 1, 20, 0, 0)
+
+    for _ in range(count):
+        if not flat or rng.random() < 0.3:
+            price = max(1.0, price + rng.gauss(0, 1))
+        open_ = price
+        close = price if flat and rng.random() < 0.5 else max(0.5, price + rng.gauss(0, 0.5))
+        candles.append(Candle(
+            timestamp=timestamp,
+            open=open_,
+            high=max(open_, close) + abs(rng.gauss(0, 0.3)),
+            low=min(open_, close) * 0.999,
+            close=close,
+            volume=rng.choice([0.0, rng.uniform(0, 1000)])
+        ))
+        timestamp += timedelta(minutes=15)
+    return candles
+
+
+class TestStreamingParity:
+    """Per-candle parity with the batch calculators"""
+
+    def setup_method(self):
+        self.vwap = VWAPCalculator()
+        self.bollinger = BollingerCalculator()
+        self.stoch_rsi = StochRSICalculator()
+        self.atr = ATRCalculator()
+        self.adx = ADXCalculator()
+
+    @pytest.mark.parametrize("seed,flat", [(1, False), (2, False), (3, True)])
+    def test_every_step_matches_batch(self, seed, flat):
+        candles = create_random_candles(200, seed, flat)
+        engine = IncrementalIndicatorEngine()
+
+        for i, candle in enumerate(candles):
+            snapshot = engine.update('BTCUSDT', '15m', candle)
+            history = candles[:i + 1]
+
+            assert snapshot.candle_count == i + 1
+            assert snapshot.vwap == self.vwap.calculate_vwap(history)
+            assert snapshot.bollinger == self.bollinger.calculate_bands(history, candle.close)
+            assert snapshot.stoch_rsi == self.stoch_rsi.calculate_stoch_rsi(history)
+            assert snapshot.atr == self.atr.calculate_atr(history)
+            assert snapshot.adx == self.adx.calculate_adx(history)
+
+    def test_stream_past_candle_store_eviction(self):
+        """The stream keeps history the bounded buffer has evicted: close, not identical."""
+        candles = create_random_candles(2300, 11)
+        store = CandleStore(maxlen=2000)
+        engine = IncrementalIndicatorEngine()
+        for candle in candles:
+            store.append(candle)
+            snapshot = engine.update('BTCUSDT', '15m', candle)
+
+        window = store.candles()
+        assert len(window) == 2000 and snapshot.candle_count == 2300
+        # VWAP only depends on the current session, which is still buffered
+        assert snapshot.vwap == self.vwap.calculate_vwap(window)
+
+        batch = {
+            'bollinger': self.bollinger.calculate_bands(window, window[-1].close),
+            'stoch_rsi': self.stoch_rsi.calculate_stoch_rsi(window),
+            'atr': self.atr.calculate_atr(window),
+            'adx': self.adx.calculate_adx(window),
+        }
+        for name, expected in batch.items():
+            for key, value in vars(expected).items():
+                streamed = getattr(getattr(snapshot, name), key)
+                if key == 'num_candles':
+                    assert streamed == 2300
+                elif isinstance(value, float):
+                    assert streamed == pytest.approx(value, rel=1e-12), (name, key)
+                else:
+                    assert streamed == value, (name, key)
+
+    def test_ema_rsi_match_talib(self):
+        talib = pytest.importorskip("talib")
+        candles = create_random_candles(300, 4)
+        engine = IncrementalIndicatorEngine(ema_periods=(7, 25), rsi_periods=(6,))
+        for candle in candles:
+            snapshot = engine.update('BTCUSDT', '1m', candle)
+
+        closes = np.array([c.close for c in candles])
+        # TA-Lib builds may contract multiply-adds (FMA), so allow last-ulp drift
+        assert snapshot.ema[7] == pytest.approx(talib.EMA(closes, 7)[-1], rel=1e-12)
+        assert snapshot.ema[25] == pytest.approx(talib.EMA(closes, 25)[-1], rel=1e-12)
+        assert snapshot.rsi[6] == pytest.approx(talib.RSI(closes, 6)[-1], rel=1e-12)
+
+
+class TestEngineStreams:
+    """Stream bookkeeping"""
+
+    def test_duplicate_and_stale_candles_ignored(self):
+        candles = create_random_candles(50, 5)
+        engine = IncrementalIndicatorEngine()
+        for candle in candles:
+            engine.update('btcusdt', '1m', candle)
+
+        before = engine.get_snapshot('BTCUSDT', '1m')
+        assert engine.update('btcusdt', '1m', candles[-1]) is before
+        assert engine.update('btcusdt', '1m', candles[10]) is before
+        assert before.candle_count == 50
+
+    def test_streams_are_isolated_and_resettable(self):
+        candles = create_random_candles(30, 6)
+        engine = IncrementalIndicatorEngine()
+        for candle in candles:
+            engine.update('btcusdt', '1m', candle)
+            engine.update('ethusdt', '1m', candle)
+        engine.update('btcusdt', '15m', candles[0])
+
+        engine.reset('btcusdt', '1m')
+        assert engine.get_snapshot('btcusdt', '1m') is None
+        assert engine.get_snapshot('ethusdt', '1m').candle_count == 30
+        assert engine.get_snapshot('btcusdt', '15m').candle_count == 1
+
+        engine.reset()
+        assert engine.get_snapshot('ethusdt', '1m') is None
+
+    def test_peek_matches_update_without_mutating(self):
+        candles = create_random_candles(80, 8)
+        engine = IncrementalIndicatorEngine()
+        reference = IncrementalIndicatorEngine()
+        for candle in candles[:-1]:
+            engine.update('btcusdt', '1m', candle)
+            reference.update('btcusdt', '1m', candle)
+
+        before = engine.get_snapshot('btcusdt', '1m')
+        for _ in range(3):
+            peeked = engine.peek('btcusdt', '1m', candles[-1])
+        assert engine.get_snapshot('btcusdt', '1m') is before
+        assert peeked == reference.update('btcusdt', '1m', candles[-1])
+        assert engine.peek('btcusdt', '1m', candles[10]) is before
+        assert engine.peek('ethusdt', '1m', candles[-1]) is None
+
+
+def _make_generator() -> SignalGenerator:
+    return SignalGenerator(
+        vwap_calculator=VWAPCalculator(),
+        bollinger_calculator=BollingerCalculator(),
+        stoch_rsi_calculator=StochRSICalculator(),
+        atr_calculator=ATRCalculator()
+    )
+
+
+def _signal_key(signal):
+    if signal is None:
+        return None
+    return (signal.signal_type, signal.entry_price, signal.stop_loss, signal.tp_levels, signal.confidence)
+
+
+class TestSignalGeneratorSnapshot:
+    """SignalGenerator gives the same signals with and without a snapshot"""
+
+    def test_signals_identical(self):
+        generator = _make_generator()
+        candles = create_random_candles(160, 7)
+        engine = IncrementalIndicatorEngine()
+
+        for i, candle in enumerate(candles):
+            snapshot = engine.update('BTCUSDT', '15m', candle)
+            history = candles[:i + 1]
+            batch = generator.generate_signal(history, 'BTCUSDT')
+            streamed = generator.generate_signal(history, 'BTCUSDT', indicator_snapshot=snapshot)
+            assert _signal_key(streamed) == _signal_key(batch)
+
+    def test_stale_snapshot_falls_back_to_batch(self):
+        generator = _make_generator()
+        candles = create_random_candles(80, 8)
+        engine = IncrementalIndicatorEngine()
+        for candle in candles[:-1]:
+            engine.update('BTCUSDT', '15m', candle)
+
+        stale = engine.get_snapshot('BTCUSDT', '15m')
+        assert not stale.matches(candles)
+        ctx = generator._prepare_market_context(candles, stale)
+        assert ctx.vwap_result == VWAPCalculator().calculate_vwap(candles)
+
+
+class _StubLoader(IHistoricalDataLoader):
+    def __init__(self, candles_by_symbol):
+        self.candles_by_symbol = candles_by_symbol
+
+    async def load_portfolio_data(self, symbols, interval, start_time, end_time=None):
+        if interval != '15m':
+            return {}
+        timeline = {}
+        for symbol in symbols:
+            for candle in self.candles_by_symbol[symbol]:
+                timeline.setdefault(candle.timestamp, {})[symbol] = candle
+        return timeline
+
+
+class TestBacktestEngineParity:
+    """Backtest results are unchanged when the engine is injected"""
+
+    def _run(self, indicator_engine):
+        data = {
+            'BTCUSDT': create_random_candles(250, 11),
+            'ETHUSDT': create_random_candles(250, 12),
+        }
+        engine = BacktestEngine(
+            signal_generator=_make_generator(),
+            loader=_StubLoader(data),
+            simulator=ExecutionSimulator(initial_balance=10000.0),
+            indicator_engine=indicator_engine
+        )
+        result = asyncio.run(engine.run_portfolio(
+            ['BTCUSDT', 'ETHUSDT'], '15m', datetime(2025, 1, 1)
+        ))
+        trades = [{k: v for k, v in t.items() if k != 'trade_id'} for t in result['trades']]
+        return trades, result['stats']
+
+    def test_trades_identical(self):
+        assert self._run(None) == self._run(IncrementalIndicatorEngine())
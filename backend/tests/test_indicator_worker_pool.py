@@ -0,0 +1,126 @@
+"""
+Tests for IndicatorWorkerPool: boundary batching, off-loop compute,
+on-loop apply, and per-boundary latency metrics.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.application.services.indicator_worker_pool import IndicatorWorkerPool
+from src.domain.entities.candle import Candle
+from src.infrastructure.di_container import DIContainer
+
+
+BOUNDARY = datetime(2026, 1, 5, 12, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def pool():
+    pool = IndicatorWorkerPool(max_workers=8, batch_window=0.05)
+    yield pool
+    pool.shutdown()
+
+
+class TestBatching:
+    async def test_full_boundary_dispatches_in_parallel(self, pool):
+        symbols = [f"sym{i}usdt" for i in range(8)]
+        for symbol in symbols:
+            pool.register_symbol(symbol)
+        loop_thread = threading.current_thread()
+        applied = []
+
+        def compute():
+            time.sleep(0.05)  # stands in for NumPy/TA-Lib work that releases the GIL
+            return threading.current_thread().name
+
+        for symbol in symbols:
+            pool.submit(symbol, '1m', BOUNDARY, compute,
+                        lambda worker, s=symbol: applied.append((s, worker, threading.current_thread())))
+        await pool.drain()
+
+        assert sorted(s for s, _, _ in applied) == symbols
+        assert all(worker.startswith('indicator-worker') for _, worker, _ in applied)
+        assert all(thread is loop_thread for _, _, thread in applied)
+
+        stats = pool.get_statistics()
+        assert stats['batches'] == 1 and stats['jobs'] == 8
+        last = stats['last']
+        assert last['symbols'] == 8 and last['wait_ms'] < 40  # all symbols in -> no window wait
+        assert last['compute_ms'] < 8 * 50 * 0.6  # threads overlapped
+        assert last['max_job_ms'] >= 45
+
+    async def test_partial_boundary_waits_for_window(self, pool):
+        for symbol in ('btcusdt', 'ethusdt', 'solusdt'):
+            pool.register_symbol(symbol)
+        applied = []
+        pool.submit('btcusdt', '1m', BOUNDARY, lambda: 1, applied.append)
+        pool.submit('ethusdt', '1m', BOUNDARY, lambda: 2, applied.append)
+        await asyncio.sleep(0)
+        assert applied == []
+
+        await asyncio.sleep(0.15)
+        assert sorted(applied) == [1, 2]
+        assert pool.get_statistics()['last']['wait_ms'] >= 40
+
+    async def test_per_symbol_order_and_errors(self, pool):
+        pool.register_symbol('btcusdt')
+        applied = []
+
+        def boom():
+            raise ValueError("bad candle")
+
+        pool.submit('btcusdt', '1m', BOUNDARY, lambda: '1m', applied.append)
+        pool.submit('btcusdt', '15m', BOUNDARY, boom, applied.append)
+        pool.submit('btcusdt', '1h', BOUNDARY, lambda: '1h', applied.append)
+        await pool.drain()
+
+        assert applied == ['1m', '1h']
+        assert pool.get_statistics()['errors'] == 1
+
+    def test_runs_inline_without_loop(self, pool):
+        applied = []
+        pool.submit('btcusdt', '1m', BOUNDARY, lambda: 42, applied.append)
+        assert applied == [42]
+        assert pool.get_statistics()['inline_jobs'] == 1
+
+
+class RecordingGenerator:
+    def __init__(self):
+        self.calls = []
+
+    def generate_signal(self, candles, symbol, **kwargs):
+        self.calls.append((symbol, len(candles), threading.current_thread().name))
+        return None
+
+
+class TestRealtimeServiceIntegration:
+    async def test_closed_candles_go_through_shared_pool(self, tmp_path):
+        container = DIContainer({'DATABASE_PATH': str(tmp_path / "pool.db")})
+        generator = RecordingGenerator()
+        services = []
+        for symbol in ('btcusdt', 'ethusdt'):
+            service = container.get_realtime_service(symbol)
+            service.signal_generator = generator
+            services.append(service)
+        pool = container.get_indicator_worker_pool()
+        assert all(service.indicator_pool is pool for service in services)
+
+        start = datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)
+        for service in services:
+            for i in range(25):
+                service._candles_1m.append(Candle(
+                    timestamp=start + timedelta(minutes=i), open=1.0, high=1.1, low=0.9, close=1.0, volume=1.0
+                ))
+            service._generate_signals()
+        await pool.drain()
+
+        assert sorted(symbol for symbol, _, _ in generator.calls) == ['btcusdt', 'ethusdt']
+        assert all(size == 25 and worker.startswith('indicator-worker') for _, size, worker in generator.calls)
+        last = pool.get_statistics()['last']
+        assert last['symbols'] == 2
+        assert last['boundary'] == (start + timedelta(minutes=25)).isoformat()
+        container.cleanup()
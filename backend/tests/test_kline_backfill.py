@@ -0,0 +1,78 @@
+"""
+Tests for the async kline backfill engine and the Binance weight limiter,
+run against a local stub kline server.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from src.infrastructure.api.binance_weight_limiter import BinanceWeightLimiter
+from src.infrastructure.data.kline_backfill import KlineBackfiller, KlineBackfillError
+from tests.stub_kline_server import StubKlineServer, make_klines
+
+
+START_MS = 1_740_787_200_000  # 2025-03-01 00:00 UTC
+MINUTE_MS = 60_000
+
+
+@pytest.fixture
+def server():
+    with StubKlineServer(make_klines(START_MS, MINUTE_MS, 3500)) as stub:
+        yield stub
+
+
+def make_backfiller(server, **kwargs):
+    kwargs.setdefault('limiter', BinanceWeightLimiter())
+    return KlineBackfiller(base_url=server.base_url, **kwargs)
+
+
+class TestKlineBackfiller:
+    async def test_concurrent_pages_cover_range_once(self, server):
+        backfiller = make_backfiller(server, max_concurrency=4, checkpoint_pages=2)
+        end_ms = START_MS + 3499 * MINUTE_MS
+
+        batches = [batch async for batch in backfiller.iter_batches('btcusdt', '1m', START_MS, end_ms)]
+        await backfiller.close()
+
+        assert [len(b) for b in batches] == [2000, 1500]
+        timestamps = np.concatenate([b.timestamp for b in batches])
+        np.testing.assert_array_equal(timestamps, START_MS + MINUTE_MS * np.arange(3500))
+        assert batches[0].close[0] == pytest.approx(100.0)
+        assert server.requests == 4
+        assert len(server.served_starts) == 4
+
+    async def test_limiter_follows_used_weight_header(self, server):
+        limiter = BinanceWeightLimiter(capacity=100, window_seconds=1.0, headroom=0.0)
+        server.used_weight = 95  # someone else on this IP already spent most of the minute
+        backfiller = make_backfiller(server, limiter=limiter, max_concurrency=1)
+
+        started = time.monotonic()
+        arrays = await backfiller.fetch_range('BTCUSDT', '1m', START_MS, START_MS + 1999 * MINUTE_MS)
+        await backfiller.close()
+
+        assert len(arrays) == 2000
+        assert limiter.server_used_weight == 105
+        assert limiter.get_statistics()['waits'] == 1
+        assert time.monotonic() - started >= 0.04
+
+    async def test_rate_limited_pages_are_retried(self, server):
+        server.rate_limit_next = 2
+        limiter = BinanceWeightLimiter()
+        backfiller = make_backfiller(server, limiter=limiter)
+
+        arrays = await backfiller.fetch_range('BTCUSDT', '1m', START_MS, START_MS + 999 * MINUTE_MS)
+        await backfiller.close()
+
+        assert len(arrays) == 1000
+        assert backfiller.retry_count == 2
+        assert limiter.get_statistics()['rate_limited'] == 2
+
+    async def test_gives_up_after_retries(self, server):
+        server.fail_after = 0
+        backfiller = make_backfiller(server, max_retries=1)
+        with pytest.raises(KlineBackfillError):
+            await backfiller.fetch_range('BTCUSDT', '1m', START_MS, START_MS + 10 * MINUTE_MS)
+        await backfiller.close()
+        assert server.requests == 2
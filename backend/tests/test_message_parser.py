@@ -0,0 +1,85 @@
+"""
+Tests for the kline stream fast path: single-pass KlineRecord decoding,
+trusted vs validated Candle construction, and BinanceWebSocketClient
+routing that matches the dict-based path.
+"""
+
+import json
+
+import pytest
+
+from src.domain.entities.candle import Candle
+from src.infrastructure.websocket.binance_websocket_client import BinanceWebSocketClient
+from src.infrastructure.websocket.message_parser import BinanceMessageParser, KlineRecord
+
+
+def frame(symbol: str = "btcusdt", interval: str = "15m", low: str = "89900.00",
+          combined: bool = True, closed: bool = True) -> str:
+    data = {
+        "e": "kline", "E": 1767571259000, "s": symbol.upper(),
+        "k": {"t": 1767571200000, "T": 1767572099999, "s": symbol.upper(), "i": interval,
+              "f": 10, "L": 42, "o": "90000.00", "c": "90100.50", "h": "90200.00", "l": low,
+              "v": "100.5", "n": 33, "x": closed},
+    }
+    return json.dumps({"stream": f"{symbol}@kline_{interval}", "data": data} if combined else data)
+
+
+class TestStreamParsing:
+    def test_record_fields(self):
+        record = BinanceMessageParser().parse_stream_message(frame())
+
+        assert record == KlineRecord(
+            symbol="btcusdt", interval="15m", open_time=1767571200000, event_time=1767571259000,
+            open=90000.0, high=90200.0, low=89900.0, close=90100.5, volume=100.5,
+            is_closed=True, first_trade_id=10, last_trade_id=42, number_of_trades=33,
+        )
+
+    @pytest.mark.parametrize("combined", [True, False])
+    def test_matches_dict_path(self, combined):
+        parser = BinanceMessageParser()
+        record, candle, metadata = parser.parse_stream(frame(combined=combined).encode())
+
+        data = json.loads(frame())["data"]
+        assert candle == parser.parse_kline_message(data)
+        expected = parser.extract_metadata(data)
+        expected['symbol'] = expected['symbol'].lower()
+        assert metadata == expected
+
+    def test_timestamps_are_cached_per_bar(self):
+        parser = BinanceMessageParser(trusted=True)
+        first = parser.parse_stream(frame())[1]
+        second = parser.parse_stream(frame(closed=False))[1]
+        assert first.timestamp is second.timestamp
+
+    def test_trusted_skips_candle_validation(self):
+        inverted = frame(low="95000.00")  # low above high
+
+        assert BinanceMessageParser(trusted=False).parse_stream(inverted) is None
+        candle = BinanceMessageParser(trusted=True).parse_stream(inverted)[1]
+        assert isinstance(candle, Candle) and candle.low == 95000.0
+
+    @pytest.mark.parametrize("raw", [
+        '{"stream": "btcusdt@bookTicker", "data": {"e": "bookTicker"}}',
+        '{"e": "kline", "k": {"t": 1}}',
+        '{"e": "kline", "k": {"t": 1, "s": "X", "i": "1m", "o": "a", "h": "1", "l": "1", "c": "1", "v": "1"}}',
+        'not json',
+    ])
+    def test_non_kline_and_malformed_frames(self, raw):
+        assert BinanceMessageParser(trusted=True).parse_stream(raw) is None
+
+
+class TestClientFastPath:
+    async def test_routes_like_dict_path(self):
+        fast, slow = BinanceWebSocketClient(), BinanceWebSocketClient()
+        received = {'fast': [], 'slow': []}
+        fast.subscribe_candle(lambda candle, metadata: received['fast'].append((candle, metadata)))
+        slow.subscribe_candle(lambda candle, metadata: received['slow'].append((candle, metadata)))
+        slow.subscribe_kline(lambda data: None)  # raw subscribers force the dict path
+
+        for raw in (frame(), frame("ethusdt", "1m", closed=False), '{"result": null, "id": 1}'):
+            await fast._process_message(raw)
+            await slow._process_message(raw)
+
+        assert len(received['fast']) == 2
+        assert received['fast'] == received['slow']
+        assert received['fast'][1][1]['symbol'] == 'ethusdt' and received['fast'][1][1]['interval'] == '1m'
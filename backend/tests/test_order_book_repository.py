@@ -0,0 +1,203 @@
+"""
+Tests for OrderBookRepository: in-memory PENDING/OPEN book indexed by
+(symbol, side), write-behind journal to SQLite, rebuild on startup, and
+tick matching without DB reads.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from src.application.services.paper_trading_service import PaperTradingService
+from src.domain.entities.paper_position import PaperPosition
+from src.infrastructure.persistence.order_book_repository import OrderBookRepository
+from src.infrastructure.persistence.order_write_behind import OrderWriteBehindQueue
+from src.infrastructure.persistence.sqlite_order_repository import SQLiteOrderRepository
+
+
+def position(id: str, symbol: str = "btcusdt", side: str = "LONG", status: str = "PENDING",
+             entry_price: float = 100.0) -> PaperPosition:
+    return PaperPosition(
+        id=id, symbol=symbol, side=side, status=status,
+        entry_price=entry_price, quantity=1.0, leverage=1, margin=entry_price,
+        liquidation_price=0.0, stop_loss=0.0, take_profit=0.0,
+        open_time=datetime.now(),  # inside the pending-order TTL
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteOrderRepository(db_path=str(tmp_path / "orders.db"))
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def book(store):
+    book = OrderBookRepository(store)
+    yield book
+    book.close()
+
+
+class TestBook:
+    def test_rebuild_loads_live_positions(self, store):
+        store.save_order(position("p1", status="PENDING"))
+        store.save_order(position("o1", symbol="ethusdt", side="SHORT", status="OPEN"))
+        store.save_order(position("c1", status="CLOSED"))
+        store.update_account_balance(12_345.0)
+
+        book = OrderBookRepository(store)
+        try:
+            assert [p.id for p in book.get_pending_orders()] == ["p1"]
+            assert [p.id for p in book.get_active_orders_by_symbol("ETHUSDT", "SHORT")] == ["o1"]
+            assert book.get_active_orders_by_symbol("ethusdt", "LONG") == []
+            assert book.get_account_balance() == 12_345.0
+            assert book.get_statistics()['live'] == 2
+        finally:
+            book.close()
+
+    def test_status_changes_move_between_buckets(self, book):
+        order = position("p1")
+        book.save_order(order)
+        assert [o.id for o in book.get_pending_orders_by_symbol("btcusdt")] == ["p1"]
+
+        order.status = "OPEN"
+        book.update_order(order)
+        assert book.get_pending_orders_by_symbol("btcusdt") == []
+        assert [p.id for p in book.get_active_orders_by_symbol("btcusdt", "LONG")] == ["p1"]
+
+        order.status = "CLOSED"
+        order.close_time = datetime(2026, 1, 5, 13, 0)
+        book.update_order(order)
+        assert book.get_active_orders() == []
+        # History reads flush the journal first
+        assert [p.id for p in book.get_closed_orders()] == ["p1"]
+        assert book.get_order("p1").status == "CLOSED"
+
+    def test_reads_return_copies(self, book):
+        book.save_order(position("p1"))
+        book.get_pending_orders()[0].entry_price = 1.0
+        assert book.get_order("p1").entry_price == 100.0
+
+    def test_update_of_unknown_id_does_not_create_row(self, book):
+        book.update_order(position("ghost", status="OPEN"))
+        assert book.get_active_orders() == []
+
+
+class TestWriteBehind:
+    def test_journal_folds_updates_per_position(self, book, store):
+        order = position("o1", status="OPEN")
+        book.save_order(order)
+        for price in (101.0, 102.0, 103.0):
+            order.highest_price = price
+            book.update_order(order)
+        book.update_account_balance(9_000.0)
+        assert book.flush()
+
+        assert store.get_order("o1").highest_price == 103.0
+        assert store.get_account_balance() == 9_000.0
+        journal = book.get_statistics()['journal']
+        assert journal['journaled'] == 5 and journal['written'] <= 4
+
+    def test_restart_sees_journaled_state(self, tmp_path):
+        store = SQLiteOrderRepository(db_path=str(tmp_path / "restart.db"))
+        book = OrderBookRepository(store)
+        book.save_order(position("p1"))
+        opened = position("o1", status="OPEN")
+        book.save_order(opened)
+        opened.stop_loss = 95.0
+        book.update_order(opened)
+        book.close()
+
+        book = OrderBookRepository(SQLiteOrderRepository(db_path=str(tmp_path / "restart.db")))
+        try:
+            assert [p.id for p in book.get_pending_orders()] == ["p1"]
+            assert book.get_active_orders()[0].stop_loss == 95.0
+        finally:
+            book.close()
+
+    def test_failed_batch_is_retried(self):
+        written = []
+        failures = [RuntimeError("database is locked")]
+
+        def writer(saved, updated, balance):
+            if failures:
+                raise failures.pop()
+            written.extend(p.id for p in saved + updated)
+            return len(saved) + len(updated)
+
+        journal = OrderWriteBehindQueue(writer, flush_interval=0.01)
+        journal.save(position("p1"))
+        journal.flush(timeout=1)
+        journal.update(position("p1", status="OPEN"))
+        journal.close()
+
+        assert written == ["p1"]
+        assert journal.get_statistics()['failed_batches'] == 1
+
+
+class NoScanStore(SQLiteOrderRepository):
+    """Store that fails the test if the tick path scans SQLite."""
+    scans_allowed = True
+
+    def get_pending_orders(self):
+        assert self.scans_allowed, "PENDING scan on the tick path"
+        return super().get_pending_orders()
+
+    def get_active_orders(self):
+        assert self.scans_allowed, "OPEN scan on the tick path"
+        return super().get_active_orders()
+
+
+class TestTickMatching:
+    def test_fill_and_merge_without_db_reads(self, tmp_path):
+        store = NoScanStore(db_path=str(tmp_path / "ticks.db"))
+        book = OrderBookRepository(store)
+        service = PaperTradingService(book)
+        store.scans_allowed = False
+        try:
+            book.save_order(position("o1", status="OPEN", entry_price=100.0))
+            book.save_order(position("p1", entry_price=99.0))
+            book.save_order(position("p2", symbol="ethusdt", entry_price=50.0))
+
+            service.process_market_data(current_price=99.2, high=99.5, low=98.9, symbol="btcusdt")
+
+            merged = book.get_active_orders_by_symbol("btcusdt", "LONG")
+            assert [p.id for p in merged] == ["o1"]
+            assert merged[0].quantity == 2.0 and merged[0].entry_price == pytest.approx(99.5)
+            assert [o.id for o in book.get_pending_orders()] == ["p2"]
+        finally:
+            store.scans_allowed = True
+            book.close()
+
+
+class TestServiceSerialization:
+    def test_stale_copy_is_not_closed_twice(self, book):
+        service = PaperTradingService(book)
+        book.save_order(position("o1", status="OPEN", entry_price=100.0))
+        stale = book.get_order("o1")  # e.g. the copy a tick is matching
+        balance = book.get_account_balance()
+
+        assert service.close_position_by_id("o1", 110.0, "MANUAL_CLOSE")
+        assert service.close_position(stale, 90.0, "STOP_LOSS") is False
+        assert not service.close_position_by_id("o1", 110.0)
+
+        closed = book.get_order("o1")
+        assert (closed.status, closed.exit_reason) == ("CLOSED", "MANUAL_CLOSE")
+        assert book.get_account_balance() == balance + 10.0
+
+    def test_racing_closes_and_cancels_credit_once(self, book):
+        service = PaperTradingService(book)
+        book.save_order(position("o1", status="OPEN", entry_price=100.0))
+        book.save_order(position("p1", entry_price=99.0))
+        balance = book.get_account_balance()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            closes = list(pool.map(lambda _: service.close_position_by_id("o1", 105.0), range(16)))
+            cancels = list(pool.map(lambda _: service.cancel_pending_order("p1"), range(16)))
+
+        assert closes.count(True) == 1
+        assert sum(order is not None for order in cancels) == 1
+        assert book.get_account_balance() == balance + 5.0 + 99.0
+        assert service.cancel_all_pending_orders() == (0, 0.0)
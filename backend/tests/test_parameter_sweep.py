@@ -0,0 +1,267 @@
+"""
+Tests for the parallel parameter sweep / walk-forward optimizer.
+"""
+
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+
+from src.domain.entities.candle import Candle
+from src.domain.entities.candle_store import CandleArrays
+from src.domain.interfaces.i_historical_data_loader import IHistoricalDataLoader
+from src.infrastructure.indicators.vwap_calculator import VWAPCalculator
+from src.infrastructure.indicators.bollinger_calculator import BollingerCalculator
+from src.infrastructure.indicators.stoch_rsi_calculator import StochRSICalculator
+from src.infrastructure.indicators.atr_calculator import ATRCalculator
+from src.application.signals.signal_generator import SignalGenerator
+from src.application.backtest.backtest_engine import BacktestEngine
+from src.application.backtest.execution_simulator import ExecutionSimulator
+from src.application.backtest.parameter_sweep import (
+    BayesianSampler,
+    GridSampler,
+    ParameterSweepRunner,
+    RandomSampler,
+    SharedCandleBlock,
+    SweepConfig,
+    WalkForwardConfig,
+    WindowedCandleLoader,
+    compute_run_metrics,
+    walk_forward_windows,
+)
+
+
+def create_random_candles(count: int, seed: int) -> List[Candle]:
+    """Mean-reverting random walk, 15m bars, tz-aware like HistoricalDataLoader."""
+    rng = random.Random(seed)
+    candles = []
+    price = 100.0
+    timestamp = datetime(2025, 1, 1, 18, 0, 0, tzinfo=timezone.utc)
+
+    for _ in range(count):
+        timestamp += timedelta(minutes=15)
+        price = max(1.0, price + rng.gauss(0, 0.4) + (100.0 - price) * 0.05)
+        close = max(0.5, price + rng.gauss(0, 0.3))
+        candles.append(Candle(
+            timestamp=timestamp,
+            open=price,
+            high=max(price, close) * (1 + abs(rng.gauss(0, 0.002))),
+            low=min(price, close) * (1 - abs(rng.gauss(0, 0.002))),
+            close=close,
+            volume=rng.uniform(1, 1000)
+        ))
+    return candles
+
+
+def make_generator() -> SignalGenerator:
+    """Module-level so worker processes can unpickle it."""
+    return SignalGenerator(
+        vwap_calculator=VWAPCalculator(),
+        bollinger_calculator=BollingerCalculator(),
+        stoch_rsi_calculator=StochRSICalculator(),
+        atr_calculator=ATRCalculator()
+    )
+
+
+class _StubLoader(IHistoricalDataLoader):
+    def __init__(self, candles_by_symbol):
+        self.candles_by_symbol = candles_by_symbol
+
+    async def load_portfolio_data(self, symbols, interval, start_time, end_time=None):
+        if interval != '15m':
+            return {}
+        timeline = {}
+        for symbol in symbols:
+            for candle in self.candles_by_symbol[symbol]:
+                timeline.setdefault(candle.timestamp, {})[symbol] = candle
+        return timeline
+
+
+class TestSamplers:
+    """Grid / random / Bayesian proposal logic"""
+
+    def test_grid_enumerates_product(self):
+        sampler = GridSampler({'a': [1, 2, 3], 'b': [0.1, 0.2]})
+        proposals = sampler.ask(4) + sampler.ask(100)
+        assert len(sampler) == 6
+        assert len(proposals) == 6
+        assert {(p['a'], p['b']) for p in proposals} == {(a, b) for a in (1, 2, 3) for b in (0.1, 0.2)}
+        assert sampler.ask(10) == []
+
+    def test_grid_rejects_ranges(self):
+        with pytest.raises(ValueError):
+            GridSampler({'a': (0.0, 1.0)})
+
+    def test_random_is_seeded_and_bounded(self):
+        space = {'risk': (0.005, 0.02), 'positions': (1, 5), 'mode': ['ISOLATED', 'SHARK_TANK']}
+        first = RandomSampler(space, n_trials=30, seed=7).ask(100)
+        second = RandomSampler(space, n_trials=30, seed=7).ask(100)
+        assert first == second
+        assert len(first) == 30
+        for params in first:
+            assert 0.005 <= params['risk'] <= 0.02
+            assert isinstance(params['positions'], int) and 1 <= params['positions'] <= 5
+            assert params['mode'] in ('ISOLATED', 'SHARK_TANK')
+
+    def test_bayesian_moves_towards_optimum(self):
+        sampler = BayesianSampler({'x': (0.0, 1.0), 'y': (0.0, 1.0)}, n_trials=30, seed=3, n_initial=6)
+        scores = []
+        while True:
+            batch = sampler.ask(3)
+            if not batch:
+                break
+            for params in batch:
+                assert 0.0 <= params['x'] <= 1.0 and 0.0 <= params['y'] <= 1.0
+                score = -((params['x'] - 0.7) ** 2 + (params['y'] - 0.2) ** 2)
+                sampler.tell(params, score)
+                scores.append(score)
+
+        assert len(scores) == 30
+        assert max(scores[6:]) > max(scores[:6])
+        assert max(scores) > -0.01
+
+
+class TestWalkForwardWindows:
+    def test_rolling_windows(self):
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        windows = walk_forward_windows(start, start + timedelta(days=100), WalkForwardConfig(30, 10))
+        assert len(windows) == 7
+        for w in windows:
+            assert w.train_end < w.test_start <= w.test_end
+            assert w.test_start - w.train_start == timedelta(days=30)
+        assert windows[1].train_start == start + timedelta(days=10)
+        assert windows[-1].test_end <= start + timedelta(days=100)
+
+    def test_anchored_windows_expand(self):
+        start = datetime(2025, 1, 1)
+        windows = walk_forward_windows(start, start + timedelta(days=60), WalkForwardConfig(30, 10, anchored=True))
+        assert [w.train_start for w in windows] == [start] * 3
+        assert windows[-1].test_start == start + timedelta(days=50)
+
+
+class TestSharedCandleBlock:
+    @pytest.mark.parametrize("tz_aware", [True, False])
+    def test_round_trip(self, tz_aware):
+        data = {'BTCUSDT': create_random_candles(50, 1), 'ETHUSDT': create_random_candles(20, 2), 'EMPTY': []}
+        if not tz_aware:
+            data = {
+                sym: [Candle(c.timestamp.replace(tzinfo=None), c.open, c.high, c.low, c.close, c.volume) for c in candles]
+                for sym, candles in data.items()
+            }
+
+        with SharedCandleBlock.create(data) as block:
+            attached = SharedCandleBlock.attach(block.spec)
+            try:
+                restored = attached.to_candles()
+                views = attached.arrays()
+                assert views['BTCUSDT'].close.tolist() == [c.close for c in data['BTCUSDT']]
+                assert not views['ETHUSDT'].timestamp.flags.owndata and len(views['EMPTY']) == 0
+                del views
+            finally:
+                attached.close()
+
+        assert restored == data
+
+    def test_windowed_loader_prepends_warmup(self):
+        candles = create_random_candles(100, 3)
+        loader = WindowedCandleLoader({'BTCUSDT': CandleArrays.from_candles(candles)}, '15m', warmup_bars=5)
+        timeline = asyncio.run(loader.load_portfolio_data(
+            ['BTCUSDT'], '15m', candles[40].timestamp, candles[59].timestamp
+        ))
+        assert [bars['BTCUSDT'] for bars in timeline.values()] == candles[35:60]
+        # Walk-forward windows end just before the next window's first candle
+        timeline = asyncio.run(loader.load_portfolio_data(
+            ['BTCUSDT', 'ETHUSDT'], '15m', candles[0].timestamp, candles[10].timestamp - timedelta(microseconds=1)
+        ))
+        assert list(timeline) == [c.timestamp for c in candles[:10]]
+        assert asyncio.run(loader.load_portfolio_data(['BTCUSDT'], '4h', candles[0].timestamp)) == {}
+
+
+class TestParameterSweepRunner:
+    """End-to-end sweeps over a process pool"""
+
+    def setup_method(self):
+        self.data = {
+            'BTCUSDT': create_random_candles(700, 11),
+            'ETHUSDT': create_random_candles(700, 12),
+        }
+        self.simulator_defaults = {'initial_balance': 10000.0, 'mode': "SHARK_TANK", 'max_positions': 2}
+
+    def _config(self, **overrides):
+        config = dict(
+            symbols=['BTCUSDT', 'ETHUSDT'],
+            interval='15m',
+            start_time=self.data['BTCUSDT'][0].timestamp,
+            end_time=self.data['BTCUSDT'][-1].timestamp,
+            space={'risk_per_trade': [0.005, 0.02], 'signal.SNIPER_PROXIMITY': [0.01, 0.015]},
+            simulator_defaults=self.simulator_defaults,
+            max_workers=2
+        )
+        config.update(overrides)
+        return SweepConfig(**config)
+
+    def test_grid_sweep_matches_direct_backtest_and_resumes(self, tmp_path):
+        results = tmp_path / "sweep.parquet"
+        runner = ParameterSweepRunner(self._config(), _StubLoader(self.data), make_generator, results)
+        report = asyncio.run(runner.run())
+
+        assert report.evaluated == 4
+        assert len(report.rows) == 4
+        assert report.best['score'] == max(r['score'] for r in report.rows)
+
+        # Same numbers as a plain BacktestEngine run with those parameters
+        params = json.loads(report.best['params_json'])
+        generator = make_generator()
+        generator.SNIPER_PROXIMITY = params['signal.SNIPER_PROXIMITY']
+        engine = BacktestEngine(
+            signal_generator=generator,
+            loader=_StubLoader(self.data),
+            simulator=ExecutionSimulator(risk_per_trade=params['risk_per_trade'], **self.simulator_defaults),
+            mode=BacktestEngine.MODE_VECTORIZED
+        )
+        direct = asyncio.run(engine.run_portfolio(['BTCUSDT', 'ETHUSDT'], '15m', self.data['BTCUSDT'][0].timestamp))
+        assert direct['stats']['total_trades'] > 0, "fixture should produce trades"
+        assert report.best['net_return_pct'] == direct['stats']['net_return_pct']
+        assert report.best['total_trades'] == direct['stats']['total_trades']
+
+        # Re-running against the same results dataset executes nothing
+        resumed = asyncio.run(ParameterSweepRunner(
+            self._config(), _StubLoader(self.data), make_generator, results
+        ).run())
+        assert resumed.evaluated == 0
+        assert sorted(r['run_key'] for r in resumed.rows) == sorted(r['run_key'] for r in report.rows)
+
+    def test_walk_forward_scores_out_of_sample(self, tmp_path):
+        config = self._config(walk_forward=WalkForwardConfig(train_days=3, test_days=1))
+        report = asyncio.run(ParameterSweepRunner(
+            config, _StubLoader(self.data), make_generator, tmp_path / "wf.parquet"
+        ).run())
+
+        # 700 x 15m bars = 7.3 days -> 4 rolling 3d+1d windows
+        assert len(report.out_of_sample) == 4
+        for window, row in enumerate(report.out_of_sample):
+            assert row['phase'] == 'test'
+            train = [r for r in report.rows if r['phase'] == 'train' and r['window'] == window]
+            assert len(train) == 4
+            best = max(train, key=lambda r: r['score'])
+            assert row['params_json'] == best['params_json']
+            assert row['start'] > best['end']
+
+
+class TestRunMetrics:
+    def test_drawdown_and_window_filter(self):
+        t0 = datetime(2025, 1, 1)
+        equity = [{'time': t0 + timedelta(minutes=15 * i), 'balance': b}
+                  for i, b in enumerate([100.0, 50.0, 100.0, 120.0, 90.0, 130.0])]
+        result = {'stats': {'net_return_pct': 30.0, 'total_trades': 3}, 'equity': equity}
+
+        metrics = compute_run_metrics(result, None, 35040)
+        assert metrics['max_drawdown_pct'] == 50.0
+        assert metrics['calmar'] == pytest.approx(0.6)
+
+        windowed = compute_run_metrics(result, equity[2]['time'], 35040)
+        assert windowed['max_drawdown_pct'] == pytest.approx(25.0)
+        assert windowed['sharpe'] > 0
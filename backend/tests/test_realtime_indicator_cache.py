@@ -0,0 +1,120 @@
+"""
+Tests for RealtimeService.get_latest_indicators caching: served from cache
+between ticks, last-bar-only updates on forming ticks, rebuild on close.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.domain.entities.candle import Candle
+from src.infrastructure.di_container import DIContainer
+
+
+START = datetime(2025, 6, 2, tzinfo=timezone.utc)
+
+
+def make_candles(count: int, seed: int = 5):
+    rng = np.random.default_rng(seed)
+    closes = 100 + np.cumsum(rng.normal(0, 0.4, count))
+    return [
+        Candle(
+            timestamp=START + timedelta(minutes=i),
+            open=float(c) - 0.05, high=float(c) + 0.3, low=float(c) - 0.3, close=float(c),
+            volume=float(5 + (i * 7) % 11)
+        )
+        for i, c in enumerate(closes)
+    ]
+
+
+def with_close(candle: Candle, close: float) -> Candle:
+    return Candle(
+        timestamp=candle.timestamp, open=candle.open, high=max(candle.high, close),
+        low=min(candle.low, close), close=close, volume=candle.volume + 1
+    )
+
+
+@pytest.fixture
+def service(tmp_path):
+    container = DIContainer({'DATABASE_PATH': str(tmp_path / "test.db")})
+    service = container.get_realtime_service('btcusdt')
+    yield service
+    container.cleanup()
+
+
+class _CountingZoneDetector:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def detect_zones(self, candles, current_price=None, atr_value=None):
+        self.calls.append((current_price, atr_value))
+        return self
+
+    def to_dict(self):
+        return {'zones': 1}
+
+
+def load(service, candles):
+    for candle in candles[:-1]:
+        service._candles_1m.append(candle)
+        service._feed_indicator_engine('1m', candle)
+    service._latest_1m = candles[-1]
+
+
+class TestIndicatorCache:
+    def test_between_ticks_served_from_cache(self, service):
+        load(service, make_candles(150))
+        first = service.get_latest_indicators('1m')
+        first['rsi'] = -1  # callers get a copy
+        second = service.get_latest_indicators('1m')
+
+        assert second['rsi'] != -1
+        assert service.get_status()['indicator_cache'] == {'hits': 1, 'incremental': 0, 'rebuilds': 1}
+
+    def test_forming_tick_only_updates_last_bar(self, service, monkeypatch):
+        candles = make_candles(150)
+        load(service, candles)
+        calls = []
+        monkeypatch.setattr(service.signal_generator, 'liquidity_zone_detector', _CountingZoneDetector(calls), raising=False)
+        before = service.get_latest_indicators('1m')
+        # ATR comes from the engine snapshot of the evaluated window
+        forming_atr = service.indicator_engine.peek('btcusdt', '1m', candles[-1]).atr.atr_value
+        assert calls == [(before['close'], forming_atr)]
+
+        service._latest_1m = with_close(candles[-1], candles[-1].close + 2.0)
+        after = service.get_latest_indicators('1m')
+
+        assert service.get_status()['indicator_cache']['incremental'] == 1
+        assert len(calls) == 1  # closed-candle structure reused
+        assert after['close'] == candles[-1].close + 2.0
+        assert after['ema_7'] > before['ema_7']
+        assert after['liquidity_zones'] == before['liquidity_zones'] == {'zones': 1}
+        # Engine state itself is untouched by the forming candle
+        assert service.get_indicator_snapshot('1m').timestamp == candles[-2].timestamp
+
+    def test_closed_candle_rebuilds(self, service):
+        candles = make_candles(151)
+        load(service, candles[:-1])
+        service.get_latest_indicators('1m')
+
+        service._candles_1m.append(candles[-2])
+        service._feed_indicator_engine('1m', candles[-2])
+        service._latest_1m = candles[-1]
+        service.get_latest_indicators('1m')
+        assert service.get_status()['indicator_cache']['rebuilds'] == 2
+
+    def test_streaming_path_matches_batch_path(self, service):
+        # 99 closed + 1 forming: the engine has seen exactly the batch window
+        candles = make_candles(100)
+        load(service, candles)
+        streaming = service.get_latest_indicators('1m')
+
+        service._indicator_cache.clear()
+        engine, service.indicator_engine = service.indicator_engine, None
+        batch = service.get_latest_indicators('1m')
+        service.indicator_engine = engine
+
+        for key in ('close', 'ema_7', 'ema_25', 'rsi_6', 'volume_ma_20', 'vwap', 'bb_upper', 'bb_lower', 'stoch_k', 'stoch_d'):
+            assert streaming[key] == pytest.approx(batch[key], rel=1e-9), key
+        assert streaming['bollinger'] == pytest.approx(batch['bollinger'])
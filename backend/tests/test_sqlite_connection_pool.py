@@ -0,0 +1,116 @@
+"""
+Tests for the shared SQLite connection pool and its DI wiring.
+"""
+
+import threading
+
+from src.infrastructure.di_container import DIContainer
+from src.infrastructure.persistence.sqlite_connection_pool import SQLiteConnectionPool
+from src.infrastructure.persistence.sqlite_state_repository import SQLiteStateRepository
+from src.infrastructure.repositories.sqlite_signal_repository import SQLiteSignalRepository
+
+
+class TestSQLiteConnectionPool:
+    def test_connection_reused_per_thread(self, tmp_path):
+        pool = SQLiteConnectionPool(str(tmp_path / "pool.db"))
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+        assert first is second
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(pool.acquire()))
+        thread.start()
+        thread.join()
+        assert other[0] is not first
+        assert pool.get_statistics()['connections'] == 2
+        pool.close()
+
+    def test_pragmas(self, tmp_path):
+        pool = SQLiteConnectionPool(str(tmp_path / "pool.db"))
+        with pool.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        pool.close()
+
+    def test_uncommitted_work_rolled_back_on_release(self, tmp_path):
+        pool = SQLiteConnectionPool(str(tmp_path / "pool.db"))
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.commit()
+
+        try:
+            with pool.connection() as conn:
+                conn.execute("INSERT INTO t VALUES (1)")
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO t VALUES (2)")
+            with pool.connection() as inner:  # re-entrant: inner release keeps the transaction
+                assert inner is conn
+            assert conn.in_transaction
+            conn.commit()
+            rows = [row[0] for row in conn.execute("SELECT x FROM t")]
+        assert rows == [2]
+        pool.close()
+
+    def test_memory_connection_is_borrowed_exclusively(self):
+        pool = SQLiteConnectionPool(":memory:")
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.commit()
+
+        seen = []
+
+        def other_thread():
+            with pool.connection() as other:
+                seen.append([row[0] for row in other.execute("SELECT x FROM t")])
+
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+            thread = threading.Thread(target=other_thread)
+            thread.start()
+            thread.join(timeout=0.2)
+            # The other thread waits instead of reading (or committing) our open transaction
+            assert thread.is_alive() and seen == []
+            conn.commit()
+        thread.join()
+        assert seen == [[1]]
+        pool.close()
+
+    def test_close_then_reconnect(self, tmp_path):
+        pool = SQLiteConnectionPool(str(tmp_path / "pool.db"))
+        pool.close()
+        with pool.connection() as conn:
+            assert conn.execute("SELECT 1").fetchone()[0] == 1
+        pool.close()
+
+
+class TestContainerPooling:
+    def test_repositories_share_pool(self, tmp_path):
+        db_path = str(tmp_path / "trading_system.db")
+        container = DIContainer({'DATABASE_PATH': db_path})
+        pool = container.get_sqlite_pool(db_path)
+
+        order_repo = container.get_order_repository()
+        state_repo = container.get_state_repository()
+        signal_repo = container.get_signal_repository()
+        assert order_repo.store._pool is pool
+        assert state_repo._pool is pool
+        assert signal_repo._pool is pool
+        assert 'signals' in pool.known_tables
+
+        assert order_repo.get_account_balance() == 10000.0
+        assert signal_repo.get_pending_count() == 0
+        container.cleanup()
+
+    def test_standalone_repositories_still_work(self, tmp_path):
+        db_path = str(tmp_path / "nested" / "state.db")
+        repo = SQLiteStateRepository(db_path)
+        assert repo.has_state("btcusdt") is False
+
+        signals = SQLiteSignalRepository(db_path)
+        assert signals.get_total_count() == 0
@@ -0,0 +1,214 @@
+"""
+Tests for the single-table candle schema, retention and legacy migration.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from src.application.services.data_retention_service import DataRetentionService
+from src.domain.entities.candle import Candle
+from src.infrastructure.persistence.sqlite_market_data_repository import SQLiteMarketDataRepository
+
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def create_candles(count: int, start: datetime = START, step: timedelta = timedelta(minutes=1)) -> List[Candle]:
+    return [
+        Candle(timestamp=start + step * i, open=100.0 + i, high=101.0 + i, low=99.0 + i, close=100.5 + i, volume=5.0)
+        for i in range(count)
+    ]
+
+
+def make_repo(tmp_path) -> SQLiteMarketDataRepository:
+    return SQLiteMarketDataRepository(str(tmp_path / "market.db"), write_behind=False)
+
+
+class TestCandlesTable:
+    def test_schema_is_clustered_without_rowid(self, tmp_path):
+        repo = make_repo(tmp_path)
+        repo.save_candles_batch(create_candles(3), '1m', 'BTCUSDT')
+
+        conn = sqlite3.connect(tmp_path / "market.db")
+        sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'candles'").fetchone()[0]
+        assert 'WITHOUT ROWID' in sql
+        assert conn.execute("SELECT symbol, typeof(ts), ts FROM candles ORDER BY ts LIMIT 1").fetchone() == (
+            'btcusdt', 'integer', int(START.timestamp() * 1000)
+        )
+        # No per-symbol tables any more
+        assert repo.get_legacy_tables() == []
+        conn.close()
+
+    def test_queries(self, tmp_path):
+        repo = make_repo(tmp_path)
+        repo.save_candles_batch(create_candles(60), '1m', 'btcusdt')
+        repo.save_candles_batch(create_candles(30), '1m', 'ethusdt')
+
+        latest = repo.get_latest_candles('btcusdt', '1m', 5)
+        assert [md.candle.timestamp for md in latest] == [START + timedelta(minutes=m) for m in range(59, 54, -1)]
+        assert latest[0].candle.timestamp.tzinfo is not None
+
+        in_range = repo.get_candles_by_date_range('1m', START + timedelta(minutes=10), START + timedelta(minutes=19))
+        assert len(in_range) == 10
+
+        assert repo.get_record_count('1m', 'ethusdt') == 30
+        assert repo.get_latest_timestamp('1m', 'ethusdt') == START + timedelta(minutes=29)
+        assert repo.get_latest_candles('solusdt', '1m') == []
+        assert repo.get_table_info('1m', 'btcusdt')['record_count'] == 60
+
+    def test_multi_symbol_history_in_one_query(self, tmp_path):
+        repo = make_repo(tmp_path)
+        repo.save_candles_batch(create_candles(20), '15m', 'btcusdt')
+        repo.save_candles_batch(create_candles(20), '15m', 'ethusdt')
+
+        history = repo.get_candles_for_symbols(
+            ['BTCUSDT', 'ethusdt', 'solusdt'], '15m', START, START + timedelta(minutes=4)
+        )
+        assert {s: len(v) for s, v in history.items()} == {'btcusdt': 5, 'ethusdt': 5, 'solusdt': 0}
+        assert history['btcusdt'][0].candle.timestamp == START
+
+
+class TestRetention:
+    def test_single_delete_across_symbols(self, tmp_path):
+        repo = make_repo(tmp_path)
+        for symbol in ('btcusdt', 'ethusdt'):
+            repo.save_candles_batch(create_candles(10), '1m', symbol)
+            repo.save_candles_batch(create_candles(10, step=timedelta(hours=1)), '1h', symbol)
+
+        deleted = repo.delete_expired_candles({
+            '1m': START + timedelta(minutes=5),
+            '1h': START + timedelta(hours=2),
+        })
+        assert deleted == 2 * 5 + 2 * 2
+        assert repo.get_record_count('1m', 'ethusdt') == 5
+        assert repo.get_record_count('1h', 'btcusdt') == 8
+
+    def test_retention_service_uses_policy(self, tmp_path):
+        repo = make_repo(tmp_path)
+        now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        repo.save_candles_batch(create_candles(3, start=now - timedelta(days=10)), '1m', 'xrpusdt')
+        repo.save_candles_batch(create_candles(3, start=now - timedelta(hours=1)), '1m', 'xrpusdt')
+
+        service = DataRetentionService(repo, retention_days={'1m': 7})
+        assert service.run_cleanup_sync() == 3
+        assert repo.get_record_count('1m', 'xrpusdt') == 3
+
+
+class TestLegacyMigration:
+    def _create_legacy_table(self, path, table, rows):
+        conn = sqlite3.connect(path)
+        conn.execute(f'''
+            CREATE TABLE {table} (
+                timestamp TEXT PRIMARY KEY, open REAL, high REAL, low REAL, close REAL,
+                volume REAL, ema_7 REAL, rsi_6 REAL, volume_ma_20 REAL
+            )
+        ''')
+        conn.executemany(f"INSERT INTO {table} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.commit()
+        conn.close()
+
+    def test_migrates_and_drops_legacy_tables(self, tmp_path):
+        path = tmp_path / "market.db"
+        rows = [
+            ((START + timedelta(minutes=i)).isoformat(), 1.0, 2.0, 0.5, 1.5, 10.0, 1.1, 55.0, 9.0)
+            for i in range(25)
+        ]
+        self._create_legacy_table(path, 'ethusdt_15m', rows)
+        self._create_legacy_table(path, 'btcusdt_1m', [])
+
+        repo = make_repo(tmp_path)
+        assert repo.get_legacy_tables() == ['btcusdt_1m', 'ethusdt_15m']
+
+        # Live write that happened before migration wins over the legacy row
+        repo.save_candles_batch(
+            [Candle(timestamp=START, open=9.0, high=9.0, low=9.0, close=9.0, volume=9.0)], '15m', 'ethusdt'
+        )
+
+        migrated = repo.migrate_legacy_tables(batch_size=10)
+        assert migrated == {
+            'btcusdt_1m': {'copied': 0, 'skipped': 0},
+            'ethusdt_15m': {'copied': 25, 'skipped': 0},
+        }
+        assert repo.get_legacy_tables() == []
+        assert repo.get_record_count('15m', 'ethusdt') == 25
+
+        first = repo.get_candle_by_timestamp('15m', START, 'ethusdt')
+        assert first.candle.close == 9.0
+        second = repo.get_candle_by_timestamp('15m', START + timedelta(minutes=1), 'ethusdt')
+        assert second.candle.close == 1.5
+        assert second.indicator.rsi_6 == 55.0
+
+    def test_keep_legacy(self, tmp_path):
+        path = tmp_path / "market.db"
+        self._create_legacy_table(path, 'solusdt_1h', [(START.isoformat(), 1, 1, 1, 1, 1, None, None, None)])
+
+        repo = make_repo(tmp_path)
+        assert repo.migrate_legacy_tables(drop_legacy=False) == {'solusdt_1h': {'copied': 1, 'skipped': 0}}
+        # Re-running is idempotent
+        assert repo.migrate_legacy_tables(drop_legacy=False) == {'solusdt_1h': {'copied': 1, 'skipped': 0}}
+        assert repo.get_record_count('1h', 'solusdt') == 1
+
+    def test_stop_between_chunks_keeps_legacy_table(self, tmp_path):
+        path = tmp_path / "market.db"
+        rows = [
+            ((START + timedelta(minutes=i)).isoformat(), 1.0, 2.0, 0.5, 1.5, 10.0, None, None, None)
+            for i in range(25)
+        ]
+        self._create_legacy_table(path, 'ethusdt_15m', rows)
+
+        repo = make_repo(tmp_path)
+        legacy_tables = repo.get_legacy_tables
+
+        def list_then_stop_after_first_chunk():
+            tables = legacy_tables()
+            connection = repo._get_connection
+
+            def stop_during_chunk():
+                repo.stop_migration()  # as if shutdown arrived while the chunk is copied
+                return connection()
+
+            repo._get_connection = stop_during_chunk
+            return tables
+
+        connection = repo._get_connection
+        repo.get_legacy_tables = list_then_stop_after_first_chunk
+        assert repo.migrate_legacy_tables(batch_size=10) == {}
+        repo._get_connection = connection
+        del repo.get_legacy_tables
+        assert repo.get_legacy_tables() == ['ethusdt_15m']
+        assert repo.get_record_count('15m', 'ethusdt') == 10
+
+        # The next start finishes the copy
+        assert make_repo(tmp_path).migrate_legacy_tables(batch_size=10) == {
+            'ethusdt_15m': {'copied': 25, 'skipped': 0}
+        }
+
+    def test_unparseable_rows_keep_legacy_table(self, tmp_path):
+        path = tmp_path / "market.db"
+        rows = [
+            (START.isoformat(), 1.0, 2.0, 0.5, 1.5, 10.0, None, None, None),
+            ('not a timestamp', 1.0, 2.0, 0.5, 1.5, 10.0, None, None, None),
+        ]
+        self._create_legacy_table(path, 'ethusdt_15m', rows)
+
+        repo = make_repo(tmp_path)
+        assert repo.migrate_legacy_tables() == {'ethusdt_15m': {'copied': 1, 'skipped': 1}}
+        assert repo.get_legacy_tables() == ['ethusdt_15m']
+        assert repo.get_record_count('15m', 'ethusdt') == 1
+
+    def test_vacuum_reclaims_dropped_tables(self, tmp_path):
+        path = tmp_path / "market.db"
+        rows = [
+            ((START + timedelta(minutes=i)).isoformat(), 1.0, 2.0, 0.5, 1.5, 10.0, None, None, None)
+            for i in range(2000)
+        ]
+        self._create_legacy_table(path, 'ethusdt_15m', rows)
+
+        repo = make_repo(tmp_path)
+        repo.migrate_legacy_tables()
+        with repo._get_connection() as conn:
+            assert conn.execute("PRAGMA freelist_count").fetchone()[0] > 0
+        repo.vacuum()
+        with repo._get_connection() as conn:
+            assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
@@ -0,0 +1,170 @@
+"""
+Tests for stream record/replay: append-only gzip capture, paced and
+max-speed replay through BinanceWebSocketClient, and per-stage latency
+collection through the EventBus.
+"""
+
+import asyncio
+import gzip
+import json
+import time
+
+import pytest
+
+from src.api.event_bus import get_event_bus
+from src.infrastructure.websocket.binance_websocket_client import BinanceWebSocketClient
+from src.infrastructure.websocket.stream_capture import StreamRecorder, StreamReplayer, read_capture
+from src.utils.latency_probe import install_latency_probe, uninstall_latency_probe
+
+
+def kline_message(symbol: str, i: int, interval: str = "1m", closed: bool = False) -> str:
+    open_time = 1767571200000 + i * 60_000
+    price = 100.0 + i * 0.1
+    return json.dumps({
+        "stream": f"{symbol}@kline_{interval}",
+        "data": {
+            "e": "kline", "E": open_time + 30_000, "s": symbol.upper(),
+            "k": {"t": open_time, "T": open_time + 59_999, "s": symbol.upper(), "i": interval,
+                  "o": f"{price:.2f}", "h": f"{price + 0.5:.2f}", "l": f"{price - 0.5:.2f}",
+                  "c": f"{price + 0.2:.2f}", "v": "12.5", "x": closed},
+        },
+    })
+
+
+def write_capture(path, count: int, spacing: float = 0.01, start: float = 1_767_571_200.0) -> None:
+    recorder = StreamRecorder(str(path))
+    for i in range(count):
+        recorder.record(kline_message("btcusdt", i), received_at=start + i * spacing)
+    recorder.close()
+
+
+class TestRecorder:
+    def test_sessions_append_to_one_capture(self, tmp_path):
+        path = tmp_path / "capture.jsonl.gz"
+        write_capture(path, 3)
+        recorder = StreamRecorder(str(path))
+        recorder.record(kline_message("ethusdt", 0).encode(), received_at=1_767_571_300.0)
+        assert recorder.flush()
+        recorder.close()
+
+        records = list(read_capture(str(path)))
+        assert [json.loads(m)["stream"] for _, m in records] == ["btcusdt@kline_1m"] * 3 + ["ethusdt@kline_1m"]
+        assert records[1][0] == pytest.approx(1_767_571_200.01)
+        assert recorder.get_statistics()['written'] == 1
+
+    def test_truncated_capture_replays_flushed_part(self, tmp_path):
+        path = tmp_path / "crashed.jsonl.gz"
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            for i in range(200):
+                f.write(f"{i}.0\t{kline_message('btcusdt', i)}\n")
+        data = path.read_bytes()
+        path.write_bytes(data[:len(data) - 40])
+
+        records = list(read_capture(str(path)))
+        assert 0 < len(records) < 200
+        assert all(json.loads(m)["data"]["e"] == "kline" for _, m in records)
+
+    def test_closed_recorder_rejects_messages(self, tmp_path):
+        recorder = StreamRecorder(str(tmp_path / "closed.jsonl.gz"))
+        recorder.close()
+        assert recorder.record("{}") is False
+
+
+class TestReplayer:
+    async def test_speed_scales_recorded_pace(self, tmp_path):
+        path = tmp_path / "paced.jsonl.gz"
+        write_capture(path, 21, spacing=0.05)  # 1 second of recorded time
+        received = []
+
+        async def sink(message):
+            received.append(time.perf_counter())
+
+        report = await StreamReplayer(str(path), speed=10).run(sink)
+
+        assert report['messages'] == 21
+        assert received[-1] - received[0] == pytest.approx(0.1, abs=0.05)
+        assert 'lag_p99_ms' in report
+
+    async def test_max_speed_and_limit(self, tmp_path):
+        path = tmp_path / "max.jsonl.gz"
+        write_capture(path, 50, spacing=10.0)  # 8 minutes recorded
+        received = []
+
+        async def sink(message):
+            received.append(message)
+
+        report = await StreamReplayer(str(path), speed=None).run(sink, limit=30)
+
+        assert report['messages'] == 30 and len(received) == 30
+        assert report['duration_s'] < 1.0
+        assert 'lag_p99_ms' not in report
+
+    def test_rejects_non_positive_speed(self, tmp_path):
+        with pytest.raises(ValueError):
+            StreamReplayer(str(tmp_path / "x.jsonl.gz"), speed=0)
+
+
+class RecordingManager:
+    def __init__(self):
+        self.messages = []
+
+    async def broadcast(self, message, symbol="btcusdt"):
+        self.messages.append(message)
+        return 1
+
+
+class TestPipelineLatency:
+    async def test_replay_reports_stage_latencies(self, tmp_path):
+        path = tmp_path / "pipeline.jsonl.gz"
+        write_capture(path, 40)
+        client = BinanceWebSocketClient()
+        bus = get_event_bus()
+        manager = RecordingManager()
+        candles = []
+
+        def handler(candle, metadata):
+            candles.append((metadata['symbol'], metadata['interval'], candle.close))
+            bus.publish_candle_update({'close': candle.close}, symbol=metadata['symbol'])
+
+        client.subscribe_candle(handler)
+        await bus.start_worker(manager)
+        probe = install_latency_probe()
+        try:
+            report = await StreamReplayer(str(path), speed=None).run(client.feed_message)
+            for _ in range(100):
+                if not bus.pending_count():
+                    break
+                await asyncio.sleep(0.01)
+            stats = probe.get_statistics()
+        finally:
+            uninstall_latency_probe()
+            await bus.stop_worker()
+
+        assert report['messages'] == 40 and len(candles) == 40
+        assert candles[0] == ("btcusdt", "1m", pytest.approx(100.2))
+        assert stats['parse']['count'] == 40 and stats['dispatch']['count'] == 40
+        assert stats['end_to_end']['count'] == len(manager.messages) > 0
+        for stage in ('parse', 'dispatch', 'bus_queue', 'broadcast', 'end_to_end'):
+            assert stats[stage]['p50_ms'] <= stats[stage]['p99_ms'] <= stats[stage]['max_ms']
+
+    async def test_live_path_is_recorded(self, tmp_path):
+        client = BinanceWebSocketClient()
+        recorder = StreamRecorder(str(tmp_path / "live.jsonl.gz"))
+        client.set_recorder(recorder)
+
+        class FakeSocket:
+            def __init__(self, messages):
+                self.messages = list(messages)
+
+            async def recv(self):
+                if not self.messages:
+                    client._should_run = False
+                    return kline_message("btcusdt", 99)
+                return self.messages.pop(0)
+
+        client._websocket = FakeSocket([kline_message("btcusdt", i) for i in range(3)])
+        client._should_run = True
+        await client._receive_messages()
+        recorder.close()
+
+        assert len(list(read_capture(str(tmp_path / "live.jsonl.gz")))) == 4
@@ -0,0 +1,138 @@
+"""
+Tests for the shared swing index: pivots match the per-candle neighbour
+scan for growing and sliding windows, a forming last candle, trimming and
+several series, and the detectors built on it agree with the scan.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.application.risk_management.liquidity_zone_detector import LiquidityZoneDetector
+from src.domain.entities.candle import Candle
+from src.domain.services.swing_index import SwingIndex, SwingIndexCache
+from src.infrastructure.indicators.order_block_detector import OrderBlockDetector
+from src.infrastructure.indicators.swing_point_detector import SwingPointDetector
+
+
+def make_candles(count: int, seed: int = 1, start: float = 100.0):
+    """Integer-ish prices so equal highs/lows (non-strict pivots) occur often."""
+    rng = random.Random(seed)
+    candles, price = [], start
+    for i in range(count):
+        close = round(price + rng.uniform(-2, 2))
+        high = max(price, close) + round(rng.uniform(0, 1))
+        low = min(price, close) - round(rng.uniform(0, 1))
+        candles.append(Candle(datetime(2026, 1, 1) + timedelta(minutes=i), price, high, low, close, 1.0))
+        price = close
+    return candles
+
+
+def scan(candles, lookback):
+    """Neighbour scan: strictly above/below `lookback` candles on each side."""
+    rng = range(lookback, len(candles) - lookback)
+    around = lambda i: [j for j in range(i - lookback, i + lookback + 1) if j != i]
+    return (
+        [i for i in rng if all(candles[j].high < candles[i].high for j in around(i))],
+        [i for i in rng if all(candles[j].low > candles[i].low for j in around(i))],
+    )
+
+
+class TestSwingIndexCache:
+    @pytest.mark.parametrize("lookback", [1, 2, 5])
+    def test_sliding_window_matches_scan(self, lookback):
+        candles = make_candles(1500, seed=lookback)
+        cache = SwingIndexCache(lookback)
+
+        for end in range(1, len(candles), 3):
+            window = candles[max(0, end - 300):end]
+            assert cache.pivots(window) == scan(window, lookback)
+
+        stats = cache.get_statistics()
+        assert stats['rebuilds'] == 1 and stats['series'] == 1
+
+    def test_forming_candle_is_not_stored(self):
+        candles = make_candles(200)
+        cache = SwingIndexCache(2)
+        cache.pivots(candles)
+
+        # The live candle spikes, then closes back lower
+        live = candles[-1]
+        spike = candles[:-1] + [Candle(live.timestamp, live.open, 10_000.0, 1.0, live.close, 1.0)]
+        assert cache.pivots(spike) == scan(spike, 2)
+        assert cache.pivots(candles) == scan(candles, 2)
+        assert cache.get_statistics()['rebuilds'] == 1
+
+    def test_series_are_kept_apart(self):
+        cache = SwingIndexCache(3)
+        btc, eth = make_candles(400, seed=7, start=100.0), make_candles(400, seed=8, start=3000.0)
+
+        for end in range(50, 400, 25):
+            assert cache.pivots(btc[:end]) == scan(btc[:end], 3)
+            assert cache.pivots(eth[:end]) == scan(eth[:end], 3)
+        assert cache.get_statistics()['series'] == 2
+
+    def test_trimmed_index_keeps_recent_pivots(self):
+        candles = make_candles(3000, seed=4)
+        index = SwingIndex(lookback=2, max_length=200)
+        for candle in candles:
+            index.append(candle.high, candle.low)
+
+        assert len(index) <= 200
+        window = candles[index.start:]
+        highs, lows = index.pivots(index.start)
+        expected = scan(window, 2)
+        # The newest candle is stored, so the last 'lookback' cannot be pivots yet
+        assert [i - index.start for i in highs] == expected[0]
+        assert [i - index.start for i in lows] == expected[1]
+
+    def test_short_input(self):
+        assert SwingIndexCache(5).pivots(make_candles(10)) == ([], [])
+        with pytest.raises(ValueError):
+            SwingIndexCache(0)
+
+
+class TestDetectors:
+    def test_swing_point_detector(self):
+        candles = make_candles(300, seed=11)
+        detector = SwingPointDetector(lookback=5)
+        highs, lows = scan(candles, 5)
+
+        assert detector.find_recent_swing_high(candles).index == highs[-1]
+        assert detector.find_recent_swing_low(candles).index == lows[-1]
+        assert detector.find_recent_swing_high(candles, max_age=len(candles) - highs[-1] - 1) is None
+        supports, resistances = detector.find_support_resistance_levels(candles)
+        assert resistances == sorted((candles[i].high for i in highs), reverse=True)[:3]
+        assert supports == sorted(candles[i].low for i in lows)[:3]
+
+    def test_liquidity_zone_swings(self):
+        candles = make_candles(120, seed=12)
+        highs, lows = scan(candles, 5)
+
+        swing_highs, swing_lows = LiquidityZoneDetector()._find_swing_points(candles, 5)
+
+        assert swing_highs == [(i, candles[i].high) for i in highs]
+        assert swing_lows == [(i, candles[i].low) for i in lows]
+
+    def test_order_block_after_break_of_structure(self):
+        bars = [
+            (100, 101, 99, 100.5), (100.5, 102, 100, 101.5), (101.5, 102.5, 101, 102),
+            (102, 102.2, 100.5, 101), (101, 101.5, 99.5, 100), (100, 104, 99.8, 103.5),
+            (103.5, 109, 103, 108), (108, 108.5, 104.5, 105), (105, 106, 103.5, 104),
+            (104, 105, 103, 104.5), (104.5, 106.5, 104.2, 106), (106, 110, 105.8, 109.5),
+        ]
+        bars += [(109.5 + k, 110.5 + k, 109 + k, 110.5 + k) for k in range(8)]
+        candles = [
+            Candle(datetime(2026, 1, 1) + timedelta(minutes=i), o, h, l, c, 10.0 + i)
+            for i, (o, h, l, c) in enumerate(bars)
+        ]
+
+        blocks = OrderBlockDetector().detect(candles, lookback=20)
+
+        # Swing high 109 (index 6) broken by the 109.5 close; the last red
+        # candle before the swing (index 4) was never revisited
+        assert [(b.ob_type, b.top, b.bottom) for b in blocks] == [('BULLISH', 101.5, 99.5)]
+
+        revisit = candles[:-1] + [Candle(candles[-1].timestamp, 117, 118, 101, 117.5, 1.0)]
+        assert OrderBlockDetector().detect(revisit, lookback=20) == []
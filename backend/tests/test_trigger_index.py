@@ -0,0 +1,246 @@
+"""
+Tests for TriggerIndex (sorted trigger levels, OCO groups) and its use in
+Paper Engine tick matching and ExecutionSimulator bar processing: the
+indexed paths must reach the same state as scanning every order/position.
+"""
+
+import math
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.application.backtest.execution_simulator import ExecutionSimulator
+from src.application.services.paper_trading_service import PaperTradingService
+from src.domain.entities.candle import Candle
+from src.domain.entities.paper_position import PaperPosition
+from src.domain.entities.trading_signal import SignalType, TradingSignal
+from src.domain.services import ABOVE, BELOW, Trigger, TriggerIndex
+from src.infrastructure.persistence.order_book_repository import OrderBookRepository
+from src.infrastructure.persistence.sqlite_order_repository import SQLiteOrderRepository
+
+
+class TestTriggerIndex:
+    def test_crossed_reports_levels_inside_bar_range(self):
+        index = TriggerIndex()
+        index.add(Trigger('buy-98', 'BTCUSDT', 98.0, BELOW))
+        index.add(Trigger('buy-99', 'btcusdt', 99.0, BELOW))
+        index.add(Trigger('buy-95', 'btcusdt', 95.0, BELOW))
+        index.add(Trigger('sell-101', 'btcusdt', 101.0, ABOVE))
+        index.add(Trigger('sell-104', 'btcusdt', 104.0, ABOVE))
+        index.add(Trigger('eth', 'ethusdt', 99.0, BELOW))
+
+        crossed = index.crossed('btcusdt', high=102.0, low=97.5)
+
+        # Falling price reaches 99 then 98; rising price reaches 101
+        assert [t.key for t in crossed] == ['buy-99', 'buy-98', 'sell-101']
+        assert index.crossed('btcusdt', high=100.0, low=99.5) == []
+        # Inclusive at the level
+        assert [t.key for t in index.crossed('btcusdt', high=104.0, low=104.0)] == ['sell-101', 'sell-104']
+
+    def test_oco_fire_cancels_siblings(self):
+        index = TriggerIndex()
+        index.add(Trigger('tp', 'btcusdt', 110.0, ABOVE, group='pos-1'))
+        index.add(Trigger('sl', 'btcusdt', 90.0, BELOW, group='pos-1'))
+        index.add(Trigger('other', 'btcusdt', 90.0, BELOW, group='pos-2'))
+
+        hit = index.crossed('btcusdt', high=100.0, low=89.0)
+        assert {t.key for t in hit} == {'sl', 'other'}
+
+        cancelled = index.fire('sl')
+        assert [t.key for t in cancelled] == ['tp']
+        assert 'tp' not in index and 'sl' not in index
+        assert index.count('btcusdt') == 1
+
+    def test_add_replaces_key_and_validates(self):
+        index = TriggerIndex()
+        index.add(Trigger('sl', 'btcusdt', 90.0, BELOW, group='pos-1'))
+        index.add(Trigger('sl', 'btcusdt', 95.0, BELOW, group='pos-1'))
+
+        assert len(index) == 1 and index.get('sl').level == 95.0
+        assert [t.key for t in index.crossed('btcusdt', 100.0, 94.0)] == ['sl']
+        with pytest.raises(ValueError):
+            index.add(Trigger('bad', 'btcusdt', 1.0, 'sideways'))
+        with pytest.raises(ValueError):
+            index.add(Trigger('nan', 'btcusdt', math.nan, ABOVE))
+
+        assert [t.key for t in index.remove_group('pos-1')] == ['sl']
+        assert len(index) == 0
+
+
+def paper_position(id: str, side: str, status: str, entry: float, opened: datetime,
+                   sl: float = 0.0, tp: float = 0.0) -> PaperPosition:
+    liq = entry * (0.5 if side == 'LONG' else 1.5)
+    return PaperPosition(
+        id=id, symbol="btcusdt", side=side, status=status,
+        entry_price=entry, quantity=1.0, leverage=1, margin=entry,
+        liquidation_price=liq, stop_loss=sl, take_profit=tp, open_time=opened,
+    )
+
+
+def seed_orders(repo) -> None:
+    start = datetime.now() - timedelta(minutes=10)
+    orders = [
+        paper_position("open-long", 'LONG', 'OPEN', 100.0, start, sl=97.0, tp=106.0),
+        paper_position("open-short", 'SHORT', 'OPEN', 101.0, start + timedelta(seconds=1), sl=104.0),
+        paper_position("buy-limit", 'LONG', 'PENDING', 98.5, start + timedelta(seconds=2), sl=95.0, tp=104.0),
+        paper_position("sell-limit", 'SHORT', 'PENDING', 103.0, start + timedelta(seconds=3), sl=106.0),
+        paper_position("far-buy", 'LONG', 'PENDING', 60.0, start + timedelta(seconds=4), sl=55.0),
+        # Already past its TTL: cancelled on the first tick even though never touched
+        paper_position("stale", 'SHORT', 'PENDING', 500.0, start - timedelta(hours=2), sl=520.0),
+    ]
+    for order in orders:
+        repo.save_order(order)
+
+
+def random_ticks(seed: int, count: int = 120):
+    rng = random.Random(seed)
+    price = 100.0
+    for _ in range(count):
+        close = price * (1 + rng.uniform(-0.01, 0.01))
+        high = max(price, close) * (1 + rng.uniform(0, 0.004))
+        low = min(price, close) * (1 - rng.uniform(0, 0.004))
+        yield close, high, low
+        price = close
+
+
+def snapshot(repo):
+    orders = [repo.get_order(id) for id in
+              ("open-long", "open-short", "buy-limit", "sell-limit", "far-buy", "stale")]
+    return [
+        (o.id, o.status, o.exit_reason, round(o.entry_price, 9), round(o.quantity, 9),
+         round(o.stop_loss, 9), round(o.realized_pnl, 9), round(o.highest_price, 9), round(o.lowest_price, 9))
+        for o in orders
+    ], round(repo.get_account_balance(), 6)
+
+
+class TestPaperEngineTriggers:
+    @pytest.mark.parametrize("seed", [1, 7, 42])
+    def test_indexed_matching_equals_full_scan(self, tmp_path, seed):
+        scan_repo = SQLiteOrderRepository(db_path=str(tmp_path / "scan.db"))
+        book = OrderBookRepository(SQLiteOrderRepository(db_path=str(tmp_path / "book.db")))
+        try:
+            scanned = PaperTradingService(scan_repo)
+            indexed = PaperTradingService(book)
+            assert not scanned._indexed and indexed._indexed
+            seed_orders(scan_repo)
+            seed_orders(book)
+
+            scan_events, index_events = [], []
+            for service, events in ((scanned, scan_events), (indexed, index_events)):
+                service.on_order_filled = lambda id, events=events: events.append(('filled', id))
+                service.on_position_closed = lambda id, reason, events=events: events.append(('closed', id, reason))
+
+            for close, high, low in random_ticks(seed):
+                scanned.process_market_data(close, high, low, "btcusdt")
+                indexed.process_market_data(close, high, low, "btcusdt")
+
+            assert snapshot(book) == snapshot(scan_repo)
+            assert index_events == scan_events
+        finally:
+            scan_repo.close()
+            book.close()
+
+    def test_untouched_orders_are_not_visited(self, tmp_path):
+        book = OrderBookRepository(SQLiteOrderRepository(db_path=str(tmp_path / "book.db")), write_behind=False)
+        try:
+            service = PaperTradingService(book)
+            opened = datetime.now()
+            for i in range(200):
+                book.save_order(paper_position(f"far-{i}", 'LONG', 'PENDING', 50.0 + i * 0.1, opened))
+            book.save_order(paper_position("near", 'LONG', 'PENDING', 99.5, opened))
+
+            visited = []
+            match = service._match_pending_order
+            service._match_pending_order = lambda order, *args: (visited.append(order.id), match(order, *args))
+
+            service.process_market_data(100.0, 100.2, 99.4, "btcusdt")
+
+            assert visited == ["near"]
+            assert book.get_order("near").status == 'OPEN'
+            assert service.get_trigger_statistics()['pending_deadlines'] == 200
+        finally:
+            book.close()
+
+    def test_rebuild_resyncs_triggers(self, tmp_path):
+        store = SQLiteOrderRepository(db_path=str(tmp_path / "book.db"))
+        book = OrderBookRepository(store, write_behind=False)
+        try:
+            service = PaperTradingService(book)
+            store.save_order(paper_position("behind-the-book", 'LONG', 'PENDING', 99.5, datetime.now()))
+            book.rebuild()
+
+            service.process_market_data(100.0, 100.2, 99.4, "btcusdt")
+
+            assert book.get_order("behind-the-book").status == 'OPEN'
+        finally:
+            book.close()
+
+
+def bar(minute: int, open: float, high: float, low: float, close: float) -> Candle:
+    return Candle(timestamp=datetime(2026, 1, 5, 0, minute), open=open, high=high, low=low, close=close, volume=1.0)
+
+
+def sim_signal(symbol: str, side: SignalType, entry: float, sl: float, tp1: float, limit: bool) -> TradingSignal:
+    return TradingSignal(
+        symbol=symbol, signal_type=side, confidence=0.8, price=entry, entry_price=entry,
+        is_limit_order=limit, stop_loss=sl, tp_levels={'tp1': tp1}, indicators={'atr': entry * 0.004},
+    )
+
+
+def run_simulator(simulator: ExecutionSimulator, seed: int):
+    rng = random.Random(seed)
+    symbols = [f"SYM{i}USDT" for i in range(6)]
+    prices = {s: 100.0 + 10 * i for i, s in enumerate(symbols)}
+    for minute in range(240):
+        candles = {}
+        for symbol in symbols:
+            open = prices[symbol]
+            close = open * (1 + rng.uniform(-0.006, 0.006))
+            high = max(open, close) * (1 + rng.uniform(0, 0.003))
+            low = min(open, close) * (1 - rng.uniform(0, 0.003))
+            candles[symbol] = bar(minute % 60, open, high, low, close)
+            prices[symbol] = close
+        simulator.update(candles, datetime(2026, 1, 5) + timedelta(minutes=minute))
+
+        if minute % 15 == 0:
+            symbol = rng.choice(symbols)
+            price = prices[symbol]
+            if rng.random() < 0.5:
+                simulator.place_order(sim_signal(symbol, SignalType.BUY, price * 0.998, price * 0.985,
+                                                 price * 1.012, limit=rng.random() < 0.7))
+            else:
+                simulator.place_order(sim_signal(symbol, SignalType.SELL, price * 1.002, price * 1.015,
+                                                 price * 0.988, limit=rng.random() < 0.7))
+    return [(t.trade_id, t.symbol, t.exit_reason, round(t.exit_price, 9), round(t.pnl_usd, 9))
+            for t in simulator.trades], round(simulator.balance, 9)
+
+
+class TestExecutionSimulatorTriggers:
+    @pytest.mark.parametrize("seed", [3, 11])
+    def test_indexed_bars_equal_full_walk(self, monkeypatch, seed):
+        # Same uuid-based trade ids in both runs
+        ids = iter(range(10_000))
+        monkeypatch.setattr("src.application.backtest.execution_simulator.uuid.uuid4",
+                            lambda: f"{next(ids):08d}")
+        indexed = run_simulator(ExecutionSimulator(), seed)
+
+        ids = iter(range(10_000))
+        full = ExecutionSimulator()
+        full._triggers.crossed = lambda symbol, high, low: [symbol]  # walk every bar
+        assert run_simulator(full, seed) == indexed
+        assert indexed[0]  # the scenario produced trades
+
+    def test_quiet_symbols_are_skipped(self):
+        simulator = ExecutionSimulator()
+        simulator.place_order(sim_signal("BTCUSDT", SignalType.BUY, 95.0, 93.0, 99.0, limit=True))
+        walked = []
+        process = simulator._process_symbol
+        simulator._process_symbol = lambda symbol, *args: (walked.append(symbol), process(symbol, *args))
+
+        simulator.update({"BTCUSDT": bar(0, 100.0, 101.0, 99.0, 100.5),
+                          "ETHUSDT": bar(0, 50.0, 51.0, 49.0, 50.5)}, datetime(2026, 1, 5))
+        simulator.update({"BTCUSDT": bar(1, 100.0, 100.5, 94.5, 96.0)}, datetime(2026, 1, 5, 0, 1))
+
+        assert walked == ["BTCUSDT"]
+        assert "BTCUSDT" in simulator.positions
@@ -0,0 +1,140 @@
+"""
+Tests for the vectorized BacktestEngine mode.
+
+Precomputed signals must equal SignalGenerator.generate_signal at every bar,
+and a VECTORIZED run must produce the same trades as the STEP loop.
+"""
+
+import asyncio
+import random
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from src.domain.entities.candle import Candle
+from src.domain.interfaces.i_historical_data_loader import IHistoricalDataLoader
+from src.infrastructure.indicators.vwap_calculator import VWAPCalculator
+from src.infrastructure.indicators.bollinger_calculator import BollingerCalculator
+from src.infrastructure.indicators.stoch_rsi_calculator import StochRSICalculator
+from src.infrastructure.indicators.atr_calculator import ATRCalculator
+from src.application.signals.signal_generator import SignalGenerator
+from src.application.backtest.backtest_engine import BacktestEngine
+from src.application.backtest.execution_simulator import ExecutionSimulator
+from src.application.backtest.vectorized_signals import VectorizedSignalPrecomputer
+from src.application.risk_management.circuit_breaker import CircuitBreaker
+
+
+def create_random_candles(count: int, seed: int, skip_every: int = 0) -> List[Candle]:
+    """Mean-reverting random walk (touches swing levels often), 15m bars."""
+    rng = random.Random(seed)
+    candles = []
+    price = 100.0
+    timestamp = datetime(2025, 1, 1, 18, 0, 0)
+
+    for i in range(count):
+        timestamp += timedelta(minutes=15)
+        if skip_every and i % skip_every == 0:
+            continue
+        price = max(1.0, price + rng.gauss(0, 0.4) + (100.0 - price) * 0.05)
+        close = max(0.5, price + rng.gauss(0, 0.3))
+        candles.append(Candle(
+            timestamp=timestamp,
+            open=price,
+            high=max(price, close) * (1 + abs(rng.gauss(0, 0.002))),
+            low=min(price, close) * (1 - abs(rng.gauss(0, 0.002))),
+            close=close,
+            volume=rng.choice([0.0, rng.uniform(1, 1000), rng.uniform(1, 1000)])
+        ))
+    return candles
+
+
+def _make_generator() -> SignalGenerator:
+    return SignalGenerator(
+        vwap_calculator=VWAPCalculator(),
+        bollinger_calculator=BollingerCalculator(),
+        stoch_rsi_calculator=StochRSICalculator(),
+        atr_calculator=ATRCalculator()
+    )
+
+
+def _signal_key(signal):
+    if signal is None:
+        return None
+    return (
+        signal.signal_type, signal.generated_at, signal.price, signal.entry_price,
+        signal.stop_loss, signal.tp_levels, signal.confidence, signal.indicators
+    )
+
+
+class _StubLoader(IHistoricalDataLoader):
+    def __init__(self, candles_by_symbol):
+        self.candles_by_symbol = candles_by_symbol
+
+    async def load_portfolio_data(self, symbols, interval, start_time, end_time=None):
+        if interval != '15m':
+            return {}
+        timeline = {}
+        for symbol in symbols:
+            for candle in self.candles_by_symbol[symbol]:
+                timeline.setdefault(candle.timestamp, {})[symbol] = candle
+        return timeline
+
+
+class TestVectorizedSignalPrecomputer:
+    """Bulk signals vs per-bar generate_signal"""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_generate_signal_at_every_bar(self, seed):
+        generator = _make_generator()
+        candles = create_random_candles(300, seed)
+        precomputed = VectorizedSignalPrecomputer(generator).precompute('BTCUSDT', candles)
+
+        assert precomputed, "fixture should produce candidate signals"
+        for i in range(len(candles)):
+            expected = generator.generate_signal(candles[:i + 1], 'BTCUSDT')
+            assert _signal_key(precomputed.get(i)) == _signal_key(expected)
+
+    def test_no_atr_calculator_no_signals(self):
+        generator = SignalGenerator(
+            vwap_calculator=VWAPCalculator(),
+            bollinger_calculator=BollingerCalculator(),
+            stoch_rsi_calculator=StochRSICalculator()
+        )
+        candles = create_random_candles(120, 4)
+        assert VectorizedSignalPrecomputer(generator).precompute('BTCUSDT', candles) == {}
+
+
+class TestVectorizedBacktestParity:
+    """VECTORIZED mode reproduces the STEP loop"""
+
+    def _run(self, mode, with_circuit_breaker):
+        data = {
+            'BTCUSDT': create_random_candles(400, 11),
+            'ETHUSDT': create_random_candles(400, 12, skip_every=7),
+            'SOLUSDT': create_random_candles(400, 13),
+        }
+        circuit_breaker = None
+        if with_circuit_breaker:
+            circuit_breaker = CircuitBreaker(max_consecutive_losses=2, cooldown_hours=2)
+        engine = BacktestEngine(
+            signal_generator=_make_generator(),
+            loader=_StubLoader(data),
+            simulator=ExecutionSimulator(initial_balance=10000.0, mode="SHARK_TANK", max_positions=2),
+            circuit_breaker=circuit_breaker,
+            mode=mode
+        )
+        result = asyncio.run(engine.run_portfolio(list(data), '15m', datetime(2025, 1, 1)))
+        trades = [{k: v for k, v in t.items() if k != 'trade_id'} for t in result['trades']]
+        return trades, result['stats'], result['equity']
+
+    @pytest.mark.parametrize("with_circuit_breaker", [False, True])
+    def test_trades_identical(self, with_circuit_breaker):
+        step = self._run(BacktestEngine.MODE_STEP, with_circuit_breaker)
+        vectorized = self._run(BacktestEngine.MODE_VECTORIZED, with_circuit_breaker)
+        assert step[0], "fixture should produce trades"
+        assert vectorized == step
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            BacktestEngine(signal_generator=_make_generator(), loader=_StubLoader({}), mode="FAST")
@@ -0,0 +1,139 @@
+"""
+Tests for the vectorized VolumeProfileCalculator (same profile as the
+per-bin weighting loop) and RollingVolumeProfile (add/evict matches a
+fresh profile of the same window).
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.entities.candle import Candle
+from src.infrastructure.indicators.volume_profile_calculator import (
+    RollingVolumeProfile,
+    VolumeProfileCalculator,
+    bin_weights,
+    value_area_indices,
+)
+
+
+def make_candles(count: int, seed: int = 7, start: float = 100.0):
+    rng = random.Random(seed)
+    candles, price = [], start
+    for i in range(count):
+        close = price * (1 + rng.uniform(-0.01, 0.01))
+        high = max(price, close) * (1 + rng.uniform(0, 0.004))
+        low = min(price, close) * (1 - rng.uniform(0, 0.004))
+        candles.append(Candle(datetime(2026, 1, 1) + timedelta(minutes=i), price, high, low, close, rng.uniform(1, 10)))
+        price = close
+    return candles
+
+
+def reference_weight(level, candle, vwap):
+    """Per-bin weighting as a scalar loop (the pre-vectorization model)."""
+    if level < candle.low or level > candle.high or candle.high <= candle.low:
+        return 0.0
+    candle_range = candle.high - candle.low
+    close_distance = abs(level - candle.close) / candle_range
+    weight = max(0, 0.30 * (1.0 - close_distance))
+    if vwap is not None:
+        weight += max(0, 0.30 * (1.0 - abs(level - vwap) / candle_range))
+    else:
+        weight += 0.15 * (1.0 - close_distance)
+    in_body = min(candle.open, candle.close) <= level <= max(candle.open, candle.close)
+    return weight + (0.40 if in_body else 0.15)
+
+
+def reference_profile(candles, levels, use_vwap):
+    profile = dict.fromkeys(levels, 0.0)
+    for candle in candles:
+        vwap = (candle.high + candle.low + candle.close) / 3 if use_vwap else None
+        for level in levels:
+            profile[level] += candle.volume * reference_weight(level, candle, vwap)
+    return profile
+
+
+class TestCalculate:
+    @pytest.mark.parametrize("use_vwap", [False, True])
+    def test_matches_scalar_weighting(self, use_vwap):
+        candles = make_candles(200)
+        calculator = VolumeProfileCalculator(num_bins=40, vwap_calculator=object() if use_vwap else None)
+
+        result = calculator.calculate(candles)
+
+        expected = reference_profile(candles, list(result.profile), use_vwap)
+        assert result.profile == pytest.approx(expected)
+        assert result.poc == max(expected, key=expected.get)
+        assert (result.vah, result.val) == calculator._calculate_value_area(expected, 0.70)
+        assert result.total_volume == pytest.approx(sum(c.volume for c in candles))
+
+    def test_value_area_expands_toward_heavier_side(self):
+        calculator = VolumeProfileCalculator()
+        profile = {1.0: 5.0, 2.0: 10.0, 3.0: 40.0, 4.0: 30.0, 5.0: 15.0}
+
+        vah, val = calculator._calculate_value_area(profile, 0.70)
+
+        assert (vah, val) == (4.0, 3.0)  # POC 40, then 30 beats 10: 70% reached
+        assert calculator._calculate_value_area(profile, 0.80) == (5.0, 3.0)  # then 15 beats 10
+        assert value_area_indices(np.zeros(4), 0.7) == (0, 0, 3)
+
+    def test_rejects_short_or_flat_input(self):
+        calculator = VolumeProfileCalculator()
+        assert calculator.calculate(make_candles(5)) is None
+        flat = [Candle(datetime(2026, 1, 1) + timedelta(minutes=i), 1.0, 1.0, 1.0, 1.0, 1.0) for i in range(20)]
+        assert calculator.calculate(flat) is None
+
+
+class TestRollingProfile:
+    def fresh(self, candles, bin_size, use_vwap=False):
+        """Profile of `candles` on the rolling grid, computed from scratch."""
+        first = int(np.floor(min(c.low for c in candles) / bin_size)) - 1
+        last = int(np.ceil(max(c.high for c in candles) / bin_size)) + 1
+        levels = (np.arange(first, last + 1) + 0.5) * bin_size
+        ohlcv = np.array([(c.open, c.high, c.low, c.close, c.volume) for c in candles])
+        volumes = ohlcv[:, 4] @ bin_weights(levels, ohlcv, use_vwap)
+        return levels, volumes
+
+    @pytest.mark.parametrize("use_vwap", [False, True])
+    def test_matches_fresh_window(self, use_vwap):
+        candles = make_candles(700, seed=3)
+        rolling = RollingVolumeProfile(window=150, bin_size=0.25, use_vwap=use_vwap)
+
+        for i, candle in enumerate(candles):
+            rolling.add(candle)
+            if i % 97 and i != len(candles) - 1:
+                continue
+            window = candles[max(0, i - 149):i + 1]
+            levels, volumes = self.fresh(window, 0.25, use_vwap)
+            nonzero = volumes > 0
+            result = rolling.result()
+
+            assert len(rolling) == len(window)
+            assert list(result.profile.values()) == pytest.approx(
+                volumes[nonzero.argmax():len(volumes) - nonzero[::-1].argmax()].tolist()
+            )
+            poc_idx, low_idx, high_idx = value_area_indices(volumes, 0.70)
+            assert rolling.key_levels() == pytest.approx((levels[poc_idx], levels[high_idx], levels[low_idx]))
+            assert result.total_volume == pytest.approx(sum(c.volume for c in window))
+            assert result.period_high == max(c.high for c in window)
+
+    def test_evicted_range_is_released(self):
+        rolling = RollingVolumeProfile(window=20, bin_size=0.5)
+        for candle in make_candles(20, start=100.0):
+            rolling.add(candle)
+        for candle in make_candles(60, start=500.0):
+            rolling.add(candle)
+
+        result = rolling.result()
+        assert min(result.profile) > 400
+        assert len(rolling._volumes) < 500  # compacted on rebuild, not spanning 100..500
+
+    def test_empty_and_invalid(self):
+        rolling = RollingVolumeProfile(window=5, bin_size=1.0)
+        assert rolling.key_levels() is None and rolling.result() is None
+        with pytest.raises(ValueError):
+            RollingVolumeProfile(window=0, bin_size=1.0)
+        with pytest.raises(ValueError):
+            VolumeProfileCalculator().rolling(window=10, bin_size=0.0)
@@ -0,0 +1,72 @@
+"""
+Tests for WarmupManager: warm-up values come from the indicator engine
+snapshot and equal the batch calculators.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.application.services.warmup_manager import WarmupManager
+from src.domain.entities.candle import Candle
+from src.infrastructure.di_container import DIContainer
+
+
+START = datetime(2025, 6, 2, tzinfo=timezone.utc)
+
+
+def make_candles(count: int, seed: int = 3):
+    rng = np.random.default_rng(seed)
+    closes = 100 + np.cumsum(rng.normal(0, 0.5, count))
+    return [
+        Candle(
+            timestamp=START + timedelta(minutes=15 * i),
+            open=float(c) - 0.1, high=float(c) + 0.4, low=float(c) - 0.4, close=float(c),
+            volume=float(3 + i % 7)
+        )
+        for i, c in enumerate(closes)
+    ]
+
+
+class _RestClient:
+    def __init__(self, candles):
+        self.candles = candles
+
+    def get_klines(self, symbol, interval, limit):
+        return self.candles[-limit:]
+
+
+@pytest.fixture
+def container(tmp_path):
+    container = DIContainer({'DATABASE_PATH': str(tmp_path / "test.db")})
+    yield container
+    container.cleanup()
+
+
+def test_warmup_reads_engine_snapshot(container, monkeypatch):
+    candles = make_candles(300)
+    adx_calculator = container.get_adx_calculator()
+    manager = WarmupManager(
+        rest_client=_RestClient(candles),
+        vwap_calculator=container.get_vwap_calculator(),
+        stoch_rsi_calculator=container.get_stoch_rsi_calculator(),
+        adx_calculator=adx_calculator,
+        indicator_engine=container.get_incremental_indicator_engine(),
+    )
+    expected_adx = adx_calculator.calculate_adx(candles).adx_value
+    expected_vwap = container.get_vwap_calculator().calculate_vwap(candles).vwap
+
+    def fail(*args, **kwargs):
+        raise AssertionError("ADX recomputed despite engine snapshot")
+
+    monkeypatch.setattr(adx_calculator, 'calculate_adx', fail)
+    result = asyncio.run(manager.warmup(symbol="btcusdt", interval="15m", limit=300))
+    # A second warm-up starts the stream over instead of appending to it
+    again = asyncio.run(manager.warmup(symbol="btcusdt", interval="15m", limit=300))
+
+    assert result.success and result.candles_processed == 300
+    assert result.adx_value == pytest.approx(expected_adx, rel=1e-9)
+    assert result.vwap_value == pytest.approx(expected_vwap, rel=1e-9)
+    assert again.adx_value == result.adx_value
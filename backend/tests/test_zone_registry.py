@@ -0,0 +1,174 @@
+"""
+Tests for incremental zone tracking: ZoneRegistry mitigation through the
+price index, FVGTracker/FVGDetector and OrderBlockDetector against the full
+rescan, and OrderBlockTracker retiring blocks as price returns.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.domain.entities.candle import Candle
+from src.domain.interfaces.i_fvg_detector import FVG
+from src.domain.services.zone_registry import ZoneRegistry
+from src.infrastructure.indicators.fvg_detector import FVGDetector, FVGTracker
+from src.domain.interfaces.i_order_block_detector import OrderBlock
+from src.infrastructure.indicators.order_block_detector import OrderBlockDetector, OrderBlockTracker
+
+
+def make_candles(count: int, seed: int = 1, start: float = 100.0):
+    rng = random.Random(seed)
+    candles, price = [], start
+    for i in range(count):
+        close = round(price + rng.uniform(-2, 2))
+        high = max(price, close) + round(rng.uniform(0, 1))
+        low = min(price, close) - round(rng.uniform(0, 1))
+        candles.append(Candle(datetime(2026, 1, 1) + timedelta(minutes=i), price, high, low, close, 1.0))
+        price = close
+    return candles
+
+
+def rescan_fvgs(candles, lookback=100):
+    """Every gap in the window, dropped if any later candle trades into it."""
+    fvgs = []
+    for i in range(max(1, len(candles) - lookback), len(candles) - 1):
+        prev_candle, next_candle = candles[i - 1], candles[i + 1]
+        if next_candle.low > prev_candle.high:
+            fvg = FVG(next_candle.low, prev_candle.high, (next_candle.low + prev_candle.high) / 2,
+                      'BULLISH', candles[i].timestamp)
+            if not any(c.low <= fvg.top for c in candles[i + 2:]):
+                fvgs.append(fvg)
+        elif next_candle.high < prev_candle.low:
+            fvg = FVG(prev_candle.low, next_candle.high, (prev_candle.low + next_candle.high) / 2,
+                      'BEARISH', candles[i].timestamp)
+            if not any(c.high >= fvg.bottom for c in candles[i + 2:]):
+                fvgs.append(fvg)
+    return fvgs
+
+
+def rescan_order_blocks(candles):
+    """Blocks of broken 5-candle fractal swings, newest swing first, dropped once price returns."""
+    def is_swing(p, value):
+        return all(value(candles[p]) > value(candles[k]) for k in range(p - 2, p + 3) if k != p)
+
+    def last_candle(p, red):
+        for k in range(p, max(0, p - 20), -1):
+            if (candles[k].close < candles[k].open) if red else (candles[k].close > candles[k].open):
+                return candles[k]
+        return None
+
+    blocks = []
+    for p in range(len(candles) - 7, 3, -1):
+        for ob_type, value, breaks, returns in (
+            ('BULLISH', lambda c: c.high, lambda c, level: c.close > level, lambda c, ob: c.low <= ob.high),
+            ('BEARISH', lambda c: -c.low, lambda c, level: c.close < level, lambda c, ob: c.high >= ob.low),
+        ):
+            if not is_swing(p, value):
+                continue
+            level = candles[p].high if ob_type == 'BULLISH' else candles[p].low
+            j = next((j for j in range(p + 1, len(candles)) if breaks(candles[j], level)), None)
+            ob = last_candle(p, red=ob_type == 'BULLISH')
+            if j is None or ob is None or any(returns(c, ob) for c in candles[j + 1:]):
+                continue
+            blocks.append(OrderBlock(ob.high, ob.low, False, ob_type, ob.timestamp, ob.volume))
+    return blocks
+
+
+class TestZoneRegistry:
+    def test_mitigates_only_reached_zones(self):
+        registry = ZoneRegistry()
+        registry.add('support', 'S', bullish=True, top=95.0, bottom=94.0)
+        registry.add('deep', 'D', bullish=True, top=90.0, bottom=89.0)
+        registry.add('resistance', 'R', bullish=False, top=106.0, bottom=105.0)
+
+        assert registry.mitigate(high=104.0, low=96.0) == []
+        assert registry.mitigate(high=105.0, low=95.0) == ['S', 'R']  # touching counts
+        assert list(registry.active) == ['deep']
+        assert registry.mitigated_count == 2
+
+    def test_active_view_is_live_and_read_only(self):
+        registry = ZoneRegistry()
+        view = registry.active
+        registry.add(1, 'zone', bullish=True, top=1.0, bottom=0.5)
+
+        assert dict(view) == {1: 'zone'}
+        with pytest.raises(TypeError):
+            view[2] = 'other'
+        assert registry.remove(1) == 'zone' and len(registry) == 0
+        assert registry.mitigate(high=10.0, low=0.0) == []
+
+
+class TestFVG:
+    @pytest.mark.parametrize("lookback", [100, 10_000])
+    def test_growing_and_sliding_windows_match_rescan(self, lookback):
+        candles = make_candles(1200, seed=3)
+        detector = FVGDetector()
+
+        for end in range(3, 600, 4):
+            assert detector.detect(candles[:end], lookback) == rescan_fvgs(candles[:end], lookback)
+        for end in range(600, 1200, 9):
+            window = candles[end - 250:end]
+            assert detector.detect(window, lookback) == rescan_fvgs(window, lookback)
+
+        # The sliding windows continue the same series
+        assert detector._trackers.get_statistics()['rebuilds'] == 1
+
+    def test_tracker_retires_filled_gap(self):
+        tracker = FVGTracker()
+        bars = [(100, 101, 99, 100.5), (100.5, 106, 100.5, 105.5), (105.5, 108, 103, 107), (107, 109, 104, 108)]
+        candles = [Candle(datetime(2026, 1, 1) + timedelta(minutes=i), *bar, 1.0) for i, bar in enumerate(bars)]
+        for candle in candles[:3]:
+            tracker.on_candle_closed(candle)
+
+        gap = tracker.registry.active[1]
+        assert (gap.fvg_type, gap.bottom, gap.top) == ('BULLISH', 101, 103)
+
+        tracker.on_candle_closed(candles[3])  # still above the gap
+        assert tracker.gaps() == [gap]
+        tracker.on_candle_closed(Candle(datetime(2026, 1, 1, 1), 108, 108.5, 102.5, 103, 1.0))
+        assert tracker.gaps() == [] and gap.mitigated
+
+
+class TestOrderBlocks:
+    def test_detect_matches_streamed_tracker(self):
+        candles = make_candles(800, seed=9)
+        detector, tracker = OrderBlockDetector(), OrderBlockTracker()
+
+        for i, candle in enumerate(candles):
+            tracker.on_candle_closed(candle)
+            if i >= 50 and i % 10 == 0:
+                assert detector.detect(candles[:i + 1]) == tracker.order_blocks(4, i + 1 - 7)
+
+        assert detector._trackers.get_statistics()['rebuilds'] == 1
+        assert all(not ob.mitigated for ob in tracker.registry.active.values())
+
+    def test_growing_and_sliding_windows_match_rescan(self):
+        candles = make_candles(1000, seed=11)
+        detector = OrderBlockDetector()
+
+        for end in range(50, 400, 7):
+            assert detector.detect(candles[:end]) == rescan_order_blocks(candles[:end])
+        # Short windows often cut into the 20-candle OB search of their first swings
+        for end in range(400, 1000, 3):
+            window = candles[end - 60:end]
+            assert detector.detect(window) == rescan_order_blocks(window)
+
+        assert detector._trackers.get_statistics()['rebuilds'] == 1
+
+    def test_block_is_retired_when_price_returns(self):
+        bars = [
+            (100, 101, 99, 100.5), (100.5, 102, 100, 101.5), (101.5, 102.5, 101, 102),
+            (102, 102.2, 100.5, 101), (101, 101.5, 99.5, 100), (100, 104, 99.8, 103.5),
+            (103.5, 109, 103, 108), (108, 108.5, 104.5, 105), (105, 106, 103.5, 104),
+            (104, 105, 103, 104.5), (104.5, 106.5, 104.2, 106), (106, 110, 105.8, 109.5),
+        ]
+        tracker = OrderBlockTracker()
+        for i, bar in enumerate(bars):
+            tracker.on_candle_closed(Candle(datetime(2026, 1, 1) + timedelta(minutes=i), *bar, 1.0))
+
+        ob = tracker.registry.active[('BULLISH', 6, 4)]
+        assert (ob.top, ob.bottom) == (101.5, 99.5)
+
+        tracker.on_candle_closed(Candle(datetime(2026, 1, 1, 1), 109.5, 110, 101, 102, 1.0))
+        assert ('BULLISH', 6, 4) not in tracker.registry and ob.mitigated
@@ -0,0 +1,112 @@
+"""
+Unit Tests for EventBus lanes
+
+Tests:
+- Priority lane is served before candle ticks and normal events
+- Candle ticks coalesce per (symbol, event type) within a bar
+- A finished bar's final tick is not overwritten by the next bar
+- Bounded lanes drop their oldest event and count it
+- Worker drains lanes into the WebSocketManager
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.event_bus import EventBus, EventType, BroadcastEvent
+
+
+@pytest.fixture
+async def bus():
+    """Fresh EventBus bound to the running loop."""
+    EventBus._instance = None
+    bus = EventBus()
+    bus._loop = asyncio.get_running_loop()
+    yield bus
+    EventBus._instance = None
+
+
+def candle(close: float, time: int = 60) -> dict:
+    return {'close': close, 'time': time}
+
+
+def drain(bus: EventBus) -> list:
+    events = []
+    while (event := bus._pop()) is not None:
+        events.append(event)
+    return events
+
+
+class TestEventBusLanes:
+    async def test_priority_lane_first(self, bus):
+        bus.publish_candle_update(candle(100), symbol="btcusdt")
+        bus.publish(BroadcastEvent(EventType.STATUS, {'ok': True}))
+        bus.publish_signal({'type': 'buy'}, symbol="btcusdt")
+        bus.publish_state_change({'to_state': 'IN_POSITION'}, symbol="btcusdt")
+
+        types = [e.event_type for e in drain(bus)]
+        assert types == [EventType.SIGNAL, EventType.STATE_CHANGE, EventType.CANDLE_UPDATE, EventType.STATUS]
+
+    async def test_candle_ticks_coalesce(self, bus):
+        for close in (100, 101, 102):
+            bus.publish_candle_update(candle(close), symbol="btcusdt")
+        bus.publish_candle_update(candle(200), symbol="ethusdt")
+        bus.publish_candle_15m(candle(103), symbol="btcusdt")
+
+        events = drain(bus)
+        assert [(e.symbol, e.event_type, e.data['close']) for e in events] == [
+            ("btcusdt", EventType.CANDLE_UPDATE, 102),
+            ("ethusdt", EventType.CANDLE_UPDATE, 200),
+            ("btcusdt", EventType.CANDLE_15M, 103),
+        ]
+        stats = bus.get_statistics()
+        assert stats['events_coalesced'] == 2
+        assert stats['events_published'] == 5
+
+    async def test_finished_bar_is_not_overwritten(self, bus):
+        bus.publish_candle_update(candle(100, time=60), symbol="btcusdt")
+        bus.publish_candle_update(candle(101, time=60), symbol="btcusdt")
+        bus.publish_candle_update(candle(102, time=120), symbol="btcusdt")
+        bus.publish_candle_update(candle(103, time=120), symbol="btcusdt")
+
+        assert [(e.data['time'], e.data['close']) for e in drain(bus)] == [(60, 101), (120, 103)]
+
+    async def test_full_lane_drops_oldest(self, bus, monkeypatch):
+        monkeypatch.setattr(EventBus, 'PRIORITY_MAXSIZE', 3)
+        for i in range(5):
+            bus.publish_signal({'index': i})
+
+        stats = bus.get_statistics()
+        assert stats['lanes']['priority'] == 3
+        assert stats['events_dropped'] == 2
+        assert stats['dropped_by_lane'] == {'priority': 2, 'normal': 0}
+        assert [e.data['signal']['index'] for e in drain(bus)] == [2, 3, 4]
+
+
+class RecordingManager:
+    def __init__(self):
+        self.messages = []
+
+    async def broadcast(self, message, symbol=None):
+        self.messages.append(message)
+        return 1
+
+
+class TestEventBusWorker:
+    async def test_worker_drains_lanes(self, bus):
+        manager = RecordingManager()
+        await bus.start_worker(manager)
+        try:
+            bus.publish_candle_update(candle(100), symbol="btcusdt")
+            bus.publish_candle_update(candle(101), symbol="btcusdt")
+            bus.publish_signal({'type': 'sell'}, symbol="btcusdt")
+            for _ in range(20):
+                if bus.pending_count() == 0 and len(manager.messages) == 2:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await bus.stop_worker()
+
+        assert [m['type'] for m in manager.messages] == ['signal', 'candle']
+        assert manager.messages[1]['close'] == 101
+        assert bus.get_statistics()['events_consumed'] == 2
@@ -13,6 +13,7 @@ Tests:
 
 import pytest
 import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
@@ -165,6 +166,7 @@ class TestWebSocketManagerBroadcast:
         await manager.connect(ws2, "ethusdt")
         
         sent = await manager.broadcast({"type": "test", "data": "hello"})
+        await manager.flush()
         
         assert sent == 2
         assert len(ws1.messages_sent) == 1
@@ -182,6 +184,7 @@ class TestWebSocketManagerBroadcast:
         await manager.connect(ws3, "ethusdt")
         
         sent = await manager.broadcast({"type": "test"}, symbol="btcusdt")
+        await manager.flush()
         
         assert sent == 2
         assert len(ws1.messages_sent) == 1
@@ -199,8 +202,10 @@ class TestWebSocketManagerBroadcast:
         
         # Should not raise, should clean up failed connection
         sent = await manager.broadcast({"type": "test"})
+        await manager.flush()
         
-        assert sent == 1  # Only ws1 succeeded
+        assert sent == 2  # Queued for both; ws2's writer fails
+        assert len(ws1.messages_sent) == 1
         assert manager.get_connection_count() == 1  # ws2 was removed
     
     @pytest.mark.asyncio
@@ -210,11 +215,131 @@ class TestWebSocketManagerBroadcast:
         
         await manager.broadcast({"type": "test1"})
         await manager.broadcast({"type": "test2"})
+        await manager.flush()
         
         assert connection.message_count == 2
         assert connection.last_message_at is not None
 
 
+class SlowWebSocket(MockWebSocket):
+    """Mock WebSocket whose sends block until released."""
+    
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+    
+    async def send_text(self, message: str):
+        await self.release.wait()
+        self.messages_sent.append(message)
+
+
+class TestWebSocketManagerSendQueues:
+    """Tests for per-client send queues and writer tasks."""
+    
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_stall_others(self, manager):
+        """A blocked socket only delays its own queue."""
+        slow = SlowWebSocket()
+        fast = MockWebSocket()
+        await manager.connect(slow, "btcusdt")
+        await manager.connect(fast, "btcusdt")
+        
+        for i in range(5):
+            await manager.broadcast({"type": "signal", "index": i}, symbol="btcusdt")
+        await asyncio.sleep(0.01)
+        
+        assert len(fast.messages_sent) == 5
+        assert slow.messages_sent == []
+        
+        slow.release.set()
+        assert await manager.flush()
+        assert len(slow.messages_sent) == 5
+    
+    @pytest.mark.asyncio
+    async def test_message_is_encoded_once(self, manager, monkeypatch):
+        """One serialization per broadcast, shared by all clients."""
+        import src.api.ws_protocol as ws_protocol
+        calls = []
+        encode = ws_protocol.encode_message
+        monkeypatch.setattr(ws_protocol, 'encode_message', lambda msg: calls.append(msg) or encode(msg))
+        
+        sockets = [MockWebSocket() for _ in range(4)]
+        for ws in sockets:
+            await manager.connect(ws, "btcusdt")
+        await manager.broadcast({"type": "test", "price": 1.5}, symbol="btcusdt")
+        await manager.flush()
+        
+        assert len(calls) == 1
+        assert all(json.loads(ws.messages_sent[0]) == {"type": "test", "price": 1.5} for ws in sockets)
+    
+    @pytest.mark.asyncio
+    async def test_candle_updates_coalesce_per_bar(self, manager):
+        """Queued ticks of the same bar collapse to the latest one."""
+        slow = SlowWebSocket()
+        connection = await manager.connect(slow, "btcusdt")
+        
+        await manager.broadcast({"type": "signal", "id": 1}, symbol="btcusdt")
+        for close in (100, 101, 102):
+            await manager.broadcast({"type": "candle", "symbol": "btcusdt", "time": 60, "close": close}, symbol="btcusdt")
+        for close in (103, 104):
+            await manager.broadcast({"type": "candle", "symbol": "btcusdt", "time": 120, "close": close}, symbol="btcusdt")
+        
+        slow.release.set()
+        await manager.flush()
+        
+        closes = [json.loads(m).get('close') for m in slow.messages_sent]
+        assert closes == [None, 102, 104]
+        assert connection.coalesced_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self):
+        """A full queue drops its oldest entry instead of blocking."""
+        manager = WebSocketManager(max_queue_size=3)
+        slow = SlowWebSocket()
+        connection = await manager.connect(slow, "btcusdt")
+        await asyncio.sleep(0)
+        
+        for i in range(6):
+            await manager.broadcast({"type": "signal", "index": i}, symbol="btcusdt")
+        
+        assert connection.queue_depth == 3
+        assert connection.dropped_count == 3
+        
+        slow.release.set()
+        await manager.flush()
+        assert [json.loads(m)['index'] for m in slow.messages_sent] == [3, 4, 5]
+        assert manager.get_statistics()['broadcast']['dropped'] == 3
+    
+    @pytest.mark.asyncio
+    async def test_lag_metrics_reported(self, manager):
+        """Per-client lag shows up in the status statistics."""
+        slow = SlowWebSocket()
+        await manager.connect(slow, "btcusdt", client_id="laggy")
+        await manager.broadcast({"type": "signal"}, symbol="btcusdt")
+        await asyncio.sleep(0.02)
+        slow.release.set()
+        await manager.flush()
+        
+        clients = manager.get_statistics()['clients']
+        assert clients[0]['client_id'] == "laggy"
+        assert clients[0]['queue_depth'] == 0
+        assert clients[0]['lag_ms'] >= 15
+        assert clients[0]['max_lag_ms'] >= clients[0]['lag_ms']
+    
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_writer(self, manager):
+        """Disconnecting cancels a writer blocked on a slow socket."""
+        slow = SlowWebSocket()
+        connection = await manager.connect(slow, "btcusdt")
+        await manager.broadcast({"type": "signal"}, symbol="btcusdt")
+        await asyncio.sleep(0)
+        
+        await manager.disconnect(connection)
+        
+        assert connection._writer_task.done()
+        assert connection.queue_depth == 0
+
+
 class TestWebSocketManagerSendToClient:
     """Tests for sending to specific clients."""
     
@@ -224,6 +349,7 @@ class TestWebSocketManagerSendToClient:
         connection = await manager.connect(mock_websocket, "btcusdt", client_id="client-1")
         
         result = await manager.send_to_client("client-1", {"type": "direct"})
+        await manager.flush()
         
         assert result is True
         assert len(mock_websocket.messages_sent) == 1
@@ -249,6 +375,7 @@ class TestWebSocketManagerStatistics:
         conn2 = await manager.connect(ws2, "btcusdt")
         
         await manager.broadcast({"type": "test"})
+        await manager.flush()
         await manager.disconnect(conn2)
         
         stats = manager.get_statistics()
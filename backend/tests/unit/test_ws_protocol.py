@@ -0,0 +1,182 @@
+"""
+Unit Tests for the compact WebSocket wire protocol
+
+Tests:
+- Keyframe + delta frames decode back to the JSON candle message
+- Delta frames only carry changed fields and are much smaller than JSON
+- WebSocketManager sends binary frames to compact clients, JSON to others
+- A client that missed a frame (coalesced/dropped) gets a keyframe
+- Protocol negotiation
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.api.websocket_manager import WebSocketManager
+from src.api.ws_protocol import (
+    COMPACT_SUBPROTOCOL,
+    CompactFrameDecoder,
+    EncodedEvent,
+    KIND_DELTA,
+    KIND_KEYFRAME,
+    STREAM_CODES,
+    WireProtocol,
+    encode_message,
+    negotiate_protocol,
+)
+
+
+def candle_message(close: float, time: int = 1_767_225_600, volume: float = 12.5) -> dict:
+    return {
+        'type': 'candle',
+        'symbol': 'btcusdt',
+        'timestamp': '2026-01-01T00:00:00',
+        'open': 98_500.12, 'high': max(98_510.0, close), 'low': 98_490.5, 'close': close,
+        'volume': volume,
+        'time': time,
+        'vwap': 98_501.37 + close / 1e6,
+        'bollinger': {
+            'upper_band': close + 40.0, 'middle_band': close, 'lower_band': close - 40.0,
+            'bandwidth': 0.0008, 'percent_b': 0.51,
+        },
+        'rsi': 55.2,
+    }
+
+
+def decoded_view(message: dict) -> dict:
+    """What a compact client reconstructs (no ISO timestamp)."""
+    return {k: v for k, v in message.items() if k != 'timestamp'}
+
+
+class TestCompactFrames:
+    def test_keyframe_then_deltas_roundtrip(self):
+        decoder = CompactFrameDecoder()
+        messages = [candle_message(98_500.0 + i, volume=12.5 + i) for i in range(5)]
+        previous = None
+        for seq, message in enumerate(messages):
+            event = EncodedEvent(message, symbol='btcusdt', code=0, seq=seq, previous=previous)
+            frame = event.compact(seq - 1 if seq else None)
+            assert frame[0] == (KIND_KEYFRAME if seq == 0 else KIND_DELTA)
+            assert decoder.decode(frame) == decoded_view(message)
+            previous = event.values()
+
+    def test_nulls_and_missing_indicators(self):
+        decoder = CompactFrameDecoder()
+        first = candle_message(100.0)
+        second = dict(candle_message(101.0), vwap=None, bollinger=None)
+        decoder.decode(EncodedEvent(first, symbol='btcusdt', code=0, seq=7).compact(None))
+        event = EncodedEvent(second, symbol='btcusdt', code=0, seq=8, previous=EncodedEvent(first, code=0).values())
+
+        decoded = decoder.decode(event.compact(7))
+        assert 'vwap' not in decoded and 'bollinger' not in decoded
+        assert decoded['close'] == 101.0
+
+    def test_delta_without_base_is_rejected(self):
+        event = EncodedEvent(candle_message(1.0), symbol='btcusdt', code=0, seq=3, previous=EncodedEvent(candle_message(2.0), code=0).values())
+        with pytest.raises(ValueError):
+            CompactFrameDecoder().decode(event.compact(2))
+
+    def test_unencodable_candle_falls_back_to_json(self):
+        message = dict(candle_message(1.0), stoch_rsi={'k': 1.0, 'zone': 'neutral'})
+        frame = EncodedEvent(message, symbol='btcusdt', code=0).compact(None)
+        assert isinstance(frame, str) and json.loads(frame)['stoch_rsi']['zone'] == 'neutral'
+
+    def test_delta_is_an_order_of_magnitude_smaller(self):
+        base = candle_message(98_500.0)
+        tick = dict(candle_message(98_501.5), high=base['high'], bollinger=dict(base['bollinger'], middle_band=98_500.7))
+        event = EncodedEvent(tick, symbol='btcusdt', code=0, seq=1, previous=EncodedEvent(base, code=0).values())
+
+        delta = event.compact(0)
+        assert len(delta) * 5 < len(encode_message(tick).encode())
+
+
+class MockWebSocket:
+    def __init__(self):
+        self.frames = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def accept(self, subprotocol=None):
+        self.subprotocol = subprotocol
+
+    async def send_text(self, message: str):
+        await self.release.wait()
+        self.frames.append(message)
+
+    async def send_bytes(self, data: bytes):
+        await self.release.wait()
+        self.frames.append(data)
+
+
+class TestManagerCompactDelivery:
+    async def test_protocols_side_by_side(self):
+        manager = WebSocketManager()
+        json_ws, compact_ws = MockWebSocket(), MockWebSocket()
+        await manager.connect(json_ws, "btcusdt")
+        await manager.connect(compact_ws, "btcusdt", protocol=WireProtocol.COMPACT, subprotocol=COMPACT_SUBPROTOCOL)
+        assert compact_ws.subprotocol == COMPACT_SUBPROTOCOL
+
+        messages = [candle_message(98_500.0 + i) for i in range(3)]
+        for message in messages:
+            await manager.broadcast(message, symbol="btcusdt")
+            await manager.flush()
+        await manager.broadcast({'type': 'signal', 'signal': {'side': 'buy'}}, symbol="btcusdt")
+        await manager.flush()
+
+        assert [json.loads(f)['close'] for f in json_ws.frames[:3]] == [98_500.0, 98_501.0, 98_502.0]
+        decoder = CompactFrameDecoder()
+        kinds = [f[0] for f in compact_ws.frames[:3]]
+        assert kinds == [KIND_KEYFRAME, KIND_DELTA, KIND_DELTA]
+        assert [decoder.decode(f) for f in compact_ws.frames[:3]] == [decoded_view(m) for m in messages]
+        assert json.loads(compact_ws.frames[3])['type'] == 'signal'
+
+        stats = manager.get_statistics()
+        assert stats['broadcast']['compact_clients'] == 1
+        assert stats['broadcast']['encodes']['json']['count'] == 4  # once per event, not per client
+        compact_bytes = next(c['bytes_sent'] for c in stats['clients'] if c['protocol'] == 'compact')
+        json_bytes = next(c['bytes_sent'] for c in stats['clients'] if c['protocol'] == 'json')
+        assert compact_bytes < json_bytes
+
+    async def test_missed_frame_gets_keyframe(self):
+        manager = WebSocketManager()
+        ws = MockWebSocket()
+        await manager.connect(ws, "btcusdt", protocol=WireProtocol.COMPACT)
+
+        await manager.broadcast(candle_message(1.0, time=60), symbol="btcusdt")
+        await manager.flush()
+        ws.release.clear()
+        # Two ticks of the next bar coalesce while the socket is blocked,
+        # so the client never sees seq 1
+        await manager.broadcast(candle_message(2.0, time=120), symbol="btcusdt")
+        await asyncio.sleep(0)
+        await manager.broadcast(candle_message(3.0, time=120), symbol="btcusdt")
+        await manager.broadcast(candle_message(4.0, time=120), symbol="btcusdt")
+        ws.release.set()
+        await manager.flush()
+
+        decoder = CompactFrameDecoder()
+        decoded = [decoder.decode(f) for f in ws.frames]
+        assert [f[0] for f in ws.frames] == [KIND_KEYFRAME, KIND_DELTA, KIND_KEYFRAME]
+        assert [m['close'] for m in decoded] == [1.0, 2.0, 4.0]
+
+
+class FakeHandshake:
+    def __init__(self, subprotocols=(), query=None):
+        self.scope = {'subprotocols': list(subprotocols)}
+        self.query_params = query or {}
+
+
+class TestNegotiation:
+    def test_defaults_to_json(self):
+        assert negotiate_protocol(FakeHandshake()) == (WireProtocol.JSON, None)
+
+    def test_subprotocol(self):
+        assert negotiate_protocol(FakeHandshake(['x', COMPACT_SUBPROTOCOL])) == (WireProtocol.COMPACT, COMPACT_SUBPROTOCOL)
+
+    def test_query_param(self):
+        assert negotiate_protocol(FakeHandshake(query={'protocol': 'compact'})) == (WireProtocol.COMPACT, None)
+
+    def test_stream_codes_cover_coalesced_types(self):
+        assert set(STREAM_CODES) == {'candle', 'candle_15m', 'candle_1h'}
@@ -33,7 +33,8 @@ if __name__ == "__main__":
             app,
             host="127.0.0.1",
             port=8000,
-            log_level="info"
+            log_level="info",
+            ws_per_message_deflate=True  # permessage-deflate for the market feed
         )
     except ImportError as e:
         print(f"❌ Error importing app: {e}")